@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+客户端端到端吞吐基准脚本
+启动本地EOP模拟服务（eop_server.py），通过 CTYUN_ENDPOINT_OVERRIDE 把请求发往它，
+测量同步客户端、分页器和流式输出的每秒调用数、p50/p99 请求延迟与峰值内存（RSS）。
+每个场景在独立的子进程中运行，峰值内存互不影响。
+
+    python scripts/benchmark_clients.py                          # 运行全部场景
+    python scripts/benchmark_clients.py --save baseline.json     # 保存结果作为基线
+    python scripts/benchmark_clients.py --baseline baseline.json # 与基线比较，退化时以非零状态退出
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / 'src'
+SCRIPTS = ROOT / 'scripts'
+
+ACCESS_KEY = 'benchmark-ak'
+SECRET_KEY = 'benchmark-sk'
+
+# 子进程输出结果的标记行
+RESULT_MARKER = '@@RESULT@@'
+
+# 模拟服务的数据规模
+DATASET = {'instances': 5000, 'vpcs': 500, 'bills': 20000}
+
+# 并发场景的线程数
+CONCURRENCY = 16
+
+# 比较基线的指标：(字段, 越大越好)
+COMPARED_METRICS = [('calls_per_sec', True), ('items_per_sec', True),
+                    ('p99_ms', False), ('peak_rss_mb', False)]
+
+
+# ---------- 场景（在子进程中运行） ----------
+
+def _client():
+    from core import CTYUNClient
+    return CTYUNClient(ACCESS_KEY, SECRET_KEY, region='cn-north-1')
+
+
+def scenario_sync_get(calls: int) -> int:
+    """同步客户端：签名并发送GET请求、解析JSON"""
+    transport = _client().transport
+    url = 'https://ctecs-global.ctapi.ctyun.cn/v4/ecs/instance-details'
+    for i in range(calls):
+        result = transport.request_json('GET', url, query_params={
+            'regionID': 'r1', 'instanceID': f"ins-{i % DATASET['instances']:08x}"})
+        assert result['statusCode'] == 800, result
+    return calls
+
+
+def scenario_sync_post(calls: int) -> int:
+    """同步客户端：ECSClient.list_instances（POST，每页50条）"""
+    from ecs.client import ECSClient
+    ecs = ECSClient(_client())
+    items = 0
+    for i in range(calls // 10):
+        result = ecs.list_instances('r1', page_no=i % 100 + 1, page_size=50)
+        items += len(result['returnObj']['results'])
+    return items
+
+
+def scenario_sync_concurrent(calls: int) -> int:
+    """同步客户端：多个线程共享一个客户端并发GET"""
+    from concurrent.futures import ThreadPoolExecutor
+    transport = _client().transport
+    url = 'https://ctecs-global.ctapi.ctyun.cn/v4/ecs/instance-details'
+
+    def call(i: int) -> None:
+        result = transport.request_json('GET', url, query_params={
+            'regionID': 'r1', 'instanceID': f"ins-{i % DATASET['instances']:08x}"})
+        assert result['statusCode'] == 800, result
+
+    with ThreadPoolExecutor(CONCURRENCY) as pool:
+        list(pool.map(call, range(calls)))
+    return calls
+
+
+def scenario_monitor_history(calls: int) -> int:
+    """监控历史数据：一天、5分钟粒度、每次 4 台云主机"""
+    from monitor.client import MonitorClient
+    monitor = MonitorClient(_client())
+    end = int(time.time())
+    points = 0
+    for i in range(calls // 10):
+        result = monitor.query_history_metric_data(
+            region_id='r1', service='ecs', dimension='ecs', item_name_list=['cpu_util', 'mem_util'],
+            start_time=end - 86400, end_time=end, fun='avg', period=300,
+            dimensions=[{'name': 'uuid', 'value': [f"vm-{i}-{k}" for k in range(4)]}])
+        assert result['success'], result
+        points += sum(len(item['itemData']) for item in result['data']['itemList'])
+    return points
+
+
+def _paginate(name: str):
+    from core.paginator import Paginator
+    if name == 'ecs':
+        from ecs.client import ECSClient
+        return Paginator(ECSClient(_client()).list_instances, region_id='r1')
+    if name == 'vpc':
+        from vpc.client import VPCClient
+        return Paginator(VPCClient(_client()).new_describe_subnets, region_id='r1')
+    from billing.client import BillingClient
+    return Paginator(BillingClient(_client()).query_ondemand_bill_flow, bill_cycle='202508')
+
+
+PAGINATED = {'ecs': '云主机', 'vpc': '子网', 'billing': '账单流水'}
+
+
+def scenario_paginator(name: str) -> Callable[[int], int]:
+    def run(calls: int) -> int:
+        return sum(1 for _ in _paginate(name))
+    run.__doc__ = f"分页器：获取全部{PAGINATED[name]}（并发翻页）"
+    return run
+
+
+def scenario_sink(output_format: str) -> Callable[[int], int]:
+    def run(calls: int) -> int:
+        from billing.commands import FLOW_HEADERS, _flow_row
+        from utils.streaming import write_records
+        with open(os.devnull, 'w', encoding='utf-8') as stream:
+            return write_records(_paginate('billing'), output_format, headers=FLOW_HEADERS,
+                                 row=_flow_row, stream=stream)
+    run.__doc__ = f"流式输出：全部账单流水 → {output_format}"
+    return run
+
+
+SCENARIOS: Dict[str, Callable[[int], int]] = {
+    'sync.get': scenario_sync_get,
+    'sync.post': scenario_sync_post,
+    'sync.concurrent': scenario_sync_concurrent,
+    'monitor.history': scenario_monitor_history,
+    'paginator.ecs': scenario_paginator('ecs'),
+    'paginator.vpc': scenario_paginator('vpc'),
+    'paginator.billing': scenario_paginator('billing'),
+    'sink.ndjson': scenario_sink('ndjson'),
+    'sink.csv': scenario_sink('csv'),
+    'sink.table': scenario_sink('table'),
+}
+
+
+def peak_rss_mb() -> float:
+    """进程峰值常驻内存（MB）"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 以KB为单位，macOS 以字节为单位
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(int(len(values) * q), len(values) - 1)]
+
+
+def run_scenario(name: str, calls: int) -> Dict[str, Any]:
+    """在当前进程中运行一个场景"""
+    sys.path.insert(0, str(SRC))
+    import logging
+    logging.getLogger('ctyun_cli').setLevel(logging.WARNING)
+    from core.trace import tracer
+
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def record(entry: Dict[str, Any]) -> None:
+        with lock:
+            latencies.append(entry['elapsed_ms'])
+
+    func = SCENARIOS[name]
+    tracer.add_listener(record)
+    start = time.perf_counter()
+    items = func(calls)
+    seconds = time.perf_counter() - start
+    tracer.remove_listener(record)
+
+    return {
+        'scenario': name,
+        'description': func.__doc__,
+        'calls': len(latencies),
+        'items': items,
+        'seconds': round(seconds, 3),
+        'calls_per_sec': round(len(latencies) / seconds, 1) if seconds else None,
+        'items_per_sec': round(items / seconds, 1) if seconds else None,
+        'p50_ms': percentile(latencies, 0.5),
+        'p99_ms': percentile(latencies, 0.99),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+
+
+# ---------- 调度（在主进程中运行） ----------
+
+def start_server(args) -> subprocess.Popen:
+    """启动模拟服务子进程，返回进程对象（url 属性为服务地址）"""
+    command = [sys.executable, str(SCRIPTS / 'eop_server.py'), '--port', '0',
+               '--access-key', ACCESS_KEY, '--secret-key', SECRET_KEY,
+               '--latency', str(args.latency), '--jitter', str(args.jitter),
+               '--error-rate', str(args.error_rate), '--seed', '1']
+    for status in args.error_status or []:
+        command += ['--error-status', str(status)]
+    for key, value in DATASET.items():
+        command += [f'--{key}', str(value)]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    process.url = process.stdout.readline().strip()
+    if not process.url.startswith('http'):
+        process.kill()
+        raise RuntimeError('模拟服务启动失败')
+    return process
+
+
+def make_home(tmp_dir: str) -> str:
+    """带有基准测试凭证的临时HOME，避免读取或改写真实配置"""
+    config_dir = Path(tmp_dir) / '.ctyun'
+    config_dir.mkdir(parents=True, exist_ok=True)
+    (config_dir / 'config').write_text(
+        '[default]\n'
+        f'access_key = {ACCESS_KEY}\n'
+        f'secret_key = {SECRET_KEY}\n'
+        'region = cn-north-1\n'
+        'endpoint = https://api.ctyun.cn\n',
+        encoding='utf-8'
+    )
+    return tmp_dir
+
+
+def run_child(name: str, calls: int, env: Dict[str, str]) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, __file__, '--run-scenario', name, '--calls', str(calls)],
+        capture_output=True, text=True, env=env, cwd=str(ROOT)
+    )
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+    raise RuntimeError(f"场景 {name} 运行失败:\n{completed.stderr[-2000:]}")
+
+
+def best_of(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """多次运行中吞吐的中位数那一次"""
+    results = sorted(results, key=lambda r: r['calls_per_sec'] or 0)
+    return results[len(results) // 2]
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """与基线比较，返回退化描述"""
+    previous = {r['scenario']: r for r in baseline.get('results', [])}
+    regressions = []
+    for result in results:
+        base = previous.get(result['scenario'])
+        if not base:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS:
+            new, old = result.get(metric), base.get(metric)
+            if not new or not old:
+                continue
+            change = (new - old) / old
+            if (change < -tolerance) if higher_is_better else (change > tolerance):
+                regressions.append(f"{result['scenario']}: {metric} {old} → {new} ({change:+.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ctyun-cli 客户端端到端吞吐基准')
+    parser.add_argument('--scenario', action='append', choices=list(SCENARIOS),
+                        help='只运行指定场景，可重复')
+    parser.add_argument('--calls', type=int, default=2000, help='同步客户端场景的请求数')
+    parser.add_argument('--runs', type=int, default=3, help='每个场景运行次数，取吞吐中位数的一次')
+    parser.add_argument('--latency', type=float, default=0.0, help='模拟服务每个请求的延迟（毫秒）')
+    parser.add_argument('--jitter', type=float, default=0.0, help='模拟服务附加的随机延迟上限（毫秒）')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='模拟服务注入错误的比例（触发客户端重试；429 还会触发自适应限流）')
+    parser.add_argument('--error-status', type=int, action='append',
+                        help='注入错误的HTTP状态码，可重复，默认 500/502/503/429')
+    parser.add_argument('--save', help='把结果保存为基线文件')
+    parser.add_argument('--baseline', help='与基线文件比较，出现退化时以非零状态退出')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='允许的相对退化幅度，默认0.25')
+    parser.add_argument('--json', action='store_true', help='以JSON格式输出结果')
+    parser.add_argument('--run-scenario', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_scenario:
+        print(RESULT_MARKER + json.dumps(run_scenario(args.run_scenario, args.calls), ensure_ascii=False))
+        return 0
+
+    server = start_server(args)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(os.environ, HOME=make_home(tmp), PYTHONPATH=str(SRC),
+                       CTYUN_ENDPOINT_OVERRIDE=server.url, CTYUN_NO_DAEMON='1')
+            results = [best_of([run_child(name, args.calls, env) for _ in range(max(args.runs, 1))])
+                       for name in (args.scenario or SCENARIOS)]
+    finally:
+        server.kill()
+        server.wait()
+
+    report = {
+        'python': sys.version.split()[0],
+        'server': {'latency_ms': args.latency, 'jitter_ms': args.jitter, 'error_rate': args.error_rate,
+                   'error_status': args.error_status, **DATASET},
+        'results': results,
+    }
+    if args.save:
+        Path(args.save).write_text(json.dumps(report, ensure_ascii=False, indent=2) + '\n', encoding='utf-8')
+
+    regressions = []
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text(encoding='utf-8')),
+                              args.tolerance)
+
+    if args.json:
+        print(json.dumps(dict(report, regressions=regressions), ensure_ascii=False, indent=2))
+    else:
+        print(f"模拟服务延迟 {args.latency}ms，错误注入比例 {args.error_rate}")
+        print(f"{'场景':<20}{'请求数':>8}{'请求/秒':>10}{'条/秒':>11}{'p50(ms)':>10}{'p99(ms)':>10}{'峰值RSS(MB)':>13}")
+        for r in results:
+            p50 = f"{r['p50_ms']:.2f}" if r['p50_ms'] is not None else '-'
+            p99 = f"{r['p99_ms']:.2f}" if r['p99_ms'] is not None else '-'
+            print(f"{r['scenario']:<20}{r['calls']:>8}{r['calls_per_sec'] or 0:>10.1f}"
+                  f"{r['items_per_sec'] or 0:>11.1f}{p50:>10}{p99:>10}{r['peak_rss_mb']:>13.1f}")
+        if args.baseline:
+            if regressions:
+                print(f"\n❌ 相对基线退化超过 {args.tolerance:.0%}:")
+                for line in regressions:
+                    print(f"  {line}")
+            else:
+                print(f"\n✅ 与基线相比没有超过 {args.tolerance:.0%} 的退化")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+JSON编解码基准脚本
+用与真实接口结构相近的大响应（CCE Pod列表、账单明细页）比较标准库 json 与
+orjson 在传输层响应解析、本地缓存读写和NDJSON输出上的耗时。
+未安装 orjson 时只测量标准库。
+"""
+
+import argparse
+import io
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+
+import requests  # noqa: E402
+
+from core.transport import EOPResponse  # noqa: E402
+from utils import jsoncodec  # noqa: E402
+from utils.streaming import write_ndjson  # noqa: E402
+
+
+def cce_pods(count: int) -> dict:
+    """CCEClient.list_pods 形式的响应"""
+    pods = []
+    for i in range(count):
+        name = f"order-service-7d9f8c6b5-{i:05d}"
+        pods.append({
+            'metadata': {
+                'name': name,
+                'namespace': 'production',
+                'uid': f"3f2a9c1d-0b7e-4c1a-9d8e-{i:012d}",
+                'creationTimestamp': '2025-08-01T08:30:00Z',
+                'labels': {'app': 'order-service', 'pod-template-hash': '7d9f8c6b5',
+                           'version': 'v2.3.1', 'team': '交易平台'},
+                'annotations': {'kubectl.kubernetes.io/restartedAt': '2025-08-01T08:29:57Z',
+                                'prometheus.io/scrape': 'true', 'prometheus.io/port': '9090'},
+                'ownerReferences': [{'kind': 'ReplicaSet', 'name': 'order-service-7d9f8c6b5',
+                                     'controller': True}],
+            },
+            'spec': {
+                'nodeName': f"cce-node-{i % 32:02d}",
+                'restartPolicy': 'Always',
+                'containers': [{
+                    'name': container,
+                    'image': f"registry.ctyun.cn/prod/{container}:2.3.1",
+                    'resources': {'limits': {'cpu': '2', 'memory': '4Gi'},
+                                  'requests': {'cpu': '500m', 'memory': '1Gi'}},
+                    'ports': [{'containerPort': 8080, 'protocol': 'TCP'}],
+                    'env': [{'name': f"ENV_{k}", 'value': f"value-{k}"} for k in range(8)],
+                } for container in ('app', 'sidecar')],
+            },
+            'status': {
+                'phase': 'Running',
+                'podIP': f"172.16.{i // 256 % 256}.{i % 256}",
+                'hostIP': f"192.168.0.{i % 32}",
+                'startTime': '2025-08-01T08:30:02Z',
+                'conditions': [{'type': kind, 'status': 'True',
+                                'lastTransitionTime': '2025-08-01T08:30:10Z'}
+                               for kind in ('Initialized', 'Ready', 'ContainersReady', 'PodScheduled')],
+                'containerStatuses': [{'name': container, 'ready': True, 'restartCount': i % 3,
+                                       'imageID': 'sha256:' + 'ab' * 32,
+                                       'state': {'running': {'startedAt': '2025-08-01T08:30:08Z'}}}
+                                      for container in ('app', 'sidecar')],
+            },
+        })
+    return {'statusCode': 800, 'message': 'success', 'returnObj': {'items': pods, 'total': count}}
+
+
+def billing_page(count: int) -> dict:
+    """账单明细（按需流水）一页的响应"""
+    records = []
+    for i in range(count):
+        records.append({
+            'billingCycle': '202508',
+            'resourceId': f"ecm-{i:08x}",
+            'resourceName': f"订单服务-生产-{i}",
+            'productName': '弹性云主机',
+            'productType': 'ecs',
+            'regionName': '华东1',
+            'regionId': '200000001852',
+            'specification': 's7.xlarge.4 4核16GB',
+            'usageStartTime': '2025-08-01 00:00:00',
+            'usageEndTime': '2025-08-01 01:00:00',
+            'usage': 1.0,
+            'usageUnit': '小时',
+            'unitPrice': 0.8125,
+            'originalAmount': 0.8125,
+            'discountAmount': 0.0813,
+            'amount': 0.7312,
+            'couponAmount': 0,
+            'projectName': '默认项目',
+            'tags': [{'key': 'env', 'value': 'prod'}, {'key': '成本中心', 'value': '交易'}],
+        })
+    return {'statusCode': 800, 'returnObj': {'result': records, 'totalCount': count * 20,
+                                             'pageNo': 1, 'pageSize': count}}
+
+
+PAYLOADS = [
+    ('cce list_pods (2000)', lambda: cce_pods(2000)),
+    ('billing page (1000)', lambda: billing_page(1000)),
+]
+
+
+def make_response(body: bytes, cls=requests.Response) -> requests.Response:
+    response = cls()
+    response.status_code = 200
+    response._content = body
+    response.headers['Content-Type'] = 'application/json'
+    response.encoding = 'utf-8'
+    return response
+
+
+def measure(func, runs: int) -> float:
+    """运行多次，返回中位数耗时（毫秒）"""
+    func()
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def scenarios(payload: dict):
+    """(场景, 函数) 列表；函数在当前选定的编解码实现下运行"""
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    text = body.decode('utf-8')
+    items = next(value for value in payload['returnObj'].values() if isinstance(value, list))
+    return [
+        ('响应解析 response.json()', lambda: make_response(body, EOPResponse).json()),
+        ('缓存写入 dumps', lambda: jsoncodec.dumps(payload)),
+        ('缓存读取 loads', lambda: jsoncodec.loads(text)),
+        ('请求体编码 (ASCII)', lambda: jsoncodec.dumps(payload, ensure_ascii=True)),
+        ('NDJSON输出', lambda: write_ndjson(items, io.StringIO())),
+    ], len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ctyun-cli JSON编解码基准')
+    parser.add_argument('--runs', type=int, default=15, help='每个场景运行次数')
+    parser.add_argument('--json', action='store_true', help='以JSON格式输出结果')
+    args = parser.parse_args()
+
+    backends = ['json'] + (['orjson'] if jsoncodec.set_backend('orjson') == 'orjson' else [])
+    results = []
+    for payload_name, build in PAYLOADS:
+        payload = build()
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        # 对照：requests 自带的 Response.json()
+        baseline = measure(lambda: make_response(body).json(), args.runs)
+        results.append({'payload': payload_name, 'scenario': 'requests Response.json()',
+                        'backend': 'requests', 'median_ms': round(baseline, 2),
+                        'size_kb': round(len(body) / 1024, 1)})
+        for name in backends:
+            jsoncodec.set_backend(name)
+            cases, size = scenarios(payload)
+            for scenario, func in cases:
+                results.append({'payload': payload_name, 'scenario': scenario, 'backend': name,
+                                'median_ms': round(measure(func, args.runs), 2),
+                                'size_kb': round(size / 1024, 1)})
+
+    # 相对标准库的加速比
+    stdlib = {(r['payload'], r['scenario']): r['median_ms'] for r in results if r['backend'] == 'json'}
+    for r in results:
+        base = stdlib.get((r['payload'], r['scenario']))
+        r['speedup'] = round(base / r['median_ms'], 2) if base and r['median_ms'] else None
+
+    if args.json:
+        print(json.dumps({'backends': backends, 'results': results}, ensure_ascii=False, indent=2))
+        return 0
+
+    from utils.streaming import display_width
+
+    def cell(text: str, width: int) -> str:
+        return text + ' ' * max(width - display_width(text), 0)
+
+    print(f"可用实现: {', '.join(backends)}")
+    current = None
+    for r in results:
+        if r['payload'] != current:
+            current = r['payload']
+            print(f"\n{current}  响应大小 {r['size_kb']} KB")
+            print(f"  {cell('场景', 28)}{cell('实现', 10)}{'中位数(ms)':>12}{'加速比':>8}")
+        speedup = f"{r['speedup']:.2f}x" if r['speedup'] else '-'
+        print(f"  {cell(r['scenario'], 28)}{cell(r['backend'], 10)}{r['median_ms']:>12.2f}{speedup:>8}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+EOP签名基准脚本
+比较 CTYUNEOPAuth.sign_request 与逐步实现签名规范的参考实现（每次重新派生 kdate、
+逐个比较请求头大小写、重新编码AK/SK和请求体）的单次签名耗时，并校验两者生成的
+签名完全一致。另外测量多线程同时签名时的总吞吐。
+"""
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import quote
+
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+
+from auth.eop_signature import CTYUNEOPAuth  # noqa: E402
+
+
+ACCESS_KEY = 'bench-access-key-0123456789abcdef'
+SECRET_KEY = 'bench-secret-key-fedcba9876543210'
+
+URL = 'https://ctecs-global.ctapi.ctyun.cn/v4/ecs/list-instances'
+
+
+def reference_signature(headers: dict, query_params, body, eop_date: str) -> str:
+    """按签名规范逐步计算的 Eop-Authorization（不做任何缓存）"""
+    header_list = []
+    for name in sorted(['ctyun-eop-request-id', 'eop-date']):
+        value = next((v for k, v in headers.items() if k.lower() == name), None)
+        if value:
+            header_list.append(f"{name}:{value}\n")
+    query = '&'.join(f"{k}={quote(str(v), safe='')}" for k, v in sorted((query_params or {}).items()))
+    if isinstance(body, bytes):
+        body = body.decode('utf-8')
+    body_hash = hashlib.sha256((body or '').encode('utf-8')).hexdigest()
+    signature_string = f"{''.join(header_list)}\n{query}\n{body_hash}"
+
+    ktime = hmac.new(SECRET_KEY.encode('utf-8'), eop_date.encode('utf-8'), hashlib.sha256).digest()
+    kak = hmac.new(ktime, ACCESS_KEY.encode('utf-8'), hashlib.sha256).digest()
+    kdate = hmac.new(kak, eop_date.split('T')[0].encode('utf-8'), hashlib.sha256).digest()
+    signature = base64.b64encode(
+        hmac.new(kdate, signature_string.encode('utf-8'), hashlib.sha256).digest()
+    ).decode('utf-8')
+    return f"{ACCESS_KEY} Headers=ctyun-eop-request-id;eop-date Signature={signature}"
+
+
+def reference_sign(method, url, query_params=None, body=None, extra_headers=None) -> dict:
+    """参考实现：与 sign_request 生成同样的请求头"""
+    import uuid
+    from datetime import datetime
+
+    eop_date = datetime.now().strftime('%Y%m%dT%H%M%SZ')
+    headers = {'Content-Type': 'application/json', 'ctyun-eop-request-id': str(uuid.uuid4()),
+               'Eop-date': eop_date}
+    if extra_headers:
+        headers.update(extra_headers)
+    headers['Eop-Authorization'] = reference_signature(headers, query_params, body, eop_date)
+    return headers
+
+
+def payload(size: int) -> str:
+    """约 size 字节的ASCII请求体（与传输层编码后的请求体一致）"""
+    if not size:
+        return ''
+    item = {'instanceID': '7a3b9c1d-0000-4000-8000-000000000000', 'instanceName': 'order-service'}
+    count = max(size // len(json.dumps(item)), 1)
+    return json.dumps({'regionID': '200000001852', 'items': [item] * count}, separators=(',', ':'))
+
+
+CASES = [
+    ('GET 查询参数', {'query_params': {'regionID': '200000001852', 'pageNo': 1, 'pageSize': 50,
+                                   'name': '订单 服务'}}),
+    ('POST 小请求体', {'body': payload(200)}),
+    ('POST 16KB请求体', {'body': payload(16 * 1024)}),
+    ('POST 16KB字节请求体', {'body': payload(16 * 1024).encode('ascii')}),
+]
+
+
+def verify(signer: CTYUNEOPAuth) -> None:
+    """fast path 的签名必须与参考实现一致（包括额外请求头覆盖签名头的情况）"""
+    extra_cases = [None, {'X-Trace': '1'}, {'Eop-date': '20250801T083000Z'}, {'ctyun-eop-request-id': ''}]
+    for _, kwargs in CASES:
+        for extra in extra_cases:
+            headers = signer.sign_request('POST', URL, extra_headers=extra, **kwargs)
+            # 派生 kdate 用的是签名时生成的 Eop-date（额外请求头覆盖的只是签名字符串中的值）
+            eop_date = signer._date[1]
+            expected = reference_signature(headers, kwargs.get('query_params'), kwargs.get('body'), eop_date)
+            if headers['Eop-Authorization'] != expected:
+                raise SystemExit(f"签名不一致: {kwargs} extra={extra}")
+
+
+def measure(func, duration: float) -> float:
+    """在 duration 秒内重复调用，返回每次调用的中位数耗时（微秒）"""
+    samples = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        for _ in range(100):
+            func()
+        samples.append((time.perf_counter() - start) / 100 * 1e6)
+    return statistics.median(samples)
+
+
+def threaded_rate(func, threads: int, duration: float) -> float:
+    """多个线程同时签名的总吞吐（次/秒）"""
+    counts = [0] * threads
+    stop = threading.Event()
+
+    def worker(index: int) -> None:
+        while not stop.is_set():
+            for _ in range(100):
+                func()
+            counts[index] += 100
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for worker_thread in workers:
+        worker_thread.start()
+    time.sleep(duration)
+    stop.set()
+    for worker_thread in workers:
+        worker_thread.join()
+    return sum(counts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ctyun-cli EOP签名基准')
+    parser.add_argument('--duration', type=float, default=1.0, help='每个场景的测量时长（秒）')
+    parser.add_argument('--threads', type=int, default=8, help='多线程吞吐测量的线程数')
+    parser.add_argument('--json', action='store_true', help='以JSON格式输出结果')
+    args = parser.parse_args()
+
+    signer = CTYUNEOPAuth(ACCESS_KEY, SECRET_KEY)
+    verify(signer)
+
+    results = []
+    for name, kwargs in CASES:
+        method = 'GET' if 'query_params' in kwargs else 'POST'
+        reference = measure(lambda: reference_sign(method, URL, **kwargs), args.duration)
+        fast = measure(lambda: signer.sign_request(method, URL, **kwargs), args.duration)
+        results.append({'scenario': name, 'reference_us': round(reference, 2), 'sign_request_us': round(fast, 2),
+                        'speedup': round(reference / fast, 2)})
+
+    kwargs = CASES[1][1]
+    reference_rate = threaded_rate(lambda: reference_sign('POST', URL, **kwargs), args.threads, args.duration)
+    fast_rate = threaded_rate(lambda: signer.sign_request('POST', URL, **kwargs), args.threads, args.duration)
+    threaded = {'threads': args.threads, 'reference_per_s': round(reference_rate),
+                'sign_request_per_s': round(fast_rate)}
+
+    if args.json:
+        print(json.dumps({'results': results, 'threaded': threaded}, ensure_ascii=False, indent=2))
+        return 0
+
+    from utils.streaming import display_width
+
+    def cell(text: str, width: int) -> str:
+        return text + ' ' * max(width - display_width(text), 0)
+
+    print("签名一致性校验通过")
+    print(f"\n  {cell('场景', 24)}{'参考实现(µs)':>14}{'sign_request(µs)':>18}{'加速比':>8}")
+    for r in results:
+        print(f"  {cell(r['scenario'], 24)}{r['reference_us']:>14.2f}{r['sign_request_us']:>18.2f}"
+              f"{r['speedup']:>7.2f}x")
+    print(f"\n{args.threads} 线程同时签名（POST 小请求体）: 参考实现 {threaded['reference_per_s']}/s，"
+          f"sign_request {threaded['sign_request_per_s']}/s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
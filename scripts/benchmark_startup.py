@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+CLI启动性能基准脚本
+测量冷启动 --help 与单个命令的启动耗时，并检查是否加载了不该加载的模块。
+调用API的场景发往进程内的EOP模拟服务（eop_server.py），不访问网络。
+超出预算或加载了多余模块时以非零状态退出，可直接用于CI。
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / 'src'
+
+from eop_server import StandIn, StandInServer  # noqa: E402
+
+ACCESS_KEY = 'benchmark-ak'
+SECRET_KEY = 'benchmark-sk'
+
+# 运行CLI并输出已加载模块列表的探针程序
+PROBE = '''
+import json, sys
+from cli.main import cli
+try:
+    cli(sys.argv[1:], standalone_mode=False)
+except SystemExit:
+    pass
+sys.stderr.write("\\n@@MODULES@@" + json.dumps(sorted(sys.modules)))
+'''
+
+# 启动时不应加载的第三方重型依赖
+HEAVY_MODULES = ['requests', 'urllib3', 'tabulate', 'yaml', 'colorama', 'asyncio']
+
+# 场景：(名称, 参数, 允许加载的 *.commands 模块, 是否允许重型依赖, 默认预算毫秒, 是否调用API)
+SCENARIOS = [
+    ('help', ['--help'], set(), False, 200, False),
+    ('show-config', ['show-config'], set(), False, 200, False),
+    ('billing --help', ['billing', '--help'], {'billing.commands'}, True, 450, False),
+    ('ecs list', ['ecs', 'list', '--region-id', 'standin-region-01'], {'ecs.commands'}, True, 500, True),
+]
+
+
+def make_home(tmp_dir: str) -> str:
+    """创建带有测试凭证的临时HOME，避免读取或改写真实配置"""
+    config_dir = Path(tmp_dir) / '.ctyun'
+    config_dir.mkdir(parents=True, exist_ok=True)
+    (config_dir / 'config').write_text(
+        '[default]\n'
+        f'access_key = {ACCESS_KEY}\n'
+        f'secret_key = {SECRET_KEY}\n'
+        'region = cn-north-1\n'
+        'endpoint = https://api.ctyun.cn\n',
+        encoding='utf-8'
+    )
+    return tmp_dir
+
+
+def run_once(args, home: str, endpoint: str):
+    """运行一次CLI（API请求发往 endpoint），返回(耗时秒, 已加载模块集合)"""
+    env = dict(os.environ)
+    env['HOME'] = home
+    env['PYTHONPATH'] = str(SRC)
+    env['CTYUN_ENDPOINT_OVERRIDE'] = endpoint
+    # 不转发给守护进程，测量的是完整的冷启动
+    env['CTYUN_NO_DAEMON'] = '1'
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-c', PROBE] + list(args),
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    elapsed = time.perf_counter() - start
+    marker = proc.stderr.rfind('@@MODULES@@')
+    if marker < 0:
+        raise RuntimeError(f"启动失败: {' '.join(args)}\n{proc.stderr}")
+    modules = set(json.loads(proc.stderr[marker + len('@@MODULES@@'):]))
+    return elapsed, modules
+
+
+def check_modules(name, modules, allowed_commands, allow_heavy):
+    """检查加载的模块，返回问题列表"""
+    problems = []
+    loaded_commands = {m for m in modules if m.endswith('.commands')}
+    extra = loaded_commands - allowed_commands
+    if extra:
+        problems.append(f"[{name}] 加载了多余的命令模块: {', '.join(sorted(extra))}")
+    if not allow_heavy:
+        heavy = sorted(m for m in HEAVY_MODULES if m in modules)
+        if heavy:
+            problems.append(f"[{name}] 加载了重型依赖: {', '.join(heavy)}")
+    return problems
+
+
+def run_scenario(scenario, args, home: str, server, results) -> list:
+    """运行一个场景 args.runs 次，结果追加到 results，返回问题列表"""
+    name, cli_args, allowed_commands, allow_heavy, budget_ms, calls_api = scenario
+    before = server.standin.stats()
+    timings = []
+    modules = set()
+    for _ in range(args.runs):
+        elapsed, modules = run_once(cli_args, home, server.url)
+        timings.append(elapsed * 1000)
+    after = server.standin.stats()
+
+    median_ms = statistics.median(timings)
+    budget = budget_ms * args.scale
+    results.append({
+        'scenario': name,
+        'median_ms': round(median_ms, 1),
+        'min_ms': round(min(timings), 1),
+        'budget_ms': round(budget, 1),
+        'modules': len(modules),
+    })
+    problems = check_modules(name, modules, allowed_commands, allow_heavy)
+    if median_ms > budget:
+        problems.append(f"[{name}] 启动耗时 {median_ms:.0f}ms 超出预算 {budget:.0f}ms")
+    # 调用API的场景每次运行都应有请求通过签名校验，否则测到的只是出错退出的耗时
+    served = sum(after['requests'].values()) - sum(before['requests'].values())
+    if after['rejected'] > before['rejected']:
+        problems.append(f"[{name}] 模拟服务拒绝了 {after['rejected'] - before['rejected']} 个请求（签名校验失败）")
+    elif calls_api and served < args.runs:
+        problems.append(f"[{name}] 模拟服务只收到 {served} 个请求，命令未完成API调用")
+    elif not calls_api and served:
+        problems.append(f"[{name}] 不应调用API，模拟服务却收到 {served} 个请求")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ctyun-cli 启动性能基准')
+    parser.add_argument('--runs', type=int, default=7, help='每个场景运行次数')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='预算缩放系数（较慢的机器上可调大）')
+    parser.add_argument('--json', action='store_true', help='以JSON格式输出结果')
+    args = parser.parse_args()
+
+    problems = []
+    results = []
+    server = StandInServer(StandIn({ACCESS_KEY: SECRET_KEY})).start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            home = make_home(tmp_dir)
+            # 预热一次，生成字节码缓存
+            run_once(['--help'], home, server.url)
+            for scenario in SCENARIOS:
+                problems.extend(run_scenario(scenario, args, home, server, results))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    if args.json:
+        print(json.dumps({'results': results, 'problems': problems},
+                         ensure_ascii=False, indent=2))
+    else:
+        print(f"{'场景':<20}{'中位数(ms)':>12}{'最小(ms)':>12}{'预算(ms)':>12}{'模块数':>10}")
+        for r in results:
+            print(f"{r['scenario']:<20}{r['median_ms']:>12}{r['min_ms']:>12}"
+                  f"{r['budget_ms']:>12}{r['modules']:>10}")
+        for problem in problems:
+            print(f"❌ {problem}")
+        if not problems:
+            print("✅ 启动性能检查通过")
+
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+本地EOP模拟服务
+按 CTYUNEOPAuth 的规则校验 Eop-Authorization 签名，为主要的V4接口（资源池列表、ECS列表/详情、
+监控历史数据、VPC列表、账单明细）返回可分页的固定数据，可配置延迟和错误注入。
+用于离线测量客户端性能（见 benchmark_clients.py）和调试：
+
+    python scripts/eop_server.py --port 8080 --instances 5000 --latency 20
+    CTYUN_ENDPOINT_OVERRIDE=http://127.0.0.1:8080 ctyun-cli ecs list --region-id r1 --all
+
+签名校验独立实现，不依赖 src/ 中的代码，可以发现签名器的回归。
+"""
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, quote, urlsplit
+
+
+# 签名中 Eop-date 与服务端时间允许的偏差
+MAX_CLOCK_SKEW = timedelta(minutes=15)
+
+# 注入错误时随机选择的HTTP状态码
+DEFAULT_ERROR_STATUSES = (500, 502, 503, 429)
+
+SIGNED_HEADERS = 'ctyun-eop-request-id;eop-date'
+
+
+class SignatureError(Exception):
+    """签名校验失败"""
+
+
+def verify_signature(headers, query: List[Tuple[str, str]], body: bytes,
+                     credentials: Dict[str, str]) -> str:
+    """
+    校验EOP签名
+
+    Args:
+        headers: 请求头（不区分大小写的映射）
+        query: 查询参数（已解码）
+        body: 原始请求体
+        credentials: {AK: SK}
+
+    Returns:
+        请求使用的AK；校验失败时抛出 SignatureError
+    """
+    authorization = headers.get('Eop-Authorization')
+    if not authorization:
+        raise SignatureError('缺少 Eop-Authorization 请求头')
+    try:
+        access_key, signed, signature = authorization.split(' ')
+    except ValueError:
+        raise SignatureError('Eop-Authorization 格式错误') from None
+    if signed != f'Headers={SIGNED_HEADERS}' or not signature.startswith('Signature='):
+        raise SignatureError('Eop-Authorization 格式错误')
+    secret_key = credentials.get(access_key)
+    if secret_key is None:
+        raise SignatureError(f'未知的AK: {access_key}')
+
+    request_id = headers.get('ctyun-eop-request-id')
+    eop_date = headers.get('Eop-date')
+    if not request_id or not eop_date:
+        raise SignatureError('缺少 ctyun-eop-request-id 或 Eop-date 请求头')
+    try:
+        signed_at = datetime.strptime(eop_date, '%Y%m%dT%H%M%SZ')
+    except ValueError:
+        raise SignatureError(f'Eop-date 格式错误: {eop_date}') from None
+    # Eop-date 为本地（东八区）时间，只是带了 Z 后缀
+    if abs(datetime.now() - signed_at) > MAX_CLOCK_SKEW:
+        raise SignatureError(f'Eop-date 与服务端时间相差过大: {eop_date}')
+
+    query_string = '&'.join(f"{key}={quote(value, safe='')}" for key, value in sorted(query))
+    text = (f"ctyun-eop-request-id:{request_id}\neop-date:{eop_date}\n\n"
+            f"{query_string}\n{hashlib.sha256(body).hexdigest()}")
+
+    ktime = hmac.new(secret_key.encode('utf-8'), eop_date.encode('utf-8'), hashlib.sha256).digest()
+    kak = hmac.new(ktime, access_key.encode('utf-8'), hashlib.sha256).digest()
+    kdate = hmac.new(kak, eop_date.split('T')[0].encode('utf-8'), hashlib.sha256).digest()
+    expected = base64.b64encode(hmac.new(kdate, text.encode('utf-8'), hashlib.sha256).digest()).decode()
+    if not hmac.compare_digest(expected, signature[len('Signature='):]):
+        raise SignatureError('签名不匹配')
+    return access_key
+
+
+# ---------- 固定数据：按序号生成，不在内存中保存整个数据集 ----------
+
+def instance(i: int) -> Dict[str, Any]:
+    """第 i 台云主机（list-instances / describe-instances 的结果项）"""
+    return {
+        'instanceID': f"ins-{i:08x}-5c4d-4b8a-9f5e-standin",
+        'instanceName': f"app-server-{i:05d}",
+        'displayName': f"应用服务器-{i:05d}",
+        'instanceStatus': 'running' if i % 10 else 'stopped',
+        'azName': f"cn-huadong1-jsnj1A-public-ctcloud-{i % 3}",
+        'privateIP': f"192.168.{i // 250 % 250}.{i % 250 + 2}",
+        'floatingIP': f"36.111.{i // 250 % 250}.{i % 250 + 2}" if i % 4 == 0 else '',
+        'vpcID': f"vpc-{i % 8:08x}",
+        'subnetID': f"subnet-{i % 32:08x}",
+        'flavor': {'flavorID': 's7.xlarge.4', 'flavorName': 's7.xlarge.4', 'flavorCPU': 4, 'flavorRAM': 16384},
+        'image': {'imageID': 'img-centos79', 'imageName': 'CentOS 7.9 64位'},
+        'createdTime': '2025-06-01T08:30:00.000Z',
+        'expiredTime': '2026-06-01T08:30:00.000Z',
+        'onDemand': i % 2 == 0,
+        'labelList': [{'labelKey': 'env', 'labelValue': 'prod'}, {'labelKey': 'team', 'labelValue': '交易'}],
+    }
+
+
+def vpc(i: int) -> Dict[str, Any]:
+    """第 i 个VPC"""
+    return {
+        'vpcID': f"vpc-{i:08x}",
+        'name': f"vpc-{i:04d}",
+        'description': '模拟VPC',
+        'CIDR': f"10.{i % 256}.0.0/16",
+        'ipv6Enabled': False,
+        'subnetIDs': [f"subnet-{i * 4 + k:08x}" for k in range(4)],
+        'natGatewayIDs': [],
+        'projectID': '0',
+        'createdAt': '2025-06-01T08:30:00Z',
+    }
+
+
+def subnet(i: int) -> Dict[str, Any]:
+    """第 i 个子网"""
+    return {
+        'subnetID': f"subnet-{i:08x}",
+        'name': f"subnet-{i:04d}",
+        'vpcID': f"vpc-{i // 4:08x}",
+        'CIDR': f"10.{i // 4 % 256}.{i % 4}.0/24",
+        'gatewayIP': f"10.{i // 4 % 256}.{i % 4}.1",
+        'availableIPCount': 250 - i % 200,
+        'type': 0,
+        'createdAt': '2025-06-01T08:30:00Z',
+    }
+
+
+def bill(i: int) -> Dict[str, Any]:
+    """第 i 条账单流水"""
+    return {
+        'resourceId': f"ecm-{i:08x}",
+        'resourceName': f"订单服务-生产-{i}",
+        'productName': '弹性云主机',
+        'productCode': 'ecs',
+        'orderNo': f"2025080100{i:010d}",
+        'billMode': '2',
+        'billType': '7',
+        'payMethod': '2',
+        'consumeDate': '2025-08-01 01:00:00',
+        'regionName': '华东1',
+        'price': '0.8125',
+        'payableAmount': '0.7312',
+        'amount': '0.7312',
+        'payStatus': '1',
+    }
+
+
+class StandIn:
+    """模拟服务的数据与行为配置"""
+
+    def __init__(self, credentials: Dict[str, str], instances: int = 1000, vpcs: int = 50,
+                 bills: int = 10000, regions: int = 4, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, error_statuses=DEFAULT_ERROR_STATUSES,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            credentials: 接受的 {AK: SK}
+            instances: 云主机数量
+            vpcs: VPC数量（每个VPC 4 个子网）
+            bills: 每个账期的账单流水条数
+            regions: 资源池数量（各资源池返回相同的数据）
+            latency: 每个请求的固定延迟（秒）
+            jitter: 附加的随机延迟上限（秒）
+            error_rate: 注入错误的请求比例（0~1）
+            error_statuses: 注入错误时使用的HTTP状态码
+            seed: 随机数种子（延迟抖动与错误注入）
+        """
+        self.credentials = credentials
+        self.instances = instances
+        self.vpcs = vpcs
+        self.bills = bills
+        self.regions = regions
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        # 统计：{路径: 次数}
+        self.requests: Dict[str, int] = {}
+        self.rejected = 0
+        self.injected = 0
+        self.routes: Dict[Tuple[str, str], Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            ('POST', '/v4/ecs/list-instances'): self.list_instances,
+            ('POST', '/v4/ecs/describe-instances'): self.list_instances,
+            ('GET', '/v4/ecs/instance-details'): self.instance_details,
+            ('GET', '/v4/region/list-regions'): self.list_regions,
+            ('POST', '/v4.2/monitor/query-history-metric-data'): self.history_metric_data,
+            ('GET', '/v4/vpc/list'): self.list_vpcs,
+            ('GET', '/v4/vpc/new-list'): self.list_vpcs,
+            ('GET', '/v4/vpc/list-subnet'): self.list_subnets,
+            ('GET', '/v4/vpc/new-list-subnet'): self.list_subnets,
+            ('POST', '/queryBillOnDemandFee'): self.list_bills,
+            ('POST', '/queryBillCycleFee'): self.list_bills,
+            ('POST', '/queryBillCycleFeeDetail'): self.list_bills,
+            ('POST', '/bill_qryOnDemandBillDetail_Res_Detail'): self.list_bills,
+        }
+
+    # ---------- 行为 ----------
+
+    def delay(self) -> float:
+        """本次请求的延迟（秒）"""
+        with self._lock:
+            return self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def inject(self) -> Optional[int]:
+        """是否注入错误，返回HTTP状态码"""
+        if not self.error_rate:
+            return None
+        with self._lock:
+            if self._random.random() >= self.error_rate:
+                return None
+            self.injected += 1
+            return self._random.choice(self.error_statuses)
+
+    def count(self, path: str) -> None:
+        with self._lock:
+            self.requests[path] = self.requests.get(path, 0) + 1
+
+    def reject(self) -> None:
+        with self._lock:
+            self.rejected += 1
+
+    # ---------- 接口 ----------
+
+    @staticmethod
+    def _page(params: Dict[str, Any], total: int, make: Callable[[int], Dict[str, Any]],
+              max_size: int) -> Tuple[List[Dict[str, Any]], int, int, int]:
+        """取一页：返回 (结果, 页码, 每页条数, 总页数)"""
+        page_no = int(params.get('pageNo') or params.get('pageNumber') or 1)
+        page_size = min(int(params.get('pageSize') or 10), max_size)
+        start = (page_no - 1) * page_size
+        items = [make(i) for i in range(start, min(start + page_size, total))]
+        return items, page_no, page_size, (total + page_size - 1) // page_size
+
+    def list_instances(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        items, _, _, total_page = self._page(params, self.instances, instance, 50)
+        return {'currentCount': len(items), 'totalCount': self.instances, 'totalPage': total_page,
+                'results': items}
+
+    def instance_details(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        instance_id = params.get('instanceID', '')
+        try:
+            index = int(instance_id.split('-')[1], 16)
+        except (IndexError, ValueError):
+            index = -1
+        if not 0 <= index < self.instances:
+            raise LookupError(f"云主机不存在: {instance_id}")
+        return instance(index)
+
+    def history_metric_data(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        start, end = int(params.get('startTime', 0)), int(params.get('endTime', 0))
+        period = int(params.get('period') or 300)
+        points = range(start - start % period, end, period) if end > start else range(0)
+        item_list = []
+        for dimension in params.get('dimensions') or []:
+            for value in dimension.get('value') or []:
+                for name in params.get('itemNameList') or []:
+                    seed = sum(map(ord, value + name))
+                    item_list.append({
+                        'itemName': name,
+                        'itemDesc': name,
+                        'itemUnit': '%',
+                        'dimensions': [{'name': dimension.get('name'), 'value': value}],
+                        'itemData': [{'value': round((seed + t // period) % 1000 / 10, 1), 'timestamp': t}
+                                     for t in points],
+                    })
+        return {'itemList': item_list}
+
+    def list_regions(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {'regionList': [{'regionID': f"standin-region-{i:02d}", 'regionName': f"模拟资源池{i}",
+                                'regionParent': '模拟', 'regionType': 'openstack', 'isMultiZones': True,
+                                'zoneList': ['az1', 'az2'], 'openapiAvailable': True}
+                               for i in range(1, self.regions + 1)]}
+
+    def list_vpcs(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        items, page_no, _, total_page = self._page(params, self.vpcs, vpc, 200)
+        return {'vpcs': items, 'currentCount': len(items), 'totalCount': self.vpcs,
+                'totalPage': total_page, 'pageNo': page_no}
+
+    def list_subnets(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        total = self.vpcs * 4
+        items, page_no, _, total_page = self._page(params, total, subnet, 200)
+        return {'subnets': items, 'currentCount': len(items), 'totalCount': total,
+                'totalPage': total_page, 'pageNo': page_no}
+
+    def list_bills(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        items, page_no, page_size, _ = self._page(params, self.bills, bill, 1000)
+        return {'result': items, 'totalCount': self.bills, 'pageNo': page_no, 'pageSize': page_size}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'requests': dict(self.requests), 'rejected': self.rejected, 'injected': self.injected}
+
+
+class Handler(BaseHTTPRequestHandler):
+    """请求处理：签名校验 → 延迟 → 错误注入 → 路由"""
+
+    protocol_version = 'HTTP/1.1'
+    # 响应头与响应体分两次写出，不关闭 Nagle 算法时与客户端的延迟确认叠加，每个请求多约40ms
+    disable_nagle_algorithm = True
+    server: 'StandInServer'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _reply(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json;charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self) -> None:
+        standin = self.server.standin
+        parts = urlsplit(self.path)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+        if parts.path == '/__stats__':
+            self._reply(200, standin.stats())
+            return
+
+        try:
+            verify_signature(self.headers, query, body, standin.credentials)
+        except SignatureError as e:
+            standin.reject()
+            self._reply(401, {'statusCode': 900, 'errorCode': 'Openapi.Signature.Invalid', 'message': str(e)})
+            return
+
+        standin.count(parts.path)
+        delay = standin.delay()
+        if delay > 0:
+            time.sleep(delay)
+
+        status = standin.inject()
+        if status is not None:
+            headers = {'Retry-After': '1'} if status == 429 else None
+            self._reply(status, {'statusCode': 900, 'errorCode': f'StandIn.Injected{status}',
+                                 'message': '模拟服务注入的错误'}, headers)
+            return
+
+        route = standin.routes.get((self.command, parts.path))
+        if route is None:
+            self._reply(404, {'statusCode': 900, 'errorCode': 'Openapi.NotFound',
+                              'message': f'模拟服务不支持该接口: {self.command} {parts.path}'})
+            return
+
+        params: Dict[str, Any] = dict(query)
+        if body:
+            try:
+                data = json.loads(body)
+            except ValueError:
+                self._reply(400, {'statusCode': 900, 'errorCode': 'Openapi.Parameter.Error',
+                                  'message': '请求体不是合法的JSON'})
+                return
+            if isinstance(data, dict):
+                params.update(data)
+        try:
+            result = route(params)
+        except LookupError as e:
+            self._reply(200, {'statusCode': 900, 'errorCode': 'StandIn.NotFound', 'message': str(e)})
+            return
+        self._reply(200, {'statusCode': 800, 'message': 'SUCCESS', 'returnObj': result})
+
+    do_GET = do_POST = _handle
+
+
+class StandInServer(ThreadingHTTPServer):
+    """多线程的模拟服务"""
+
+    daemon_threads = True
+    # 并发翻页时同时建立的连接较多，默认的 5 会导致连接被丢弃后等待重传
+    request_queue_size = 128
+
+    def __init__(self, standin: StandIn, host: str = '127.0.0.1', port: int = 0, verbose: bool = False):
+        super().__init__((host, port), Handler)
+        self.standin = standin
+        self.verbose = verbose
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'StandInServer':
+        """在后台线程中运行"""
+        threading.Thread(target=self.serve_forever, name='eop-standin', daemon=True).start()
+        return self
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='本地EOP模拟服务')
+    parser.add_argument('--host', default='127.0.0.1', help='监听地址')
+    parser.add_argument('--port', type=int, default=8080, help='监听端口，0表示随机端口')
+    parser.add_argument('--access-key', default='standin-ak', help='接受的AK')
+    parser.add_argument('--secret-key', default='standin-sk', help='AK对应的SK')
+    parser.add_argument('--instances', type=int, default=1000, help='云主机数量')
+    parser.add_argument('--vpcs', type=int, default=50, help='VPC数量（每个VPC 4 个子网）')
+    parser.add_argument('--bills', type=int, default=10000, help='账单流水条数')
+    parser.add_argument('--regions', type=int, default=4, help='资源池数量')
+    parser.add_argument('--latency', type=float, default=0.0, help='每个请求的固定延迟（毫秒）')
+    parser.add_argument('--jitter', type=float, default=0.0, help='附加的随机延迟上限（毫秒）')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='注入错误的请求比例（0~1）')
+    parser.add_argument('--error-status', type=int, action='append',
+                        help=f'注入错误的HTTP状态码，可重复，默认 {DEFAULT_ERROR_STATUSES}')
+    parser.add_argument('--seed', type=int, help='随机数种子')
+    parser.add_argument('--verbose', action='store_true', help='输出访问日志')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    standin = StandIn({args.access_key: args.secret_key}, instances=args.instances, vpcs=args.vpcs,
+                      bills=args.bills, regions=args.regions, latency=args.latency / 1000, jitter=args.jitter / 1000,
+                      error_rate=args.error_rate,
+                      error_statuses=args.error_status or DEFAULT_ERROR_STATUSES, seed=args.seed)
+    server = StandInServer(standin, args.host, args.port, args.verbose)
+    # 第一行输出监听地址，供基准脚本等调用方读取
+    print(server.url, flush=True)
+    sys.stderr.write(f"EOP模拟服务已启动: {server.url}  AK={args.access_key}\n"
+                     f"使用方式: CTYUN_ENDPOINT_OVERRIDE={server.url} ctyun-cli ...\n")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
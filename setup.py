@@ -79,7 +79,8 @@ setup(
         'dev': DEV_REQUIREMENTS,
         'test': ['pytest>=7.4.0', 'pytest-cov>=4.1.0'],
         'lint': ['black>=23.0.0', 'flake8>=6.0.0'],
-        'build': ['build>=0.10.0', 'twine>=4.0.0']
+        'build': ['build>=0.10.0', 'twine>=4.0.0'],
+        'fast': ['orjson>=3.9.0']
     },
 
     # 命令行入口点 - 直接使用CLI主入口
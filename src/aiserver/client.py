@@ -5,7 +5,6 @@
 import json
 from typing import Dict, List, Optional, Any
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -15,8 +14,8 @@ class AIServerClient:
     def __init__(self, client: CTYUNClient):
         self.client = client
         self.base_endpoint = 'ctinfer-global.ctapi.ctyun.cn'
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
-        self.timeout = 30
+        self.eop_auth = client.eop_auth
+        self.timeout = client.timeout
 
     def set_timeout(self, timeout: int):
         self.timeout = timeout
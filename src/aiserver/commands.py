@@ -8,6 +8,7 @@ import sys
 from typing import Optional, List
 
 from .client import AIServerClient
+from cli.paging import list_operation
 
 
 @click.group()
@@ -122,6 +123,7 @@ def create_order(ctx, model_id, token_by_use, token_quantities, tpm, output_form
     click.echo(json.dumps(result, indent=2, ensure_ascii=False))
 
 
+@list_operation(AIServerClient.page_query_orders, 'model_id', 'order_id', items_key='list')
 @aiserver.command('orders')
 @click.option('--model-id', help='模型ID')
 @click.option('--order-id', help='订单ID')
@@ -4,8 +4,11 @@ import click
 from typing import Optional
 from .client import AoneClient
 from utils import OutputFormatter
+from utils.query import query_output
+from cli.paging import list_operation
 
 
+@query_output
 def format_output(data, output_format='table'):
     """格式化输出"""
     if output_format == 'json':
@@ -41,6 +44,8 @@ def aone():
 # ==================== 域名管理 ====================
 
 
+@list_operation(AoneClient.query_domain_list, 'access_mode', 'domain', 'product_code', 'status', 'area_scope',
+                items_key='result', instance=lambda p: list(p['instance']) if p['instance'] else None)
 @aone.command('query-domain-list')
 @click.option('--access-mode', type=int, help='接入方式: 1(域名接入), 2(无域名接入)')
 @click.option('--domain', help='域名')
@@ -111,6 +116,8 @@ def cmd_query_domain_basic_config(ctx, domain, product_code, output):
     format_output(result.get('returnObj', {}), output_format)
 
 
+@list_operation(AoneClient.query_domain_status, 'product_code', items_key='result',
+                domains=lambda p: list(p['domains']))
 @aone.command('query-domain-status')
 @click.option('--domains', required=True, multiple=True, help='域名列表(可多次指定)')
 @click.option('--product-code', required=True, help='产品编码: 010(WAF), 011(DDoS), 020(边缘安全)')
@@ -158,6 +165,8 @@ def cmd_query_domain_protocol(ctx, product_code, access_mode, domain, instance,
     format_output(result.get('returnObj', {}), output_format)
 
 
+@list_operation(AoneClient.query_domain_list_basic, 'domain', 'product_code', 'status', 'area_scope',
+                items_key='result')
 @aone.command('query-domain-list-basic')
 @click.option('--domain', help='域名')
 @click.option('--product-code', help='产品类型编码')
@@ -228,6 +237,7 @@ def cmd_query_resource_packages(ctx, output):
 # ==================== 证书管理 ====================
 
 
+@list_operation(AoneClient.query_cert_list, 'usage_mode', items_key='result')
 @aone.command('query-cert-list')
 @click.option('--page', default=1, type=int, help='页码，默认1')
 @click.option('--per-page', default=1000, type=int, help='每页条数，默认1000')
@@ -291,6 +301,8 @@ def cmd_query_cert_domains(ctx, name, output):
 # ==================== 缓存管理 ====================
 
 
+@list_operation(AoneClient.query_refresh_tasks, 'url', 'start_time', 'end_time', 'submit_id', 'task_id',
+                'task_type', items_key='result', type='query_type')
 @aone.command('query-refresh-tasks')
 @click.option('--type', 'query_type', default=0, type=int, help='查询方式: 0(按时间), 1(按提交ID), 2(按任务ID)')
 @click.option('--url', help='URL(支持模糊匹配)')
@@ -344,6 +356,8 @@ def cmd_query_refresh_task_quota(ctx, output):
         format_output(result_data, output_format)
 
 
+@list_operation(AoneClient.query_preload_tasks, 'url', 'start_time', 'end_time', 'submit_id', 'task_id',
+                items_key='result', type='query_type')
 @aone.command('query-preload-tasks')
 @click.option('--type', 'query_type', default=0, type=int, help='查询方式: 0(按时间), 1(按提交ID), 2(按任务ID)')
 @click.option('--url', help='URL(支持模糊匹配)')
@@ -1075,6 +1089,8 @@ def cmd_query_cc_attack_report(ctx, product_code, start_time, end_time, domain,
     format_output(data_list, output_format)
 
 
+@list_operation(AoneClient.query_cc_attack_events, 'product_code', 'start_time', 'end_time', 'domain',
+                items_key='resultList')
 @aone.command('query-cc-attack-events')
 @click.option('--product-code', required=True, help='产品号: 020(边缘安全与加速)')
 @click.option('--start-time', required=True, help='开始时间(yyyy-MM-dd HH:mm:ss)')
@@ -1181,6 +1197,7 @@ def cmd_query_waf_config(ctx, domain, product_code, output):
     format_output(result.get('returnObj', {}), output_format)
 
 
+@list_operation(AoneClient.query_rule_engine_config, 'domain', 'product_code', 'rule_id', items_key='results')
 @aone.command('query-rule-engine-config')
 @click.option('--domain', required=True, help='域名')
 @click.option('--product-code', required=True, help='产品类型: 020(边缘安全加速)')
@@ -1241,6 +1258,7 @@ def cmd_query_access_control_switch(ctx, domain, product_code, output):
     format_output(result.get('returnObj', {}), output_format)
 
 
+@list_operation(AoneClient.query_tamper_protect, 'domain', 'product_code', items_key='results')
 @aone.command('query-tamper-protect')
 @click.option('--domain', required=True, help='域名')
 @click.option('--product-code', required=True, help='产品类型: 010(边缘云WAF), 020(边缘安全加速)')
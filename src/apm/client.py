@@ -3,7 +3,6 @@
 from typing import Dict, Any, Optional, List
 import json
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -20,7 +19,7 @@ class APMClient:
         self.client = client
         self.service = 'apm'
         self.base_endpoint = 'arms-global.ctapi.ctyun.cn'
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     def _request(self, method: str, path: str,
                  query_params: Optional[Dict] = None,
@@ -36,38 +35,15 @@ class APMClient:
         if region_id:
             extra_headers['regionId'] = region_id
 
-        headers = self.eop_auth.sign_request(
-            method=method,
-            url=url,
-            query_params=query_params,
-            body=body,
-            extra_headers=extra_headers
-        )
-
-        logger.debug(f"请求URL: {url}")
-        logger.debug(f"请求体: {body}")
-        logger.debug(f"查询参数: {query_params}")
+        logger.debug("请求URL: %s", url)
+        logger.debug("请求体: %s", body)
+        logger.debug("查询参数: %s", query_params)
 
         try:
-            if method == 'GET':
-                response = self.client.session.get(
-                    url, params=query_params, headers=headers, timeout=30, verify=False
-                )
-            else:
-                response = self.client.session.post(
-                    url, data=body, headers=headers, timeout=30, verify=False
-                )
-
-            logger.debug(f"响应状态码: {response.status_code}")
-
-            if response.status_code != 200:
-                return {
-                    'statusCode': response.status_code,
-                    'error': f'HTTP_{response.status_code}',
-                    'message': response.text
-                }
-
-            return response.json()
+            return self.client.transport.request_json(
+                method, url, query_params=query_params, body=body,
+                extra_headers=extra_headers, verify=False
+            )
 
         except Exception as e:
             logger.error(f"请求失败: {str(e)}")
@@ -3,8 +3,11 @@
 import click
 from .client import APMClient
 from utils import OutputFormatter
+from utils.query import query_output
+from cli.paging import list_operation
 
 
+@query_output
 def format_output(data, output_format='table'):
     """格式化输出"""
     if output_format == 'json':
@@ -161,6 +164,8 @@ def transaction_types(ctx, region_id, output):
     format_output(result, output or ctx.obj.get('output_format', 'table'))
 
 
+@list_operation(APMClient.list_agents_page, 'region_id', 'service_name', 'deployment', 'agent_ip',
+                'access_type', 'agent_status', 'version')
 @app.command('agents')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--service-name', help='应用名称')
@@ -198,6 +203,8 @@ def env_instances(ctx, region_id, addon_template_id, env_type, resource_id,
     format_output(result, output or ctx.obj.get('output_format', 'table'))
 
 
+@list_operation(APMClient.list_app_tasks_page, 'region_id', 'start_time', 'end_time', 'deployment',
+                'env_uuid', 'service_name', 'project_code', 'project_uuid')
 @app.command('tasks')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--start-time', required=True, type=int, help='开始时间(ms)')
@@ -272,6 +279,9 @@ def span_detail(ctx, region_id, trace_id, span_id, timestamp, output):
     format_output(result, output or ctx.obj.get('output_format', 'table'))
 
 
+@list_operation(APMClient.list_transactions_page, 'region_id', 'start_time', 'end_time', 'service_name',
+                'project_code', 'deployment', 'sort', 'duration', 'outcome', 'type_', 'span_kind', 'trace_id',
+                'transaction_name', 'query_filter')
 @trace.command('list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--start-time', required=True, type=int, help='开始时间(ms)')
@@ -379,6 +389,8 @@ def http_code_curve(ctx, region_id, start_time, end_time, service_name,
     format_output(result, output or ctx.obj.get('output_format', 'table'))
 
 
+@list_operation(APMClient.list_slow_transactions_page, 'region_id', 'start_time', 'end_time', 'service_name',
+                'project_code', 'deployment', 'span_kind')
 @perf.command('slow-transactions')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--start-time', required=True, type=int, help='开始时间(ms)')
@@ -400,6 +412,8 @@ def slow_transactions(ctx, region_id, start_time, end_time, service_name,
     format_output(result, output or ctx.obj.get('output_format', 'table'))
 
 
+@list_operation(APMClient.get_exception_list, 'region_id', 'start_time', 'end_time', 'service_name',
+                'transaction_name', 'project_code', 'deployment')
 @perf.command('exceptions')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--start-time', required=True, type=int, help='开始时间(ms)')
@@ -421,6 +435,8 @@ def exceptions(ctx, region_id, start_time, end_time, service_name,
     format_output(result, output or ctx.obj.get('output_format', 'table'))
 
 
+@list_operation(APMClient.list_sql_stat_page, 'region_id', 'start_time', 'end_time', 'service_name',
+                'db_types', 'project_code', 'deployment')
 @perf.command('sql-stat-page')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--start-time', required=True, type=int, help='开始时间(ms)')
@@ -478,6 +494,8 @@ def nosql_stat_histogram(ctx, region_id, start_time, end_time, service_name,
     format_output(result, output or ctx.obj.get('output_format', 'table'))
 
 
+@list_operation(APMClient.list_nosql_stat_page, 'region_id', 'start_time', 'end_time', 'service_name',
+                'project_code', 'deployment', 'db_types', 'target_instance_id')
 @perf.command('nosql-stat-page')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--start-time', required=True, type=int, help='开始时间(ms)')
@@ -501,6 +519,8 @@ def nosql_stat_page(ctx, region_id, start_time, end_time, service_name,
     format_output(result, output or ctx.obj.get('output_format', 'table'))
 
 
+@list_operation(APMClient.list_mq_stat_page, 'region_id', 'start_time', 'end_time', 'service_name',
+                'project_code', 'deployment', 'instance_id', 'type_', 'message_system')
 @perf.command('mq-stat-page')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--start-time', required=True, type=int, help='开始时间(ms)')
@@ -683,6 +703,8 @@ def alert():
     pass
 
 
+@list_operation(APMClient.list_alert_rules, 'region_id', 'obj_type', 'rule_name', 'group_id', 'rule_status',
+                'obj_id')
 @alert.command('rules')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--obj-type', required=True, help='对象类型编码(ctgcache/KAFKA/MQ2等)')
@@ -714,6 +736,8 @@ def rule_templates(ctx, region_id, obj_type, output):
     format_output(result, output or ctx.obj.get('output_format', 'table'))
 
 
+@list_operation(APMClient.list_alert_send_history, 'region_id', 'alert_name', 'alert_status', 'start_time',
+                'end_time', 'strategy_id')
 @alert.command('send-history')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-num', type=int, help='页码')
@@ -742,6 +766,7 @@ def notify():
     pass
 
 
+@list_operation(APMClient.list_contacts, 'region_id', 'group_id')
 @notify.command('contacts')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--group-id', type=int, help='通知组ID')
@@ -755,6 +780,7 @@ def contacts(ctx, region_id, group_id, page_num, page_size, output):
     format_output(result, output or ctx.obj.get('output_format', 'table'))
 
 
+@list_operation(APMClient.list_contact_groups, 'region_id')
 @notify.command('contact-groups')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-num', required=True, type=int, help='页码')
@@ -767,6 +793,7 @@ def contact_groups(ctx, region_id, page_num, page_size, output):
     format_output(result, output or ctx.obj.get('output_format', 'table'))
 
 
+@list_operation(APMClient.list_notify_strategies, 'region_id', 'strategy_name')
 @notify.command('strategies')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-num', type=int, help='页码')
@@ -789,6 +816,7 @@ def webhook():
     pass
 
 
+@list_operation(APMClient.list_webhooks, 'region_id', 'name')
 @webhook.command('list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-num', type=int, help='页码')
@@ -9,7 +9,6 @@ import urllib.parse
 import logging
 from typing import Any, Dict, List, Optional
 
-from auth.eop_signature import CTYUNEOPAuth
 
 logger = logging.getLogger('ctyun_cli')
 
@@ -20,8 +19,8 @@ class AuditClient:
     def __init__(self, client):
         self.base_endpoint = 'cloudaudit-global.ctapi.ctyun.cn'
         self.client = client
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
-        self.timeout = 30
+        self.eop_auth = client.eop_auth
+        self.timeout = client.timeout
 
     def _make_extra_headers(self, region_id: Optional[str] = None,
                             account_id: Optional[str] = None,
@@ -45,14 +44,14 @@ class AuditClient:
 
     def _log_request(self, url: str, method: str, body: Optional[str] = None,
                      headers: Optional[Dict] = None, query_params: Optional[Dict] = None):
-        logger.debug(f"请求URL [{method}]: {url}")
+        logger.debug("请求URL [%s]: %s", method, url)
         if query_params:
-            logger.debug(f"查询参数: {query_params}")
+            logger.debug("查询参数: %s", query_params)
         if body:
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求体: %s", body)
         if headers:
             safe_headers = {k: v for k, v in headers.items() if k.lower() != 'eop-authorization'}
-            logger.debug(f"请求头: {safe_headers}")
+            logger.debug("请求头: %s", safe_headers)
 
     def _build_get_url(self, base_url: str, query_params: Optional[Dict[str, Any]] = None) -> str:
         """手动构造GET请求URL，避免requests对params编码与EOP签名不一致"""
@@ -65,14 +64,15 @@ class AuditClient:
         return f"{base_url}?{encoded}"
 
     def _handle_response(self, response) -> Dict[str, Any]:
-        logger.debug(f"响应状态码: {response.status_code}")
+        logger.debug("响应状态码: %s", response.status_code)
         if response.status_code != 200:
             logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
             return self._create_error_response(
                 f'HTTP {response.status_code}', response.status_code
             )
         result = response.json()
-        logger.debug(f"响应内容: {json.dumps(result, ensure_ascii=False)[:500]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("响应内容: %s", json.dumps(result, ensure_ascii=False)[:500])
         if result.get('statusCode') not in (0, '0', 800):
             logger.warning(f"API返回错误: {result.get('message', '未知错误')}")
         return result
@@ -100,8 +100,7 @@ class AuditClient:
             return self._handle_response(response)
         except Exception as e:
             logger.error(f"获取资源池列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._create_error_response(str(e))
 
     # ========== 用户授权 & 服务状态 ==========
@@ -126,8 +125,7 @@ class AuditClient:
             return self._handle_response(response)
         except Exception as e:
             logger.error(f"获取用户授权桶信息失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._create_error_response(str(e))
 
     def get_service_enable_status(self, region_id: str,
@@ -150,8 +148,7 @@ class AuditClient:
             return self._handle_response(response)
         except Exception as e:
             logger.error(f"获取服务开通状态失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._create_error_response(str(e))
 
     def get_storage_region_info(self, region_id: str,
@@ -175,8 +172,7 @@ class AuditClient:
             return self._handle_response(response)
         except Exception as e:
             logger.error(f"获取事件存储资源池信息失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._create_error_response(str(e))
 
     # ========== 事件查询 ==========
@@ -235,8 +231,7 @@ class AuditClient:
             return self._handle_response(response)
         except Exception as e:
             logger.error(f"查询事件列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._create_error_response(str(e))
 
     def get_event_selection(self, region_id: str, account_id: str,
@@ -263,8 +258,7 @@ class AuditClient:
             return self._handle_response(response)
         except Exception as e:
             logger.error(f"查询事件筛选条件失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._create_error_response(str(e))
 
     # ========== 跟踪任务管理 ==========
@@ -296,8 +290,7 @@ class AuditClient:
             return self._handle_response(response)
         except Exception as e:
             logger.error(f"查询跟踪任务详情失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._create_error_response(str(e))
 
     def list_audit_tracks(self, region_id: str, account_id: str,
@@ -327,6 +320,5 @@ class AuditClient:
             return self._handle_response(response)
         except Exception as e:
             logger.error(f"查询跟踪任务列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._create_error_response(str(e))
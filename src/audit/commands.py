@@ -10,10 +10,14 @@ import click
 
 from core import CTYUNClient
 from utils import OutputFormatter
+from utils.query import query_output
+from cli.paging import (LIST_OUTPUT_FORMATS, STREAM_FORMATS, all_pages_option, echo_items,
+                        explicit_page_size, iter_all, list_operation)
 
 from .client import AuditClient
 
 
+@query_output
 def format_output(data, output_format='table'):
     """格式化输出"""
     if output_format == 'json':
@@ -154,6 +158,26 @@ def get_storage_region(ctx, region_id: str, account_id: str,
 
 # ========== 查询事件列表 ==========
 
+def _echo_event(idx, evt):
+    """输出一条审计事件"""
+    event_level_map = {0: 'normal', 1: 'warning', 2: 'incident'}
+    event_type_map = {0: 'API调用', 1: '控制台操作', 2: '登录登出', 3: '其他'}
+    act_type_map = {0: '读', 1: '写'}
+    level = event_level_map.get(evt.get('eventLevel'), 'N/A')
+    etype = event_type_map.get(evt.get('eventType'), 'N/A')
+    act = act_type_map.get(evt.get('eventActType'), 'N/A')
+    click.echo(f"\n{idx}. 事件: {evt.get('eventName', 'N/A')}")
+    click.echo(f"   时间: {evt.get('eventTime', 'N/A')} | 级别: {level}")
+    click.echo(f"   类型: {etype} ({act})")
+    click.echo(f"   来源: {evt.get('srcServiceType', 'N/A')} / {evt.get('srcProdTypeName', 'N/A')}")
+    click.echo(f"   资源: {evt.get('srcProdName', 'N/A')} (ID: {evt.get('srcResId', 'N/A')})")
+    click.echo(f"   操作者: {evt.get('subUserEmail', evt.get('userId', 'N/A'))}")
+    click.echo(f"   源IP: {evt.get('srcIp', 'N/A')}")
+
+
+@list_operation(AuditClient.list_events, 'region_id', 'event_act_type', 'time_label', 'from_time', 'to_time',
+                'event_level', 'user_id', 'src_service_type', 'filter_key', 'filter_value',
+                src_prod_type_name='src_prod_type')
 @audit.command('list-events')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page', default=1, type=int, help='页码')
@@ -169,7 +193,8 @@ def get_storage_region(ctx, region_id: str, account_id: str,
 @click.option('--filter-key', type=click.Choice(['-1', 'resName', 'resId', 'eventName']),
               help='筛选类型（需与filter-value同时使用）')
 @click.option('--filter-value', help='筛选值（需与filter-key同时使用）')
-@click.option('--output', type=click.Choice(['table', 'json', 'yaml']), help='输出格式')
+@all_pages_option
+@click.option('--output', type=click.Choice(LIST_OUTPUT_FORMATS), help='输出格式')
 @click.pass_context
 def list_events(ctx, region_id: str, page: int, page_size: int,
                 event_act_type: Optional[int], time_label: Optional[str],
@@ -177,43 +202,51 @@ def list_events(ctx, region_id: str, page: int, page_size: int,
                 event_level: Optional[int], user_id: Optional[str],
                 src_service_type: Optional[str], src_prod_type: Optional[str],
                 filter_key: Optional[str], filter_value: Optional[str],
-                output: Optional[str]):
+                all_pages: bool, output: Optional[str]):
     """查询审计事件列表"""
     client = _get_audit_client(ctx)
-    result = client.list_events(
-        region_id=region_id, page_number=page, page_size=page_size,
+    filters = dict(
         event_act_type=event_act_type, time_label=time_label,
         from_time=from_time, to_time=to_time,
         event_level=event_level, user_id=user_id,
         src_service_type=src_service_type, src_prod_type_name=src_prod_type,
         filter_key=filter_key, filter_value=filter_value
     )
+
+    if all_pages:
+        events = iter_all(client.list_events, page_size=explicit_page_size(ctx),
+                          region_id=region_id, **filters)
+        if output in ('json', 'yaml') or output in STREAM_FORMATS:
+            echo_items(events, output, format_output)
+            return
+        # 逐页到达即逐条输出
+        click.echo("审计事件列表")
+        click.echo("=" * 120)
+        count = 0
+        for count, evt in enumerate(events, 1):
+            _echo_event(count, evt)
+        click.echo(f"\n共 {count} 条" if count else "\n无事件数据")
+        return
+
+    result = client.list_events(
+        region_id=region_id, page_number=page, page_size=page_size, **filters
+    )
     if result.get('statusCode') not in (0, '0', 800):
         click.echo(f"错误: {result.get('message', '未知错误')}", err=True)
         return
     return_obj = result.get('returnObj', {})
     if output in ('json', 'yaml'):
         format_output(result, output)
+    elif output in STREAM_FORMATS:
+        echo_items(return_obj.get('data', []), output, format_output)
     else:
         data = return_obj.get('data', [])
         total = return_obj.get('total', 0)
         click.echo(f"审计事件列表 (共 {total} 条)")
         click.echo("=" * 120)
         if data:
-            event_level_map = {0: 'normal', 1: 'warning', 2: 'incident'}
-            event_type_map = {0: 'API调用', 1: '控制台操作', 2: '登录登出', 3: '其他'}
-            act_type_map = {0: '读', 1: '写'}
             for idx, evt in enumerate(data, 1):
-                level = event_level_map.get(evt.get('eventLevel'), 'N/A')
-                etype = event_type_map.get(evt.get('eventType'), 'N/A')
-                act = act_type_map.get(evt.get('eventActType'), 'N/A')
-                click.echo(f"\n{idx}. 事件: {evt.get('eventName', 'N/A')}")
-                click.echo(f"   时间: {evt.get('eventTime', 'N/A')} | 级别: {level}")
-                click.echo(f"   类型: {etype} ({act})")
-                click.echo(f"   来源: {evt.get('srcServiceType', 'N/A')} / {evt.get('srcProdTypeName', 'N/A')}")
-                click.echo(f"   资源: {evt.get('srcProdName', 'N/A')} (ID: {evt.get('srcResId', 'N/A')})")
-                click.echo(f"   操作者: {evt.get('subUserEmail', evt.get('userId', 'N/A'))}")
-                click.echo(f"   源IP: {evt.get('srcIp', 'N/A')}")
+                _echo_event(idx, evt)
         else:
             click.echo("\n无事件数据")
 
@@ -300,6 +333,7 @@ def get_track(ctx, region_id: str, account_id: str, user_id: str,
 
 # ========== 查询跟踪任务列表 ==========
 
+@list_operation(AuditClient.list_audit_tracks, 'region_id', 'account_id', 'user_id', items_key='records')
 @audit.command('list-tracks')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--account-id', required=True, help='租户账户ID')
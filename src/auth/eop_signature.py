@@ -6,14 +6,27 @@
 import hashlib
 import hmac
 import base64
+import time
 import uuid
-from datetime import datetime
 from urllib.parse import quote
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Union
+
+
+# EOP强制要求签名的请求头（小写、按字母排序）
+SIGNED_HEADER_NAMES = ('ctyun-eop-request-id', 'eop-date')
+SIGNED_HEADERS = ';'.join(SIGNED_HEADER_NAMES)
+
+# 空请求体的SHA256摘要
+EMPTY_BODY_HASH = hashlib.sha256(b'').hexdigest()
 
 
 class CTYUNEOPAuth:
-    """天翼云EOP签名认证类"""
+    """
+    天翼云EOP签名认证类
+
+    同一秒内签名的请求共用 Eop-date 和由它派生的密钥 kdate，
+    派生结果按秒缓存，大量并发请求时每个请求只需计算一次HMAC。
+    """
 
     def __init__(self, access_key: str, secret_key: str):
         """
@@ -25,9 +38,16 @@ class CTYUNEOPAuth:
         """
         self.access_key = access_key
         self.secret_key = secret_key
+        self._access_key_bytes = access_key.encode('utf-8')
+        self._secret_key_bytes = secret_key.encode('utf-8')
+        self._authorization_prefix = f"{access_key} Headers={SIGNED_HEADERS} Signature="
+        # 最近一秒的 (秒数, Eop-date) 与 (Eop-date, kdate)；整体替换，多线程读写安全
+        self._date: Tuple[int, str] = (-1, '')
+        self._kdate: Tuple[str, bytes] = ('', b'')
 
     def sign_request(self, method: str, url: str, query_params: Optional[Dict[str, Any]] = None,
-                    body: Optional[str] = None, extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+                     body: Optional[Union[str, bytes]] = None,
+                     extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """
         对请求进行签名，返回完整的请求头
 
@@ -35,7 +55,7 @@ class CTYUNEOPAuth:
             method: HTTP方法
             url: 请求URL
             query_params: 查询参数
-            body: 请求体
+            body: 请求体（字符串或已编码的UTF-8字节）
             extra_headers: 额外的请求头
 
         Returns:
@@ -57,21 +77,23 @@ class CTYUNEOPAuth:
             headers.update(extra_headers)
 
         # 步骤一：构造待签名字符串 signature
-        signature_string = self._build_signature_string(
-            headers, query_params, body
-        )
-
-        # 步骤二：构造动态密钥 kdate
+        if extra_headers and any(name.lower() in SIGNED_HEADER_NAMES for name in extra_headers):
+            signature_string = self._build_signature_string(headers, query_params, body)
+        else:
+            # 签名头就是上面生成的两个，直接取值，不再逐个比较请求头的大小写
+            signature_string = (
+                f"ctyun-eop-request-id:{request_id}\neop-date:{eop_date}\n"
+                f"\n{self._encode_query(query_params)}\n{self._hash_body(body)}"
+            )
+
+        # 步骤二：构造动态密钥 kdate（同一秒内复用）
         kdate = self._build_kdate(eop_date)
 
         # 步骤三：构造 signature
         signature = self._build_signature(signature_string, kdate)
 
         # 步骤四：构造 Eop-Authorization
-        eop_authorization = self._build_eop_authorization(signature, headers)
-
-        # 添加认证头
-        headers['Eop-Authorization'] = eop_authorization
+        headers['Eop-Authorization'] = self._authorization_prefix + signature
 
         return headers
 
@@ -84,13 +106,34 @@ class CTYUNEOPAuth:
         Returns:
             EOP格式的日期时间字符串
         """
-        # 获取当前北京时间（UTC+8）
-        now = datetime.now()
-        return now.strftime('%Y%m%dT%H%M%SZ')
+        # 获取当前北京时间（UTC+8），同一秒内只格式化一次
+        now = int(time.time())
+        second, eop_date = self._date
+        if second != now:
+            eop_date = time.strftime('%Y%m%dT%H%M%SZ', time.localtime(now))
+            self._date = (now, eop_date)
+        return eop_date
+
+    @staticmethod
+    def _encode_query(query_params: Optional[Dict[str, Any]]) -> str:
+        """按key排序并对值进行URL编码的query字符串"""
+        if not query_params:
+            return ''
+        return '&'.join(f"{key}={quote(str(value), safe='')}"
+                        for key, value in sorted(query_params.items()))
+
+    @staticmethod
+    def _hash_body(body: Optional[Union[str, bytes]]) -> str:
+        """请求体的SHA256摘要（十六进制），字节直接计算，不再重新编码"""
+        if not body:
+            return EMPTY_BODY_HASH
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        return hashlib.sha256(body).hexdigest()
 
     def _build_signature_string(self, headers: Dict[str, str],
                                 query_params: Optional[Dict[str, Any]] = None,
-                                body: Optional[str] = None) -> str:
+                                body: Optional[Union[str, bytes]] = None) -> str:
         """
         构造待签名字符串
         sigture = 需要进行签名的Header排序后的组合列表 + "\n" + encode的query + "\n" + toHex(sha256(原封的body))
@@ -105,42 +148,20 @@ class CTYUNEOPAuth:
         """
         # 1. 构造需要签名的Header排序后的组合列表
         # EOP强制要求 ctyun-eop-request-id、eop-date 必须进行签名
-        signed_header_names = ['ctyun-eop-request-id', 'eop-date']
-        
-        # 按字母顺序排序
-        signed_header_names.sort()
-        
         # 构造 header_name:header_value\n 格式
-        header_list = []
-        for header_name in signed_header_names:
+        lowered = {}
+        for k, v in headers.items():
             # 注意：查找header时不区分大小写，但构造签名字符串时必须用小写
-            header_value = None
-            for k, v in headers.items():
-                if k.lower() == header_name.lower():
-                    header_value = v
-                    break
-            
-            if header_value:
-                header_list.append(f"{header_name.lower()}:{header_value}\n")
-        
-        header_string = ''.join(header_list)
+            lowered.setdefault(k.lower(), v)
+        header_string = ''.join(
+            f"{name}:{lowered[name]}\n" for name in SIGNED_HEADER_NAMES if lowered.get(name)
+        )
 
         # 2. 构造编码后的query字符串
-        query_string = ''
-        if query_params:
-            # 对参数按key排序
-            sorted_params = sorted(query_params.items())
-            encoded_params = []
-            for key, value in sorted_params:
-                # 值需要进行URL编码
-                encoded_value = quote(str(value), safe='')
-                encoded_params.append(f"{key}={encoded_value}")
-            query_string = '&'.join(encoded_params)
+        query_string = self._encode_query(query_params)
 
         # 3. 对body进行SHA256摘要并转十六进制
-        if body is None or body == '':
-            body = ''
-        body_hash = hashlib.sha256(body.encode('utf-8')).hexdigest()
+        body_hash = self._hash_body(body)
 
         # 拼接最终的待签名字符串
         # 格式：header_string + "\n" + query_string + "\n" + body_hash
@@ -150,7 +171,7 @@ class CTYUNEOPAuth:
 
     def _build_kdate(self, eop_date: str) -> bytes:
         """
-        构造动态密钥 kdate
+        构造动态密钥 kdate，结果按 Eop-date 缓存（同一秒内的请求共用）
 
         步骤：
         1. ktime = hmacSHA256(eop_date, sk)
@@ -163,9 +184,13 @@ class CTYUNEOPAuth:
         Returns:
             动态密钥 kdate
         """
+        cached_date, kdate = self._kdate
+        if cached_date == eop_date:
+            return kdate
+
         # 1. 使用eop_date作为数据，sk作为密钥，算出ktime
         ktime = hmac.new(
-            self.secret_key.encode('utf-8'),
+            self._secret_key_bytes,
             eop_date.encode('utf-8'),
             hashlib.sha256
         ).digest()
@@ -173,7 +198,7 @@ class CTYUNEOPAuth:
         # 2. 使用ak作为数据，ktime作为密钥，算出kAk
         kAk = hmac.new(
             ktime,
-            self.access_key.encode('utf-8'),
+            self._access_key_bytes,
             hashlib.sha256
         ).digest()
 
@@ -186,6 +211,7 @@ class CTYUNEOPAuth:
             hashlib.sha256
         ).digest()
 
+        self._kdate = (eop_date, kdate)
         return kdate
 
     def _build_signature(self, signature_string: str, kdate: bytes) -> str:
@@ -200,16 +226,10 @@ class CTYUNEOPAuth:
         Returns:
             Base64编码的签名
         """
-        signature_bytes = hmac.new(
-            kdate,
-            signature_string.encode('utf-8'),
-            hashlib.sha256
-        ).digest()
+        signature_bytes = hmac.digest(kdate, signature_string.encode('utf-8'), 'sha256')
 
         # Base64编码
-        signature = base64.b64encode(signature_bytes).decode('utf-8')
-
-        return signature
+        return base64.b64encode(signature_bytes).decode('ascii')
 
     def _build_eop_authorization(self, signature: str, headers: Dict[str, str]) -> str:
         """
@@ -223,13 +243,5 @@ class CTYUNEOPAuth:
         Returns:
             Eop-Authorization 字符串
         """
-        # 构造 Headers 部分（需要签名的header，按字母排序，用分号分隔）
-        signed_header_names = ['ctyun-eop-request-id', 'eop-date']
-        signed_header_names.sort()
-        headers_part = ';'.join(signed_header_names)
-
-        # 构造完整的 Eop-Authorization
-        # 格式：ak Headers=xxx Signature=xxx
-        eop_authorization = f"{self.access_key} Headers={headers_part} Signature={signature}"
-
-        return eop_authorization
+        # 格式：ak Headers=xxx Signature=xxx，Headers 部分为需要签名的header（按字母排序，用分号分隔）
+        return self._authorization_prefix + signature
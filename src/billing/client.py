@@ -5,8 +5,8 @@
 
 from typing import Dict, Any, List, Optional
 import json
+import logging
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -24,7 +24,7 @@ class BillingClient:
         self.service = 'billing'
         self.base_endpoint = 'acct-global.ctapi.ctyun.cn'
         # 初始化EOP签名认证器
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     def query_bill_list(self, bill_cycle: str, page_no: int = 1,
                        page_size: int = 10, product_code: Optional[str] = None,
@@ -68,22 +68,23 @@ class BillingClient:
                 body=body
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             response.raise_for_status()
             result = response.json()
-            logger.debug(f"解析结果: {result}")
+            logger.debug("解析结果: %s", result)
             return result
             
         except Exception as e:
@@ -138,11 +139,11 @@ class BillingClient:
                 body=body
             )
             
-            response = self.client.session.post(url, data=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, data=body, headers=headers, timeout=self.client.timeout)
             
             response.raise_for_status()
             result = response.json()
-            logger.debug(f"按需账单明细(按产品)查询结果: {result}")
+            logger.debug("按需账单明细(按产品)查询结果: %s", result)
             return result
             
         except Exception as e:
@@ -194,22 +195,23 @@ class BillingClient:
                 body=body
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             response.raise_for_status()
             result = response.json()
-            logger.debug(f"解析结果: {result}")
+            logger.debug("解析结果: %s", result)
             return result
             
         except Exception as e:
@@ -273,22 +275,23 @@ class BillingClient:
                 body=body
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             response.raise_for_status()
             result = response.json()
-            logger.debug(f"解析结果: {result}")
+            logger.debug("解析结果: %s", result)
             return result
             
         except Exception as e:
@@ -339,22 +342,23 @@ class BillingClient:
                 body=body
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             response.raise_for_status()
             result = response.json()
-            logger.debug(f"解析结果: {result}")
+            logger.debug("解析结果: %s", result)
             return result
             
         except Exception as e:
@@ -413,22 +417,23 @@ class BillingClient:
                 body=body
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             response.raise_for_status()
             result = response.json()
-            logger.debug(f"解析结果: {result}")
+            logger.debug("解析结果: %s", result)
             return result
             
         except Exception as e:
@@ -466,25 +471,26 @@ class BillingClient:
                 }
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
                 response.raise_for_status()
             
             result = response.json()
-            logger.debug(f"解析结果: {result}")
+            logger.debug("解析结果: %s", result)
             return result
             
         except Exception as e:
@@ -524,22 +530,23 @@ class BillingClient:
                 body=body
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             response.raise_for_status()
             result = response.json()
-            logger.debug(f"解析结果: {result}")
+            logger.debug("解析结果: %s", result)
             return result
             
         except Exception as e:
@@ -578,22 +585,23 @@ class BillingClient:
                 body=body
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             response.raise_for_status()
             result = response.json()
-            logger.debug(f"解析结果: {result}")
+            logger.debug("解析结果: %s", result)
             return result
             
         except Exception as e:
@@ -653,22 +661,23 @@ class BillingClient:
                 body=body
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
 
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             response.raise_for_status()
             result = response.json()
-            logger.debug(f"解析结果: {result}")
+            logger.debug("解析结果: %s", result)
             return result
 
         except Exception as e:
@@ -724,22 +733,23 @@ class BillingClient:
                 body=body
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
 
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             response.raise_for_status()
             result = response.json()
-            logger.debug(f"解析结果: {result}")
+            logger.debug("解析结果: %s", result)
             return result
 
         except Exception as e:
@@ -795,22 +805,23 @@ class BillingClient:
                 body=body
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
 
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             response.raise_for_status()
             result = response.json()
-            logger.debug(f"解析结果: {result}")
+            logger.debug("解析结果: %s", result)
             return result
 
         except Exception as e:
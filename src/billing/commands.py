@@ -7,7 +7,10 @@ from functools import wraps
 from typing import Optional
 from core import CTYUNAPIError
 from utils import OutputFormatter, ValidationUtils, logger
+from utils.query import query_output
 from billing import BillingClient
+from cli.paging import (LIST_OUTPUT_FORMATS, STREAM_FORMATS, all_pages_option, echo_items,
+                        explicit_page_size, iter_all, list_operation)
 
 
 def handle_error(func):
@@ -29,6 +32,7 @@ def handle_error(func):
     return wrapper
 
 
+@query_output
 def format_output(data, output_format='table'):
     """格式化输出"""
     if output_format == 'json':
@@ -67,6 +71,8 @@ def billing():
 # 原因：POST /v1/bill/queryAccountBalance 返回 CTAPI_10000: API Not Found
 
 
+@list_operation(BillingClient.query_cycle_bill_by_product, 'bill_cycle', 'bill_type', 'product_code',
+                'contract_id', items_key='result')
 @billing.command()
 @click.argument('bill_cycle', metavar='BILL_CYCLE')
 @click.option('--page', default=1, type=int, help='页码')
@@ -173,6 +179,48 @@ def cycle_product(ctx, bill_cycle, page, page_size, bill_type, product_code, con
             click.echo(error_msg, err=True)
 
 
+# 按需流水账单的表头（与 _simplify_flow_item 的键一致）
+FLOW_HEADERS = ['资源ID', '资源名称', '产品名称', '订单号', '计费模式', '账单类型',
+                '支付方式', '消费时间', '官网价', '应付金额', '实付金额', '支付状态']
+
+
+def _flow_row(item):
+    """按需流水账单中的一行"""
+    return list(_simplify_flow_item(item).values())
+
+
+def _simplify_flow_item(item):
+    """按需流水账单的用户友好格式"""
+    # 计费模式映射
+    bill_mode_map = {'1': '包周期', '2': '按需'}
+    # 账单类型映射
+    bill_type_map = {
+        '1': '新购', '2': '续订', '3': '变更',
+        '4': '退订', '5': '退款降级', '6': '其他', '7': '使用'
+    }
+    # 支付方式映射
+    pay_method_map = {'1': '预付费', '2': '后付费'}
+    # 支付状态映射
+    pay_status_map = {'1': '已支付', '2': '未支付'}
+
+    return {
+        '资源ID': item.get('resourceId', ''),  # 移除截断，保留完整资源ID
+        '资源名称': item.get('resourceName', ''),
+        '产品名称': item.get('productName', ''),
+        '订单号': item.get('orderNo', '-'),
+        '计费模式': bill_mode_map.get(item.get('billMode', ''), item.get('billMode', '')),
+        '账单类型': bill_type_map.get(item.get('billType', ''), item.get('billType', '')),
+        '支付方式': pay_method_map.get(item.get('payMethod', ''), item.get('payMethod', '')),
+        '消费时间': item.get('consumeDate', ''),
+        '官网价': float(item.get('price', 0)),
+        '应付金额': float(item.get('payableAmount', 0)),
+        '实付金额': float(item.get('amount', 0)),
+        '支付状态': pay_status_map.get(item.get('payStatus', ''), item.get('payStatus', ''))
+    }
+
+
+@list_operation(BillingClient.query_ondemand_bill_flow, 'bill_cycle', 'contract_id', 'project_id',
+                'product_code', 'bill_type', 'pay_method', items_key='result', master_order_id='order_id')
 @billing.command()
 @click.argument('bill_cycle', metavar='BILL_CYCLE')
 @click.option('--page', default=1, type=int, help='页码')
@@ -183,11 +231,12 @@ def cycle_product(ctx, bill_cycle, page, page_size, bill_type, product_code, con
 @click.option('--bill-type', help='账单类型')
 @click.option('--pay-method', help='支付方式')
 @click.option('--order-id', help='主订单号')
-@click.option('--output', type=click.Choice(['table', 'json', 'yaml']), default=None, help='输出格式')
+@all_pages_option
+@click.option('--output', type=click.Choice(LIST_OUTPUT_FORMATS), default=None, help='输出格式')
 @click.pass_context
 @handle_error
 def ondemand_flow(ctx, bill_cycle, page, page_size, contract_id, project_id,
-                  product_code, bill_type, pay_method, order_id, output):
+                  product_code, bill_type, pay_method, order_id, all_pages, output):
     """按需流水账单"""
     if not ValidationUtils.validate_bill_cycle(bill_cycle):
         click.echo("错误: 账期格式不正确，应为YYYYMM格式，如：202508", err=True)
@@ -196,6 +245,26 @@ def ondemand_flow(ctx, bill_cycle, page, page_size, contract_id, project_id,
     
     client = ctx.obj['client']
     billing_client = BillingClient(client)
+
+    if all_pages:
+        output_format = output or ctx.obj.get('output_format', 'table')
+        bills = iter_all(
+            billing_client.query_ondemand_bill_flow,
+            page_size=explicit_page_size(ctx),
+            bill_cycle=bill_cycle,
+            contract_id=contract_id,
+            project_id=project_id,
+            product_code=product_code,
+            bill_type=bill_type,
+            pay_method=pay_method,
+            master_order_id=order_id
+        )
+        if output_format == 'table':
+            click.echo(f"\n账期 {bill_cycle} 按需流水账单：")
+        count = echo_items(bills, output_format, format_output, FLOW_HEADERS, _flow_row)
+        if output_format == 'table':
+            click.echo(f"\n共 {count} 条" if count else f"账期 {bill_cycle} 没有按需流水账单记录")
+        return
     
     result = billing_client.query_ondemand_bill_flow(
         bill_cycle=bill_cycle,
@@ -230,38 +299,14 @@ def ondemand_flow(ctx, bill_cycle, page, page_size, contract_id, project_id,
             # YAML输出：也返回原始数据
             elif output_format == 'yaml':
                 format_output(result, output_format)
+            # NDJSON/CSV：逐条输出
+            elif output_format in STREAM_FORMATS:
+                echo_items(bill_list, output_format, format_output, FLOW_HEADERS, _flow_row)
             # 表格输出：使用简化的用户友好格式
             else:
                 click.echo(f"\n账期 {bill_cycle} 按需流水账单（共 {total_count} 条）：")
 
-                simplified_list = []
-                for item in bill_list:
-                    # 计费模式映射
-                    bill_mode_map = {'1': '包周期', '2': '按需'}
-                    # 账单类型映射
-                    bill_type_map = {
-                        '1': '新购', '2': '续订', '3': '变更',
-                        '4': '退订', '5': '退款降级', '6': '其他', '7': '使用'
-                    }
-                    # 支付方式映射
-                    pay_method_map = {'1': '预付费', '2': '后付费'}
-                    # 支付状态映射
-                    pay_status_map = {'1': '已支付', '2': '未支付'}
-
-                    simplified_list.append({
-                        '资源ID': item.get('resourceId', ''),  # 移除截断，保留完整资源ID
-                        '资源名称': item.get('resourceName', ''),
-                        '产品名称': item.get('productName', ''),
-                        '订单号': item.get('orderNo', '-'),
-                        '计费模式': bill_mode_map.get(item.get('billMode', ''), item.get('billMode', '')),
-                        '账单类型': bill_type_map.get(item.get('billType', ''), item.get('billType', '')),
-                        '支付方式': pay_method_map.get(item.get('payMethod', ''), item.get('payMethod', '')),
-                        '消费时间': item.get('consumeDate', ''),
-                        '官网价': float(item.get('price', 0)),
-                        '应付金额': float(item.get('payableAmount', 0)),
-                        '实付金额': float(item.get('amount', 0)),
-                        '支付状态': pay_status_map.get(item.get('payStatus', ''), item.get('payStatus', ''))
-                    })
+                simplified_list = [_simplify_flow_item(item) for item in bill_list]
 
                 format_output(simplified_list, output_format)
         else:
@@ -277,6 +322,8 @@ def ondemand_flow(ctx, bill_cycle, page, page_size, contract_id, project_id,
             click.echo(error_msg, err=True)
 
 
+@list_operation(BillingClient.query_cycle_bill_detail, 'bill_cycle', 'resource_id', 'product_code',
+                'contract_id', items_key='result')
 @billing.command()
 @click.argument('bill_cycle', metavar='BILL_CYCLE')
 @click.option('--page', default=1, type=int, help='页码')
@@ -373,6 +420,8 @@ def cycle_bill(ctx, bill_cycle, page, page_size, resource_id, product_code, cont
         click.echo(f"查询失败: {result.get('message', '未知错误')}", err=True)
 
 
+@list_operation(BillingClient.query_bill_list, 'bill_cycle', 'product_code', 'resource_id',
+                items_key='result')
 @billing.command()
 @click.argument('bill_cycle', metavar='BILL_CYCLE')
 @click.option('--page', default=1, type=int, help='页码')
@@ -572,6 +621,8 @@ def bill_summary(ctx, bill_cycle, contract_id, output):
             click.echo(error_msg, err=True)
 
 
+@list_operation(BillingClient.query_ondemand_bill_by_product, 'bill_cycle', 'product_code', 'bill_type',
+                'contract_id', 'group_by_day', items_key='result')
 @billing.command()
 @click.argument('bill_cycle', metavar='BILL_CYCLE')
 @click.option('--page', default=1, type=int, help='页码')
@@ -677,6 +728,8 @@ def ondemand_product(ctx, bill_cycle, page, page_size, product_code, bill_type,
             click.echo(error_msg, err=True)
 
 
+@list_operation(BillingClient.query_cycle_bill_flow, 'bill_cycle', 'product_code', 'project_id', 'bill_type',
+                'contract_id', items_key='result', master_order_id='order_id')
 @billing.command()
 @click.argument('bill_cycle', metavar='BILL_CYCLE')
 @click.option('--page', default=1, type=int, help='页码')
@@ -855,6 +908,8 @@ def account_bill(ctx, bill_cycle, account_id, output):
             click.echo(error_msg, err=True)
 
 
+@list_operation(BillingClient.query_ondemand_bill_by_usage_cycle, 'bill_cycle', 'product_code', 'resource_id',
+                'project_id', 'contract_id', 'group_by_day', items_key='result')
 @billing.command()
 @click.argument('bill_cycle', metavar='BILL_CYCLE')
 @click.option('--page', default=1, type=int, help='页码')
@@ -947,6 +1002,8 @@ def ondemand_usage(ctx, bill_cycle, page, page_size, product_code, resource_id,
         click.echo(f"查询失败: {result.get('message', '未知错误')}", err=True)
 
 
+@list_operation(BillingClient.query_ondemand_bill_by_usage_detail, 'bill_cycle', 'product_code',
+                'resource_id', 'project_id', 'contract_id', items_key='result')
 @billing.command()
 @click.argument('bill_cycle', metavar='BILL_CYCLE')
 @click.option('--page', default=1, type=int, help='页码')
@@ -1044,6 +1101,8 @@ def ondemand_detail(ctx, bill_cycle, page, page_size, product_code, resource_id,
 
 
 
+@list_operation(BillingClient.query_ondemand_bill_by_resource_cycle, 'bill_cycle', 'product_code',
+                'resource_id', 'contract_id', 'group_by_day', items_key='result')
 @billing.command()
 @click.argument('bill_cycle', metavar='BILL_CYCLE')
 @click.option('--page', default=1, type=int, help='页码')
@@ -5,10 +5,9 @@
 提供完整的容器应用生命周期管理能力。
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 import json
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -26,7 +25,7 @@ class CCEClient:
         self.service = 'cce'
         self.base_endpoint = 'ccse-global.ctapi.ctyun.cn'
         # 初始化EOP签名认证器
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     # ========== 集群管理 ==========
 
@@ -1376,6 +1375,34 @@ class CCEClient:
             from core import CTYUNAPIError
             raise CTYUNAPIError('HTTP_ERROR', f'HTTP {response.status_code}: {response.text}')
 
+    def iter_pods(self, region_id: str, cluster_id: str, namespace: str,
+                  label_selector: Optional[str] = None,
+                  field_selector: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        流式查询Pod列表：边接收响应边逐条产出Pod，不在内存中保留整个列表
+
+        Args:
+            region_id: 区域ID
+            cluster_id: 集群ID
+            namespace: 命名空间名称
+            label_selector: Kubernetes标签选择器（可选）
+            field_selector: Kubernetes字段选择器（可选）
+
+        Returns:
+            Pod迭代器；接口返回错误时在读完响应后抛出 CTYUNAPIError
+        """
+        logger.info(f"流式查询Pod列表: regionId={region_id}, clusterId={cluster_id}, namespace={namespace}")
+
+        url = f'https://{self.base_endpoint}/v2/cce/clusters/{cluster_id}/api/v1/namespaces/{namespace}/pods'
+
+        query_params = {}
+        if label_selector:
+            query_params['labelSelector'] = label_selector
+        if field_selector:
+            query_params['fieldSelector'] = field_selector
+
+        return self._stream_list(url, region_id, query_params)
+
     def list_daemonsets(self, region_id: str, cluster_id: str, namespace_name: str,
                        label_selector: Optional[str] = None, field_selector: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -2796,6 +2823,70 @@ class CCEClient:
             from core import CTYUNAPIError
             raise CTYUNAPIError('HTTP_ERROR', f'HTTP {response.status_code}: {response.text}')
 
+    def iter_events(self, region_id: str, cluster_id: str,
+                    api_version: str = 'v1',
+                    label_selector: Optional[str] = None,
+                    field_selector: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        流式查询Kubernetes Event列表：边接收响应边逐条产出Event
+
+        Args:
+            region_id: 区域ID
+            cluster_id: 集群ID
+            api_version: 资源API版本（可选，默认v1）
+            label_selector: Kubernetes标签选择器（可选）
+            field_selector: Kubernetes字段选择器（可选）
+
+        Returns:
+            Event迭代器；接口返回错误时在读完响应后抛出 CTYUNAPIError
+        """
+        logger.info(f"流式查询Event列表: regionId={region_id}, clusterId={cluster_id}")
+
+        url = f'https://{self.base_endpoint}/v2/cce/clusters/{cluster_id}/apis/events.k8s.io/{api_version}/events'
+
+        query_params = {}
+        if label_selector:
+            query_params['labelSelector'] = label_selector
+        if field_selector:
+            query_params['fieldSelector'] = field_selector
+
+        return self._stream_list(url, region_id, query_params)
+
+    def _stream_list(self, url: str, region_id: str,
+                     query_params: Dict[str, str]) -> Iterator[Dict[str, Any]]:
+        """
+        以流式方式请求Kubernetes列表接口，逐条产出 returnObj.items 中的资源
+
+        returnObj 不是列表对象（例如为文本）时，读完后按普通响应提取结果列表。
+        """
+        from core import CTYUNAPIError
+        from core.jsonstream import JSONStreamError, iter_items
+        from core.paginator import extract_items
+
+        headers = self.eop_auth.sign_request(
+            method='GET',
+            url=url,
+            query_params=query_params
+        )
+        headers['regionId'] = region_id
+        headers['Content-Type'] = 'application/json'
+
+        with self.client.session.get(url, params=query_params, headers=headers, stream=True) as response:
+            if response.status_code != 200:
+                raise CTYUNAPIError(f'HTTP {response.status_code}: {response.text}', 'HTTP_ERROR',
+                                    response.status_code)
+            items = iter_items(response)
+            try:
+                yield from items
+            except JSONStreamError as e:
+                raise CTYUNAPIError(str(e), 'PARSE_ERROR', response.status_code)
+
+        result = items.envelope
+        if result.get('statusCode') != 800:
+            raise CTYUNAPIError(result.get('message', 'Unknown error'), str(result.get('statusCode', 'unknown')))
+        if items.path is None:
+            yield from extract_items(result)
+
     # ========== 运维管理 ==========
 
     def get_inspection_job(self, region_id: str, cluster_id: str) -> Dict[str, Any]:
@@ -3658,7 +3749,7 @@ class CCEClient:
             response = self.client.session.get(
                 url,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -3723,7 +3814,7 @@ class CCEClient:
                 url,
                 params=query_params if query_params else None,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -3785,7 +3876,7 @@ class CCEClient:
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -3838,7 +3929,7 @@ class CCEClient:
         )
         headers['regionId'] = region_id
 
-        response = self.client.session.post(url, data=namespace_yaml, headers=headers, timeout=30)
+        response = self.client.session.post(url, data=namespace_yaml, headers=headers, timeout=self.client.timeout)
 
         if response.status_code == 200:
             result = response.json()
@@ -3875,7 +3966,7 @@ class CCEClient:
         )
         headers['regionId'] = region_id
 
-        response = self.client.session.delete(url, headers=headers, timeout=30)
+        response = self.client.session.delete(url, headers=headers, timeout=self.client.timeout)
 
         if response.status_code == 200:
             result = response.json()
@@ -3914,7 +4005,7 @@ class CCEClient:
         )
         headers['regionId'] = region_id
 
-        response = self.client.session.put(url, data=namespace_yaml, headers=headers, timeout=30)
+        response = self.client.session.put(url, data=namespace_yaml, headers=headers, timeout=self.client.timeout)
 
         if response.status_code == 200:
             result = response.json()
@@ -3951,7 +4042,7 @@ class CCEClient:
         headers['regionId'] = region_id
         headers['Content-Type'] = 'application/json'
 
-        response = self.client.session.get(url, headers=headers, timeout=30)
+        response = self.client.session.get(url, headers=headers, timeout=self.client.timeout)
 
         if response.status_code == 200:
             result = response.json()
@@ -3998,7 +4089,7 @@ class CCEClient:
         headers['Content-Type'] = 'application/json'
 
         response = self.client.session.get(url, params=query_params if query_params else None,
-                                          headers=headers, timeout=30)
+                                          headers=headers, timeout=self.client.timeout)
 
         if response.status_code == 200:
             result = response.json()
@@ -4038,7 +4129,7 @@ class CCEClient:
         headers['regionId'] = region_id
         headers['Content-Type'] = 'application/json'
 
-        response = self.client.session.get(url, params=query_params, headers=headers, timeout=30)
+        response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout)
 
         if response.status_code == 200:
             result = response.json()
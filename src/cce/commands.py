@@ -7,8 +7,10 @@
 import click
 from functools import wraps
 from typing import Optional, Dict, Any
+from cli.paging import LIST_OUTPUT_FORMATS, STREAM_FORMATS, echo_items, list_operation
 from core import CTYUNAPIError
 from utils import OutputFormatter, logger
+from utils.query import query_output
 from cce import CCEClient
 
 
@@ -31,6 +33,7 @@ def handle_error(func):
     return wrapper
 
 
+@query_output
 def format_output(data, output_format='table'):
     """格式化输出"""
     import click
@@ -195,6 +198,7 @@ def list_authorized_namespaces(ctx, region_id: str, cluster_name: str):
         format_output(result, output_format)
 
 
+@list_operation(CCEClient.list_clusters, 'region_id', 'cluster_name', 'res_pool_id', items_key='records')
 @cce.command('list-clusters')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--page-size', default=10, help='每页条数')
@@ -726,6 +730,7 @@ def list_nodes(ctx, region_id: str, cluster_id: str, node_name: Optional[str]):
         format_output(result, output_format)
 
 
+@list_operation(CCEClient.list_node_pools, 'region_id', 'cluster_id', 'node_pool_name', items_key='records')
 @cce.command('list-node-pools')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--cluster-id', required=True, help='集群ID')
@@ -949,21 +954,62 @@ def get_deployment(ctx, region_id: str, cluster_id: str, namespace: str, deploym
         format_output(result, output_format)
 
 
+# 流式输出Pod列表时的表头
+POD_HEADERS = ['名称', '命名空间', '状态', '节点', 'Pod IP', '重启次数', '创建时间']
+
+# 流式输出Event列表时的表头
+EVENT_HEADERS = ['类型', '原因', '对象', '说明', '时间']
+
+
+def _pod_row(pod):
+    """Pod列表中的一行"""
+    metadata = pod.get('metadata') or {}
+    status = pod.get('status') or {}
+    restarts = sum(item.get('restartCount', 0) for item in status.get('containerStatuses') or [])
+    return [metadata.get('name'), metadata.get('namespace'), status.get('phase'),
+            (pod.get('spec') or {}).get('nodeName'), status.get('podIP'), restarts,
+            metadata.get('creationTimestamp')]
+
+
+def _event_row(event):
+    """Event列表中的一行"""
+    regarding = event.get('regarding') or {}
+    target = '/'.join(part for part in (regarding.get('kind'), regarding.get('name')) if part)
+    timestamp = (event.get('eventTime') or event.get('deprecatedLastTimestamp')
+                 or (event.get('metadata') or {}).get('creationTimestamp'))
+    return [event.get('type'), event.get('reason'), target, event.get('note'), timestamp]
+
+
+def stream_option(func):
+    """为Kubernetes列表命令添加 --stream 选项"""
+    return click.option(
+        '--stream', is_flag=True,
+        help='边接收边解析，逐条输出结果（超大列表内存占用不随条数增长；ndjson/csv 输出时自动启用）'
+    )(func)
+
+
 @cce.command('list-pods')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--cluster-id', required=True, help='集群ID')
 @click.option('--namespace', required=True, help='命名空间名称')
 @click.option('--label-selector', help='Kubernetes标签选择器')
 @click.option('--field-selector', help='Kubernetes字段选择器')
+@stream_option
+@click.option('--output', type=click.Choice(LIST_OUTPUT_FORMATS), help='输出格式')
 @click.pass_context
 @handle_error
 def list_pods(ctx, region_id: str, cluster_id: str, namespace: str,
-              label_selector: Optional[str], field_selector: Optional[str]):
+              label_selector: Optional[str], field_selector: Optional[str],
+              stream: bool, output: Optional[str]):
     """查询Pod列表"""
     client = ctx.obj['client']
-    output_format = ctx.obj['output']
+    output_format = output or ctx.obj['output']
 
     cce_client = CCEClient(client)
+    if stream or output_format in STREAM_FORMATS:
+        pods = cce_client.iter_pods(region_id, cluster_id, namespace, label_selector, field_selector)
+        echo_items(pods, output_format, format_output, POD_HEADERS, _pod_row)
+        return
     result = cce_client.list_pods(region_id, cluster_id, namespace, label_selector, field_selector)
 
     if output_format == 'table':
@@ -1975,15 +2021,22 @@ def get_volume_snapshot_class(ctx, region_id: str, cluster_id: str, vsc_name: st
 @click.option('--api-version', default='v1', help='资源API版本，默认v1')
 @click.option('--label-selector', help='Kubernetes标签选择器')
 @click.option('--field-selector', help='Kubernetes字段选择器，支持type/regarding.kind/regarding.name/regarding.namespace')
+@stream_option
+@click.option('--output', type=click.Choice(LIST_OUTPUT_FORMATS), help='输出格式')
 @click.pass_context
 @handle_error
 def list_events(ctx, region_id: str, cluster_id: str, api_version: str,
-                label_selector: Optional[str], field_selector: Optional[str]):
+                label_selector: Optional[str], field_selector: Optional[str],
+                stream: bool, output: Optional[str]):
     """查询Kubernetes Event列表 (events.k8s.io)"""
     client = ctx.obj['client']
-    output_format = ctx.obj['output']
+    output_format = output or ctx.obj['output']
 
     cce_client = CCEClient(client)
+    if stream or output_format in STREAM_FORMATS:
+        events = cce_client.iter_events(region_id, cluster_id, api_version, label_selector, field_selector)
+        echo_items(events, output_format, format_output, EVENT_HEADERS, _event_row)
+        return
     result = cce_client.list_events(region_id, cluster_id, api_version, label_selector, field_selector)
 
     if output_format == 'table':
@@ -2029,6 +2082,7 @@ def get_inspection_job(ctx, region_id: str, cluster_id: str):
         format_output(result, output_format)
 
 
+@list_operation(CCEClient.list_inspection_reports, 'region_id', 'cluster_id', items_key='records')
 @cce.command('list-inspection-reports')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--cluster-id', required=True, help='集群ID')
@@ -2061,6 +2115,8 @@ def list_inspection_reports(ctx, region_id: str, cluster_id: str, page_now: int,
         format_output(result, output_format)
 
 
+@list_operation(CCEClient.get_inspection_report, 'region_id', 'cluster_id', 'report_id', 'namespace',
+                'resource_type', 'level', items_key='records')
 @cce.command('get-inspection-report')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--cluster-id', required=True, help='集群ID')
@@ -2198,6 +2254,7 @@ def check_component_log_collection(ctx, region_id: str, cluster_name: str):
 
 # ========== 任务管理命令 ==========
 
+@list_operation(CCEClient.list_tasks, 'region_id', 'cluster_id', items_key='records')
 @cce.command('list-tasks')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--cluster-id', required=True, help='集群ID')
@@ -2256,6 +2313,7 @@ def list_tasks(ctx, region_id: str, cluster_id: str, page_number: int, page_size
         format_output(result, output_format)
 
 
+@list_operation(CCEClient.list_task_events, 'region_id', 'cluster_id', 'task_id', items_key='records')
 @cce.command('list-task-events')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--cluster-id', required=True, help='集群ID')
@@ -2294,6 +2352,7 @@ def list_task_events(ctx, region_id: str, cluster_id: str, task_id: str, page_nu
         format_output(result, output_format)
 
 
+@list_operation(CCEClient.list_auto_scaling_policies, 'region_id', 'cluster_id', items_key='returnObj')
 @autoscaling.command('list-policies')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--cluster-id', required=True, help='集群ID')
@@ -2359,6 +2418,7 @@ def bind_cluster_tag(ctx, region_id: str, cluster_id: str, tag_key: str, tag_val
         format_output(result, output_format)
 
 
+@list_operation(CCEClient.query_cluster_tags, 'region_id', 'cluster_id', 'tag_key')
 @tag.command('list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--cluster-id', required=True, help='集群ID')
@@ -2534,6 +2594,8 @@ def get_task_detail(ctx, region_id: str, task_id: str):
         format_output(result, output_format)
 
 
+@list_operation(CCEClient.get_cluster_events, 'region_id', 'cluster_id', 'event_type', 'task_id',
+                items_key='records')
 @cce.command('list-cluster-events')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--cluster-id', required=True, help='集群ID')
@@ -2791,6 +2853,7 @@ def logs():
     pass
 
 
+@list_operation(CCEClient.query_cluster_logs, 'region_id', 'cluster_name', items_key='records')
 @logs.command('query')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--cluster-name', required=True, help='集群名称')
@@ -3346,6 +3409,7 @@ def check_template_instance_exists_v2(ctx, region_id: str, cluster_id: str,
     format_output(result, output_format)
 
 
+@list_operation(CCEClient.get_cluster_events_v2, 'region_id', 'cluster_id', 'event_type', 'task_id')
 @cce.command('get-cluster-events-v2')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--cluster-id', required=True, help='集群ID（Long型数字）')
@@ -16,8 +16,9 @@
 
 from typing import Dict, Any, List, Optional
 import json
+import logging
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
+from core.endpoints import EndpointResolver
 from utils import logger
 
 
@@ -41,8 +42,10 @@ class CDAClient:
             'global-cda.ctapi.ctyun.cn'
         ]
         self.base_endpoint = self.endpoints[0]
+        # 按API路径记住可用的端点
+        self.resolver = EndpointResolver(self.service, namespace=getattr(client, 'cache_namespace', ''))
         # 初始化EOP签名认证器
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     def make_eop_request(
         self,
@@ -50,7 +53,7 @@ class CDAClient:
         endpoint_path: str,
         query_params: Optional[Dict[str, Any]] = None,
         body_data: Optional[Dict[str, Any]] = None,
-        timeout: int = 30
+        timeout: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         发送EOP认证的API请求，支持尝试多个端点
@@ -60,91 +63,51 @@ class CDAClient:
             endpoint_path: API端点路径
             query_params: 查询参数
             body_data: 请求体数据
-            timeout: 请求超时时间
+            timeout: 请求超时时间，默认使用配置值
 
         Returns:
             API响应结果
         """
-        # 尝试不同的端点
-        for endpoint in self.endpoints:
+        # 构造请求
+        body = json.dumps(body_data) if body_data else None
+
+        # 返回 (是否成功, 结果)：网络错误、404、5xx 时为False（换下一个端点），
+        # 业务错误与其他4xx为None（端点正确，请求本身有误，不换端点）
+        def attempt(endpoint: str):
             url = f"https://{endpoint}{endpoint_path}"
 
-            # 构造请求
-            body = json.dumps(body_data) if body_data else None
-            headers = self.eop_auth.sign_request(
-                method=method,
-                url=url,
-                query_params=query_params,
-                body=body,
-                extra_headers={}
-            )
-
-            logger.debug(f"尝试端点: {endpoint}")
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求方法: {method}")
+            logger.debug("尝试端点: %s", endpoint)
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求方法: %s", method)
             if query_params:
-                logger.debug(f"查询参数: {query_params}")
+                logger.debug("查询参数: %s", query_params)
             if body_data:
-                logger.debug(f"请求体: {body}")
+                logger.debug("请求体: %s", body)
 
             try:
                 # 发送请求
-                if method.upper() == 'GET':
-                    # 对于GET方法，如果有body_data，将其作为data传递
-                    # 这是天翼云API的特殊模式：GET方法但有请求体
-                    if body_data:
-                        response = self.client.session.get(
-                            url,
-                            params=query_params,
-                            data=body,
-                            headers=headers,
-                            timeout=timeout,
-                            verify=False
-                        )
-                    else:
-                        response = self.client.session.get(
-                            url,
-                            params=query_params,
-                            headers=headers,
-                            timeout=timeout,
-                            verify=False
-                        )
-                elif method.upper() == 'POST':
-                    response = self.client.session.post(
-                        url,
-                        data=body,
-                        headers=headers,
-                        timeout=timeout,
-                        verify=False
-                    )
-                elif method.upper() == 'PUT':
-                    response = self.client.session.put(
-                        url,
-                        data=body,
-                        headers=headers,
-                        timeout=timeout,
-                        verify=False
-                    )
-                elif method.upper() == 'DELETE':
-                    response = self.client.session.delete(
-                        url,
-                        params=query_params,
-                        headers=headers,
-                        timeout=timeout,
-                        verify=False
-                    )
-                else:
+                # 天翼云API的特殊模式：GET方法也可以携带请求体
+                if method.upper() not in ('GET', 'POST', 'PUT', 'DELETE'):
                     raise ValueError(f"不支持的HTTP方法: {method}")
+                response = self.client.transport.request(
+                    method,
+                    url,
+                    query_params=query_params,
+                    body=body if method.upper() != 'DELETE' else None,
+                    timeout=timeout,
+                    verify=False
+                )
 
-                logger.debug(f"响应状态码: {response.status_code}")
-                logger.debug(f"响应内容: {response.text}")
+                logger.debug("响应状态码: %s", response.status_code)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("响应内容: %s", response.text)
 
                 if response.status_code == 200:
                     result = response.json()
                     # 检查业务状态码
                     if result.get('statusCode') == 800:
-                        logger.debug(f"成功使用端点: {endpoint}")
-                        return {
+                        logger.debug("成功使用端点: %s", endpoint)
+                        return True, {
                             'success': True,
                             'data': result.get('returnObj', {}),
                             'endpoint': endpoint
@@ -152,18 +115,35 @@ class CDAClient:
                     else:
                         error_code = result.get('errorCode', 'UNKNOWN_ERROR')
                         error_msg = result.get('message', result.get('msgDesc', '未知错误'))
-                        logger.debug(f"端点 {endpoint} 返回业务错误: {error_code} - {error_msg}")
-                        continue
+                        logger.debug("端点 %s 返回业务错误: %s - %s", endpoint, error_code, error_msg)
+                        return None, {
+                            'success': False,
+                            'error': error_code,
+                            'message': error_msg,
+                            'endpoint': endpoint
+                        }
                 elif response.status_code == 404:
-                    logger.debug(f"端点 {endpoint} 返回404，尝试下一个端点")
-                    continue
+                    logger.debug("端点 %s 返回404，尝试下一个端点", endpoint)
+                elif response.status_code < 500:
+                    logger.debug("端点 %s 拒绝请求 (HTTP %s): %s", endpoint, response.status_code, response.text)
+                    return None, {
+                        'success': False,
+                        'error': f'HTTP_{response.status_code}',
+                        'message': f'HTTP {response.status_code}: {response.text}',
+                        'endpoint': endpoint
+                    }
                 else:
                     logger.error(f"端点 {endpoint} API调用失败 (HTTP {response.status_code}): {response.text}")
-                    continue
 
             except Exception as e:
-                logger.debug(f"端点 {endpoint} 请求异常: {str(e)}")
-                continue
+                logger.debug("端点 %s 请求异常: %s", endpoint, str(e))
+            return False, None
+
+        # 先访问上次成功的端点；首次访问只读接口时并发尝试各端点
+        ok, result = self.resolver.call(method, endpoint_path, self.endpoints, attempt)
+        if result is not None:
+            # 成功，或端点返回的业务错误
+            return result
 
         # 所有端点都失败
         return {
@@ -207,9 +187,9 @@ class CDAClient:
                 )
                 if result.get('success'):
                     return result
-                logger.debug(f"路径 {path} 返回失败: {result}")
+                logger.debug("路径 %s 返回失败: %s", path, result)
             except Exception as e:
-                logger.debug(f"路径 {path} 异常: {str(e)}")
+                logger.debug("路径 %s 异常: %s", path, str(e))
                 continue
 
         # 所有路径都失败，返回最后一个路径的结果
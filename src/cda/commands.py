@@ -16,7 +16,9 @@ from functools import wraps
 from typing import Optional, List
 from core import CTYUNAPIError
 from utils import OutputFormatter, logger
+from utils.query import query_output
 from cda import init_cda_client, get_cda_client
+from cli.paging import list_operation
 
 
 def handle_error(func):
@@ -38,6 +40,7 @@ def handle_error(func):
     return wrapper
 
 
+@query_output
 def format_output(data, output_format='table'):
     """格式化输出"""
     if output_format == 'json':
@@ -83,6 +86,7 @@ def gateway():
     pass
 
 
+@list_operation('cda.client:CDAClient.list_gateways', 'account', 'region_id', 'project_id', 'gateway_name')
 @gateway.command('list')
 @click.option('--account', required=True, help='天翼云客户邮箱（必填）')
 @click.option('--region-id', help='资源池ID（可选）')
@@ -358,6 +362,8 @@ def physical_line():
     pass
 
 
+@list_operation('cda.client:CDAClient.list_physical_lines', 'region_id', 'line_type', 'account',
+                items_key='physicalLineList')
 @physical_line.command('list')
 @click.option('--region-id', help='资源池ID')
 @click.option('--page-no', default=1, type=int, help='页码，默认为1')
@@ -507,6 +513,8 @@ def count_physical_lines(ctx, account: str, region_id: Optional[str]):
             click.echo(f"端点: {result.get('endpoint')}")
 
 
+@list_operation('cda.client:CDAClient.list_shared_physical_lines', 'region_id', 'line_type', 'line_code',
+                'account', items_key='physicalLineList')
 @physical_line.command('shared')
 @click.option('--region-id', help='资源池ID')
 @click.option('--page-no', default=1, type=int, help='页码，默认为1')
@@ -1156,6 +1164,8 @@ def account_auth():
     pass
 
 
+@list_operation('cda.client:CDAClient.list_account_authorizations', 'region_id', 'vpc_id', 'auth_account_id',
+                items_key='accountAuthList')
 @account_auth.command('list')
 @click.option('--region-id', required=True, help='资源池ID（必填）')
 @click.option('--page-no', default=1, type=int, help='页码，默认为1')
@@ -3,7 +3,7 @@
 from typing import Dict, Any, Optional
 import json
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
+from core.endpoints import EndpointResolver
 from utils import logger
 
 
@@ -16,13 +16,14 @@ class CFWClient:
     成功statusCode: "800" (字符串), error=CFW_0000
     """
 
-    # API分散发布在两个节点上，404时自动切换另一节点重试
+    # API分散发布在两个节点上，404时自动切换另一节点重试，并按路径记住可用的节点
     ENDPOINTS = ['ctcfw-global.ctapi.ctyun.cn', 'ctcfw-east-a.ctapi.ctyun.cn']
 
     def __init__(self, client: CTYUNClient):
         self.client = client
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
-        self.timeout = 30
+        self.eop_auth = client.eop_auth
+        self.timeout = client.timeout
+        self.resolver = EndpointResolver('cfw', namespace=getattr(client, 'cache_namespace', ''))
 
     def _headers(self, region_id: str) -> Dict[str, str]:
         return {'regionId': region_id, 'urlType': 'CTAPI'}
@@ -38,32 +39,27 @@ class CFWClient:
         req_headers = self._headers(region_id)
         if extra_headers:
             req_headers.update({k: str(v) for k, v in extra_headers.items() if v is not None})
-        last = None
-        for endpoint in self.ENDPOINTS:
+
+        # 返回 (是否成功, 结果)；404、5xx与请求异常时换下一个节点，其他HTTP错误不换节点
+        def attempt(endpoint: str):
             url = f'https://{endpoint}{path}'
             try:
-                headers = self.eop_auth.sign_request(
-                    method=method, url=url, query_params=qp, body=body_str,
-                    extra_headers=req_headers)
-                logger.debug(f"{method} {url} | 参数: {qp} | body: {bd}")
-                if method == 'GET':
-                    response = self.client.session.get(url, params=qp, headers=headers, timeout=self.timeout)
-                else:
-                    response = self.client.session.post(url, json=bd, headers=headers, timeout=self.timeout)
-                if response.status_code == 404:
-                    last = {'statusCode': 404,
-                            'message': f'HTTP 404: {response.text}',
-                            'returnObj': None}
-                    continue
+                logger.debug("%s %s | 参数: %s | body: %s", method, url, qp, bd)
+                response = self.client.transport.request(
+                    method, url, query_params=qp if method == 'GET' else None,
+                    body=body_str, extra_headers=req_headers, timeout=self.timeout)
                 if response.status_code != 200:
-                    return {'statusCode': response.status_code,
-                            'message': f'HTTP {response.status_code}: {response.text}',
-                            'returnObj': None}
-                return response.json()
+                    unavailable = response.status_code == 404 or response.status_code >= 500
+                    return (False if unavailable else None), {
+                        'statusCode': response.status_code,
+                        'message': f'HTTP {response.status_code}: {response.text}',
+                        'returnObj': None}
+                return True, response.json()
             except Exception as e:
                 logger.error(f"{desc}失败: {e}")
-                last = {'statusCode': 500, 'message': str(e), 'returnObj': None}
-        return last
+                return False, {'statusCode': 500, 'message': str(e), 'returnObj': None}
+
+        return self.resolver.call(method, path, self.ENDPOINTS, attempt)[1]
 
     def _get(self, path: str, region_id: str,
              query_params: Optional[Dict[str, Any]] = None,
@@ -308,7 +304,7 @@ class CFWClient:
     def _download(self, path: str, region_id: str, output: str,
                   desc: str = 'CFW下载') -> Dict[str, Any]:
         """下载文件类API（返回xlsx等二进制流）"""
-        url = f'https://{self.ENDPOINTS[0]}{path}'
+        url = f'https://{self.resolver.candidates(path, self.ENDPOINTS)[0]}{path}'
         try:
             headers = self.eop_auth.sign_request(
                 method='GET', url=url, query_params={}, body='',
@@ -2,10 +2,14 @@
 
 import json
 import click
+from utils.query import query_output
+from cli.paging import (STREAM_FORMATS, all_pages_option, echo_items, explicit_page_size, iter_all,
+                        list_operation)
 from .client import CFWClient
 
 
-def _echo(result):
+@query_output
+def _echo(result, output_format='json'):
     click.echo(json.dumps(result, ensure_ascii=False, indent=2))
 
 
@@ -15,6 +19,8 @@ def cfw():
     pass
 
 
+@list_operation(CFWClient.firewall_simple_query, 'region_id', 'firewall_id', 'firewall_name', 'firewall_type',
+                'firewall_state')
 @cfw.command('list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--firewall-id', help='防火墙ID')
@@ -52,6 +58,7 @@ def can_buy(ctx, region_id):
     _echo(client.can_buy_firewall(region_id))
 
 
+@list_operation(CFWClient.firewall_query, 'region_id', 'firewall_id', 'firewall_type')
 @cfw.command('show')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--firewall-id', required=True, help='防火墙ID')
@@ -215,6 +222,7 @@ def asset_statistics(ctx, region_id, firewall_id, firewall_type):
                                      firewall_type=firewall_type))
 
 
+@list_operation(CFWClient.assert_nat_query, 'region_id', 'nat_name', 'protect_status')
 @asset.command('nat-list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--nat-name', help='NAT名称')
@@ -279,6 +287,8 @@ def asset_vpc_statistics(ctx, region_id):
     _echo(client.assert_statistics(region_id))
 
 
+@list_operation(CFWClient.vrf_bind_query, 'region_id', 'firewall_id', 'eip', 'eip_id', 'eip_name',
+                'attached_type', 'ip_type', 'protect_status', 'subnet_id')
 @asset.command('list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--firewall-id', help='防火墙ID')
@@ -340,6 +350,9 @@ def policy():
     pass
 
 
+@list_operation(CFWClient.sec_policy_query, 'region_id', 'firewall_id', 'firewall_type', 'action',
+                'direction', 'src_ip', 'dst_ip', 'ip_proto', 'service', 'status', 'rule_name',
+                'address_group')
 @policy.command('list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--firewall-id', help='防火墙ID（与类型二选一）')
@@ -406,6 +419,8 @@ def blackwhite():
     pass
 
 
+@list_operation(CFWClient.black_white_policy_query, 'region_id', 'firewall_id', 'address_direction', 'ip',
+                'ip_proto', 'rule_id', 'rule_name', 'address_group', black_white_type='bw_type')
 @blackwhite.command('list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--firewall-id', required=True, help='防火墙ID')
@@ -462,6 +477,8 @@ def address_book():
     pass
 
 
+@list_operation(CFWClient.address_group_query, 'region_id', 'ip', 'address_type', 'address_group_name',
+                'group_id')
 @address_book.command('list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--ip', help='IP地址')
@@ -480,6 +497,7 @@ def address_book_list(ctx, region_id, ip, address_type, address_group_name,
                                      group_id=group_id, page=page, size=size))
 
 
+@list_operation(CFWClient.address_group_items, 'region_id', 'group_id')
 @address_book.command('items')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--group-id', required=True, type=int, help='地址簿ID')
@@ -507,6 +525,8 @@ def ips():
     pass
 
 
+@list_operation(CFWClient.ips_rule_query, 'region_id', 'firewall_id', 'method', 'target', 'rule_id',
+                type='query_type')
 @ips.command('rules')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--firewall-id', required=True, help='防火墙ID')
@@ -583,6 +603,8 @@ def alarm():
     pass
 
 
+@list_operation(CFWClient.alarm_query, 'region_id', 'start_time', 'finish_time', 'firewall_id',
+                'firewall_type', 'attack_ip', 'affected_ip')
 @alarm.command('list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--start-time', required=True, help='开始时间, 如 2024-10-23T08:31:25Z')
@@ -632,6 +654,8 @@ def log():
     pass
 
 
+@list_operation(CFWClient.alarm_log_list, 'region_id', 'firewall_id', 'start_time', 'finish_time',
+                'attack_direction', 'source_ip', 'target_ip')
 @log.command('flow-list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--firewall-id', required=True, help='防火墙ID')
@@ -667,6 +691,8 @@ def log_flow_trend(ctx, region_id, firewall_type, time_type, begin_time, end_tim
                                 begin_time, end_time))
 
 
+@list_operation(CFWClient.operation_log_query, 'region_id', 'firewall_id', 'begin_time', 'end_time', 'action',
+                'content')
 @log.command('operation')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--firewall-id', required=True, help='防火墙ID')
@@ -738,6 +764,7 @@ def log_deliver_time(ctx, region_id, firewall_id, save_types):
                                         save_types.split(',')))
 
 
+@list_operation(CFWClient.get_raw_log, 'region_id', 'firewall_id', 'log_type', 'start_time', 'end_time')
 @log.command('raw')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--firewall-id', required=True, help='防火墙ID')
@@ -746,12 +773,27 @@ def log_deliver_time(ctx, region_id, firewall_id, save_types):
 @click.option('--end-time', required=True, help='结束时间')
 @click.option('--page', type=int, default=1, help='页码')
 @click.option('--size', type=int, default=10, help='页大小')
+@all_pages_option
+@click.option('--output', type=click.Choice(['json'] + list(STREAM_FORMATS)), default='json',
+              help='输出格式，ndjson/csv 逐条输出日志记录')
 @click.pass_context
-def log_raw(ctx, region_id, firewall_id, log_type, start_time, end_time, page, size):
+def log_raw(ctx, region_id, firewall_id, log_type, start_time, end_time, page, size,
+            all_pages, output):
     """查询日志内容"""
     client = CFWClient(ctx.obj['client'])
-    _echo(client.get_raw_log(region_id, firewall_id, log_type,
-                             start_time, end_time, page=page, size=size))
+    if all_pages:
+        logs = iter_all(client.get_raw_log, page_size=explicit_page_size(ctx, 'size'),
+                        region_id=region_id, firewall_id=firewall_id, log_type=log_type,
+                        start_time=start_time, end_time=end_time)
+        echo_items(logs, output, _echo)
+        return
+    result = client.get_raw_log(region_id, firewall_id, log_type,
+                                start_time, end_time, page=page, size=size)
+    if output in STREAM_FORMATS:
+        from core.paginator import extract_items
+        echo_items(extract_items(result), output, _echo)
+        return
+    _echo(result)
 
 
 @log.command('count')
@@ -774,6 +816,8 @@ def report():
     pass
 
 
+@list_operation(CFWClient.report_list, 'region_id', 'firewall_id', 'start_time', 'end_time', 'report_type',
+                'selected_time')
 @report.command('list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--firewall-id', required=True, help='防火墙ID')
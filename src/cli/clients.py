@@ -0,0 +1,67 @@
+"""
+CLI客户端复用
+长驻进程（守护进程、交互式shell）中按认证参数复用 CTYUNClient，
+保留其会话、连接池和签名器
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+
+class ClientRegistry:
+    """按 profile/AK/SK/区域/端点 缓存 CTYUNClient"""
+
+    def __init__(self, response_cache_ttl: int = 0):
+        """
+        初始化客户端注册表
+
+        Args:
+            response_cache_ttl: 只读请求的内存响应缓存有效期（秒），0表示不缓存
+        """
+        self.response_cache_ttl = response_cache_ttl
+        self._clients: Dict[Tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def get(self, access_key: Optional[str] = None, secret_key: Optional[str] = None,
+            region: Optional[str] = None, endpoint: Optional[str] = None,
+            profile: str = 'default'):
+        """
+        获取（必要时创建）客户端
+
+        Returns:
+            CTYUNClient 实例
+        """
+        from core import CTYUNClient
+
+        key = (profile, access_key, secret_key, region, endpoint)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = CTYUNClient(
+                    access_key=access_key,
+                    secret_key=secret_key,
+                    region=region,
+                    endpoint=endpoint,
+                    profile=profile
+                )
+                if self.response_cache_ttl > 0:
+                    client.transport.enable_response_cache(self.response_cache_ttl)
+                self._clients[key] = client
+            return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def clear_response_caches(self) -> None:
+        """清空所有客户端的内存响应缓存"""
+        with self._lock:
+            for client in self._clients.values():
+                if client.transport.response_cache is not None:
+                    client.transport.response_cache.clear()
+
+    def clear(self) -> None:
+        """关闭并清空所有客户端（配置变化后调用）"""
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
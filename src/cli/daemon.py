@@ -0,0 +1,558 @@
+"""
+CLI守护进程
+常驻进程保持已导入的命令模块、CTYUNClient 会话（TLS连接池）、签名器与内存缓存，
+普通CLI调用通过本地Unix套接字把argv转发给守护进程执行，并流式取回输出。
+
+守护进程同一时间只执行一条命令：命令会修改进程级状态（标准输出/错误、工作目录、
+日志级别、请求跟踪与指标监听器），并发转发来的调用在 CLIDaemon._run_lock 上排队，
+一条耗时的命令（如大量结果的 --all）会让其后的调用等待。需要并行的脚本请设置
+CTYUN_NO_DAEMON=1 在本地执行，或在一条命令内用 --region-id all、--profiles 并发。
+
+命令在调用方的工作目录和 CTYUN_* 环境变量下执行。以下情况不转发，在本地执行：
+守护进程的代码版本与调用方不同（升级后未重启）、HOME/代理/CA证书等只在进程启动时
+生效的环境变量与守护进程不同、标准输入是管道或文件、命令需要交互输入（确认提示等）。
+
+协议：每行一个JSON对象。
+    请求  {"type": "run", "version": "...", "argv": [...], "cwd": "...", "env": {...},
+           "process_env": {...}, "tty": bool, "width": int}
+          {"type": "ping"} / {"type": "shutdown"}
+    响应  {"stream": "out"|"err", "data": "..."} ... {"exit": 0}
+          {"refused": "原因", "restart": bool}（不执行，调用方在本地执行）
+"""
+
+import io
+import json
+import os
+import socket
+import stat
+import sys
+import time
+from typing import Dict, List, Optional
+
+import click
+
+
+# 转发协议版本；请求或响应的格式不兼容地变化时递增
+PROTOCOL_VERSION = 2
+
+# 转发给守护进程、在命令执行期间生效的环境变量前缀
+FORWARDED_ENV_PREFIX = 'CTYUN_'
+
+# 进程启动时即已生效（配置文件位置、连接池、JSON后端等）的环境变量：
+# 与守护进程不同时不转发
+PROCESS_ENV = ('HOME', 'HTTP_PROXY', 'HTTPS_PROXY', 'NO_PROXY', 'ALL_PROXY',
+               'http_proxy', 'https_proxy', 'no_proxy', 'all_proxy',
+               'REQUESTS_CA_BUNDLE', 'CURL_CA_BUNDLE', 'SSL_CERT_FILE', 'SSL_CERT_DIR',
+               'CTYUN_JSON_BACKEND')
+
+
+# 这些子命令总是在本地执行
+_LOCAL_COMMANDS = {'daemon', 'shell'}
+
+# 根命令组中需要取值的全局选项
+_GLOBAL_VALUE_OPTIONS = {'--profile', '--access-key', '--secret-key',
+                         '--region', '--endpoint', '--output', '--query',
+                         '--trace-file', '--profile-requests-json',
+                         '--metrics-file', '--record', '--replay', '--replay-latency',
+                         '--profiles'}
+
+
+def default_socket_path() -> str:
+    """守护进程套接字路径，可通过 CTYUN_DAEMON_SOCKET 覆盖"""
+    return os.environ.get('CTYUN_DAEMON_SOCKET') or os.path.expanduser('~/.ctyun/daemon.sock')
+
+
+def _code_version() -> str:
+    """协议版本与命令行代码的指纹：升级后未重启的守护进程与新的调用方不一致"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    stamps = [str(os.stat(os.path.join(here, name)).st_mtime_ns) for name in ('main.py', 'daemon.py')]
+    return ':'.join([str(PROTOCOL_VERSION)] + stamps)
+
+
+# 导入时的代码版本；守护进程中即为它启动时加载的代码
+CODE_VERSION = _code_version()
+
+
+def _find_subcommand(argv: List[str]) -> Optional[str]:
+    """跳过全局选项，返回第一个子命令名"""
+    index = _subcommand_index(argv, _GLOBAL_VALUE_OPTIONS)
+    return argv[index] if index is not None else None
+
+
+def _subcommand_index(argv: List[str], value_options=frozenset()) -> Optional[int]:
+    """跳过选项（value_options 中的选项连同其取值），返回第一个子命令名的位置"""
+    skip_next = False
+    for i, arg in enumerate(argv):
+        if skip_next:
+            skip_next = False
+            continue
+        if arg in value_options:
+            skip_next = True
+            continue
+        if arg.startswith('-'):
+            continue
+        return i
+    return None
+
+
+def _forwarded_env() -> Dict[str, str]:
+    return {key: value for key, value in os.environ.items() if key.startswith(FORWARDED_ENV_PREFIX)}
+
+
+def _swap_env(env: Dict[str, str]) -> Dict[str, str]:
+    """
+    把进程的 CTYUN_* 环境变量换成 env
+
+    Returns:
+        原来的 CTYUN_* 环境变量（用它再次调用即可恢复）
+    """
+    saved = _forwarded_env()
+    for key in saved:
+        if key not in env:
+            del os.environ[key]
+    os.environ.update(env)
+    return saved
+
+
+def _stdin_has_input() -> bool:
+    """标准输入是否为管道或文件（命令可能读取它；终端和 /dev/null 不算）"""
+    try:
+        mode = os.fstat(sys.stdin.fileno()).st_mode
+    except (AttributeError, OSError, ValueError):
+        return False
+    return stat.S_ISFIFO(mode) or stat.S_ISREG(mode)
+
+
+def _send(sock: socket.socket, message: Dict) -> None:
+    sock.sendall((json.dumps(message, ensure_ascii=False) + '\n').encode('utf-8'))
+
+
+def _request(message: Dict, socket_path: Optional[str] = None, timeout: float = 5.0) -> Dict:
+    """发送控制请求（ping/shutdown）并返回单条响应"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path or default_socket_path())
+        _send(sock, message)
+        line = sock.makefile('r', encoding='utf-8').readline()
+    return json.loads(line) if line else {}
+
+
+def try_forward(argv: List[str], socket_path: Optional[str] = None) -> Optional[int]:
+    """
+    尝试把一次CLI调用转发给守护进程
+
+    Args:
+        argv: 命令行参数（不含程序名）
+        socket_path: 套接字路径
+
+    Returns:
+        退出码；守护进程不可用或该命令需在本地执行时返回None
+    """
+    if os.environ.get('CTYUN_NO_DAEMON') == '1' or not hasattr(socket, 'AF_UNIX'):
+        return None
+    if _find_subcommand(argv) in _LOCAL_COMMANDS or _stdin_has_input():
+        return None
+    socket_path = socket_path or default_socket_path()
+    if not os.path.exists(socket_path):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+
+    with sock:
+        _send(sock, {
+            'type': 'run',
+            'version': CODE_VERSION,
+            'argv': argv,
+            'cwd': os.getcwd(),
+            'env': _forwarded_env(),
+            'process_env': {key: os.environ.get(key) for key in PROCESS_ENV},
+            'tty': sys.stdout.isatty(),
+            'width': _terminal_width(),
+        })
+        for line in sock.makefile('r', encoding='utf-8'):
+            message = json.loads(line)
+            if 'exit' in message:
+                return message['exit']
+            if 'refused' in message:
+                # 守护进程没有执行命令，在本地执行
+                if message.get('restart'):
+                    click.echo(f"提示: {message['refused']}，本次在本地执行；"
+                               "请运行 ctyun-cli daemon stop 后重新启动守护进程", err=True)
+                return None
+            stream = sys.stderr if message.get('stream') == 'err' else sys.stdout
+            try:
+                stream.write(message.get('data', ''))
+                stream.flush()
+            except BrokenPipeError:
+                # 下游关闭了管道（如 | head）：断开连接，守护进程随即停止输出
+                from utils.streaming import discard_stdout
+                discard_stdout()
+                return 1
+
+    click.echo("错误: 与守护进程的连接意外中断", err=True)
+    return 1
+
+
+def _terminal_width() -> int:
+    import shutil
+    return shutil.get_terminal_size().columns
+
+
+class _SocketStream(io.TextIOBase):
+    """把写入的文本作为帧发送给客户端"""
+
+    def __init__(self, sock: socket.socket, name: str, tty: bool):
+        self._sock = sock
+        self._name = name
+        self._tty = tty
+
+    @property
+    def encoding(self) -> str:
+        return 'utf-8'
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    @property
+    def errors(self) -> str:
+        return 'strict'
+
+    def write(self, data: str) -> int:
+        if not isinstance(data, str):
+            raise TypeError(f"write() argument must be str, not {type(data).__name__}")
+        if data:
+            _send(self._sock, {'stream': self._name, 'data': data})
+        return len(data)
+
+
+class CLIDaemon:
+    """
+    CLI守护进程：串行执行转发来的命令，复用客户端与缓存
+
+    每个连接由单独的线程处理，但 run_command 持有全局锁，命令逐个执行，
+    后到的调用等待前一条命令结束（等待数见 status() 的 waiting）。
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, metrics_port: Optional[int] = None):
+        import threading
+        from cli.clients import ClientRegistry
+
+        self.socket_path = socket_path or default_socket_path()
+        self.metrics_port = metrics_port
+        self._metrics_server = None
+        self.registry = ClientRegistry()
+        self.started_at = time.time()
+        self.requests_served = 0
+        # 命令会修改进程级状态（标准输出/错误、工作目录、日志级别、跟踪监听器），因此逐个执行
+        self._run_lock = threading.Lock()
+        self._waiting_lock = threading.Lock()
+        self.waiting = 0
+        self._server = None
+        # 上一条命令的 CTYUN_* 环境变量；变化时重建客户端（端点覆盖等在创建客户端时读取）
+        self._env: Optional[Dict[str, str]] = None
+
+    def warm_up(self) -> None:
+        """预先导入所有命令模块"""
+        from cli.main import cli
+
+        ctx = click.Context(cli)
+        for name in cli.list_commands(ctx):
+            command = cli.get_command(ctx, name)
+            if isinstance(command, click.Group):
+                for sub_name in command.list_commands(ctx):
+                    command.get_command(ctx, sub_name)
+
+    def refusal(self, request: Dict) -> Optional[str]:
+        """
+        不能由守护进程执行该请求的原因
+
+        Returns:
+            原因；可以执行时返回None
+        """
+        if request.get('version') != CODE_VERSION:
+            return "守护进程的版本与当前命令行不一致"
+        process_env = request.get('process_env') or {}
+        differing = [key for key in PROCESS_ENV if process_env.get(key) != os.environ.get(key)]
+        if differing:
+            return f"环境变量与守护进程不同: {', '.join(differing)}"
+        if self._needs_input(list(request.get('argv') or [])):
+            return "命令需要交互输入"
+        return None
+
+    @staticmethod
+    def _needs_input(argv: List[str]) -> bool:
+        """命令是否会提示输入（确认提示等命令行中未给出取值的 prompt 选项）"""
+        from cli.main import cli
+
+        ctx = click.Context(cli)
+        command, args, value_options = cli, argv, _GLOBAL_VALUE_OPTIONS
+        while isinstance(command, click.Group):
+            index = _subcommand_index(args, value_options)
+            if index is None:
+                return False
+            command = command.get_command(ctx, args[index])
+            if command is None:
+                return False
+            args, value_options = args[index + 1:], frozenset()
+        return any(
+            isinstance(param, click.Option) and param.prompt
+            and not any(arg == opt or arg.startswith(opt + '=') for arg in args for opt in param.opts)
+            for param in command.params
+        )
+
+    def run_command(self, sock: socket.socket, request: Dict) -> int:
+        """
+        在当前进程中执行一次CLI调用
+
+        持有全局锁执行：并发的调用排队等待，不会同时执行。
+
+        Returns:
+            命令的退出码
+        """
+        import logging
+        import traceback
+        from cli.main import cli
+        from config.settings import config
+
+        with self._waiting_lock:
+            self.waiting += 1
+        with self._run_lock:
+            with self._waiting_lock:
+                self.waiting -= 1
+            if config.reload_if_changed():
+                self.registry.clear()
+
+            tty = bool(request.get('tty'))
+            out = _SocketStream(sock, 'out', tty)
+            err = _SocketStream(sock, 'err', tty)
+            saved = (sys.stdout, sys.stderr, sys.stdin, os.getcwd())
+            env = {key: str(value) for key, value in (request.get('env') or {}).items()
+                   if key.startswith(FORWARDED_ENV_PREFIX)}
+            if env != self._env:
+                if self._env is not None:
+                    self.registry.clear()
+                self._env = env
+            saved_env = _swap_env(env)
+            cli_logger = logging.getLogger('ctyun_cli')
+            saved_level = cli_logger.level
+            exit_code = 0
+            try:
+                sys.stdout, sys.stderr, sys.stdin = out, err, io.StringIO()
+                os.chdir(request.get('cwd') or saved[3])
+                cli.main(
+                    args=list(request.get('argv') or []),
+                    prog_name='ctyun-cli',
+                    obj={'client_registry': self.registry},
+                    terminal_width=request.get('width'),
+                    standalone_mode=True
+                )
+            except SystemExit as e:
+                if isinstance(e.code, int):
+                    exit_code = e.code
+                elif e.code is not None:
+                    err.write(f"{e.code}\n")
+                    exit_code = 1
+            except Exception:
+                err.write(traceback.format_exc())
+                exit_code = 1
+            finally:
+                sys.stdout, sys.stderr, sys.stdin = saved[0], saved[1], saved[2]
+                os.chdir(saved[3])
+                _swap_env(saved_env)
+                cli_logger.setLevel(saved_level)
+                self.requests_served += 1
+            return exit_code
+
+    def status(self) -> Dict:
+        """守护进程状态"""
+        return {
+            'pid': os.getpid(),
+            'uptime': round(time.time() - self.started_at, 1),
+            'requests': self.requests_served,
+            'waiting': self.waiting,
+            'clients': len(self.registry),
+            'metrics_port': self.metrics_port,
+            'version': CODE_VERSION,
+        }
+
+    def serve_forever(self) -> None:
+        """监听套接字并处理请求"""
+        import socketserver
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline()
+                if not line:
+                    return
+                request = json.loads(line.decode('utf-8'))
+                request_type = request.get('type')
+                if request_type == 'run':
+                    reason = daemon.refusal(request)
+                    if reason is not None:
+                        _send(self.connection, {'refused': reason,
+                                                'restart': request.get('version') != CODE_VERSION})
+                        return
+                    code = daemon.run_command(self.connection, request)
+                    try:
+                        _send(self.connection, {'exit': code})
+                    except OSError:
+                        # 客户端已断开（如输出管道被 head 关闭）
+                        pass
+                elif request_type == 'ping':
+                    _send(self.connection, daemon.status())
+                elif request_type == 'shutdown':
+                    _send(self.connection, {'ok': True})
+                    import threading
+                    threading.Thread(target=daemon._server.shutdown, daemon=True).start()
+
+        class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+
+        os.makedirs(os.path.dirname(self.socket_path), exist_ok=True)
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        old_umask = os.umask(0o177)
+        try:
+            self._server = Server(self.socket_path, Handler)
+        finally:
+            os.umask(old_umask)
+
+        # 指标在守护进程的整个生命周期内累计
+        if self.metrics_port:
+            from core.metrics import MetricsRegistry
+            from core.trace import tracer
+            metrics = MetricsRegistry()
+            tracer.add_listener(metrics)
+            self._metrics_server = metrics.serve(self.metrics_port)
+
+        try:
+            self._server.serve_forever()
+        finally:
+            if self._metrics_server is not None:
+                self._metrics_server.shutdown()
+                self._metrics_server.server_close()
+            self._server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            self.registry.clear()
+
+
+def _ping(socket_path: str) -> Optional[Dict]:
+    try:
+        return _request({'type': 'ping'}, socket_path)
+    except (OSError, ValueError):
+        return None
+
+
+@click.group()
+def daemon():
+    """
+    守护进程模式（复用会话与缓存，加速重复调用）
+
+    守护进程逐个执行命令，同时发出的调用排队等待；需要并行执行的脚本请设置 CTYUN_NO_DAEMON=1。
+    """
+    pass
+
+
+@daemon.command()
+@click.option('--socket', 'socket_path', default=None, help='套接字路径，默认 ~/.ctyun/daemon.sock')
+@click.option('--foreground', is_flag=True, help='在前台运行')
+@click.option('--log-file', default=None, help='后台运行时的日志文件，默认 ~/.ctyun/daemon.log')
+@click.option('--metrics-port', type=click.IntRange(1, 65535), default=None,
+              help='在本机该端口的 /metrics 上提供Prometheus格式的API调用指标')
+def start(socket_path: Optional[str], foreground: bool, log_file: Optional[str],
+          metrics_port: Optional[int]):
+    """
+    启动守护进程
+
+    启动后，普通的 ctyun-cli 调用会自动转发给守护进程执行；
+    设置环境变量 CTYUN_NO_DAEMON=1 可强制在本地执行。
+    守护进程逐个执行命令：同时发出的调用排队等待，耗时的命令会阻塞其后的调用，
+    需要并行执行时请设置 CTYUN_NO_DAEMON=1。守护进程不转发标准输入：
+    标准输入为管道或文件、或命令需要确认时在本地执行。
+    指定 --metrics-port 时，守护进程在 127.0.0.1 上提供 /metrics 供Prometheus抓取。
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        click.echo("✗ 当前平台不支持Unix套接字，无法启动守护进程", err=True)
+        sys.exit(1)
+
+    socket_path = socket_path or default_socket_path()
+    info = _ping(socket_path)
+    if info:
+        click.echo(f"守护进程已在运行 (PID {info.get('pid')})")
+        return
+
+    server = CLIDaemon(socket_path, metrics_port)
+    if foreground:
+        server.warm_up()
+        click.echo(f"✓ 守护进程已启动 (PID {os.getpid()})，套接字: {socket_path}")
+        server.serve_forever()
+        return
+
+    log_file = log_file or os.path.expanduser('~/.ctyun/daemon.log')
+    pid = os.fork()
+    if pid == 0:
+        # 子进程：脱离终端后再次fork，由孙进程提供服务
+        os.setsid()
+        if os.fork() != 0:
+            os._exit(0)
+        log_fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        null_fd = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(null_fd, 0)
+        os.dup2(log_fd, 1)
+        os.dup2(log_fd, 2)
+        try:
+            server.warm_up()
+            server.serve_forever()
+        finally:
+            os._exit(0)
+
+    os.waitpid(pid, 0)
+    deadline = time.time() + 15
+    while time.time() < deadline:
+        info = _ping(socket_path)
+        if info:
+            click.echo(f"✓ 守护进程已启动 (PID {info.get('pid')})，套接字: {socket_path}")
+            return
+        time.sleep(0.1)
+    click.echo(f"✗ 守护进程启动失败，请查看日志: {log_file}", err=True)
+    sys.exit(1)
+
+
+@daemon.command()
+@click.option('--socket', 'socket_path', default=None, help='套接字路径')
+def stop(socket_path: Optional[str]):
+    """停止守护进程"""
+    socket_path = socket_path or default_socket_path()
+    try:
+        _request({'type': 'shutdown'}, socket_path)
+        click.echo("✓ 守护进程已停止")
+    except (OSError, ValueError):
+        click.echo("守护进程未运行")
+
+
+@daemon.command()
+@click.option('--socket', 'socket_path', default=None, help='套接字路径')
+def status(socket_path: Optional[str]):
+    """查看守护进程状态"""
+    info = _ping(socket_path or default_socket_path())
+    if not info:
+        click.echo("守护进程未运行")
+        sys.exit(1)
+    click.echo(f"PID: {info.get('pid')}")
+    click.echo(f"运行时间: {info.get('uptime')}秒")
+    click.echo(f"已处理请求: {info.get('requests')}")
+    click.echo(f"排队等待的请求: {info.get('waiting', 0)}")
+    click.echo(f"缓存的客户端: {info.get('clients')}")
+    if info.get('metrics_port'):
+        click.echo(f"指标地址: http://127.0.0.1:{info['metrics_port']}/metrics")
@@ -0,0 +1,280 @@
+"""
+命令并发扇出
+把同一条列表查询按多个目标（资源池、配置文件）并发执行并合并输出：
+
+    ctyun-cli ecs list --region-id all --output ndjson
+    ctyun-cli --all-profiles ecs list --region-id 200000001852 --output csv
+
+只有用 list_operation 声明了分页方法的列表命令可以扇出（见 cli.paging）。
+各目标直接调用服务客户端的分页方法，每条记录加上目标标识（regionID、profile）后
+按目标顺序合并为一个结果流，--query 作用于合并后的记录；表格输出为合并后的通用表格。
+各目标的错误加上目标标识写到标准错误，不影响其他目标。
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import click
+
+if TYPE_CHECKING:
+    from cli.paging import ListOperation
+
+
+# --region-id 取该值时在全部资源池上执行
+ALL_REGIONS = 'all'
+
+# 合并结果时记录资源池、配置文件的字段
+REGION_KEY = 'regionID'
+PROFILE_KEY = 'profile'
+
+# 每个目标缓冲的记录数：输出跟不上时工作线程等待，内存占用有上限
+BUFFER_SIZE = 1000
+
+# 队列中表示目标结束的标记
+_DONE = object()
+
+
+class FanoutTarget(NamedTuple):
+    """扇出的一个执行目标"""
+    labels: Dict[str, str]      # 写入记录的目标标识，如 {'regionID': ...}
+    client: Any                 # 该目标使用的API客户端
+    params: Dict[str, Any]      # 该目标的命令参数
+
+    @property
+    def label(self) -> str:
+        return '/'.join(self.labels.values())
+
+
+class _Failure(NamedTuple):
+    message: str
+
+
+def _option(command: click.Command, names: Sequence[str]) -> Optional[click.Option]:
+    """命令中参数名为 names 之一的选项"""
+    for param in command.params:
+        if isinstance(param, click.Option) and param.name in names:
+            return param
+    return None
+
+
+def _option_value(args: Sequence[str], option: click.Option) -> Optional[str]:
+    """命令行中该选项最后一次给出的值"""
+    value = None
+    for i, token in enumerate(args):
+        for opt in option.opts:
+            if token == opt and i + 1 < len(args):
+                value = args[i + 1]
+            elif token.startswith(opt + '=') and opt.startswith('--'):
+                value = token[len(opt) + 1:]
+    return value
+
+
+def leaf_command(ctx: click.Context, command: click.Command,
+                 args: Sequence[str]) -> Optional[click.Command]:
+    """沿命令组找到 args 实际要执行的命令；无法确定时返回None"""
+    while isinstance(command, click.Group):
+        for i, token in enumerate(args):
+            if not token.startswith('-'):
+                break
+        else:
+            return None
+        command = command.get_command(ctx, token)
+        if command is None:
+            return None
+        args = args[i + 1:]
+    return command
+
+
+def region_fanout_requested(command: click.Command, args: Sequence[str]) -> bool:
+    """命令行中命令的 --region-id 是否为 all"""
+    option = _option(command, ('region_id',))
+    return option is not None and _option_value(args, option) == ALL_REGIONS
+
+
+def list_regions(client) -> List[Tuple[str, str]]:
+    """
+    账号可用的全部资源池（使用 ECSClient.list_regions 的参考数据缓存）
+
+    Returns:
+        [(资源池ID, 资源池名称)]，只包含开放了OpenAPI的资源池
+    """
+    from ecs.client import ECSClient
+
+    result = ECSClient(client).list_regions()
+    # 接口调用失败时 list_regions 返回模拟数据（_mock），不能用于扇出
+    if result.get('_mock'):
+        raise click.ClickException("无法获取资源池列表: 接口调用失败")
+    if result.get('statusCode') != 800:
+        raise click.ClickException(f"无法获取资源池列表: {result.get('message', '接口调用失败')}")
+    regions = []
+    for region in (result.get('returnObj') or {}).get('regionList') or []:
+        if region.get('regionID') and region.get('openapiAvailable', True) is not False:
+            regions.append((region['regionID'], region.get('regionName', '')))
+    return regions
+
+
+def _error_message(error: Exception) -> str:
+    return error.format_message() if isinstance(error, click.ClickException) else str(error)
+
+
+def _labelled(items: Iterable[Any], labels: Dict[str, str]) -> Iterator[Dict[str, Any]]:
+    """每条记录加上目标标识；标识最后合并，覆盖记录中的同名字段"""
+    for item in items:
+        if isinstance(item, dict):
+            yield {**item, **labels}
+        else:
+            yield {'value': item, **labels}
+
+
+def merge_records(targets: Sequence[FanoutTarget],
+                  fetch: Callable[[FanoutTarget], Iterable[Any]],
+                  failed: List[str], workers: int) -> Iterator[Dict[str, Any]]:
+    """
+    在多个目标上并发取得记录，按目标顺序合并
+
+    每个目标由一个工作线程逐条取得记录，写入该目标的有界队列；
+    调用方按目标顺序读取队列，先完成的目标的记录在队列中等待。
+
+    Args:
+        targets: 执行目标
+        fetch: 取得一个目标的记录的函数
+        failed: 执行失败的目标标识追加到这里
+        workers: 最大并发数
+
+    Returns:
+        加上目标标识的记录迭代器；目标的错误加上目标标识写到标准错误
+    """
+    queues = [queue.Queue(maxsize=BUFFER_SIZE) for _ in targets]
+    cancelled = threading.Event()
+
+    def put(q: queue.Queue, value: Any) -> bool:
+        # 输出提前结束（如管道被关闭）时不再等待
+        while not cancelled.is_set():
+            try:
+                q.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run(target: FanoutTarget, q: queue.Queue) -> None:
+        try:
+            for item in _labelled(fetch(target), target.labels):
+                if not put(q, item):
+                    return
+        except Exception as e:
+            put(q, _Failure(_error_message(e)))
+        put(q, _DONE)
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(workers, len(targets))),
+                                  thread_name_prefix='ctyun-fanout')
+    try:
+        for target, q in zip(targets, queues):
+            executor.submit(run, target, q)
+        for target, q in zip(targets, queues):
+            while True:
+                item = q.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, _Failure):
+                    click.echo(f"[{target.label}] 错误: {item.message}", err=True)
+                    failed.append(target.label)
+                    continue
+                yield item
+    finally:
+        cancelled.set()
+        executor.shutdown(wait=True)
+
+
+def fanout_targets(ctx: click.Context, params: Dict[str, Any], failed: List[str]) -> List[FanoutTarget]:
+    """
+    按 --profiles/--all-profiles 和 --region-id all 展开执行目标
+
+    Args:
+        ctx: 命令上下文
+        params: 命令参数
+        failed: 无法展开（创建客户端、查询资源池失败）的目标标识追加到这里
+
+    Returns:
+        执行目标：先按配置文件、再按资源池展开
+    """
+    from cli.main import create_client
+
+    root = ctx.find_root()
+    obj = root.obj
+    profiles = obj.get('profiles')
+    if profiles:
+        targets = []
+        for profile in profiles:
+            try:
+                client = create_client(root, profile)
+            except Exception as e:
+                click.echo(f"[{profile}] 错误: 初始化客户端失败 - {e}", err=True)
+                failed.append(profile)
+                continue
+            targets.append(FanoutTarget({PROFILE_KEY: profile}, client, params))
+    else:
+        targets = [FanoutTarget({}, obj['client'], params)]
+
+    if params.get('region_id') != ALL_REGIONS:
+        return targets
+    expanded = []
+    for target in targets:
+        try:
+            regions = list_regions(target.client)
+        except Exception as e:
+            label = f"[{target.label}] " if target.labels else ''
+            click.echo(f"{label}错误: {_error_message(e)}", err=True)
+            failed.append(target.label or ALL_REGIONS)
+            continue
+        for region_id, _ in regions:
+            # 资源池标识在前，配置文件标识在后
+            expanded.append(FanoutTarget({REGION_KEY: region_id, **target.labels}, target.client,
+                                         dict(target.params, region_id=region_id)))
+    return expanded
+
+
+def run_fanout(ctx: click.Context, operation: 'ListOperation', params: Dict[str, Any],
+               output_format: str, all_pages: bool = False, page_size: Optional[int] = None,
+               workers: Optional[int] = None) -> None:
+    """
+    在多个目标上并发执行列表查询并合并输出；有目标失败时以状态码1退出
+
+    Args:
+        ctx: 命令上下文
+        operation: 命令声明的分页方法
+        params: 命令参数
+        output_format: 输出格式
+        all_pages: 是否自动翻页获取全部结果
+        page_size: 命令行中显式指定的每页条数（--all）
+        workers: 最大并发数，默认为每个端点主机的最大并发请求数
+    """
+    from cli.main import format_output
+    from cli.paging import echo_items
+    from config.settings import config
+    from utils.streaming import table_columns
+
+    failed: List[str] = []
+    targets = fanout_targets(ctx, params, failed)
+    total = len(targets) + len(failed)
+    if not total:
+        raise click.ClickException("没有可用的资源池")
+
+    def fetch(target: FanoutTarget) -> Iterable[Any]:
+        return operation.records(target.client, target.params, all_pages, page_size)
+
+    merged = merge_records(targets, fetch, failed, workers or config.get_max_concurrency())
+    try:
+        items, headers, row = merged, None, None
+        if output_format == 'table':
+            items, headers, row = table_columns(items)
+        echo_items(items, output_format, format_output, headers=headers, row=row)
+    finally:
+        # 输出提前结束时通知工作线程停止
+        merged.close()
+
+    if failed:
+        click.echo(f"警告: {len(failed)}/{total} 个目标执行失败: {', '.join(failed)}", err=True)
+        ctx.exit(1)
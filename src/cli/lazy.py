@@ -0,0 +1,70 @@
+"""
+按需加载的命令组
+子命令只登记名称，调用时才导入对应的 commands 模块
+"""
+
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+import click
+from click.utils import make_default_short_help
+
+
+class LazyGroup(click.Group):
+    """
+    惰性加载子命令的命令组
+
+    lazy_subcommands 形如 ``{命令名: (模块路径, 属性名, 简短说明)}``。
+    列出帮助时直接使用登记的简短说明，只有真正调用某个子命令时才导入其模块。
+    """
+
+    def __init__(self, *args,
+                 lazy_subcommands: Optional[Dict[str, Tuple[str, str, str]]] = None,
+                 **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_subcommands:
+            command = self._load_command(cmd_name)
+        return command
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """导入并注册子命令"""
+        module_path, attr_name, _ = self.lazy_subcommands[cmd_name]
+        module = importlib.import_module(module_path)
+        command = getattr(module, attr_name)
+        if not isinstance(command, click.Command):
+            raise click.ClickException(f"{module_path}.{attr_name} 不是有效的命令")
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """输出子命令列表，未加载的子命令使用登记的简短说明"""
+        rows = []
+        for cmd_name in self.list_commands(ctx):
+            command = self.commands.get(cmd_name)
+            if command is not None:
+                if command.hidden:
+                    continue
+                rows.append((cmd_name, command))
+            else:
+                rows.append((cmd_name, self.lazy_subcommands[cmd_name][2]))
+
+        if not rows:
+            return
+
+        limit = formatter.width - 6 - max(len(name) for name, _ in rows)
+        help_rows = []
+        for cmd_name, command in rows:
+            if isinstance(command, click.Command):
+                help_rows.append((cmd_name, command.get_short_help_str(limit)))
+            else:
+                help_rows.append((cmd_name, make_default_short_help(command, limit)))
+
+        with formatter.section('Commands'):
+            formatter.write_dl(help_rows)
@@ -4,15 +4,190 @@
 
 import click
 import sys
-from typing import Optional
+from functools import wraps
+from typing import List, Optional
 
-from core import CTYUNClient, CTYUNAPIError
+from cli.lazy import LazyGroup
+from cli.paging import LIST_OUTPUT_FORMATS, STREAM_FORMATS, all_pages_option, list_operation
+from utils.query import query_output
 from config.settings import config
-from utils.helpers import OutputFormatter, logger
-# 移除循环导入，稍后动态添加
 
 
-@click.group()
+# 服务命令组按需加载：{命令名: (模块路径, 属性名, 简短说明)}
+SERVICE_COMMANDS = {
+    'billing': ('billing.commands', 'billing', '账务中心管理 - 账单查询、消费汇总、流水明细'),
+    'monitor': ('monitor.commands', 'monitor', '云监控服务管理'),
+    'iam': ('iam.commands', 'iam', '统一身份认证(IAM)管理'),
+    'ebs': ('ebs.commands', 'ebs', '云硬盘(EBS)管理'),
+    'sfs': ('sfs.commands', 'sfs', '弹性文件服务(SFS)管理'),
+    'oceanfs': ('oceanfs.commands', 'oceanfs', '海量文件服务(OceanFS)管理'),
+    'zos': ('zos.commands', 'zos', '对象存储(ZOS)管理'),
+    'aone': ('aone.commands', 'aone', '边缘安全加速平台(Aone)管理'),
+    'lts': ('lts.commands', 'lts', '云日志服务(LTS)管理'),
+    'apm': ('apm.commands', 'apm', '应用性能监控(APM)管理'),
+    'kafka': ('kafka.commands', 'kafka', '分布式消息服务Kafka管理'),
+    'css': ('css.commands', 'css', '云搜索服务(CSS)管理'),
+    'emr': ('emr.commands', 'emr', '翼MapReduce(EMR)管理'),
+    'cloudpc': ('cloudpc.commands', 'cloudpc', '云电脑(CloudPC)管理'),
+    'aiserver': ('aiserver.commands', 'aiserver', '模型推理服务(AIServer)管理'),
+    'redis': ('rdscmd.commands', 'redis_group', 'Redis分布式缓存服务管理'),
+    'cce': ('cce.commands', 'cce', '容器引擎(CCE)服务管理'),
+    'cda': ('cda.commands', 'cda', '云专线CDA服务管理'),
+    'vpc': ('vpc.commands', 'vpc', 'VPC(虚拟私有云)管理'),
+    'elb': ('elb.commands', 'elb', '弹性负载均衡(ELB) - 负载均衡器、目标组、监听器管理'),
+    'dps': ('dps.commands', 'dps', '物理机(DPS)管理'),
+    'ctmysql': ('ctmysql.commands', 'ctmysql', '关系数据库MySQL版(RDS)管理'),
+    'security': ('security.commands', 'security', '服务器安全卫士管理'),
+    'csscn': ('csscn.commands', 'csscn', '服务器安全卫士(原生版)管理'),
+    'audit': ('audit.commands', 'audit', '云审计服务'),
+    'ims': ('ims.commands', 'ims', '镜像管理服务'),
+    'ec': ('ec.commands', 'ec', '云间高速(EC)管理'),
+    'mse': ('mse.commands', 'mse', '微服务引擎(MSE)管理'),
+    'cfw': ('cfw.commands', 'cfw', '云防火墙（原生版）管理'),
+    'daemon': ('cli.daemon', 'daemon', '守护进程模式（复用会话与缓存，加速重复调用）'),
+    'shell': ('cli.shell', 'shell', '交互式shell（复用客户端、会话与缓存，适合连续执行大量命令）'),
+}
+
+# ecs/commands.py 中注册到 ecs 命令组的命令，同样按需加载
+ECS_COMMANDS = {
+    'update-label': ('ecs.commands', 'update_ecs_label', '编辑云主机标签（增加/修改/删除）'),
+    'query-dedicated-host-uuid': ('ecs.commands', 'query_dedicated_host_uuid', '根据masterOrderID查询宿主机ID'),
+    'query-order-uuid': ('ecs.commands', 'query_order_uuid', '根据订单号查询资源uuid（通用，返回资源类型和uuid）'),
+    'cpu-history': ('ecs.commands', 'cpu_history', '查询指定时间段内的CPU监控数据'),
+    'mem-history': ('ecs.commands', 'mem_history', '查询指定时间段内的内存监控数据'),
+    'network-history': ('ecs.commands', 'network_history', '查询指定时间段内的网卡监控数据'),
+    'disk-history': ('ecs.commands', 'disk_history', '查询指定时间段内的磁盘监控数据'),
+    'cpu-latest': ('ecs.commands', 'cpu_latest', '查询云主机的CPU实时监控数据'),
+    'mem-latest': ('ecs.commands', 'mem_latest', '查询云主机的内存实时监控数据'),
+    'network-latest': ('ecs.commands', 'network_latest', '查询云主机的网卡实时监控数据'),
+    'disk-latest': ('ecs.commands', 'disk_latest', '查询云主机的磁盘实时监控数据'),
+    'get-region-summary': ('ecs.commands', 'get_region_summary', '查询资源池概况信息'),
+    'get-region-products': ('ecs.commands', 'get_region_products', '查询资源池产品信息'),
+    'check-region-demand': ('ecs.commands', 'check_region_demand', '查询资源池产品可售状态'),
+    'get-commands': ('ecs.commands', 'get_commands', '查询云助手命令列表'),
+    'get-command': ('ecs.commands', 'get_command', '查询云助手命令详情'),
+    'get-ca-agent': ('ecs.commands', 'get_ca_agent', '查询实例是否安装了云助手agent'),
+    'describe-send-file-results': ('ecs.commands', 'describe_send_file_results', '查询文件上传结果'),
+    'list-dedicated-hosts': ('ecs.commands', 'list_dedicated_hosts', '查询一台或多台宿主机的详细信息'),
+    'check-dedicated-host-demand': ('ecs.commands', 'check_dedicated_host_demand', '查询宿主机规格售罄情况'),
+    'list-dedicated-host-flavors': ('ecs.commands', 'list_dedicated_host_flavors', '查询宿主机支持的云主机规格列表'),
+    'list-ports': ('ecs.commands', 'list_ports', '查询网卡列表'),
+    'show-port': ('ecs.commands', 'show_port', '查询网卡详细信息'),
+    'dedicated-host-label': ('ecs.commands', 'dedicated_host_label', '更新专有宿主机的标签信息'),
+    'query-security-groups': ('ecs.commands', 'query_security_groups', '查询用户安全组列表'),
+    'describe-security-group': ('ecs.commands', 'describe_security_group', '查询用户安全组详情（含规则列表）'),
+    'list-flavor-family-instances': ('ecs.commands', 'list_flavor_family_instances', '查询指定规格族下的云主机信息'),
+    'list-dedicated-host-specs': ('ecs.commands', 'list_dedicated_host_specs', '查询专有宿主机规格信息'),
+    'describe-metadata': ('ecs.commands', 'describe_metadata', '查询云主机元数据'),
+    'describe-invocation-results': ('ecs.commands', 'describe_invocation_results', '查询云助手命令执行结果'),
+    'get-availability-zones-details': ('ecs.commands', 'get_availability_zones_details', '查询账户资源池中可用区信息'),
+    'console': ('ecs.commands', 'console', '获取云服务器实例控制台URL（VNC）'),
+}
+
+# --region-id 取该值时在全部资源池上执行（与 cli.fanout.ALL_REGIONS 一致，避免启动时导入）
+ALL_REGIONS = 'all'
+
+# 不需要 API 客户端的命令跳过初始化
+_NO_CLIENT_CMDS = {'configure', 'show-config', 'list-profiles', 'clear-cache', 'cache', 'daemon', 'shell'}
+
+# --memoize 时只读请求结果的有效期（秒），覆盖一次命令的执行时间
+MEMOIZE_TTL = 3600
+
+
+@query_output
+def format_output(data, output_format='table'):
+    """格式化输出（调用时才导入 ecs.commands）"""
+    from ecs.commands import format_output as _format_output
+    _format_output.__wrapped__(data, output_format)
+
+
+def handle_error(func):
+    """错误处理装饰器（调用时才导入 ecs.commands）"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        from ecs.commands import handle_error as _handle_error
+        return _handle_error(func)(*args, **kwargs)
+    return wrapper
+
+
+class RootGroup(LazyGroup):
+    """根命令组：守护进程运行时把命令转发给它执行"""
+
+    def main(self, args=None, prog_name=None, **extra):
+        # 只转发来自真实命令行的调用，守护进程内部执行时会显式传入args
+        if args is None:
+            from cli.daemon import try_forward
+            exit_code = try_forward(sys.argv[1:])
+            if exit_code is not None:
+                sys.exit(exit_code)
+        return super().main(args, prog_name, **extra)
+
+    def resolve_command(self, ctx, args):
+        cmd_name, command, args = super().resolve_command(ctx, args)
+        if command is None or cmd_name in _NO_CLIENT_CMDS:
+            return cmd_name, command, args
+        profiles = _fanout_profiles(ctx.params)
+        region_all = any(token == ALL_REGIONS or token.endswith('=' + ALL_REGIONS) for token in args)
+        if (profiles is not None or region_all) and '--help' not in args:
+            # --profiles / --all-profiles、--region-id all：只有声明了分页方法的列表命令
+            # 可以在多个目标上并发执行（见 cli.fanout）
+            from cli.fanout import leaf_command, region_fanout_requested
+            leaf = leaf_command(ctx, command, args)
+            listing = getattr(leaf, 'list_operation', None) is not None
+            if profiles is not None and leaf is not None and not listing:
+                raise click.UsageError("--profiles/--all-profiles 只能用于列表查询命令")
+            if region_all and leaf is not None and not listing and region_fanout_requested(leaf, args):
+                raise click.UsageError("--region-id all 只能用于列表查询命令")
+            ctx.ensure_object(dict)['profiles'] = profiles
+        return cmd_name, command, args
+
+
+def _fanout_profiles(params: dict) -> Optional[List[str]]:
+    """--profiles / --all-profiles 指定的配置文件列表；未指定时返回None"""
+    if params.get('all_profiles'):
+        # 只包含配置了AK/SK的配置文件（排除 logging 等其他配置节）
+        profiles = [name for name in config.list_profiles() if config.validate_credentials(name)]
+        if not profiles:
+            raise click.UsageError("没有配置了认证信息的配置文件")
+        return profiles
+    if not params.get('profiles'):
+        return None
+    profiles = list(dict.fromkeys(name.strip() for name in params['profiles'].split(',') if name.strip()))
+    unknown = [name for name in profiles if name not in config.list_profiles()]
+    if unknown:
+        raise click.BadParameter(f"配置文件不存在: {', '.join(unknown)}", param_hint="'--profiles'")
+    return profiles
+
+
+def create_client(ctx: click.Context, profile: str):
+    """
+    按根命令的全局选项为配置文件创建API客户端
+
+    Args:
+        ctx: 根命令上下文
+        profile: 配置文件名称
+
+    Returns:
+        CTYUNClient；长驻进程（守护进程等）中从客户端注册表取得，复用已有会话
+    """
+    params = ctx.params
+    kwargs = dict(access_key=params.get('access_key'), secret_key=params.get('secret_key'),
+                  region=params.get('region'), endpoint=params.get('endpoint'), profile=profile)
+    registry = ctx.obj.get('client_registry')
+    if registry is not None:
+        client = registry.get(**kwargs)
+    else:
+        from core import CTYUNClient
+        client = CTYUNClient(**kwargs)
+
+    # 只在本次命令内缓存只读请求的结果；守护进程中命令结束后关闭
+    if params.get('memoize') and client.transport.response_cache is None:
+        client.transport.enable_response_cache(ttl=MEMOIZE_TTL)
+        ctx.call_on_close(client.transport.disable_response_cache)
+    return client
+
+
+@click.group(cls=RootGroup, lazy_subcommands=SERVICE_COMMANDS)
 @click.option('--profile', default='default', help='配置文件名称')
 @click.option('--access-key', help='访问密钥')
 @click.option('--secret-key', help='密钥')
@@ -20,10 +195,31 @@ from utils.helpers import OutputFormatter, logger
 @click.option('--endpoint', help='API端点')
 @click.option('--output', type=click.Choice(['table', 'json', 'yaml']),
               default=None, help='输出格式')
+@click.option('--query', help='对输出结果执行查询（JMESPath子集），如 "[*].{id: instanceID}"')
 @click.option('--debug', is_flag=True, help='启用调试模式')
+@click.option('--trace', is_flag=True, help='为每个API请求输出一行JSON跟踪记录（写到标准错误）')
+@click.option('--trace-file', type=click.Path(dir_okay=False), help='跟踪记录追加写入的文件（隐含 --trace）')
+@click.option('--profile-requests', is_flag=True, help='命令结束时按端点输出请求耗时统计（写到标准错误）')
+@click.option('--profile-requests-json', type=click.Path(dir_okay=False),
+              help='把请求耗时统计写为JSON文件（隐含 --profile-requests）')
+@click.option('--metrics-file', type=click.Path(dir_okay=False),
+              help='把API调用指标累加写入Prometheus textfile collector文件')
+@click.option('--memoize', is_flag=True, help='在本次命令内复用相同只读请求的结果（写操作后自动失效）')
+@click.option('--record', 'record_dir', type=click.Path(file_okay=False),
+              help='把本次命令的API请求与响应录制到目录中的归档')
+@click.option('--replay', 'replay_dir', type=click.Path(file_okay=False),
+              help='从录制的归档回放API响应，不访问网络')
+@click.option('--replay-latency', help='回放时模拟的延迟：毫秒数，或 recorded 按录制时的耗时')
+@click.option('--profiles', help='在多个配置文件（账号）上并发执行命令，逗号分隔，如 prod,test')
+@click.option('--all-profiles', is_flag=True, help='在所有配置了认证信息的配置文件上并发执行命令')
 @click.pass_context
 def cli(ctx, profile: str, access_key: Optional[str], secret_key: Optional[str],
-        region: Optional[str], endpoint: Optional[str], output: Optional[str], debug: bool):
+        region: Optional[str], endpoint: Optional[str], output: Optional[str],
+        query: Optional[str], debug: bool, trace: bool, trace_file: Optional[str],
+        profile_requests: bool, profile_requests_json: Optional[str],
+        metrics_file: Optional[str], memoize: bool, record_dir: Optional[str],
+        replay_dir: Optional[str], replay_latency: Optional[str], profiles: Optional[str],
+        all_profiles: bool):
     """
     天翼云CLI工具 - 基于终端的云资源管理平台
     """
@@ -36,6 +232,18 @@ def cli(ctx, profile: str, access_key: Optional[str], secret_key: Optional[str],
         logging.getLogger('ctyun_cli').setLevel(logging.DEBUG)
         click.echo("调试模式已启用", err=True)
 
+    # 请求跟踪：命令结束时注销，避免在守护进程、shell中影响后续命令
+    if trace or trace_file:
+        from core.trace import trace_to
+        ctx.call_on_close(trace_to(trace_file))
+    if profile_requests or profile_requests_json:
+        from core.profiler import profile_requests as start_profiling
+        ctx.call_on_close(start_profiling(profile_requests_json))
+    metrics_file = metrics_file or config.get_metrics_file()
+    if metrics_file:
+        from core.metrics import record_metrics
+        ctx.call_on_close(record_metrics(metrics_file))
+
     # 存储全局配置
     ctx.obj['profile'] = profile
     ctx.obj['access_key'] = access_key
@@ -44,23 +252,59 @@ def cli(ctx, profile: str, access_key: Optional[str], secret_key: Optional[str],
     ctx.obj['endpoint'] = endpoint
     ctx.obj['output'] = output or config.get_output_format()
 
-    # 不需要 API 客户端的命令跳过初始化
-    _NO_CLIENT_CMDS = {'configure', 'show-config', 'list-profiles', 'clear-cache'}
-    if ctx.invoked_subcommand is not None and ctx.invoked_subcommand not in _NO_CLIENT_CMDS:
+    if record_dir and replay_dir:
+        raise click.UsageError("--record 与 --replay 不能同时使用")
+    fanout = bool(profiles or all_profiles)
+    if fanout and (access_key or secret_key or record_dir or replay_dir):
+        raise click.UsageError("--profiles/--all-profiles 不能与 --access-key、--secret-key、--record、--replay 同时使用")
+    if replay_latency is not None:
+        from core.replay import parse_latency
         try:
-            # 创建API客户端
-            client = CTYUNClient(
-                access_key=access_key,
-                secret_key=secret_key,
-                region=region,
-                endpoint=endpoint,
-                profile=profile
-            )
+            replay_latency = parse_latency(replay_latency)
+        except ValueError:
+            raise click.BadParameter("应为毫秒数或 recorded", param_hint="'--replay-latency'")
+
+    # 查询表达式只编译一次，输出时逐条应用
+    ctx.obj['query'] = None
+    if query:
+        from utils.query import Query, QueryError
+        try:
+            ctx.obj['query'] = Query(query)
+        except QueryError as e:
+            raise click.BadParameter(str(e), param_hint="'--query'")
+
+    # 不需要 API 客户端的命令跳过初始化；多配置文件执行时由 cli.fanout 为每个配置文件创建
+    if (ctx.invoked_subcommand is not None and ctx.invoked_subcommand not in _NO_CLIENT_CMDS
+            and not fanout):
+        try:
+            client = create_client(ctx, profile)
             ctx.obj['client'] = client
         except Exception as e:
             click.echo(f"错误: 初始化客户端失败 - {e}", err=True)
             sys.exit(1)
 
+        # 录制/回放只作用于本次命令；守护进程中命令结束后恢复正常访问
+        if record_dir or replay_dir:
+            from core.replay import record_traffic, replay_traffic
+            try:
+                if record_dir:
+                    ctx.call_on_close(record_traffic(client.transport, record_dir))
+                else:
+                    ctx.call_on_close(replay_traffic(client.transport, replay_dir, replay_latency))
+            except OSError as e:
+                click.echo(f"错误: 无法打开流量归档 - {e}", err=True)
+                sys.exit(1)
+
+
+@cli.result_callback()
+@click.pass_context
+def check_query_applied(ctx, result, **kwargs):
+    """命令自行输出、没有取用 --query 时提示查询没有生效"""
+    obj = ctx.obj if isinstance(ctx.obj, dict) else {}
+    if obj.get('query') is not None and not obj.get('query_applied'):
+        click.echo("警告: 该命令的输出未应用 --query，请使用 --output json", err=True)
+    return result
+
 
 @cli.command()
 @click.option('--access-key', required=True, help='访问密钥')
@@ -135,6 +379,8 @@ def test(ctx):
     """
     测试API连接
     """
+    from core import CTYUNAPIError
+
     try:
         client = ctx.obj['client']
         # 这里可以调用一个简单的API来测试连接
@@ -154,7 +400,7 @@ def test(ctx):
         sys.exit(1)
 
 
-@cli.group()
+@cli.group(cls=LazyGroup, lazy_subcommands=ECS_COMMANDS)
 def ecs():
     """
     云服务器(ECS)管理
@@ -162,7 +408,41 @@ def ecs():
     pass
 
 
-@ecs.command()
+# 云主机列表的表头
+INSTANCE_HEADERS = ['实例ID', '实例名称', '状态', 'IP地址', '规格', '镜像', '到期时间']
+
+
+def _instance_row(instance):
+    """云主机列表中的一行"""
+    # 获取IP地址
+    private_ip = instance.get('privateIP', '')
+    floating_ip = instance.get('floatingIP', '')
+    ip_display = private_ip
+    if floating_ip:
+        ip_display += f"\n({floating_ip})"
+
+    # 获取规格信息
+    flavor = instance.get('flavor', {})
+    flavor_str = f"{flavor.get('flavorName', '')}\n{flavor.get('flavorCPU', '')}C{flavor.get('flavorRAM', 0)//1024}G"
+
+    # 获取镜像信息
+    image = instance.get('image', {})
+    image_name = image.get('imageName', '')
+
+    return [
+        instance.get('instanceID', ''),  # 保留完整的实例ID，不截断
+        instance.get('displayName', instance.get('instanceName', '')),
+        instance.get('instanceStatus', ''),
+        ip_display,
+        flavor_str,
+        image_name[:20] + '...' if len(image_name) > 20 else image_name,
+        instance.get('expiredTime', '-') if instance.get('expiredTime') else '按量付费'
+    ]
+
+
+@list_operation('ecs.client:ECSClient.list_instances', 'region_id', 'az_name', 'state', 'keyword',
+                'instance_name', 'vpc_id')
+@ecs.command('list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page', default=1, type=int, help='页码')
 @click.option('--page-size', default=10, type=int, help='每页数量（最大50）')
@@ -172,12 +452,40 @@ def ecs():
 @click.option('--keyword', help='关键字模糊查询')
 @click.option('--instance-name', help='云主机名称（精确匹配）')
 @click.option('--vpc-id', help='VPC ID')
-@click.option('--output', type=click.Choice(['table', 'json', 'yaml']), help='输出格式')
+@all_pages_option
+@click.option('--output', type=click.Choice(LIST_OUTPUT_FORMATS), help='输出格式')
 @click.pass_context
-def list(ctx, region_id: str, page: int, page_size: int, az_name: Optional[str], 
-         state: Optional[str], keyword: Optional[str], instance_name: Optional[str],
-         vpc_id: Optional[str], output: Optional[str]):
+def list_instances(ctx, region_id: str, page: int, page_size: int, az_name: Optional[str],
+                   state: Optional[str], keyword: Optional[str], instance_name: Optional[str],
+                   vpc_id: Optional[str], all_pages: bool, output: Optional[str]):
     """列出云主机实例"""
+    if all_pages:
+        try:
+            from ecs.client import ECSClient
+            from cli.paging import echo_items, explicit_page_size, iter_all
+
+            instances = iter_all(
+                ECSClient(ctx.obj['client']).list_instances,
+                page_size=explicit_page_size(ctx),
+                region_id=region_id, az_name=az_name, state=state, keyword=keyword,
+                instance_name=instance_name, vpc_id=vpc_id
+            )
+            output_format = output or 'table'
+            if output_format == 'table':
+                click.echo("云主机列表")
+                click.echo()
+            count = echo_items(instances, output_format, format_output, INSTANCE_HEADERS, _instance_row)
+            if output_format == 'table':
+                click.echo(f"\n总计: {count} 台" if count else "没有找到云主机实例")
+        except (click.ClickException, click.exceptions.Exit, click.Abort, BrokenPipeError):
+            # 管道被关闭时由 click 静默退出
+            raise
+        except Exception as e:
+            # 翻页中途出错：已输出的结果保留，以非零状态退出
+            click.echo(f"运行出错: {e}", err=True)
+            ctx.exit(1)
+        return
+
     try:
         from ecs.client import ECSClient
         
@@ -205,38 +513,14 @@ def list(ctx, region_id: str, page: int, page_size: int, az_name: Optional[str],
         
         if output and output in ['json', 'yaml']:
             format_output(instances, output)
+        elif output in STREAM_FORMATS:
+            echo_items(instances, output, format_output, INSTANCE_HEADERS, _instance_row)
         else:
             if instances:
                 from tabulate import tabulate
                 
-                table_data = []
-                headers = ['实例ID', '实例名称', '状态', 'IP地址', '规格', '镜像', '到期时间']
-                
-                for instance in instances:
-                    # 获取IP地址
-                    private_ip = instance.get('privateIP', '')
-                    floating_ip = instance.get('floatingIP', '')
-                    ip_display = private_ip
-                    if floating_ip:
-                        ip_display += f"\n({floating_ip})"
-                    
-                    # 获取规格信息
-                    flavor = instance.get('flavor', {})
-                    flavor_str = f"{flavor.get('flavorName', '')}\n{flavor.get('flavorCPU', '')}C{flavor.get('flavorRAM', 0)//1024}G"
-                    
-                    # 获取镜像信息
-                    image = instance.get('image', {})
-                    image_name = image.get('imageName', '')
-                    
-                    table_data.append([
-                        instance.get('instanceID', ''),  # 保留完整的实例ID，不截断
-                        instance.get('displayName', instance.get('instanceName', '')),
-                        instance.get('instanceStatus', ''),
-                        ip_display,
-                        flavor_str,
-                        image_name[:20] + '...' if len(image_name) > 20 else image_name,
-                        instance.get('expiredTime', '-') if instance.get('expiredTime') else '按量付费'
-                    ])
+                table_data = [_instance_row(instance) for instance in instances]
+                headers = INSTANCE_HEADERS
                 
                 total_count = return_obj.get('totalCount', 0)
                 current_count = return_obj.get('currentCount', len(instances))
@@ -394,6 +678,8 @@ def detail(ctx, instance_id: str, region_id: str, output: Optional[str]):
         traceback.print_exc()
 
 
+@list_operation('ecs.client:ECSClient.describe_instances', 'region_id', 'instance_id_list', 'instance_name',
+                'state', 'keyword', page_size=100)
 @ecs.command()
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--instance-id-list', help='实例ID列表，多个ID用逗号分隔')
@@ -802,6 +1088,7 @@ def query_uuid(ctx, region_id: str, master_order_id: str, output: Optional[str])
         output_format = output or ctx.obj.get('output', 'table')
 
         if output_format == 'json':
+            from utils.helpers import OutputFormatter
             click.echo(OutputFormatter.format_json(result))
         elif output_format == 'yaml':
             try:
@@ -967,6 +1254,7 @@ def query_price(ctx, region_id: str, resource_type: str, count: int, on_demand:
         output_format = output or ctx.obj.get('output', 'table')
 
         if output_format == 'json':
+            from utils.helpers import OutputFormatter
             click.echo(OutputFormatter.format_json(result))
         elif output_format == 'yaml':
             try:
@@ -1047,6 +1335,7 @@ def renew_price(ctx, region_id: str, resource_type: str, resource_uuid: str,
         output_format = output or ctx.obj.get('output', 'table')
 
         if output_format == 'json':
+            from utils.helpers import OutputFormatter
             click.echo(OutputFormatter.format_json(result))
         elif output_format == 'yaml':
             try:
@@ -1096,23 +1385,97 @@ def clear_cache():
         from utils.cache import get_cache
         cache = get_cache()
         count = cache.clear()
-        click.echo(f"✓ 已清空 {count} 个缓存文件")
+        click.echo(f"✓ 已清空 {count} 个缓存条目")
     except Exception as e:
         click.echo(f"✗ 清空缓存失败: {e}", err=True)
 
-    # 应用过滤条件
-    filtered_instances = mock_instances
-    if status:
-        filtered_instances = [inst for inst in filtered_instances if inst['status'] == status]
-    if instance_type:
-        filtered_instances = [inst for inst in filtered_instances if inst['instanceType'] == instance_type]
 
-    # 应用分页
-    start_idx = (page - 1) * page_size
-    end_idx = start_idx + page_size
-    paginated_instances = filtered_instances[start_idx:end_idx]
+def _format_bytes(size: int) -> str:
+    """把字节数格式化为易读的字符串"""
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == 'B' else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+@cli.group()
+def cache():
+    """本地缓存管理"""
+    pass
+
 
-    format_output(paginated_instances, ctx.obj['output'])
+@cache.command('stats')
+@click.option('--dump', 'dump_file', type=click.Path(dir_okay=False),
+              help='把统计信息以JSON格式写入指定文件（供监控采集）')
+@click.option('--reset', is_flag=True, help='输出后清零命中/未命中等计数器')
+@click.pass_context
+def cache_stats(ctx, dump_file: Optional[str], reset: bool):
+    """查看本地缓存统计信息（按配置文件/账号/区域分别统计）"""
+    import datetime
+    import json
+    import os
+    from utils.cache import get_cache
+
+    cache_store = get_cache()
+    stats = cache_store.stats()
+    if reset:
+        cache_store.reset_stats()
+
+    if dump_file:
+        tmp_file = f"{dump_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(stats, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, dump_file)
+        click.echo(f"✓ 统计信息已写入 {dump_file}")
+        return
+
+    if ctx.obj.get('output') in ('json', 'yaml'):
+        format_output(stats, ctx.obj['output'])
+        return
+
+    def _time(ts):
+        return datetime.datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S') if ts else '-'
+
+    hit_rate = f"{stats['hit_rate'] * 100:.1f}%" if stats['hit_rate'] is not None else '-'
+    click.echo(f"缓存数据库: {stats['path']}")
+    click.echo(f"缓存条目: {stats['entries']}（已过期 {stats['expired_entries']}）")
+    click.echo(f"数据大小: {_format_bytes(stats['data_bytes'])} / 上限 {_format_bytes(stats['max_bytes'])}")
+    click.echo(f"文件大小: {_format_bytes(stats['file_bytes'])}")
+    click.echo(f"命中/未命中: {stats['hits']}/{stats['misses']}（命中率 {hit_rate}）")
+    click.echo(f"写入: {stats['writes']}  淘汰: {stats['evictions']}  过期: {stats['expired']}")
+    click.echo(f"最早写入: {_time(stats['oldest'])}")
+    click.echo(f"最近写入: {_time(stats['newest'])}")
+
+    if stats['namespaces']:
+        from utils.helpers import OutputFormatter
+        rows = [{
+            '命名空间(配置/密钥指纹/区域)': ns['namespace'] or '(未分区)',
+            '条目': ns['entries'],
+            '大小': _format_bytes(ns['data_bytes']),
+            '命中': ns['hits'],
+            '未命中': ns['misses'],
+            '淘汰': ns['evictions'],
+        } for ns in stats['namespaces']]
+        click.echo()
+        click.echo(OutputFormatter.format_table(rows))
+
+
+@cache.command('clear')
+@click.option('--namespace', help='只清空指定命名空间（见 cache stats）')
+def cache_clear(namespace: Optional[str]):
+    """清空缓存"""
+    from utils.cache import get_cache
+    count = get_cache().clear(namespace)
+    click.echo(f"✓ 已清空 {count} 个缓存条目")
+
+
+@cache.command('clean')
+def cache_clean():
+    """清理已过期的缓存"""
+    from utils.cache import get_cache
+    count = get_cache().clean_expired()
+    click.echo(f"✓ 已清理 {count} 个过期缓存条目")
 
 
 @cli.group()
@@ -1131,151 +1494,6 @@ def network():
     pass
 
 
-@cli.group()
-def monitor():
-    """
-    监控查询
-    """
-    pass
-
-
-from billing.commands import billing
-cli.add_command(billing)
-
-from monitor.commands import monitor
-cli.add_command(monitor)
-
-from iam.commands import iam
-cli.add_command(iam)
-
-from ebs.commands import ebs
-cli.add_command(ebs)
-
-from sfs.commands import sfs
-cli.add_command(sfs)
-
-from oceanfs.commands import oceanfs
-cli.add_command(oceanfs)
-
-from zos.commands import zos
-cli.add_command(zos)
-
-from aone.commands import aone
-cli.add_command(aone)
-
-from lts.commands import lts
-cli.add_command(lts)
-
-from apm.commands import apm
-cli.add_command(apm)
-
-from kafka.commands import kafka
-cli.add_command(kafka)
-
-from css.commands import css
-cli.add_command(css)
-
-from emr.commands import emr
-cli.add_command(emr)
-
-from cloudpc.commands import cloudpc
-cli.add_command(cloudpc)
-
-from aiserver.commands import aiserver
-cli.add_command(aiserver)
-
-from rdscmd.commands import redis_group
-cli.add_command(redis_group)
-
-from cce.commands import cce
-cli.add_command(cce)
-
-from cda.commands import cda
-cli.add_command(cda)
-
-from vpc.commands import vpc
-cli.add_command(vpc)
-
-from elb.commands import elb
-cli.add_command(elb)
-
-from dps.commands import dps
-cli.add_command(dps)
-
-from ctmysql.commands import ctmysql
-cli.add_command(ctmysql)
-
-from security.commands import security
-cli.add_command(security)
-
-from csscn.commands import csscn
-cli.add_command(csscn)
-
-from audit.commands import audit
-cli.add_command(audit)
-
-from ims.commands import ims
-cli.add_command(ims)
-
-from ec.commands import ec
-cli.add_command(ec)
-
-from mse.commands import mse
-cli.add_command(mse)
-
-from cfw.commands import cfw
-cli.add_command(cfw)
-
-# 将 ecs/commands.py 中定义的命令注册到当前 ecs group
-from ecs.commands import (format_output, handle_error, update_ecs_label, query_dedicated_host_uuid, query_order_uuid,
-                           cpu_history, mem_history, network_history, disk_history,
-                           cpu_latest, mem_latest, network_latest, disk_latest,
-                           get_region_summary, get_region_products, check_region_demand,
-                           get_commands, get_command, get_ca_agent,
-                           describe_send_file_results,
-                           list_dedicated_hosts, check_dedicated_host_demand,
-                           list_dedicated_host_flavors,
-                           list_ports, show_port,
-                           dedicated_host_label,
-                           query_security_groups, describe_security_group,
-                           list_flavor_family_instances, list_dedicated_host_specs,
-                           describe_metadata, describe_invocation_results,
-                           get_availability_zones_details,
-                           console)
-ecs.add_command(update_ecs_label)
-ecs.add_command(query_dedicated_host_uuid)
-ecs.add_command(query_order_uuid)
-ecs.add_command(cpu_history)
-ecs.add_command(mem_history)
-ecs.add_command(network_history)
-ecs.add_command(disk_history)
-ecs.add_command(cpu_latest)
-ecs.add_command(mem_latest)
-ecs.add_command(network_latest)
-ecs.add_command(disk_latest)
-ecs.add_command(get_region_summary)
-ecs.add_command(get_region_products)
-ecs.add_command(check_region_demand)
-ecs.add_command(get_commands)
-ecs.add_command(get_command)
-ecs.add_command(get_ca_agent)
-ecs.add_command(describe_send_file_results)
-ecs.add_command(list_dedicated_hosts)
-ecs.add_command(check_dedicated_host_demand)
-ecs.add_command(list_dedicated_host_flavors)
-ecs.add_command(list_ports)
-ecs.add_command(show_port)
-ecs.add_command(dedicated_host_label)
-ecs.add_command(query_security_groups)
-ecs.add_command(describe_security_group)
-ecs.add_command(list_flavor_family_instances)
-ecs.add_command(list_dedicated_host_specs)
-ecs.add_command(describe_metadata)
-ecs.add_command(describe_invocation_results)
-ecs.add_command(get_availability_zones_details)
-ecs.add_command(console)
-
-
 # ==================== ECS 询价命令（新 URI） ====================
 
 @ecs.command('new-order-price')
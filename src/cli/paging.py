@@ -0,0 +1,391 @@
+"""
+命令行分页辅助
+为列表命令提供统一的 --all 选项：自动翻页，并逐条流式输出结果
+
+列表命令可以用 all_pages_option 自行实现 --all（直接调用分页器，可使用定制的表格）；
+其余列表命令用 list_operation 声明对应的服务客户端分页方法及参数映射，
+由声明加上 --all 和 ndjson/csv 输出，直接调用分页器取得全部结果。
+--query 应用在输出的数据上（echo_items、各模块的 format_output），不重新执行命令。
+"""
+
+import contextlib
+import functools
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Union
+
+import click
+
+if TYPE_CHECKING:
+    from core.paginator import PageStyle
+
+
+# 逐条写出的输出格式
+STREAM_FORMATS = ('ndjson', 'csv')
+
+# 列表命令 --output 可选的格式
+LIST_OUTPUT_FORMATS = ['table', 'json', 'yaml'] + list(STREAM_FORMATS)
+
+# 命令中页码、每页条数、输出格式选项的参数名
+PAGE_OPTION_NAMES = ('page', 'page_no', 'page_num', 'page_number', 'page_index', 'page_now')
+SIZE_OPTION_NAMES = ('page_size', 'size', 'limit', 'max_keys', 'max_results')
+OUTPUT_OPTION_NAMES = ('output', 'output_format')
+
+
+def all_pages_option(func: Callable) -> Callable:
+    """为列表命令添加 --all 选项（参数名 all_pages）"""
+    return click.option(
+        '--all', 'all_pages', is_flag=True,
+        help='自动翻页，获取并流式输出全部结果（忽略 --page）'
+    )(func)
+
+
+def iter_all(method: Callable, page_size: Optional[int] = None, **kwargs) -> Iterator[Any]:
+    """
+    逐条产出列表接口的全部结果
+
+    Args:
+        method: 服务客户端的列表查询方法
+        page_size: 每页条数，默认使用接口允许的较大值
+        kwargs: 传给列表查询方法的其他参数
+
+    Returns:
+        结果迭代器；接口返回错误或网络错误时抛出 click.ClickException
+    """
+    from core.paginator import Paginator
+
+    with _paging_errors():
+        yield from Paginator(method, page_size=page_size, **kwargs)
+
+
+@contextlib.contextmanager
+def _paging_errors() -> Iterator[None]:
+    """把接口错误和网络错误转换为 click.ClickException"""
+    import requests
+
+    from core import CTYUNAPIError
+    from core.paginator import PaginationError
+
+    try:
+        yield
+    except PaginationError as e:
+        raise click.ClickException(f"翻页查询失败 [{e.code}]: {e.message}")
+    except CTYUNAPIError as e:
+        raise click.ClickException(f"翻页查询失败 {e}")
+    except requests.RequestException as e:
+        raise click.ClickException(f"翻页查询失败（网络错误）: {e}")
+
+
+def echo_items(items: Iterable[Any], output_format: str,
+               format_output: Callable[[Any, str], None],
+               headers: Optional[Sequence[str]] = None,
+               row: Optional[Callable[[Any], Sequence[Any]]] = None) -> int:
+    """
+    输出全部结果
+
+    json、ndjson、csv 格式逐条写出（不在内存中保留全部结果），ndjson 和 csv 写出记录的原始字段；
+    提供了 headers 和 row 时表格也流式输出，列宽按前若干行取样计算；
+    其他情况收集后交给 format_output。
+    指定了 --query 时，[*]... 和 [?...]... 形式的查询逐条应用，其他查询先收集全部结果再求值；
+    表格输出时查询结果以通用表格显示。
+    下游提前关闭管道（如 | head）时停止输出，不报错，以状态码 1 退出。
+
+    Args:
+        items: 结果迭代器
+        output_format: 输出格式
+        format_output: 所属模块的格式化输出函数
+        headers: 表头（table）
+        row: 把一条结果转换为表格一行的函数（table）
+
+    Returns:
+        输出的条数
+    """
+    try:
+        return _echo_items(items, output_format, format_output, headers, row)
+    except BrokenPipeError:
+        from utils.streaming import discard_stdout
+        discard_stdout()
+        # SystemExit 不会被命令中 except Exception 的错误处理当作错误输出
+        sys.exit(1)
+
+
+def _echo_items(items: Iterable[Any], output_format: str, format_output: Callable[[Any, str], None],
+                headers: Optional[Sequence[str]], row: Optional[Callable[[Any], Sequence[Any]]]) -> int:
+    from utils.query import current_query
+
+    query = current_query()
+    if query is not None:
+        # --query 改变了记录结构，不再使用命令自带的表头；format_output 不再重复应用查询
+        format_output = getattr(format_output, '__wrapped__', format_output)
+        headers = row = None
+        if query.streamable:
+            items = query.iter_records(items)
+        else:
+            result = query.search(list(items))
+            if output_format == 'table':
+                from utils.streaming import write_result_table
+                return write_result_table(result)
+            if output_format not in STREAM_FORMATS:
+                format_output(result, output_format)
+                return len(result) if isinstance(result, list) else 1
+            items = result if isinstance(result, list) else [result]
+        if output_format == 'table':
+            from utils.streaming import table_columns
+            items, headers, row = table_columns(items)
+
+    if output_format in STREAM_FORMATS or (output_format == 'table' and headers and row):
+        from utils.streaming import write_records
+        return write_records(items, output_format, headers=headers, row=row)
+
+    if output_format != 'json':
+        data = list(items)
+        format_output(data, output_format)
+        return len(data)
+
+    from utils.jsoncodec import dumps
+
+    count = 0
+    click.echo('[', nl=False)
+    for item in items:
+        text = dumps(item, indent=2)
+        click.echo((',\n' if count else '\n') + '  ' + text.replace('\n', '\n  '), nl=False)
+        count += 1
+    click.echo('\n]' if count else ']')
+    return count
+
+
+def explicit_page_size(ctx: click.Context, name: str = 'page_size') -> Optional[int]:
+    """命令行中显式指定的每页条数；使用默认值时返回None，由分页器取较大的值"""
+    from click.core import ParameterSource
+
+    if ctx.get_parameter_source(name) == ParameterSource.COMMANDLINE:
+        return ctx.params.get(name)
+    return None
+
+
+def _find_option(command: click.Command, names: Sequence[str]) -> Optional[click.Option]:
+    """命令中参数名为 names 之一的选项"""
+    for param in command.params:
+        if isinstance(param, click.Option) and param.name in names:
+            return param
+    return None
+
+
+# 命令参数到方法参数的映射：命令参数名，或以命令参数字典为参数的函数（常量、类型转换）
+ArgumentSource = Union[str, Callable[[Dict[str, Any]], Any]]
+
+
+class ListOperation:
+    """列表命令对应的分页查询：服务客户端方法、分页约定及命令参数到方法参数的映射"""
+
+    def __init__(self, method: Union[Callable, str], arguments: Dict[str, ArgumentSource],
+                 options: Sequence[str] = (), page_size: Optional[int] = None,
+                 items_key: Optional[str] = None, style: Optional['PageStyle'] = None):
+        """
+        初始化列表查询
+
+        Args:
+            method: 服务客户端类的列表查询方法，如 VPCClient.describe_vpcs；
+                也可以写作 'vpc.client:VPCClient.describe_vpcs'，执行时才导入
+            arguments: {方法参数名: 命令参数名或函数}，不含页码和每页条数
+            options: 命令的全部参数名（用于找出页码和每页条数选项）
+            page_size: --all 未指定每页条数时使用的值（一般取接口允许的最大值）
+            items_key: 结果列表的字段名，不指定则自动识别
+            style: 分页约定，不指定则由 infer_style() 根据方法参数推断
+        """
+        self.method = method
+        self.arguments = arguments
+        self.options = list(options)
+        self.page_size = page_size
+        self.items_key = items_key
+        self._style = style
+
+    @functools.cached_property
+    def function(self) -> Callable:
+        """服务客户端类的列表查询方法（未绑定）"""
+        if not isinstance(self.method, str):
+            return self.method
+        import importlib
+
+        module, name = self.method.split(':')
+        function = importlib.import_module(module)
+        for attr in name.split('.'):
+            function = getattr(function, attr)
+        return function
+
+    @functools.cached_property
+    def style(self) -> 'PageStyle':
+        """分页约定，声明的 items_key 优先"""
+        from core.paginator import PageStyle, infer_style
+
+        style = self._style or infer_style(self.function)
+        if self.items_key is None or style.items_key == self.items_key:
+            return style
+        return PageStyle(style.page_param, style.size_param, style.marker_param, style.start,
+                         style.default_size, self.items_key)
+
+    @property
+    def page_option(self) -> Optional[str]:
+        """命令的页码选项：优先使用与方法页码参数同名的选项"""
+        return self._option(self.style.page_param, PAGE_OPTION_NAMES)
+
+    @property
+    def size_option(self) -> Optional[str]:
+        """命令的每页条数选项：优先使用与方法每页条数参数同名的选项"""
+        return self._option(self.style.size_param, SIZE_OPTION_NAMES)
+
+    def _option(self, param: Optional[str], names: Sequence[str]) -> Optional[str]:
+        if param is None:
+            return None
+        if param in self.options:
+            return param
+        return next((name for name in names if name in self.options), None)
+
+    def bind(self, client: Any) -> Callable:
+        """用API客户端创建服务客户端，返回其列表查询方法"""
+        owner = sys.modules[self.function.__module__]
+        for name in self.function.__qualname__.split('.')[:-1]:
+            owner = getattr(owner, name)
+        return getattr(owner(client), self.function.__name__)
+
+    def kwargs(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """根据命令参数生成方法参数"""
+        return {name: source(params) if callable(source) else params.get(source)
+                for name, source in self.arguments.items()}
+
+    def page(self, client: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        按命令指定的页码和每页条数查询一页
+
+        Returns:
+            接口的原始响应；接口返回错误时抛出 PaginationError
+        """
+        from core.paginator import check_page
+
+        style = self.style
+        kwargs = self.kwargs(params)
+        for param, option in ((style.page_param, self.page_option), (style.size_param, self.size_option)):
+            if option is not None and params.get(option) is not None:
+                kwargs[param] = params[option]
+        return check_page(self.bind(client)(**kwargs))
+
+    def records(self, client: Any, params: Dict[str, Any], all_pages: bool = False,
+                page_size: Optional[int] = None) -> Iterator[Any]:
+        """
+        逐条产出查询结果
+
+        Args:
+            client: API客户端
+            params: 命令参数
+            all_pages: 是否自动翻页获取全部结果；否则只取命令指定的一页
+            page_size: 命令行中显式指定的每页条数（--all）
+
+        Returns:
+            结果迭代器；接口返回错误或网络错误时抛出 click.ClickException
+        """
+        from core.paginator import Paginator, extract_items
+
+        with _paging_errors():
+            if not all_pages:
+                yield from extract_items(self.page(client, params), self.style.items_key)
+                return
+            page_size = page_size or self.page_size or params.get(self.size_option)
+            yield from Paginator(self.bind(client), page_size=page_size, style=self.style,
+                                 **self.kwargs(params))
+
+
+def list_operation(method: Union[Callable, str], *arguments: str, page_size: Optional[int] = None,
+                   items_key: Optional[str] = None, style: Optional['PageStyle'] = None,
+                   **renamed: ArgumentSource) -> Callable[[click.Command], click.Command]:
+    """
+    声明列表命令对应的服务客户端分页方法（用在 @group.command 之上）
+
+    命令没有自己的 --all 时加上 --all；--output 可选 json 时增加 ndjson、csv。
+    指定了 --all 或 ndjson/csv 输出时不执行原命令，直接调用分页器取得结果并逐条输出；
+    指定了 --query 的表格输出改为按 JSON 输出执行命令，查询结果以通用表格输出；
+    --profiles/--all-profiles 和 --region-id all 在各目标上调用分页方法并合并输出（见 cli.fanout）::
+
+        @list_operation(VPCClient.describe_vpcs, 'region_id', 'vpc_id', page_size=200)
+        @vpc.command('list')
+        ...
+
+    Args:
+        method: 服务客户端类的列表查询方法，或 '模块:类名.方法名'（客户端在命令中延迟导入时）
+        arguments: 与方法参数同名的命令参数
+        page_size: --all 未指定每页条数时使用的值，默认使用命令的每页条数
+        items_key: 结果列表的字段名，不指定则自动识别
+        style: 分页约定，不指定则根据方法参数推断
+        renamed: 方法参数名=命令参数名，或以命令参数字典为参数的函数
+
+    Returns:
+        装饰器
+    """
+    def decorator(command: click.Command) -> click.Command:
+        operation = ListOperation(method, dict({name: name for name in arguments}, **renamed),
+                                  options=[param.name for param in command.params],
+                                  page_size=page_size, items_key=items_key, style=style)
+        command.list_operation = operation
+        _wrap_callback(command, operation)
+        return command
+
+    return decorator
+
+
+def _wrap_callback(command: click.Command, operation: ListOperation) -> None:
+    """
+    包装命令的回调
+
+    命令自行实现了 --all 时保留原实现，只处理 --query 的表格输出；
+    否则加上 --all 和 ndjson/csv 输出。
+    """
+    callback = command.callback
+    generic = _find_option(command, ('all_pages',)) is None
+    output_option = _find_option(command, OUTPUT_OPTION_NAMES)
+    json_output = (output_option is not None and isinstance(output_option.type, click.Choice)
+                   and 'json' in output_option.type.choices)
+    if generic and json_output:
+        choices = list(output_option.type.choices)
+        output_option.type = click.Choice(
+            choices + [name for name in STREAM_FORMATS if name not in choices],
+            case_sensitive=output_option.type.case_sensitive
+        )
+
+    @functools.wraps(callback)
+    def wrapper(*args, **kwargs):
+        ctx = click.get_current_context()
+        obj = ctx.obj if isinstance(ctx.obj, dict) else {}
+        all_pages = kwargs.pop('all_pages', False) if generic else kwargs.get('all_pages', False)
+        output_format = ((kwargs.get(output_option.name) if output_option is not None else None)
+                         or obj.get('output') or 'table')
+        page_size = explicit_page_size(ctx, operation.size_option) if operation.size_option else None
+
+        from cli.main import ALL_REGIONS
+        if obj.get('profiles') or kwargs.get('region_id') == ALL_REGIONS:
+            # --profiles/--all-profiles、--region-id all：在各目标上并发查询并合并输出
+            from cli.fanout import run_fanout
+            return run_fanout(ctx, operation, kwargs, output_format, all_pages, page_size)
+        if (output_format == 'table' and obj.get('query') is not None and not all_pages
+                and json_output):
+            # 命令自己绘制的表格不经过 format_output：按 JSON 输出的数据应用查询，
+            # 由 format_output 把查询结果输出为通用表格（与 --output json 的结果一致）
+            kwargs[output_option.name] = 'json'
+            obj['query_as_table'] = True
+            return callback(*args, **kwargs)
+        if not generic or (not all_pages and output_format not in STREAM_FORMATS):
+            return callback(*args, **kwargs)
+
+        # --all，或不带 --all 的 ndjson/csv（只输出当前页）
+        from cli.main import format_output
+        from utils.streaming import table_columns
+
+        items = operation.records(obj['client'], kwargs, all_pages, page_size)
+        headers, row = None, None
+        if output_format == 'table':
+            items, headers, row = table_columns(items)
+        echo_items(items, output_format, format_output, headers=headers, row=row)
+
+    command.callback = wrapper
+    if generic:
+        command.params.append(click.Option(
+            ['--all', 'all_pages'], is_flag=True,
+            help='自动翻页，获取并输出全部结果（忽略页码选项）'
+        ))
@@ -0,0 +1,240 @@
+"""
+交互式shell
+在一个进程内连续执行多条命令，复用已导入的命令模块、CTYUNClient 会话（TLS连接池）
+以及只读请求的内存响应缓存
+"""
+
+import os
+import shlex
+import sys
+from typing import List, Optional
+
+import click
+
+
+# shell 内置命令
+_BUILTIN_HELP = """内置命令:
+  help              显示全部服务命令（<命令> --help 查看具体用法）
+  refresh           清空内存响应缓存，之后的查询重新请求API
+  exit / quit       退出shell（也可使用 Ctrl-D）
+
+其余输入按 ctyun-cli 命令执行，省略开头的 ctyun-cli，例如:
+  ecs list --region-id xxx
+  --output json vpc list --region-id xxx
+"""
+
+# 不能在shell内部再次启动的命令
+_NESTED_COMMANDS = {'shell', 'daemon'}
+
+# 从根命令继承的全局选项：(参数名, 命令行选项)
+_GLOBAL_OPTIONS = [
+    ('profile', '--profile'),
+    ('access_key', '--access-key'),
+    ('secret_key', '--secret-key'),
+    ('region', '--region'),
+    ('endpoint', '--endpoint'),
+    ('output', '--output'),
+    ('query', '--query'),
+    ('trace_file', '--trace-file'),
+    ('profile_requests_json', '--profile-requests-json'),
+    ('metrics_file', '--metrics-file'),
+    ('record_dir', '--record'),
+    ('replay_dir', '--replay'),
+    ('replay_latency', '--replay-latency'),
+    ('profiles', '--profiles'),
+]
+
+
+def _global_args(root_params: dict) -> List[str]:
+    """把启动shell时指定的全局选项转换为命令行参数"""
+    args = []
+    for name, option in _GLOBAL_OPTIONS:
+        value = root_params.get(name)
+        if value and not (name == 'profile' and value == 'default'):
+            args.extend([option, value])
+    for flag in ('debug', 'trace', 'profile_requests', 'memoize', 'all_profiles'):
+        if root_params.get(flag):
+            args.append('--' + flag.replace('_', '-'))
+    return args
+
+
+class _Completer:
+    """基于命令树的Tab补全"""
+
+    def __init__(self, root: click.Group):
+        self.root = root
+        self._matches: List[str] = []
+
+    def _candidates(self, words: List[str], prefix: str) -> List[str]:
+        ctx = click.Context(self.root)
+        command = self.root
+        for word in words:
+            if word.startswith('-') or not isinstance(command, click.Group):
+                continue
+            sub = command.get_command(ctx, word)
+            if sub is None:
+                continue
+            command = sub
+
+        if prefix.startswith('-') or not isinstance(command, click.Group):
+            names = [opt for param in command.params for opt in getattr(param, 'opts', [])]
+        else:
+            names = command.list_commands(ctx)
+            if command is self.root:
+                names = [n for n in names if n not in _NESTED_COMMANDS] + ['help', 'refresh', 'exit']
+        return sorted(n for n in names if n.startswith(prefix))
+
+    def complete(self, text: str, state: int) -> Optional[str]:
+        if state == 0:
+            import readline
+            line = readline.get_line_buffer()[:readline.get_endidx()]
+            try:
+                words = shlex.split(line)
+            except ValueError:
+                words = line.split()
+            if text and words and words[-1] == text:
+                words = words[:-1]
+            try:
+                self._matches = [m + ' ' for m in self._candidates(words, text)]
+            except Exception:
+                self._matches = []
+        return self._matches[state] if state < len(self._matches) else None
+
+
+def _setup_readline(root: click.Group) -> Optional[str]:
+    """启用历史记录与Tab补全，返回历史文件路径"""
+    try:
+        import readline
+    except ImportError:
+        return None
+
+    history_file = os.path.expanduser('~/.ctyun/shell_history')
+    try:
+        readline.read_history_file(history_file)
+    except (OSError, IOError):
+        pass
+    readline.set_history_length(1000)
+    readline.set_completer(_Completer(root).complete)
+    readline.set_completer_delims(' \t\n')
+    if 'libedit' in (readline.__doc__ or ''):
+        readline.parse_and_bind('bind ^I rl_complete')
+    else:
+        readline.parse_and_bind('tab: complete')
+    return history_file
+
+
+def _save_history(history_file: Optional[str]) -> None:
+    if not history_file:
+        return
+    try:
+        import readline
+        os.makedirs(os.path.dirname(history_file), exist_ok=True)
+        readline.write_history_file(history_file)
+    except (ImportError, OSError, IOError):
+        pass
+
+
+def run_line(root: click.Group, args: List[str], registry) -> int:
+    """
+    执行一条命令
+
+    Args:
+        root: 根命令组
+        args: 命令行参数（含继承的全局选项）
+        registry: 客户端注册表
+
+    Returns:
+        退出码
+    """
+    import logging
+
+    cli_logger = logging.getLogger('ctyun_cli')
+    saved_level = cli_logger.level
+    try:
+        root.main(args=args, prog_name='ctyun-cli',
+                  obj={'client_registry': registry}, standalone_mode=False)
+        return 0
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.exceptions.Exit as e:
+        return e.exit_code
+    except click.Abort:
+        click.echo("已取消", err=True)
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    finally:
+        cli_logger.setLevel(saved_level)
+
+
+@click.command()
+@click.option('--cache-ttl', type=int, default=60, show_default=True,
+              help='只读请求的内存缓存有效期（秒），0表示不缓存')
+@click.pass_context
+def shell(ctx, cache_ttl: int):
+    """
+    交互式shell（复用客户端、会话与缓存，适合连续执行大量命令）
+
+    启动时指定的全局选项（--profile、--region、--output 等）对shell中的所有命令生效，
+    单条命令中再次指定可覆盖。查询类请求的结果在 --cache-ttl 秒内直接复用，
+    执行任何变更操作后缓存自动清空。
+    """
+    from cli.clients import ClientRegistry
+    from config.settings import config
+
+    root = ctx.find_root().command
+    prefix_args = _global_args(ctx.find_root().params)
+    registry = ClientRegistry(response_cache_ttl=max(cache_ttl, 0))
+    interactive = sys.stdin.isatty()
+    history_file = _setup_readline(root) if interactive else None
+
+    if interactive:
+        click.echo("天翼云CLI交互式shell，输入 help 查看帮助，exit 退出")
+
+    try:
+        while True:
+            try:
+                line = input('ctyun> ' if interactive else '')
+            except EOFError:
+                if interactive:
+                    click.echo()
+                break
+            except KeyboardInterrupt:
+                click.echo()
+                continue
+
+            try:
+                words = shlex.split(line, comments=True)
+            except ValueError as e:
+                click.echo(f"错误: {e}", err=True)
+                continue
+            if not words:
+                continue
+
+            name = words[0]
+            if name in ('exit', 'quit'):
+                break
+            if name == 'help':
+                click.echo(_BUILTIN_HELP)
+                run_line(root, ['--help'], registry)
+                continue
+            if name == 'refresh':
+                registry.clear_response_caches()
+                click.echo("✓ 内存缓存已清空")
+                continue
+            if name in ('ctyun-cli', 'ctyun'):
+                words = words[1:]
+            if words and words[0] in _NESTED_COMMANDS:
+                click.echo(f"错误: 不能在shell中执行 {words[0]} 命令", err=True)
+                continue
+
+            if config.reload_if_changed():
+                registry.clear()
+            try:
+                run_line(root, prefix_args + words, registry)
+            except KeyboardInterrupt:
+                click.echo("\n已中断", err=True)
+    finally:
+        _save_history(history_file)
+        registry.clear()
@@ -4,7 +4,6 @@
 
 from typing import Dict, List, Optional, Any
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -14,8 +13,8 @@ class CloudPCClient:
     def __init__(self, client: CTYUNClient):
         self.client = client
         self.base_endpoint = 'ecpc-global.ctapi.ctyun.cn'
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
-        self.timeout = 30
+        self.eop_auth = client.eop_auth
+        self.timeout = client.timeout
 
     def set_timeout(self, timeout: int):
         self.timeout = timeout
@@ -39,12 +38,12 @@ class CloudPCClient:
                 method='GET', url=url, query_params=params,
                 body='', extra_headers={}
             )
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {params}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", params)
             response = self.client.session.get(
                 url, params=params, headers=headers, timeout=self.timeout
             )
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
             return response.json()
@@ -8,6 +8,7 @@ import sys
 from typing import Optional
 
 from .client import CloudPCClient
+from cli.paging import list_operation
 
 
 # 通用状态映射
@@ -66,6 +67,7 @@ def service_status(ctx, region_id, output_format, timeout):
 
 # ========== 桌面列表 ==========
 
+@list_operation(CloudPCClient.describe_desktops, 'region_id', 'desktop_oid', 'nickname', 'status', 'vpc_oid')
 @cloudpc.command('list')
 @click.option('--region-id', '-r', required=True, help='资源池ID (必需)')
 @click.option('--desktop-oid', help='桌面OID')
@@ -178,6 +180,7 @@ def _display_desktops_summary(result):
 
 # ========== ECS型云电脑 ==========
 
+@list_operation(CloudPCClient.describe_ecs, 'region_id', 'desktop_oid', 'nickname', 'status')
 @cloudpc.command('ecs-list')
 @click.option('--region-id', '-r', required=True, help='资源池ID (必需)')
 @click.option('--desktop-oid', help='桌面OID')
@@ -267,6 +270,7 @@ def _display_ecs_summary(result):
 
 # ========== 镜像 ==========
 
+@list_operation(CloudPCClient.describe_available_images, 'region_id', 'os_type', 'flavor_type')
 @cloudpc.command('images')
 @click.option('--region-id', '-r', required=True, help='资源池ID (必需)')
 @click.option('--os-type', help='操作系统类型')
@@ -336,6 +340,7 @@ def _display_images_summary(result):
 
 # ========== 云硬盘 ==========
 
+@list_operation(CloudPCClient.describe_cloud_volumes, 'region_id', 'desktop_oid', 'disk_type', 'status')
 @cloudpc.command('volumes')
 @click.option('--region-id', '-r', required=True, help='资源池ID (必需)')
 @click.option('--desktop-oid', help='桌面OID')
@@ -413,6 +418,7 @@ def _display_volumes_summary(result):
 
 # ========== 网络 ==========
 
+@list_operation(CloudPCClient.describe_vpcs, 'region_id', 'vpc_oid')
 @cloudpc.command('vpcs')
 @click.option('--region-id', '-r', required=True, help='资源池ID (必需)')
 @click.option('--vpc-oid', help='VPC OID')
@@ -476,6 +482,7 @@ def _display_vpcs_summary(result):
     click.echo(f"✅ 查询成功 | 📋 总数: {total}")
 
 
+@list_operation(CloudPCClient.describe_subnets, 'region_id', 'vpc_oid')
 @cloudpc.command('subnets')
 @click.option('--region-id', '-r', required=True, help='资源池ID (必需)')
 @click.option('--vpc-oid', required=True, help='VPC OID (必需)')
@@ -546,6 +553,7 @@ def _display_subnets_summary(result, vpc_oid):
 
 # ========== 用户与部门 ==========
 
+@list_operation(CloudPCClient.describe_users, 'region_id', 'org_oid', 'user_name')
 @cloudpc.command('users')
 @click.option('--region-id', '-r', required=True, help='资源池ID (必需)')
 @click.option('--org-oid', help='部门OID')
@@ -615,6 +623,7 @@ def _display_users_summary(result):
     click.echo(f"🔒 锁定: {locked}")
 
 
+@list_operation(CloudPCClient.describe_organizations, 'region_id', 'parent_org_oid', 'org_name')
 @cloudpc.command('orgs')
 @click.option('--region-id', '-r', required=True, help='资源池ID (必需)')
 @click.option('--parent-org-oid', help='父部门OID')
@@ -6,7 +6,7 @@
 import os
 import configparser
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 
 
 class ConfigManager:
@@ -27,6 +27,7 @@ class ConfigManager:
 
         self.config_file = config_file
         self.config = configparser.ConfigParser()
+        self._mtime: Optional[float] = None
         self._load_config()
 
     def _load_config(self) -> None:
@@ -36,6 +37,27 @@ class ConfigManager:
         else:
             # 创建默认配置
             self._create_default_config()
+        self._mtime = self._get_mtime()
+
+    def _get_mtime(self) -> Optional[float]:
+        """获取配置文件修改时间"""
+        try:
+            return os.path.getmtime(self.config_file)
+        except OSError:
+            return None
+
+    def reload_if_changed(self) -> bool:
+        """
+        配置文件被修改时重新加载（供长驻进程使用）
+
+        Returns:
+            是否重新加载
+        """
+        if self._get_mtime() == self._mtime:
+            return False
+        self.config = configparser.ConfigParser()
+        self._load_config()
+        return True
 
     def _create_default_config(self) -> None:
         """创建默认配置文件"""
@@ -46,6 +68,16 @@ class ConfigManager:
             'endpoint': 'https://api.ctyun.cn',
             'timeout': '30',
             'retry': '3',
+            'pool_connections': '32',
+            'pool_maxsize': '64',
+            'max_concurrency': '16',
+            'cache_max_size_mb': '64',
+            'rate_limit': '0',
+            'rate_limit_burst': '0',
+            'rate_limit_adaptive': 'true',
+            'coalesce_reads': 'true',
+            'coalesce_post_paths': '',
+            'hedge_endpoints': 'true',
             'output_format': 'table'
         }
         self.config['logging'] = {
@@ -127,6 +159,55 @@ class ConfigManager:
         """获取重试次数"""
         return int(self.get('retry', fallback='3'))
 
+    def get_pool_connections(self) -> int:
+        """获取缓存的主机连接池数量"""
+        return int(self.get('pool_connections', fallback='32'))
+
+    def get_pool_maxsize(self) -> int:
+        """获取每个主机连接池的最大连接数"""
+        return int(self.get('pool_maxsize', fallback='64'))
+
+    def get_max_concurrency(self) -> int:
+        """获取每个端点主机的最大并发请求数"""
+        return int(self.get('max_concurrency', fallback='16'))
+
+    def get_rate_limit(self) -> float:
+        """获取每个API端点每秒的请求数上限，0表示不设固定上限"""
+        return float(self.get('rate_limit', fallback='0'))
+
+    def get_rate_limit_burst(self) -> float:
+        """获取每个API端点允许的突发请求数，0表示与速率上限相同"""
+        return float(self.get('rate_limit_burst', fallback='0'))
+
+    def get_rate_limit_adaptive(self) -> bool:
+        """获取是否在收到429时自动降低该端点的请求速率"""
+        return self.get('rate_limit_adaptive', fallback='true').strip().lower() in ('1', 'true', 'yes', 'on')
+
+    def get_coalesce_reads(self) -> bool:
+        """获取是否合并同一时刻发出的相同只读请求"""
+        return self.get('coalesce_reads', fallback='true').strip().lower() in ('1', 'true', 'yes', 'on')
+
+    def get_coalesce_post_paths(self) -> List[str]:
+        """获取允许合并的只读POST接口路径（逗号分隔），默认只合并GET请求"""
+        return [path.strip().rstrip('/') for path in self.get('coalesce_post_paths', fallback='').split(',')
+                if path.strip()]
+
+    def get_hedge_endpoints(self) -> bool:
+        """获取多端点服务首次访问只读接口时是否并发尝试所有候选端点"""
+        return self.get('hedge_endpoints', fallback='true').strip().lower() in ('1', 'true', 'yes', 'on')
+
+    def get_cache_max_bytes(self) -> int:
+        """获取本地缓存数据库的容量上限（字节）"""
+        return int(float(self.get('cache_max_size_mb', fallback='64')) * 1024 * 1024)
+
+    def get_metrics_file(self) -> str:
+        """获取API调用指标文件（Prometheus textfile collector），环境变量 CTYUN_METRICS_FILE 优先"""
+        return os.environ.get('CTYUN_METRICS_FILE') or self.get('metrics_file', fallback='')
+
+    def get_endpoint_override(self) -> str:
+        """获取替代所有服务端点的地址（如本地模拟服务），环境变量 CTYUN_ENDPOINT_OVERRIDE 优先"""
+        return os.environ.get('CTYUN_ENDPOINT_OVERRIDE') or self.get('endpoint_override', fallback='')
+
     def get_output_format(self) -> str:
         """获取输出格式"""
         return self.get('output_format', fallback='table')
@@ -136,6 +217,7 @@ class ConfigManager:
         os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
         with open(self.config_file, 'w', encoding='utf-8') as f:
             self.config.write(f)
+        self._mtime = self._get_mtime()
 
     def list_profiles(self) -> list:
         """列出所有配置文件"""
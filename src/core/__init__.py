@@ -4,14 +4,14 @@
 """
 
 import json
-import time
 from typing import Dict, Any, Optional, Union
+import logging
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from auth.signature import CTYUNAuth
 from config import config
+from core.transport import EOPTransport
+from utils import jsoncodec
 from utils.helpers import logger
 
 
@@ -51,8 +51,11 @@ class CTYUNClient:
         # 初始化认证器
         self.auth = CTYUNAuth(access_key, secret_key)
 
-        # 创建会话
-        self.session = requests.Session()
+        # 共享传输层：EOP签名器、连接池、超时与重试
+        self.transport = EOPTransport(access_key, secret_key)
+        self.eop_auth = self.transport.signer
+        self.timeout = self.transport.timeout
+        self.session = self.transport.session
         self._setup_session()
 
         # API版本
@@ -60,21 +63,15 @@ class CTYUNClient:
 
         logger.info(f"初始化天翼云客户端: region={self.region}, endpoint={self.endpoint}")
 
+    @property
+    def cache_namespace(self) -> str:
+        """本地缓存命名空间（配置文件/访问密钥指纹/区域）"""
+        from utils.cache import cache_namespace
+        return cache_namespace(self.profile, self.access_key, self.region)
+
     def _setup_session(self) -> None:
         """设置请求会话"""
-        # 设置重试策略
-        retry_strategy = Retry(
-            total=config.get_retry_count(),
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"]
-        )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-
-        # 设置默认请求头
+        # 连接池与重试策略由传输层挂载，这里只设置默认请求头
         self.session.headers.update({
             'User-Agent': 'ctyun-cli/1.0.0',
             'Content-Type': 'application/json',
@@ -120,7 +117,7 @@ class CTYUNClient:
 
         # 准备请求体
         if isinstance(data, dict):
-            data = json.dumps(data, ensure_ascii=False)
+            data = jsoncodec.dumps(data)
 
         # 添加签名头
         if sign:
@@ -137,10 +134,10 @@ class CTYUNClient:
             # 简单的Bearer Token认证
             headers['Authorization'] = self.auth.get_bearer_token()
 
-        logger.debug(f"发送请求: {method} {url}")
-        logger.debug(f"请求头: {headers}")
+        logger.debug("发送请求: %s %s", method, url)
+        logger.debug("请求头: %s", headers)
         if data:
-            logger.debug(f"请求体: {data}")
+            logger.debug("请求体: %s", data)
 
         try:
             response = self.session.request(
@@ -149,12 +146,13 @@ class CTYUNClient:
                 params=params,
                 data=data,
                 headers=headers,
-                timeout=config.get_timeout()
+                timeout=self.timeout
             )
 
             # 记录响应信息
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应头: {dict(response.headers)}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应头: %s", dict(response.headers))
 
             # 检查响应状态
             if not response.ok:
@@ -349,8 +347,8 @@ class CTYUNClient:
 
     def close(self) -> None:
         """关闭客户端会话"""
-        if self.session:
-            self.session.close()
+        if self.transport:
+            self.transport.close()
 
     def __enter__(self):
         """上下文管理器入口"""
@@ -388,4 +386,12 @@ class CTYUNAPIError(Exception):
     def __repr__(self) -> str:
         """返回错误的详细表示"""
         return (f"CTYUNAPIError(code='{self.code}', message='{self.message}', "
-                f"status_code={self.status_code}, request_id='{self.request_id}')")
\ No newline at end of file
+                f"status_code={self.status_code}, request_id='{self.request_id}')")
+
+
+def __getattr__(name: str):
+    """按需导入异步客户端，避免同步调用路径加载asyncio"""
+    if name in ('AsyncCTYUNClient', 'AsyncServiceClient'):
+        from core import async_client
+        return getattr(async_client, name)
+    raise AttributeError(f"module 'core' has no attribute '{name}'")
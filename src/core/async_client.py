@@ -0,0 +1,165 @@
+"""
+天翼云API异步客户端
+在asyncio中并发调用各服务客户端，复用同步客户端的签名器与连接池
+"""
+
+import asyncio
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Type
+from urllib.parse import urlsplit
+
+from config import config
+from core import CTYUNClient
+
+
+def service_host(service_client: Any) -> str:
+    """
+    服务客户端请求的端点主机
+
+    多数服务客户端在 base_endpoint 中保存主机名，部分保存完整URL（service_endpoint）
+    或候选端点列表（ENDPOINTS，取首选端点）；都没有时使用客户端类名，
+    保证不同服务不会共用同一个并发信号量。
+    """
+    host = getattr(service_client, 'base_endpoint', None) or getattr(service_client, 'service_endpoint', None)
+    if not host:
+        endpoints = getattr(service_client, 'ENDPOINTS', None)
+        host = endpoints[0] if endpoints else None
+    if not host:
+        return type(service_client).__name__
+    return urlsplit(host).hostname if '://' in host else host
+
+
+class AsyncServiceClient:
+    """
+    服务客户端的异步包装
+
+    同步服务客户端（如 ECSClient）的每个公开方法都变为可等待的协程，
+    调用在线程池中执行，并受所属端点主机的并发信号量约束::
+
+        ecs = aclient.service(ECSClient)
+        result = await ecs.describe_instances(region_id='...')
+    """
+
+    def __init__(self, owner: 'AsyncCTYUNClient', service_client: Any):
+        self._owner = owner
+        self._service_client = service_client
+        self._host = service_host(service_client)
+
+    @property
+    def sync(self) -> Any:
+        """被包装的同步服务客户端"""
+        return self._service_client
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._service_client, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return await self._owner.run(self._host, attr, *args, **kwargs)
+
+        return call
+
+
+class AsyncCTYUNClient:
+    """
+    天翼云API异步客户端
+
+    持有一个同步 CTYUNClient，所有服务共享其EOP签名器和连接池。
+    每个端点主机有独立的并发信号量，避免大批量并发压垮单个服务。
+    信号量绑定创建它的事件循环，因此按事件循环分别创建（如多次调用 asyncio.run）。
+    """
+
+    def __init__(self, client: Optional[CTYUNClient] = None,
+                 max_concurrency: Optional[int] = None,
+                 **client_kwargs):
+        """
+        初始化异步客户端
+
+        Args:
+            client: 已有的同步客户端，不传则按 client_kwargs 创建
+            max_concurrency: 每个端点主机的最大并发请求数，默认读取配置
+            client_kwargs: 创建 CTYUNClient 的参数（access_key/secret_key/profile等）
+        """
+        self.client = client or CTYUNClient(**client_kwargs)
+        self.max_concurrency = max_concurrency or config.get_max_concurrency()
+        # 事件循环 -> {端点主机: 信号量}；事件循环结束后随之回收
+        self._semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]' = \
+            weakref.WeakKeyDictionary()
+        # 线程数与连接池上限一致，保证每个在途请求都能拿到连接
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.client.transport.pool_maxsize,
+            thread_name_prefix='ctyun-async'
+        )
+
+    def service(self, service_cls: Type, *args, **kwargs) -> AsyncServiceClient:
+        """
+        创建异步服务客户端
+
+        Args:
+            service_cls: 同步服务客户端类，如 ECSClient、MonitorClient
+            args, kwargs: 传给服务客户端构造函数的额外参数
+
+        Returns:
+            异步服务客户端
+        """
+        return AsyncServiceClient(self, service_cls(self.client, *args, **kwargs))
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        """获取当前事件循环中端点主机的并发信号量（惰性创建）"""
+        semaphores = self._semaphores.setdefault(asyncio.get_running_loop(), {})
+        semaphore = semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            semaphores[host] = semaphore
+        return semaphore
+
+    async def run(self, host: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        在线程池中执行同步调用
+
+        Args:
+            host: 端点主机，用于并发控制
+            func: 同步函数
+            args, kwargs: 函数参数
+
+        Returns:
+            函数返回值
+        """
+        loop = asyncio.get_running_loop()
+        async with self._semaphore(host):
+            return await loop.run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+
+    async def request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+        """
+        异步发送EOP签名请求并解码JSON
+
+        Args:
+            method: HTTP方法
+            url: 请求URL
+            kwargs: 传给 EOPTransport.request_json 的参数
+
+        Returns:
+            响应数据
+        """
+        host = urlsplit(url).hostname or url
+        return await self.run(host, self.client.transport.request_json,
+                              method, url, **kwargs)
+
+    def close(self) -> None:
+        """关闭线程池和底层会话"""
+        self._executor.shutdown(wait=False)
+        self.client.close()
+
+    async def __aenter__(self):
+        """异步上下文管理器入口"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """异步上下文管理器出口"""
+        self.close()
@@ -0,0 +1,173 @@
+"""
+多端点选择
+部分服务（CDA、CFW）的API分散在多个候选端点上。按API路径记住上次可用的端点
+（进程内 + 本地持久化缓存），之后直接访问该端点；首次访问只读接口时并发尝试
+所有候选端点，采用最先成功的结果，避免逐个等待不可用端点的超时。
+
+只有端点不可用（网络、DNS错误，HTTP 5xx，404 即该端点不提供此API）时才换端点并忘记
+记住的端点；端点返回的接口错误（参数错误等业务错误）直接返回，不影响记住的端点。
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# 记住的端点在持久化缓存中的有效期（秒）
+ENDPOINT_MEMO_TTL = 7 * 24 * 3600
+
+# 尝试一个端点：返回 (是否成功, 结果)
+#   True   成功
+#   False  端点不可用（网络、DNS错误，HTTP 5xx，404），换下一个端点
+#   None   端点提供此API，但返回接口错误（参数错误等），不换端点
+Attempt = Callable[[str], Tuple[Optional[bool], Any]]
+
+
+class EndpointResolver:
+    """按API路径选择服务端点"""
+
+    # 进程内记忆，同一账号的同类客户端共享：{(缓存命名空间, 服务, 路径): 端点}
+    _memo: Dict[Tuple[str, str, str], str] = {}
+
+    def __init__(self, service: str, hedge: Optional[bool] = None, namespace: str = ''):
+        """
+        Args:
+            service: 服务名，用于区分缓存键
+            hedge: 首次访问只读接口时是否并发尝试所有端点，默认读取配置 hedge_endpoints
+            namespace: 缓存命名空间（CTYUNClient.cache_namespace），不同账号、区域记住的端点互不影响
+        """
+        self.service = service
+        self.namespace = namespace
+        if hedge is None:
+            from config.settings import config
+            hedge = config.get_hedge_endpoints()
+        self.hedge = hedge
+
+    def _cache_key(self, path: str) -> str:
+        return f"endpoint:{self.service}:{path}"
+
+    def _memo_key(self, path: str) -> Tuple[str, str, str]:
+        return (self.namespace, self.service, path)
+
+    def remembered(self, path: str) -> Optional[str]:
+        """上次可用的端点"""
+        key = self._memo_key(path)
+        endpoint = self._memo.get(key)
+        if endpoint is None:
+            try:
+                from utils.cache import get_cache
+                endpoint = get_cache().get(self._cache_key(path), namespace=self.namespace)
+            except Exception:
+                endpoint = None
+            if isinstance(endpoint, str):
+                self._memo[key] = endpoint
+            else:
+                endpoint = None
+        return endpoint
+
+    def remember(self, path: str, endpoint: str) -> None:
+        """记住可用的端点"""
+        key = self._memo_key(path)
+        if self._memo.get(key) == endpoint:
+            return
+        self._memo[key] = endpoint
+        try:
+            from utils.cache import get_cache
+            get_cache().set(self._cache_key(path), endpoint, ttl=ENDPOINT_MEMO_TTL,
+                            namespace=self.namespace)
+        except Exception:
+            pass
+
+    def forget(self, path: str) -> None:
+        """记住的端点不再可用"""
+        if self._memo.pop(self._memo_key(path), None) is None:
+            return
+        try:
+            from utils.cache import get_cache
+            get_cache().delete(self._cache_key(path), namespace=self.namespace)
+        except Exception:
+            pass
+
+    def candidates(self, path: str, endpoints: Sequence[str]) -> List[str]:
+        """候选端点，记住的端点排在最前"""
+        endpoint = self.remembered(path)
+        if endpoint in endpoints:
+            return [endpoint] + [item for item in endpoints if item != endpoint]
+        return list(endpoints)
+
+    def call(self, method: str, path: str, endpoints: Sequence[str],
+             attempt: Attempt) -> Tuple[bool, Any]:
+        """
+        在候选端点上执行请求
+
+        先访问记住的端点；没有记住的端点或其不可用时，只读请求在开启并发尝试时
+        同时访问其余端点，写请求逐个尝试（不会被重复执行）。
+        接口错误说明端点正确，直接返回该结果，不再尝试其他端点。
+
+        Args:
+            method: HTTP方法，用于判断是否为只读请求
+            path: API路径
+            endpoints: 候选端点（按优先顺序）
+            attempt: 访问单个端点的函数
+
+        Returns:
+            (是否成功, 结果)；接口错误时为该端点的结果，全部不可用时为最后一个端点的结果
+        """
+        from core.response_cache import ResponseCache
+
+        remaining = list(endpoints)
+        endpoint = self.remembered(path)
+        if endpoint in remaining:
+            ok, result = attempt(endpoint)
+            if ok is not False:
+                return bool(ok), result
+            # 只有端点不可用时才忘记，接口错误不换端点
+            self.forget(path)
+            remaining.remove(endpoint)
+            if not remaining:
+                return ok, result
+
+        if self.hedge and len(remaining) > 1 and ResponseCache.is_cacheable(method, path):
+            winner, ok, result = _race(remaining, attempt)
+        else:
+            winner, ok, result = _sequential(remaining, attempt)
+        if ok is not False:
+            self.remember(path, winner)
+        return bool(ok), result
+
+
+def _sequential(endpoints: Sequence[str], attempt: Attempt) -> Tuple[Optional[str], Optional[bool], Any]:
+    result = None
+    for endpoint in endpoints:
+        ok, result = attempt(endpoint)
+        if ok is not False:
+            return endpoint, ok, result
+    return None, False, result
+
+
+def _race(endpoints: Sequence[str], attempt: Attempt) -> Tuple[Optional[str], Optional[bool], Any]:
+    """并发尝试所有端点，返回最先成功（或返回接口错误）的结果；未完成的请求在后台结束后丢弃"""
+    results: 'queue.Queue[Tuple[str, bool, Any]]' = queue.Queue()
+
+    def run(endpoint: str) -> None:
+        try:
+            ok, result = attempt(endpoint)
+        except Exception as e:
+            ok, result = False, e
+        results.put((endpoint, ok, result))
+
+    # 守护线程：进程退出时不等待仍在等待超时的端点
+    for endpoint in endpoints:
+        threading.Thread(target=run, args=(endpoint,), name='ctyun-hedge', daemon=True).start()
+
+    failed: Dict[str, Any] = {}
+    for _ in endpoints:
+        endpoint, ok, result = results.get()
+        if ok is not False:
+            return endpoint, ok, result
+        failed[endpoint] = result
+    # 全部失败时与逐个尝试一致，返回最后一个端点的结果
+    last = failed[endpoints[-1]]
+    if isinstance(last, Exception):
+        raise last
+    return None, False, last
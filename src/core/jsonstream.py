@@ -0,0 +1,208 @@
+"""
+流式JSON解析
+边接收响应体边解析，逐条产出响应中结果列表（returnObj 列表或 Kubernetes items）
+的元素。已产出的元素不再保留，内存占用取决于单条记录的大小而不是响应大小；
+结果列表以外的字段（statusCode、message、总条数等）在读完后作为 envelope 提供。
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from core.paginator import ITEM_KEYS
+
+
+# 每次从连接读取的字节数
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 结果列表可能所在的位置（键路径），按响应中先出现者为准
+DEFAULT_PATHS: Tuple[Tuple[str, ...], ...] = tuple(
+    path
+    for container in ('returnObj', 'data')
+    for path in [(container,)] + [(container, key) for key in ITEM_KEYS]
+)
+
+# 定位结果列表时关心的词法单元：完整字符串、未读完的字符串（单独的引号）、结构符号
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|"|[\[\]{}:,]')
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class JSONStreamError(ValueError):
+    """响应体不是合法的JSON"""
+
+
+class JSONArrayStream:
+    """
+    从JSON文本片段中逐条产出目标列表的元素
+
+    用法::
+
+        items = JSONArrayStream(response.iter_content(STREAM_CHUNK_SIZE))
+        for item in items:
+            ...
+        items.envelope['statusCode']
+    """
+
+    def __init__(self, chunks: Iterable[Any], paths: Optional[Sequence[Sequence[str]]] = None):
+        """
+        Args:
+            chunks: 响应体片段（UTF-8字节或字符串）
+            paths: 结果列表的候选键路径，默认为 DEFAULT_PATHS
+        """
+        self._chunks = chunks
+        self._paths = {tuple(path) for path in (paths if paths is not None else DEFAULT_PATHS)}
+        self._decoder = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        # 扫描状态：容器栈（'{' 或 '['）及各层对象当前的键
+        self._containers: List[str] = []
+        self._keys: List[Optional[str]] = []
+        self._expect_key = False
+        # 结果列表以外的文本，读完后解析为 envelope
+        self._outside: List[str] = []
+        self._in_array = False
+        self._envelope: Optional[Dict[str, Any]] = None
+        self.path: Optional[Tuple[str, ...]] = None
+        self.count = 0
+
+    @property
+    def envelope(self) -> Dict[str, Any]:
+        """去掉结果列表元素后的完整响应（读完响应后可用）"""
+        if self._envelope is None:
+            raise RuntimeError("响应尚未读完")
+        return self._envelope
+
+    def __iter__(self) -> Iterator[Any]:
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        chunks = iter(self._chunks)
+        while True:
+            if self._in_array:
+                yield from self._items()
+            if not self._in_array and self._scan():
+                continue
+            if self._eof:
+                break
+            chunk = next(chunks, None)
+            if chunk is None:
+                self._eof = True
+                self._feed(decoder.decode(b'', final=True))
+            else:
+                self._feed(chunk if isinstance(chunk, str) else decoder.decode(chunk))
+
+        if self._in_array:
+            raise JSONStreamError("结果列表未结束，响应体不完整")
+        self._outside.append(self._buf)
+        text = ''.join(self._outside)
+        self._outside = []
+        self._buf = ''
+        try:
+            envelope = json.loads(text) if text.strip() else {}
+        except ValueError as e:
+            raise JSONStreamError(f"响应体不是合法的JSON: {e}") from None
+        self._envelope = envelope if isinstance(envelope, dict) else {'returnObj': envelope}
+
+    def _feed(self, text: str) -> None:
+        """追加新收到的文本，丢弃已处理的部分"""
+        self._buf = self._buf[self._pos:] + text
+        self._pos = 0
+
+    def _scan(self) -> bool:
+        """
+        在结果列表之外扫描，直到进入目标列表或需要更多数据；
+        扫描过的文本移入 envelope
+
+        Returns:
+            是否进入了目标列表
+        """
+        buf = self._buf
+        pos = self._pos
+        entered = False
+        for match in _TOKEN.finditer(buf, pos):
+            token = match.group()
+            if token == '"':
+                # 字符串未读完，等待后续数据
+                break
+            pos = match.end()
+            if token[0] == '"':
+                if self._expect_key:
+                    self._keys[-1] = json.loads(token)
+                    self._expect_key = False
+            elif token in '{[':
+                entered = token == '[' and self.path is None and self._target()
+                if entered:
+                    self.path = tuple(self._keys)
+                self._containers.append(token)
+                self._keys.append(None)
+                self._expect_key = token == '{'
+                if entered:
+                    break
+            elif token in '}]':
+                if self._containers:
+                    self._containers.pop()
+                    self._keys.pop()
+                self._expect_key = False
+            elif token == ',':
+                self._expect_key = bool(self._containers) and self._containers[-1] == '{'
+        self._outside.append(buf[self._pos:pos])
+        self._buf = buf[pos:]
+        self._pos = 0
+        self._in_array = entered
+        return entered
+
+    def _target(self) -> bool:
+        """即将打开的列表是否位于目标键路径上（路径上只能是对象）"""
+        return '[' not in self._containers and tuple(self._keys) in self._paths
+
+    def _items(self) -> Iterator[Any]:
+        """逐条解析列表元素，直到列表结束或需要更多数据"""
+        buf = self._buf
+        end = len(buf)
+        decode = self._decoder.raw_decode
+        while True:
+            pos = _WHITESPACE.match(buf, self._pos).end()
+            if pos >= end:
+                break
+            char = buf[pos]
+            if char == ']':
+                # 列表结束：']' 留给扫描，envelope 中该字段为空列表
+                self._in_array = False
+                self._pos = pos
+                break
+            if char == ',':
+                self._pos = pos + 1
+                continue
+            try:
+                item, item_end = decode(buf, pos)
+            except ValueError as e:
+                if self._eof:
+                    raise JSONStreamError(f"响应体不是合法的JSON: {e}") from None
+                break
+            # 元素之后应为 ',' 或 ']'；否则数字可能还没有读完（如 "12." 之后还有小数位）
+            after = _WHITESPACE.match(buf, item_end).end()
+            if after >= end or buf[after] not in ',]':
+                if not self._eof:
+                    break
+                if after < end:
+                    raise JSONStreamError("响应体不是合法的JSON: 列表元素之后应为 ',' 或 ']'")
+            self._pos = item_end
+            self.count += 1
+            yield item
+
+
+def iter_items(response, paths: Optional[Sequence[Sequence[str]]] = None,
+               chunk_size: int = STREAM_CHUNK_SIZE) -> JSONArrayStream:
+    """
+    以流式方式读取响应中的结果列表
+
+    Args:
+        response: 以 stream=True 发出的请求的响应
+        paths: 结果列表的候选键路径，默认为 DEFAULT_PATHS
+        chunk_size: 每次读取的字节数
+
+    Returns:
+        JSONArrayStream；迭代完成后可通过 envelope 取得其余字段
+    """
+    return JSONArrayStream(response.iter_content(chunk_size), paths)
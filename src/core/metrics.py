@@ -0,0 +1,299 @@
+"""
+API调用指标（Prometheus文本格式）
+作为请求跟踪的监听器，按服务、接口统计调用次数、结果（业务码 800 为成功）和耗时分布。
+单次CLI调用结束时把计数累加进 node_exporter textfile collector 读取的文件；
+守护进程可以在本地端口上提供 /metrics。
+"""
+
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# 视为成功的业务状态码
+SUCCESS_CODES = {'800', '0'}
+
+# 耗时直方图的桶上界（秒）
+DURATION_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+REQUESTS_TOTAL = 'ctyun_api_requests_total'
+DURATION_SECONDS = 'ctyun_api_request_duration_seconds'
+RESPONSE_BYTES_TOTAL = 'ctyun_api_response_bytes_total'
+RETRIES_TOTAL = 'ctyun_api_retries_total'
+
+# 指标族：名称 -> (类型, 说明)，按此顺序输出
+_FAMILIES = {
+    REQUESTS_TOTAL: ('counter', 'CTyun API requests by endpoint, HTTP status and result.'),
+    DURATION_SECONDS: ('histogram', 'CTyun API request duration in seconds.'),
+    RESPONSE_BYTES_TOTAL: ('counter', 'CTyun API response body bytes.'),
+    RETRIES_TOTAL: ('counter', 'CTyun API transport-level retries.'),
+}
+
+_SAMPLE_RE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)\s*$')
+_LABEL_RE = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+
+# 样本键：(样本名, ((标签名, 标签值), ...))
+SampleKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def service_name(host: Optional[str]) -> str:
+    """由端点主机名得到服务名，如 ctecs-global.ctapi.ctyun.cn -> ctecs"""
+    if not host:
+        return 'unknown'
+    parts = [part for part in host.split('.', 1)[0].split('-') if part != 'global']
+    return parts[0] if parts else host
+
+
+def request_result(record: Dict[str, Any]) -> str:
+    """
+    请求结果：success 或 error
+
+    有业务状态码时以业务码为准（HTTP 200 也可能返回 statusCode 900），
+    没有业务码的响应按HTTP状态码判断。
+    """
+    if record.get('error') or record.get('status') is None:
+        return 'error'
+    api_status = record.get('api_status')
+    if api_status is not None:
+        return 'success' if api_status in SUCCESS_CODES else 'error'
+    return 'success' if record['status'] < 400 else 'error'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _unescape(value: str) -> str:
+    return re.sub(r'\\(.)', lambda m: '\n' if m.group(1) == 'n' else m.group(1), value)
+
+
+def _format_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(round(value, 6))
+
+
+def _family_of(name: str) -> Optional[str]:
+    if name in _FAMILIES:
+        return name
+    for suffix in ('_bucket', '_sum', '_count'):
+        if name.endswith(suffix) and name[:-len(suffix)] == DURATION_SECONDS:
+            return DURATION_SECONDS
+    return None
+
+
+def parse_samples(text: str) -> Dict[SampleKey, float]:
+    """
+    解析Prometheus文本格式中本模块的样本，其他指标忽略
+
+    Args:
+        text: 指标文本
+
+    Returns:
+        样本字典
+    """
+    samples: Dict[SampleKey, float] = {}
+    for line in text.splitlines():
+        if not line or line.startswith('#'):
+            continue
+        match = _SAMPLE_RE.match(line)
+        if not match or _family_of(match.group(1)) is None:
+            continue
+        try:
+            value = float(match.group(3))
+        except ValueError:
+            continue
+        labels = tuple((name, _unescape(raw)) for name, raw in _LABEL_RE.findall(match.group(2) or ''))
+        samples[(match.group(1), labels)] = value
+    return samples
+
+
+def render_samples(samples: Dict[SampleKey, float]) -> str:
+    """把样本输出为Prometheus文本格式（带 HELP/TYPE，同一指标族的样本相邻）"""
+    grouped: Dict[str, List[Tuple[SampleKey, float]]] = {name: [] for name in _FAMILIES}
+    for key, value in samples.items():
+        family = _family_of(key[0])
+        if family is not None:
+            grouped[family].append((key, value))
+
+    def order(item: Tuple[SampleKey, float]):
+        (name, labels), _ = item
+        # 直方图按标签分组，组内 bucket 按上界从小到大，之后是 sum、count
+        plain = tuple(pair for pair in labels if pair[0] != 'le')
+        le = dict(labels).get('le')
+        bound = float('inf') if le in (None, '+Inf') else float(le)
+        suffix = {'_bucket': 0, '_sum': 1, '_count': 2}.get(name[len(DURATION_SECONDS):], 0)
+        return plain, suffix, bound
+
+    lines = []
+    for family, items in grouped.items():
+        if not items:
+            continue
+        kind, help_text = _FAMILIES[family]
+        lines.append(f"# HELP {family} {help_text}")
+        lines.append(f"# TYPE {family} {kind}")
+        for (name, labels), value in sorted(items, key=order):
+            label_text = ','.join(f'{label}="{_escape(text)}"' for label, text in labels)
+            lines.append(f"{name}{{{label_text}}} {_format_value(value)}" if labels
+                         else f"{name} {_format_value(value)}")
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+class MetricsRegistry:
+    """API调用指标：接收跟踪记录并累计计数"""
+
+    def __init__(self):
+        self._samples: Dict[SampleKey, float] = {}
+        self._lock = threading.Lock()
+
+    def _inc(self, name: str, labels: Tuple[Tuple[str, str], ...], amount: float = 1) -> None:
+        key = (name, labels)
+        self._samples[key] = self._samples.get(key, 0) + amount
+
+    def __call__(self, record: Dict[str, Any]) -> None:
+        # 命中本地缓存或共享了其他请求结果的调用没有访问API
+        if record.get('cache') in ('hit', 'coalesced'):
+            return
+        endpoint = (('service', service_name(record.get('host'))),
+                    ('method', record.get('method') or ''),
+                    ('path', record.get('path') or ''))
+        status = record.get('status')
+        seconds = (record.get('elapsed_ms') or 0.0) / 1000
+        with self._lock:
+            self._inc(REQUESTS_TOTAL, endpoint + (
+                ('http_status', str(status) if status is not None else 'error'),
+                ('result', request_result(record))))
+            # 每个桶都要输出（包括计数为0的），否则直方图不完整
+            for bound in DURATION_BUCKETS:
+                self._inc(f'{DURATION_SECONDS}_bucket', endpoint + (('le', _format_value(bound)),),
+                          1 if seconds <= bound else 0)
+            self._inc(f'{DURATION_SECONDS}_bucket', endpoint + (('le', '+Inf'),))
+            self._inc(f'{DURATION_SECONDS}_sum', endpoint, seconds)
+            self._inc(f'{DURATION_SECONDS}_count', endpoint)
+            if record.get('bytes'):
+                self._inc(RESPONSE_BYTES_TOTAL, endpoint, record['bytes'])
+            if record.get('retries'):
+                self._inc(RETRIES_TOTAL, endpoint, record['retries'])
+
+    def samples(self) -> Dict[SampleKey, float]:
+        """当前样本的副本"""
+        with self._lock:
+            return dict(self._samples)
+
+    def render(self) -> str:
+        """Prometheus文本格式"""
+        return render_samples(self.samples())
+
+    def write_textfile(self, path: str) -> None:
+        """
+        把本进程的计数累加进 textfile collector 文件
+
+        文件中已有的样本与本次计数相加后整体替换（先写临时文件再改名），
+        并发执行的多个CLI进程通过文件锁串行合并。
+
+        Args:
+            path: 指标文件路径，通常以 .prom 结尾
+        """
+        samples = self.samples()
+        if not samples:
+            return
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with _file_lock(path + '.lock'):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    merged = parse_samples(f.read())
+            except FileNotFoundError:
+                merged = {}
+            for key, value in samples.items():
+                merged[key] = merged.get(key, 0) + value
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(render_samples(merged))
+            os.replace(temp_path, path)
+
+    def serve(self, port: int, host: str = '127.0.0.1'):
+        """
+        在后台线程中通过HTTP提供 /metrics
+
+        Args:
+            port: 监听端口
+            host: 监听地址，默认只监听本机
+
+        Returns:
+            HTTP服务器对象，调用 shutdown() 停止
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='ctyun-metrics', daemon=True).start()
+        return server
+
+
+class _file_lock:
+    """独占文件锁（不支持 fcntl 的平台上不加锁）"""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._fd: Optional[int] = None
+
+    def __enter__(self):
+        try:
+            import fcntl
+        except ImportError:
+            return self
+        self._fd = os.open(self._path, os.O_WRONLY | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._fd is not None:
+            import fcntl
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+def record_metrics(path: str):
+    """
+    开始统计API调用指标
+
+    Args:
+        path: textfile collector 指标文件
+
+    Returns:
+        结束函数：注销监听器并把计数累加进文件
+    """
+    from core.trace import tracer
+
+    path = os.path.expanduser(path)
+    registry = MetricsRegistry()
+    tracer.add_listener(registry)
+
+    def finish() -> None:
+        tracer.remove_listener(registry)
+        try:
+            registry.write_textfile(path)
+        except OSError as e:
+            import sys
+            sys.stderr.write(f"警告: 写入指标文件失败: {e}\n")
+    return finish
@@ -0,0 +1,392 @@
+"""
+通用分页器
+各服务API的分页约定各不相同（pageNo / pageNumber / pageNum / pageIndex、marker、
+通过请求头传递的 page/size 等），分页器按约定逐页调用服务客户端方法，
+并以生成器方式逐条产出结果，调用方无需关心具体的翻页方式::
+
+    for instance in Paginator(ECSClient(client).list_instances, region_id='...'):
+        ...
+"""
+
+import inspect
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from core import CTYUNAPIError
+
+
+# 表示成功的业务状态码（各服务返回的类型不统一）
+SUCCESS_CODES = (800, '800', 0, '0', 200, '200', 100000, '100000')
+
+# 结果列表常用的字段名，按优先级排列
+ITEM_KEYS = ('results', 'result', 'list', 'records', 'items', 'rows', 'data',
+             'contents', 'Contents', 'dataList', 'resultList', 'instances')
+
+# 总条数常用的字段名
+TOTAL_KEYS = ('totalCount', 'total', 'totalNum', 'totalSize', 'recordCount', 'totalRecords')
+
+# 总页数常用的字段名
+TOTAL_PAGE_KEYS = ('totalPage', 'totalPages', 'pages', 'pageCount')
+
+# marker分页时下一页标记、是否截断的常用字段名
+NEXT_MARKER_KEYS = ('nextMarker', 'NextMarker', 'next_marker', 'nextKeyMarker', 'NextKeyMarker')
+TRUNCATED_KEYS = ('isTruncated', 'IsTruncated', 'truncated')
+
+# 方法签名中页码、每页条数、marker参数的常见名称（用于自动推断分页方式）
+PAGE_PARAMS = ('page_no', 'page_number', 'page_num', 'page_index', 'page_now', 'current_page', 'page')
+SIZE_PARAMS = ('page_size', 'size', 'max_keys', 'limit', 'max_results')
+MARKER_PARAMS = ('marker', 'key_marker', 'next_marker', 'next_token')
+
+# 防止接口异常时无限翻页
+MAX_PAGES = 100000
+
+
+class PaginationError(CTYUNAPIError):
+    """分页过程中API返回错误"""
+
+
+class PageStyle:
+    """分页约定：页码/marker参数名、每页条数参数名及结果字段"""
+
+    def __init__(self, page_param: Optional[str] = None, size_param: Optional[str] = None,
+                 marker_param: Optional[str] = None, start: int = 1,
+                 default_size: int = 50, items_key: Optional[str] = None):
+        """
+        初始化分页约定
+
+        Args:
+            page_param: 页码参数名（页码分页）
+            size_param: 每页条数参数名
+            marker_param: marker参数名（marker分页）
+            start: 起始页码
+            default_size: 未指定每页条数时使用的值（一般取接口允许的最大值）
+            items_key: returnObj 中结果列表的字段名，不指定则自动识别
+        """
+        self.page_param = page_param
+        self.size_param = size_param
+        self.marker_param = marker_param
+        self.start = start
+        self.default_size = default_size
+        self.items_key = items_key
+
+    @property
+    def is_marker(self) -> bool:
+        return self.marker_param is not None
+
+
+# 需要特别说明的接口分页约定：{类名.方法名: PageStyle}
+# 其余方法根据参数名自动推断，见 infer_style()
+PAGE_STYLES: Dict[str, PageStyle] = {
+    'ECSClient.list_instances': PageStyle('page_no', 'page_size', default_size=50),
+    'BillingClient.query_ondemand_bill_flow': PageStyle('page_no', 'page_size', default_size=100,
+                                                        items_key='result'),
+    'IAMClient.list_users': PageStyle('page_num', 'page_size', default_size=100,
+                                      items_key='result'),
+    'AuditClient.list_events': PageStyle('page_number', 'page_size', default_size=100,
+                                         items_key='data'),
+    'ZOSClient.list_objects': PageStyle(marker_param='marker', size_param='max_keys',
+                                        default_size=1000),
+    # 同时支持页码和游标，页码分页可以在拿到总数后并发获取
+    'VPCClient.new_describe_subnets': PageStyle('page_no', 'page_size', default_size=200),
+    # 日志内容接口的 page/size 通过请求头传递，由客户端方法内部处理
+    'CFWClient.get_raw_log': PageStyle('page', 'size', default_size=100),
+    # 同时支持页码和游标（nextToken），使用页码分页
+    'VPCClient.new_describe_vpcs': PageStyle('page_no', 'page_size', default_size=200),
+    'VPCClient.describe_subnets': PageStyle('page_no', 'page_size', default_size=200),
+    'VPCClient.describe_security_groups': PageStyle('page_no', 'page_size'),
+    'VPCClient.new_describe_security_groups': PageStyle('page_no', 'page_size'),
+    'VPCClient.list_ports': PageStyle('page_no', 'page_size'),
+    'VPCClient.new_list_ports': PageStyle('page_no', 'page_size'),
+    'AoneClient.query_cert_list': PageStyle('page', 'per_page', default_size=1000),
+    'CSSCNClient.quota_list': PageStyle('current_num', 'page_size'),
+    'RedisClient.describe_parameter_modification_history': PageStyle('page', 'rows', default_size=100),
+    'RedisClient.find_history_slow_log': PageStyle('page', 'rows', default_size=100),
+}
+
+
+def _method_name(method: Callable) -> str:
+    owner = getattr(method, '__self__', None)
+    if owner is None:
+        # 未绑定的方法（类名.方法名）或普通函数
+        return getattr(method, '__qualname__', repr(method))
+    return type(owner).__name__ + '.' + getattr(method, '__name__', repr(method))
+
+
+def infer_style(method: Callable) -> PageStyle:
+    """
+    获取方法的分页约定
+
+    优先使用 PAGE_STYLES 中登记的约定，否则根据方法参数名推断。
+
+    Args:
+        method: 服务客户端的方法（绑定或未绑定）
+
+    Returns:
+        分页约定
+
+    Raises:
+        ValueError: 方法不支持分页
+    """
+    style = PAGE_STYLES.get(_method_name(method))
+    if style is not None:
+        return style
+
+    params = inspect.signature(method).parameters
+    size_param = next((name for name in SIZE_PARAMS if name in params), None)
+    marker_param = next((name for name in MARKER_PARAMS if name in params), None)
+    if marker_param:
+        return PageStyle(marker_param=marker_param, size_param=size_param)
+    page_param = next((name for name in PAGE_PARAMS if name in params), None)
+    if page_param:
+        return PageStyle(page_param, size_param)
+    raise ValueError(f"{_method_name(method)} 不支持分页")
+
+
+def _find_key(data: Dict[str, Any], keys) -> Optional[str]:
+    return next((key for key in keys if key in data), None)
+
+
+def _container(result: Dict[str, Any]) -> Any:
+    """分页数据所在的对象（多数接口为 returnObj）"""
+    for key in ('returnObj', 'data'):
+        if key in result and result[key] is not None:
+            return result[key]
+    return result
+
+
+def extract_items(result: Dict[str, Any], items_key: Optional[str] = None) -> List[Any]:
+    """
+    从一页响应中取出结果列表
+
+    Args:
+        result: 接口响应
+        items_key: 结果列表字段名，不指定则按常用字段名和唯一的列表字段识别
+
+    Returns:
+        结果列表
+
+    Raises:
+        PaginationError: 没有指定 items_key，且响应中有多个无法区分的列表字段
+    """
+    container = _container(result)
+    if isinstance(container, list):
+        return container
+    if not isinstance(container, dict):
+        return []
+    if items_key:
+        return container.get(items_key) or []
+
+    key = _find_key(container, ITEM_KEYS)
+    if key is not None and isinstance(container[key], list):
+        return container[key]
+    lists = [key for key, value in container.items() if isinstance(value, list)]
+    if len(lists) > 1:
+        raise PaginationError(f"无法确定结果列表字段（{', '.join(lists)}）")
+    return container[lists[0]] if lists else []
+
+
+def extract_total(result: Dict[str, Any]) -> Optional[int]:
+    """从响应中取出总条数，没有则返回None"""
+    container = _container(result)
+    for data in (container, result):
+        if isinstance(data, dict):
+            key = _find_key(data, TOTAL_KEYS)
+            if key is not None:
+                try:
+                    return int(data[key])
+                except (TypeError, ValueError):
+                    return None
+    return None
+
+
+def extract_total_pages(result: Dict[str, Any]) -> Optional[int]:
+    """从响应中取出总页数，没有则返回None"""
+    container = _container(result)
+    if isinstance(container, dict):
+        key = _find_key(container, TOTAL_PAGE_KEYS)
+        if key is not None:
+            try:
+                return int(container[key])
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+def check_page(result: Any) -> Dict[str, Any]:
+    """检查一页响应是否成功，失败时抛出 PaginationError"""
+    if not isinstance(result, dict):
+        raise PaginationError('接口未返回有效数据')
+    status_code = result.get('statusCode')
+    if status_code is not None and status_code not in SUCCESS_CODES:
+        raise PaginationError(
+            result.get('message') or result.get('description') or '未知错误',
+            code=str(result.get('errorCode') or result.get('error') or status_code),
+            status_code=status_code if isinstance(status_code, int) else 0,
+            request_id=str(result.get('requestId') or '')
+        )
+    if result.get('_mock'):
+        # 部分客户端在请求失败时返回模拟数据，翻页时视为错误
+        raise PaginationError('API调用失败（客户端返回了模拟数据）')
+    return result
+
+
+class Paginator:
+    """
+    通用分页器
+
+    迭代分页器得到逐条结果（惰性翻页），``pages()`` 得到逐页的原始响应。
+    页码分页的接口在第一页返回总条数（或总页数）后，其余页由有限数量的线程并发获取，
+    仍按页码顺序产出；总数未知时逐页串行获取。
+    """
+
+    def __init__(self, method: Callable, page_size: Optional[int] = None,
+                 max_items: Optional[int] = None, style: Optional[PageStyle] = None,
+                 workers: Optional[int] = None, **kwargs):
+        """
+        初始化分页器
+
+        Args:
+            method: 服务客户端的列表查询方法，如 ECSClient(client).list_instances
+            page_size: 每页条数，默认使用分页约定中的 default_size
+            max_items: 最多返回的条数，None表示不限制
+            style: 分页约定，默认由 infer_style() 推断
+            workers: 第一页返回总数后并发获取其余页的线程数，默认读取配置 max_concurrency，
+                1表示逐页串行获取
+            kwargs: 传给列表查询方法的其他参数（页码/marker参数会被覆盖）
+        """
+        self.method = method
+        self.style = style or infer_style(method)
+        self.page_size = page_size or self.style.default_size
+        self.max_items = max_items
+        if workers is None:
+            from config import config
+            workers = config.get_max_concurrency()
+        self.workers = max(1, workers)
+        self.kwargs = kwargs
+        # 第一页返回后可用
+        self.total: Optional[int] = None
+
+    def _call(self, **page_args) -> Dict[str, Any]:
+        kwargs = dict(self.kwargs)
+        if self.style.size_param:
+            kwargs[self.style.size_param] = self.page_size
+        kwargs.update(page_args)
+        return check_page(self.method(**kwargs))
+
+    def pages(self) -> Iterator[Dict[str, Any]]:
+        """逐页产出原始响应"""
+        if self.style.is_marker:
+            yield from self._marker_pages()
+        else:
+            yield from self._numbered_pages()
+
+    def _numbered_pages(self) -> Iterator[Dict[str, Any]]:
+        start = self.style.start
+        result = self._call(**{self.style.page_param: start})
+        items = extract_items(result, self.style.items_key)
+        self.total = extract_total(result)
+        yield result
+        if not items:
+            return
+
+        last_page = self._last_page(result, len(items))
+        if last_page is not None and self.workers > 1:
+            # 总数已知：其余页并发获取，按页码顺序产出
+            if last_page > start:
+                yield from self._prefetch_pages(start + 1, last_page)
+            return
+
+        seen = len(items)
+        page = start
+        for _ in range(MAX_PAGES):
+            # 优先以总条数/总页数判断是否结束（接口可能把每页条数限制得比请求的小）
+            total_pages = extract_total_pages(result)
+            if self.total is not None:
+                if seen >= self.total:
+                    return
+            elif total_pages is not None:
+                if page - start + 1 >= total_pages:
+                    return
+            elif len(items) < self.page_size:
+                return
+            if self.max_items is not None and seen >= self.max_items:
+                return
+
+            page += 1
+            result = self._call(**{self.style.page_param: page})
+            items = extract_items(result, self.style.items_key)
+            yield result
+            seen += len(items)
+            if not items:
+                return
+
+    def _last_page(self, first_page: Dict[str, Any], per_page: int) -> Optional[int]:
+        """根据第一页返回的总条数/总页数计算最后一页的页码，未知时返回None"""
+        start = self.style.start
+        total_pages = extract_total_pages(first_page)
+        if self.total is not None:
+            # 以实际返回的条数计算，接口可能把每页条数限制得比请求的小
+            total_pages = -(-self.total // per_page)
+        if total_pages is None:
+            return None
+        if self.max_items is not None:
+            total_pages = min(total_pages, -(-self.max_items // per_page))
+        return start + min(total_pages, MAX_PAGES) - 1
+
+    def _prefetch_pages(self, first: int, last: int) -> Iterator[Dict[str, Any]]:
+        """用有限的线程并发获取 first..last 页，按页码顺序产出"""
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(self.workers, last - first + 1)
+        # 最多领先消费者 2*workers 页，避免结果堆积在内存中
+        window = workers * 2
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ctyun-page')
+        pending: 'deque' = deque()
+        next_page = first
+        try:
+            while pending or next_page <= last:
+                while next_page <= last and len(pending) < window:
+                    pending.append(executor.submit(self._call, **{self.style.page_param: next_page}))
+                    next_page += 1
+                result = pending.popleft().result()
+                yield result
+                if not extract_items(result, self.style.items_key):
+                    # 数据在翻页过程中减少了，后面的页不再需要
+                    return
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _marker_pages(self) -> Iterator[Dict[str, Any]]:
+        marker = self.kwargs.get(self.style.marker_param)
+        for _ in range(MAX_PAGES):
+            result = self._call(**{self.style.marker_param: marker})
+            yield result
+
+            container = _container(result)
+            if not isinstance(container, dict):
+                return
+            truncated_key = _find_key(container, TRUNCATED_KEYS)
+            next_key = _find_key(container, NEXT_MARKER_KEYS)
+            next_marker = container.get(next_key) if next_key else None
+            if truncated_key is not None:
+                if str(container[truncated_key]).lower() not in ('true', '1'):
+                    return
+                if not next_marker:
+                    # 未返回下一页标记时，以本页最后一个对象的key继续
+                    items = extract_items(result, self.style.items_key)
+                    last = items[-1] if items else None
+                    next_marker = last.get('key') or last.get('Key') if isinstance(last, dict) else None
+            if not next_marker or next_marker == marker:
+                return
+            marker = next_marker
+
+    def __iter__(self) -> Iterator[Any]:
+        count = 0
+        for result in self.pages():
+            for item in extract_items(result, self.style.items_key):
+                if self.max_items is not None and count >= self.max_items:
+                    return
+                yield item
+                count += 1
@@ -0,0 +1,211 @@
+"""
+请求耗时统计（--profile-requests）
+作为请求跟踪的监听器，按端点（方法 + 路径）汇总请求次数、耗时分布、字节数、
+连接复用与重试，命令结束时输出直方图或写出JSON
+"""
+
+import json
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, TextIO
+
+
+# 耗时直方图的桶上界（毫秒），最后一个桶收集更慢的请求
+LATENCY_BUCKETS_MS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def _bucket(elapsed_ms: float) -> int:
+    for i, bound in enumerate(LATENCY_BUCKETS_MS):
+        if elapsed_ms <= bound:
+            return i
+    return len(LATENCY_BUCKETS_MS)
+
+
+class _EndpointStats:
+    """单个端点的累计数据"""
+
+    __slots__ = ('method', 'path', 'hosts', 'latencies', 'ttfb_total', 'ttfb_count',
+                 'histogram', 'errors', 'request_bytes', 'response_bytes',
+                 'reused', 'new_connections', 'retries', 'cache_hits')
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.hosts = set()
+        self.latencies: List[float] = []
+        self.ttfb_total = 0.0
+        self.ttfb_count = 0
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.errors = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.reused = 0
+        self.new_connections = 0
+        self.retries = 0
+        self.cache_hits = 0
+
+    def add(self, record: Dict[str, Any]) -> None:
+        elapsed = record.get('elapsed_ms') or 0.0
+        self.latencies.append(elapsed)
+        self.histogram[_bucket(elapsed)] += 1
+        if record.get('host'):
+            self.hosts.add(record['host'])
+        if record.get('ttfb_ms') is not None and record.get('cache') in (None, 'miss'):
+            self.ttfb_total += record['ttfb_ms']
+            self.ttfb_count += 1
+        status = record.get('status')
+        if record.get('error') or status is None or status >= 400:
+            self.errors += 1
+        self.request_bytes += record.get('request_bytes') or 0
+        self.response_bytes += record.get('bytes') or 0
+        if record.get('reused') is True:
+            self.reused += 1
+        elif record.get('reused') is False:
+            self.new_connections += 1
+        self.retries += record.get('retries') or 0
+        if record.get('cache') == 'hit':
+            self.cache_hits += 1
+
+    def summary(self) -> Dict[str, Any]:
+        values = sorted(self.latencies)
+        count = len(values)
+        total = sum(values)
+        return {
+            'endpoint': f"{self.method} {self.path}",
+            'method': self.method,
+            'path': self.path,
+            'hosts': sorted(self.hosts),
+            'count': count,
+            'errors': self.errors,
+            'total_ms': round(total, 2),
+            'mean_ms': round(total / count, 2) if count else 0.0,
+            'p50_ms': round(_percentile(values, 0.5), 2),
+            'p90_ms': round(_percentile(values, 0.9), 2),
+            'p99_ms': round(_percentile(values, 0.99), 2),
+            'max_ms': round(values[-1], 2) if values else 0.0,
+            'ttfb_mean_ms': round(self.ttfb_total / self.ttfb_count, 2) if self.ttfb_count else None,
+            'reused_connections': self.reused,
+            'new_connections': self.new_connections,
+            'retries': self.retries,
+            'cache_hits': self.cache_hits,
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'histogram': list(self.histogram),
+        }
+
+
+class RequestProfiler:
+    """按端点汇总跟踪记录"""
+
+    def __init__(self):
+        self._endpoints: Dict[tuple, _EndpointStats] = {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def __call__(self, record: Dict[str, Any]) -> None:
+        key = (record.get('method'), record.get('path'))
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = _EndpointStats(*key)
+            stats.add(record)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        汇总报告
+
+        Returns:
+            报告字典，endpoints 按总耗时从高到低排列
+        """
+        with self._lock:
+            endpoints = [stats.summary() for stats in self._endpoints.values()]
+        endpoints.sort(key=lambda item: item['total_ms'], reverse=True)
+        return {
+            'started': round(self.started, 3),
+            'wall_ms': round((time.time() - self.started) * 1000, 2),
+            'requests': sum(item['count'] for item in endpoints),
+            'request_ms': round(sum(item['total_ms'] for item in endpoints), 2),
+            'buckets_ms': LATENCY_BUCKETS_MS + [None],
+            'endpoints': endpoints,
+        }
+
+    def dump(self, path: str) -> None:
+        """把报告写为JSON文件"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+
+    def print_report(self, stream: TextIO, top: Optional[int] = 20) -> None:
+        """
+        输出文本报告：端点汇总表和各端点的耗时直方图
+
+        Args:
+            stream: 输出流
+            top: 最多列出的端点数，None表示全部
+        """
+        report = self.report()
+        endpoints = report['endpoints'][:top] if top else report['endpoints']
+        write = stream.write
+        write(f"\n请求耗时统计：{report['requests']} 个请求，"
+              f"累计 {report['request_ms'] / 1000:.2f}s，命令总耗时 {report['wall_ms'] / 1000:.2f}s\n")
+        if not endpoints:
+            write("（没有API请求）\n")
+            return
+
+        from utils.streaming import display_width
+
+        columns = [('次数', 6), ('总耗时s', 9), ('平均ms', 9), ('p50', 8), ('p90', 8), ('max', 8),
+                   ('首字节ms', 9), ('复用', 5), ('重试', 5), ('错误', 5), ('响应KB', 9)]
+        write(' '.join(' ' * (width - display_width(name)) + name for name, width in columns)
+              + '  端点\n')
+        for item in endpoints:
+            connections = item['reused_connections'] + item['new_connections']
+            reuse = f"{item['reused_connections'] * 100 // connections}%" if connections else '-'
+            ttfb = f"{item['ttfb_mean_ms']:.1f}" if item['ttfb_mean_ms'] is not None else '-'
+            write(f"{item['count']:>6} {item['total_ms'] / 1000:>9.2f} {item['mean_ms']:>9.1f} "
+                  f"{item['p50_ms']:>8.1f} {item['p90_ms']:>8.1f} {item['max_ms']:>8.1f} "
+                  f"{ttfb:>9} {reuse:>5} {item['retries']:>5} {item['errors']:>5} "
+                  f"{item['response_bytes'] / 1024:>9.1f}  {item['endpoint']}\n")
+
+        labels = [f"≤{bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        write("\n耗时分布：\n")
+        for item in endpoints:
+            write(f"  {item['endpoint']}\n")
+            peak = max(item['histogram'])
+            for label, count in zip(labels, item['histogram']):
+                if count:
+                    bar = '#' * max(1, count * 40 // peak)
+                    write(f"    {label:>10} {count:>6} {bar}\n")
+        if top and len(report['endpoints']) > top:
+            write(f"\n（仅列出耗时最多的 {top} 个端点，共 {len(report['endpoints'])} 个）\n")
+
+
+def profile_requests(json_path: Optional[str] = None):
+    """
+    开始统计请求耗时
+
+    Args:
+        json_path: 报告写入的JSON文件，不指定时在结束时把文本报告输出到标准错误
+
+    Returns:
+        结束函数：注销监听器并输出报告
+    """
+    from core.trace import tracer
+
+    profiler = RequestProfiler()
+    tracer.add_listener(profiler)
+
+    def finish() -> None:
+        tracer.remove_listener(profiler)
+        if json_path:
+            profiler.dump(json_path)
+        else:
+            profiler.print_report(sys.stderr)
+    return finish
@@ -0,0 +1,182 @@
+"""
+客户端限流
+按端点（主机 + API路径）划分令牌桶，进程内所有客户端和线程共享。
+收到 429 时该端点的速率减半并遵守 Retry-After，之后随时间线性恢复（AIMD），
+避免并发脚本触发服务端限流后集中重试。
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+# 自适应限流的最低速率（请求/秒）
+MIN_RATE = 0.5
+
+# Retry-After 的最长等待时间（秒）
+MAX_RETRY_AFTER = 60.0
+
+# 未再被限流时每秒恢复的速率（相对上限的比例）
+RECOVERY_PER_SECOND = 0.1
+
+# 未配置固定速率时，持续这么久（秒）没有 429 后取消限速
+RELEASE_AFTER = 60.0
+
+# 同一时间窗口（秒）内的多个 429 只降速一次：并发请求往往同时被限流
+DECREASE_INTERVAL = 1.0
+
+
+class TokenBucket:
+    """
+    单个端点的令牌桶
+
+    rate 为 None 表示不限速（未配置固定速率且尚未遇到 429）。
+    令牌可以透支为负数：并发线程按到达顺序排队，各自等待对应的时间。
+    """
+
+    def __init__(self, rate: Optional[float], burst: float):
+        self.limit = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        # 最近一秒左右的请求数，用于估计首次被限流时的实际速率
+        self._window_start = self.updated
+        self._window_count = 0
+        self._observed = 0.0
+        self._ceiling: Optional[float] = None
+        self._decreased = float('-inf')
+        self._recovered = self.updated
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """取一个令牌，返回需要等待的秒数"""
+        with self._lock:
+            now = time.monotonic()
+            self._count(now)
+            if self.rate is None:
+                return max(self.blocked_until - now, 0.0)
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return max(-self.tokens / self.rate, self.blocked_until - now, 0.0)
+
+    def _count(self, now: float) -> None:
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            self._observed = self._window_count / elapsed
+            self._window_start = now
+            self._window_count = 0
+        self._window_count += 1
+
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        """服务端返回 429：速率减半，并在 Retry-After 之前暂停该端点"""
+        with self._lock:
+            now = time.monotonic()
+            if self.rate is None:
+                elapsed = max(now - self._window_start, 1.0)
+                self.rate = max(self._observed, self._window_count / elapsed, MIN_RATE * 2)
+                self.updated = now
+            if now - self._decreased >= DECREASE_INTERVAL:
+                # 未配置固定速率时，以被限流时的速率作为恢复的上限
+                if self.limit is None:
+                    self._ceiling = self.rate
+                self.rate = max(self.rate / 2, MIN_RATE)
+                self.tokens = min(self.tokens, 0.0)
+                self._decreased = self._recovered = now
+            pause = retry_after if retry_after is not None else 1.0 / self.rate
+            self.blocked_until = max(self.blocked_until, now + min(pause, MAX_RETRY_AFTER))
+
+    def succeeded(self) -> None:
+        """请求未被限流：按距上次调整的时间恢复速率"""
+        if self.rate is None or (self.limit is not None and self.rate >= self.limit):
+            return
+        with self._lock:
+            if self.rate is None:
+                return
+            now = time.monotonic()
+            ceiling = self.limit if self.limit is not None else self._ceiling
+            self.rate = min(self.rate + ceiling * RECOVERY_PER_SECOND * (now - self._recovered), ceiling)
+            self._recovered = now
+            # 未配置固定速率时，恢复到上限后又持续一段时间没有 429，取消限速
+            if self.limit is None and self.rate >= ceiling and now - self._decreased >= RELEASE_AFTER:
+                self.rate = None
+                self.tokens = self.burst
+
+
+class RateLimiter:
+    """按端点划分的令牌桶集合"""
+
+    def __init__(self):
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._settings: Tuple[float, float, bool] = (0.0, 0.0, False)
+
+    @property
+    def enabled(self) -> bool:
+        """是否限流：配置了固定速率或开启了自适应限流"""
+        rate, _, adaptive = self._settings
+        return rate > 0 or adaptive
+
+    def configure(self, rate: float = 0.0, burst: float = 0.0, adaptive: bool = True) -> None:
+        """
+        设置限流参数；参数变化时丢弃已有的令牌桶
+
+        Args:
+            rate: 每个端点每秒的请求数上限，0表示不设固定上限
+            burst: 令牌桶容量（允许的突发请求数），0表示与速率相同
+            adaptive: 收到 429 时是否自动降低该端点的速率
+        """
+        settings = (float(rate), float(burst), bool(adaptive))
+        with self._lock:
+            if settings != self._settings:
+                self._settings = settings
+                self._buckets = {}
+
+    def bucket(self, url: str) -> TokenBucket:
+        """URL所属端点的令牌桶"""
+        parts = urlsplit(url)
+        key = (parts.netloc, parts.path)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    rate, burst, _ = self._settings
+                    bucket = TokenBucket(rate if rate > 0 else None, burst or max(rate, 1.0))
+                    self._buckets[key] = bucket
+        return bucket
+
+    def acquire(self, url: str) -> TokenBucket:
+        """
+        等待URL所属端点的令牌
+
+        Returns:
+            令牌桶，请求结束后据响应调用 throttled/succeeded
+        """
+        bucket = self.bucket(url)
+        wait = bucket.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return bucket
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """解析 Retry-After 响应头（秒数或HTTP日期）"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+limiter = RateLimiter()
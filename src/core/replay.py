@@ -0,0 +1,263 @@
+"""
+API流量录制与回放
+录制时把每个请求的指纹（不含 Eop-date、ctyun-eop-request-id 等易变请求头）和响应
+写入目录中的归档；回放时按指纹返回录制的响应，不访问网络，可模拟录制时的延迟。
+用于在离线环境中重复同一批调用，测量解析、格式化、签名等客户端耗时。
+
+归档格式：
+    index.jsonl   每行一条响应的索引：指纹、方法、URL、状态码、响应头、响应体位置、耗时
+    bodies.bin    zlib 压缩的响应体，内容相同的响应体只保存一份
+"""
+
+import hashlib
+import http.client
+import json
+import os
+import threading
+import time
+import zlib
+from collections import deque
+from datetime import timedelta
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+INDEX_FILE = 'index.jsonl'
+BODIES_FILE = 'bodies.bin'
+
+# 不录制的响应头：响应体已解压保存，长度和传输方式在回放时不再适用
+_SKIPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection',
+                    'keep-alive', 'date', 'set-cookie'}
+
+
+class ReplayMiss(requests.exceptions.ConnectionError):
+    """回放归档中没有匹配的请求（按网络错误处理）"""
+
+
+def _endpoint(url: str) -> str:
+    """不含查询参数的URL，指纹不匹配时按它回放"""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, '', ''))
+
+
+class TrafficRecorder:
+    """把请求和响应追加写入归档目录（线程安全）"""
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: 归档目录，不存在时创建；已有归档时追加
+        """
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._index = open(os.path.join(self.directory, INDEX_FILE), 'a', encoding='utf-8')
+        self._bodies = open(os.path.join(self.directory, BODIES_FILE), 'ab')
+        # 已保存的响应体：{内容摘要: (位置, 长度)}
+        self._stored: Dict[str, Tuple[int, int]] = {}
+        for entry in _read_index(self.directory):
+            self._stored.setdefault(entry.get('digest', ''), (entry['offset'], entry['size']))
+        self.count = 0
+
+    def record(self, key: str, method: str, url: str, response: requests.Response,
+               elapsed: float) -> None:
+        """
+        录制一个响应
+
+        Args:
+            key: 请求指纹
+            method: HTTP方法
+            url: 请求URL（未替换端点）
+            response: 响应；流式响应会被完整读取，之后仍可按原方式读取
+            elapsed: 请求耗时（秒）
+        """
+        body = response.content or b''
+        digest = hashlib.sha256(body).hexdigest()
+        headers = {name: value for name, value in response.headers.items()
+                   if name.lower() not in _SKIPPED_HEADERS}
+        with self._lock:
+            location = self._stored.get(digest)
+            if location is None:
+                data = zlib.compress(body)
+                self._bodies.seek(0, os.SEEK_END)
+                location = (self._bodies.tell(), len(data))
+                self._bodies.write(data)
+                self._bodies.flush()
+                self._stored[digest] = location
+            entry = {'key': key, 'method': method.upper(), 'url': url, 'status': response.status_code,
+                     'headers': headers, 'offset': location[0], 'size': location[1], 'digest': digest,
+                     'elapsed_ms': round(elapsed * 1000, 2)}
+            self._index.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+            self._index.flush()
+            self.count += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._index.close()
+            self._bodies.close()
+
+
+class TrafficReplayer:
+    """
+    从归档中回放响应（线程安全）
+
+    同一指纹录制了多次时按录制顺序依次返回，用完后重复最后一次。
+    指纹不匹配（例如请求体中含有当前时间）时，按方法和不含查询参数的URL依次返回录制的响应。
+    """
+
+    def __init__(self, directory: str, latency: Union[None, float, str] = None):
+        """
+        Args:
+            directory: 归档目录
+            latency: 模拟延迟：None 不等待，'recorded' 按录制时的耗时等待，数字为固定毫秒数
+        """
+        self.directory = os.path.expanduser(directory)
+        entries = _read_index(self.directory)
+        if not entries and not os.path.exists(os.path.join(self.directory, INDEX_FILE)):
+            raise FileNotFoundError(f"回放归档不存在: {self.directory}")
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._by_key: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._by_endpoint: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = {}
+        for entry in entries:
+            self._by_key.setdefault(entry['key'], deque()).append(entry)
+            self._by_endpoint.setdefault((entry['method'], _endpoint(entry['url'])), deque()).append(entry)
+        with open(os.path.join(self.directory, BODIES_FILE), 'rb') as f:
+            self._bodies = f.read()
+        self._decompressed: Dict[int, bytes] = {}
+        self.hits = 0
+        self.fallbacks = 0
+        self.misses: List[str] = []
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._by_key.values())
+
+    @staticmethod
+    def _next(entries: Optional[Deque[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        if not entries:
+            return None
+        return entries.popleft() if len(entries) > 1 else entries[0]
+
+    def _body(self, entry: Dict[str, Any]) -> bytes:
+        offset = entry['offset']
+        body = self._decompressed.get(offset)
+        if body is None:
+            body = zlib.decompress(self._bodies[offset:offset + entry['size']])
+            self._decompressed[offset] = body
+        return body
+
+    def replay(self, key: str, method: str, url: str, request: requests.PreparedRequest) -> requests.Response:
+        """
+        返回录制的响应；没有匹配的录制时抛出 ReplayMiss
+
+        Args:
+            key: 请求指纹
+            method: HTTP方法
+            url: 请求URL（未替换端点）
+            request: 准备好的请求，附在响应上
+        """
+        from core.transport import EOPResponse
+
+        method = method.upper()
+        with self._lock:
+            entry = self._next(self._by_key.get(key))
+            if entry is not None:
+                self.hits += 1
+            else:
+                entry = self._next(self._by_endpoint.get((method, _endpoint(url))))
+                if entry is None:
+                    self.misses.append(f"{method} {_endpoint(url)}")
+                    raise ReplayMiss(f"回放归档中没有该请求: {method} {_endpoint(url)}")
+                self.fallbacks += 1
+            body = self._body(entry)
+
+        delay = self._delay(entry)
+        if delay > 0:
+            time.sleep(delay)
+
+        response = EOPResponse()
+        response.status_code = entry['status']
+        response.reason = http.client.responses.get(entry['status'], '')
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = body
+        response._content_consumed = True
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(seconds=delay)
+        return response
+
+    def _delay(self, entry: Dict[str, Any]) -> float:
+        if self.latency is None:
+            return 0.0
+        if self.latency == 'recorded':
+            return entry.get('elapsed_ms', 0) / 1000
+        return float(self.latency) / 1000
+
+
+def _read_index(directory: str) -> List[Dict[str, Any]]:
+    """读取归档索引，忽略写了一半的最后一行"""
+    path = os.path.join(directory, INDEX_FILE)
+    entries = []
+    try:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def parse_latency(value: Optional[str]) -> Union[None, float, str]:
+    """解析 --replay-latency：recorded 或毫秒数"""
+    if value is None or value == '':
+        return None
+    if value == 'recorded':
+        return value
+    latency = float(value)
+    if latency < 0:
+        raise ValueError(f"延迟不能为负数: {value}")
+    return latency
+
+
+def record_traffic(transport, directory: str):
+    """
+    开始录制传输对象的API流量
+
+    Returns:
+        结束函数：停止录制并关闭归档
+    """
+    recorder = TrafficRecorder(directory)
+    transport.recorder = recorder
+
+    def finish() -> None:
+        if transport.recorder is recorder:
+            transport.recorder = None
+        recorder.close()
+    return finish
+
+
+def replay_traffic(transport, directory: str, latency: Union[None, float, str] = None):
+    """
+    开始从归档回放传输对象的API流量
+
+    Returns:
+        结束函数：停止回放，有未命中的请求时输出警告
+    """
+    replayer = TrafficReplayer(directory, latency)
+    transport.replayer = replayer
+
+    def finish() -> None:
+        if transport.replayer is replayer:
+            transport.replayer = None
+        if replayer.misses:
+            import sys
+            sys.stderr.write(f"警告: {len(replayer.misses)} 个请求在回放归档中没有录制: "
+                             f"{', '.join(sorted(set(replayer.misses))[:5])}\n")
+    return finish
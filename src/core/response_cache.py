@@ -0,0 +1,76 @@
+"""
+内存响应缓存
+在同一进程内短时间复用只读请求的响应，写操作会清空缓存
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+
+# 只读接口路径最后一段的常见前缀（大部分V4查询接口使用POST）
+READ_PATH_PATTERN = re.compile(
+    r'^(list|describe|query|show|get|check|count|statistics|search)', re.IGNORECASE
+)
+
+
+class ResponseCache:
+    """带有效期和容量上限的LRU响应缓存（线程安全）"""
+
+    def __init__(self, ttl: int = 60, max_entries: int = 512):
+        """
+        初始化响应缓存
+
+        Args:
+            ttl: 缓存有效期（秒）
+            max_entries: 最多缓存的响应数量
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_cacheable(method: str, url: str) -> bool:
+        """判断请求是否为只读请求"""
+        method = method.upper()
+        if method in ('GET', 'HEAD'):
+            return True
+        if method != 'POST':
+            return False
+        last_segment = urlsplit(url).path.rstrip('/').rsplit('/', 1)[-1]
+        return bool(READ_PATH_PATTERN.match(last_segment))
+
+    def get(self, key: str) -> Optional[Any]:
+        """获取未过期的缓存响应"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, value: Any) -> None:
+        """写入缓存，超出容量时淘汰最久未使用的条目"""
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
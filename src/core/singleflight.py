@@ -0,0 +1,67 @@
+"""
+相同请求合并（singleflight）
+同一时刻发出的相同只读请求只有第一个真正访问网络，其余调用等待并共享它的结果
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class _Call:
+    """一次进行中的调用"""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """按键合并进行中的调用（线程安全）"""
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        # 共享了其他调用结果的次数
+        self.shared = 0
+
+    def do(self, key: str, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        执行调用；已有相同键的调用在进行时等待其结果
+
+        Args:
+            key: 调用键（请求指纹）
+            func: 实际执行的函数
+
+        Returns:
+            (结果, 是否共享了其他线程的结果)；调用出错时所有等待者收到同一个异常
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def __len__(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,230 @@
+"""
+请求跟踪
+开启后，传输层为每个请求生成一条结构化记录（端点、状态码、字节数、耗时、连接复用等）
+并交给已注册的监听器；没有监听器时不计时、也不构造任何记录
+"""
+
+import re
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional, TextIO
+from urllib.parse import urlsplit
+
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from utils import jsoncodec
+
+
+# 跟踪记录监听器：接收一条记录字典
+TraceListener = Callable[[Dict[str, Any]], None]
+
+
+class RequestTracer:
+    """请求跟踪器：进程内唯一，监听器在CLI启动时按选项注册"""
+
+    def __init__(self):
+        self._listeners: List[TraceListener] = []
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """是否有监听器；传输层据此决定是否计时和构造记录"""
+        return bool(self._listeners)
+
+    def add_listener(self, listener: TraceListener) -> None:
+        with self._lock:
+            self._listeners = self._listeners + [listener]
+
+    def remove_listener(self, listener: TraceListener) -> None:
+        with self._lock:
+            self._listeners = [item for item in self._listeners if item is not listener]
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        """把记录交给所有监听器，监听器出错不影响请求本身"""
+        for listener in self._listeners:
+            try:
+                listener(record)
+            except Exception:
+                pass
+
+
+tracer = RequestTracer()
+
+
+# ==================== 连接复用统计 ====================
+
+_connects = threading.local()
+
+
+def connection_count() -> int:
+    """当前线程新建的TCP连接数；请求前后不变说明复用了连接池中的连接"""
+    return getattr(_connects, 'count', 0)
+
+
+def _count_connect() -> None:
+    _connects.count = getattr(_connects, 'count', 0) + 1
+
+
+class _CountingHTTPConnection(HTTPConnection):
+    def connect(self):
+        _count_connect()
+        super().connect()
+
+
+class _CountingHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        _count_connect()
+        super().connect()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+
+# 传输层连接池管理器使用的连接池类
+COUNTING_POOL_CLASSES = {
+    'http': _CountingHTTPConnectionPool,
+    'https': _CountingHTTPSConnectionPool,
+}
+
+
+def _body_size(response, streamed: bool) -> Optional[int]:
+    """响应体字节数；流式响应不读取响应体，只取 Content-Length"""
+    if not streamed:
+        return len(response.content)
+    length = response.headers.get('Content-Length')
+    return int(length) if length and length.isdigit() else None
+
+
+# 响应体开头的业务状态码（statusCode 通常是第一个字段），只扫描前 2KB
+_API_STATUS_RE = re.compile(rb'"statusCode"\s*:\s*"?(-?\d+)')
+_API_STATUS_SCAN_BYTES = 2048
+
+
+def _api_status(response, streamed: bool) -> Optional[str]:
+    """响应中的业务状态码（如 800、900），无法识别时返回None"""
+    if streamed:
+        return None
+    match = _API_STATUS_RE.search(response.content[:_API_STATUS_SCAN_BYTES])
+    return match.group(1).decode('ascii') if match else None
+
+
+def _request_size(body: Any) -> int:
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    return 0
+
+
+def _retry_count(response) -> int:
+    retries = getattr(getattr(response, 'raw', None), 'retries', None)
+    history = getattr(retries, 'history', None)
+    return (len(history) if history else 0) + getattr(response, 'throttle_retries', 0)
+
+
+def build_record(method: str, url: str, started: float, elapsed: float,
+                 response=None, error: Optional[BaseException] = None,
+                 cache: Optional[str] = None,
+                 headers: Optional[Dict[str, str]] = None,
+                 streamed: bool = False,
+                 new_connections: Optional[int] = None,
+                 body: Any = None) -> Dict[str, Any]:
+    """
+    构造一条跟踪记录
+
+    Args:
+        method: HTTP方法
+        url: 请求URL
+        started: 开始时间（时间戳）
+        elapsed: 总耗时（秒），含重试与缓存查找
+        response: 响应对象，请求异常时为None
+        error: 请求异常
+        cache: 响应缓存状态 hit/miss/coalesced（共享了进行中的相同请求），未启用缓存时为None
+        headers: 请求头
+        streamed: 是否为流式响应
+        new_connections: 本次请求新建的连接数，0表示复用了已有连接
+        body: 请求体（响应不可用时用于统计请求字节数）
+
+    Returns:
+        记录字典
+    """
+    parts = urlsplit(url)
+    record = {
+        'ts': round(started, 3),
+        'method': method.upper(),
+        'host': parts.hostname,
+        'path': parts.path or '/',
+        'status': None,
+        'request_bytes': _request_size(body),
+        'bytes': None,
+        'elapsed_ms': round(elapsed * 1000, 2),
+        'ttfb_ms': None,
+        'reused': None,
+        'retries': 0,
+        'api_status': None,
+        'cache': cache,
+        'request_id': (headers or {}).get('ctyun-eop-request-id'),
+    }
+    if response is not None:
+        record['status'] = response.status_code
+        if response.request is not None:
+            record['request_bytes'] = _request_size(response.request.body)
+        record['bytes'] = _body_size(response, streamed)
+        # requests 记录的 elapsed 为发出请求到解析完响应头的时间
+        if response.elapsed is not None:
+            record['ttfb_ms'] = round(response.elapsed.total_seconds() * 1000, 2)
+        record['retries'] = _retry_count(response)
+        record['api_status'] = _api_status(response, streamed)
+    if new_connections is not None and cache in (None, 'miss'):
+        record['reused'] = new_connections == 0
+    if error is not None:
+        record['error'] = f"{type(error).__name__}: {error}"
+    return record
+
+
+class JSONLinesWriter:
+    """把跟踪记录逐行写为JSON（默认写到标准错误）"""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: 输出文件（追加写入），不指定时写到标准错误
+        """
+        self._file: Optional[TextIO] = open(path, 'a', encoding='utf-8') if path else None
+        self._lock = threading.Lock()
+
+    def __call__(self, record: Dict[str, Any]) -> None:
+        line = jsoncodec.dumps(record) + '\n'
+        stream = self._file or sys.stderr
+        with self._lock:
+            stream.write(line)
+            stream.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def trace_to(path: Optional[str] = None) -> Callable[[], None]:
+    """
+    开启跟踪并写出JSON行
+
+    Returns:
+        关闭函数：注销监听器并关闭文件
+    """
+    writer = JSONLinesWriter(path)
+    tracer.add_listener(writer)
+
+    def stop() -> None:
+        tracer.remove_listener(writer)
+        writer.close()
+    return stop
@@ -0,0 +1,430 @@
+"""
+EOP请求传输层
+统一处理签名、连接池、超时、重试、限流与JSON解码
+"""
+
+import hashlib
+import time
+from typing import TYPE_CHECKING, Dict, Any, Optional, Union
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from auth.eop_signature import CTYUNEOPAuth
+from config import config
+from core.ratelimit import limiter, retry_after_seconds
+from core.response_cache import ResponseCache
+from core.singleflight import SingleFlight
+from core.trace import COUNTING_POOL_CLASSES, build_record, connection_count, tracer
+from utils import jsoncodec
+
+if TYPE_CHECKING:
+    from core.replay import TrafficRecorder, TrafficReplayer
+
+
+# 重试的HTTP状态码：限流与网关类错误
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+# 服务端限流的状态码；开启客户端限流时由会话经过令牌桶重试，不交给连接池适配器
+THROTTLED_STATUS = 429
+
+
+class _UnthrottledRetry(Retry):
+    """不重试 429（即使带有 Retry-After），限流重试由会话经过令牌桶完成"""
+
+    RETRY_AFTER_STATUS_CODES = Retry.RETRY_AFTER_STATUS_CODES - {THROTTLED_STATUS}
+
+
+# 每次请求都会变化、不影响语义的请求头（小写）
+VOLATILE_HEADERS = {'ctyun-eop-request-id', 'eop-date', 'eop-authorization'}
+
+# requests.Session.request 在 method、url 之后的参数顺序
+_REQUEST_PARAMS = ('params', 'data', 'headers', 'cookies', 'files', 'auth', 'timeout',
+                   'allow_redirects', 'proxies', 'hooks', 'stream', 'verify', 'cert', 'json')
+
+
+def request_fingerprint(method: str, url: str, params: Any = None,
+                        data: Any = None, json_body: Any = None,
+                        headers: Optional[Dict[str, str]] = None) -> str:
+    """
+    计算请求指纹
+
+    相同方法、URL、查询参数、请求体和非易变请求头的请求指纹相同，
+    用于响应缓存等场景。
+    """
+    if isinstance(params, dict):
+        params = sorted((str(k), str(v)) for k, v in params.items() if v is not None)
+    if json_body is not None:
+        data = jsoncodec.dumps(json_body, sort_keys=True)
+    if isinstance(data, bytes):
+        data = data.decode('utf-8', 'replace')
+    stable_headers = sorted(
+        (k.lower(), str(v)) for k, v in (headers or {}).items()
+        if k.lower() not in VOLATILE_HEADERS
+    )
+    raw = jsoncodec.dumps([method.upper(), url, params, data, stable_headers], default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class EOPResponse(requests.Response):
+    """传输层响应：json() 经过统一的JSON编解码（可用时使用 orjson）"""
+
+    def json(self, **kwargs):
+        if kwargs or not self.content:
+            return super().json(**kwargs)
+        try:
+            return jsoncodec.loads(self.content)
+        except ValueError:
+            # 非UTF-8编码等情况按 requests 的方式推断编码后解析，并抛出同样的异常
+            return super().json(**kwargs)
+
+
+class EOPSession(requests.Session):
+    """
+    传输层会话
+
+    所有服务客户端通过 ``client.session`` 发出的请求都会经过这里，
+    未显式指定超时时间时使用配置文件中的 timeout。
+    同一时刻发出的相同GET请求（及配置允许的只读POST接口）合并为一次网络调用；
+    开启客户端限流时，发出请求前先取得所属端点的令牌。
+    开启请求跟踪时，每个请求结束后生成一条跟踪记录。
+    """
+
+    def __init__(self, transport: 'EOPTransport'):
+        super().__init__()
+        self.transport = transport
+
+    def request(self, method, url, *args, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.transport.timeout
+
+        if not tracer.enabled:
+            return self._send(method, url, *args, **kwargs)[0]
+
+        started = time.time()
+        start = time.perf_counter()
+        connects = connection_count()
+        response, cache_state, error = None, None, None
+        try:
+            response, cache_state = self._send(method, url, *args, **kwargs)
+            return response
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            tracer.emit(build_record(
+                method, url, started, time.perf_counter() - start,
+                response=response, error=error, cache=cache_state,
+                headers=kwargs.get('headers'), streamed=bool(kwargs.get('stream')),
+                new_connections=connection_count() - connects, body=kwargs.get('data')
+            ))
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        response.__class__ = EOPResponse
+        return response
+
+    def _send(self, method, url, *args, **kwargs):
+        """
+        发送请求（只读请求经过响应缓存与请求合并）
+
+        Returns:
+            (响应, 缓存状态)：hit 命中缓存、coalesced 共享了进行中的相同请求、
+            miss 未命中缓存，未启用缓存时为None
+        """
+        cache = self.transport.response_cache
+        coalesce = not args and self.transport.coalesces(method, url)
+        if args or not (coalesce or ResponseCache.is_cacheable(method, url)):
+            if cache is not None and not args:
+                # 写操作可能改变任何已缓存的结果
+                cache.clear()
+            return self._dispatch(method, url, *args, **kwargs), None
+
+        # 流式响应的响应体只能读取一次，不能缓存或共享；
+        # 按路径前缀判断的只读POST只经过（显式开启的）响应缓存，不合并
+        inflight = self.transport.inflight if coalesce else None
+        if kwargs.get('stream') or (cache is None and inflight is None):
+            return self._dispatch(method, url, **kwargs), None
+
+        # 指纹不含签名头；每个传输对象只对应一个账号，合并不会跨账号
+        key = request_fingerprint(method, url, kwargs.get('params'), kwargs.get('data'),
+                                  kwargs.get('json'), kwargs.get('headers'))
+        if cache is not None:
+            response = cache.get(key)
+            if response is not None:
+                return response, 'hit'
+        if inflight is not None:
+            response, shared = inflight.do(key, lambda: self._dispatch(method, url, **kwargs))
+            if shared:
+                return response, 'coalesced'
+        else:
+            response = self._dispatch(method, url, **kwargs)
+        if cache is None:
+            return response, None
+        if response.status_code == 200:
+            cache.put(key, response)
+        return response, 'miss'
+
+    def _dispatch(self, method, url, *args, **kwargs):
+        """发出请求；回放时返回归档中录制的响应，录制时把响应写入归档"""
+        recorder, replayer = self.transport.recorder, self.transport.replayer
+        if recorder is None and replayer is None:
+            return self._throttled(method, url, *args, **kwargs)
+
+        kwargs.update(zip(_REQUEST_PARAMS, args))
+        key = request_fingerprint(method, url, kwargs.get('params'), kwargs.get('data'),
+                                  kwargs.get('json'), kwargs.get('headers'))
+        if replayer is not None:
+            # 与实际发送时一样准备请求（合并会话请求头、编码参数），回放只省去网络访问
+            request = self.prepare_request(requests.Request(
+                method, self.transport.route(url), params=kwargs.get('params'), data=kwargs.get('data'),
+                json=kwargs.get('json'), headers=kwargs.get('headers')
+            ))
+            return replayer.replay(key, method, url, request)
+
+        start = time.perf_counter()
+        response = self._throttled(method, url, **kwargs)
+        recorder.record(key, method, url, response, time.perf_counter() - start)
+        return response
+
+    def _throttled(self, method, url, *args, **kwargs):
+        """经过限流发出请求；被限流（429）时降低该端点速率并重试"""
+        url = self.transport.route(url)
+        if not limiter.enabled:
+            return super().request(method, url, *args, **kwargs)
+
+        throttled = 0
+        while True:
+            bucket = limiter.acquire(url)
+            response = super().request(method, url, *args, **kwargs)
+            if response.status_code != THROTTLED_STATUS:
+                bucket.succeeded()
+                break
+            bucket.throttled(retry_after_seconds(response.headers.get('Retry-After')))
+            if throttled >= self.transport.retries:
+                break
+            throttled += 1
+            response.close()
+        # 跟踪记录中的重试次数包含限流重试
+        response.throttle_retries = throttled
+        return response
+
+
+class EOPTransport:
+    """
+    EOP请求传输对象
+
+    一个 CTYUNClient 持有一个传输对象，所有服务客户端共享其签名器和
+    按主机划分的连接池，连接池大小与保活参数只在此处调整。
+    """
+
+    def __init__(self, access_key: str, secret_key: str,
+                 timeout: Optional[int] = None,
+                 retries: Optional[int] = None,
+                 pool_connections: Optional[int] = None,
+                 pool_maxsize: Optional[int] = None):
+        """
+        初始化传输对象
+
+        Args:
+            access_key: 访问密钥（AK）
+            secret_key: 密钥（SK）
+            timeout: 请求超时时间（秒），默认读取配置
+            retries: 重试次数，默认读取配置
+            pool_connections: 缓存的主机连接池数量，默认读取配置
+            pool_maxsize: 每个主机连接池的最大连接数，默认读取配置
+        """
+        self.signer = CTYUNEOPAuth(access_key, secret_key)
+        self.timeout = timeout if timeout is not None else config.get_timeout()
+        self.retries = retries if retries is not None else config.get_retry_count()
+        self.pool_connections = pool_connections or config.get_pool_connections()
+        self.pool_maxsize = pool_maxsize or config.get_pool_maxsize()
+
+        # 限流器在进程内共享，参数不变时保留各端点已调整的速率
+        limiter.configure(config.get_rate_limit(), config.get_rate_limit_burst(),
+                          config.get_rate_limit_adaptive())
+
+        # 内存响应缓存，默认关闭，由交互式shell等长驻场景或 --memoize 开启
+        self.response_cache: Optional[ResponseCache] = None
+        # 进行中的GET请求（及配置允许的只读POST接口），相同请求合并为一次网络调用
+        self.inflight: Optional[SingleFlight] = SingleFlight() if config.get_coalesce_reads() else None
+        self.coalesce_post_paths = frozenset(config.get_coalesce_post_paths())
+
+        # API流量录制与回放（core.replay），由 --record / --replay 开启
+        self.recorder: Optional['TrafficRecorder'] = None
+        self.replayer: Optional['TrafficReplayer'] = None
+
+        # 替代所有服务端点的地址（scheme://host[:port]），用于本地模拟服务
+        self.endpoint_override = config.get_endpoint_override().rstrip('/')
+
+        self.session = EOPSession(self)
+        self._mount_adapters()
+
+    def route(self, url: str) -> str:
+        """
+        实际发送请求的URL：配置了 endpoint_override 时替换协议和主机，路径与查询参数不变
+
+        EOP签名不包含主机，替换后签名仍然有效。
+        """
+        if not self.endpoint_override:
+            return url
+        parts = urlsplit(url)
+        return self.endpoint_override + urlunsplit(('', '', parts.path, parts.query, parts.fragment))
+
+    def coalesces(self, method: str, url: str) -> bool:
+        """
+        请求是否可以与进行中的相同请求合并
+
+        只合并 GET/HEAD 以及 coalesce_post_paths 中列出的POST接口；
+        其他POST即使路径看起来是查询接口也不合并，避免把有副作用的请求当作只读请求共享响应。
+        """
+        if self.inflight is None:
+            return False
+        method = method.upper()
+        if method in ('GET', 'HEAD'):
+            return True
+        return method == 'POST' and urlsplit(url).path.rstrip('/') in self.coalesce_post_paths
+
+    def enable_response_cache(self, ttl: int = 60, max_entries: int = 512) -> ResponseCache:
+        """
+        开启内存响应缓存
+
+        Args:
+            ttl: 缓存有效期（秒）
+            max_entries: 最多缓存的响应数量
+
+        Returns:
+            响应缓存对象
+        """
+        self.response_cache = ResponseCache(ttl=ttl, max_entries=max_entries)
+        return self.response_cache
+
+    def disable_response_cache(self) -> None:
+        """关闭内存响应缓存"""
+        self.response_cache = None
+
+    def _mount_adapters(self) -> None:
+        """挂载带重试策略的连接池适配器"""
+        retry_class, status_forcelist = Retry, RETRY_STATUS_CODES
+        if limiter.enabled:
+            retry_class = _UnthrottledRetry
+            status_forcelist = [code for code in RETRY_STATUS_CODES if code != THROTTLED_STATUS]
+        retry_strategy = retry_class(
+            total=self.retries,
+            backoff_factor=1,
+            status_forcelist=status_forcelist,
+            allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"],
+            # 重试耗尽后返回最后一次响应，由调用方按状态码处理
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry_strategy
+        )
+        # 连接池统计新建连接数，供请求跟踪判断连接复用
+        adapter.poolmanager.pool_classes_by_scheme = COUNTING_POOL_CLASSES
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @staticmethod
+    def encode_body(body: Optional[Union[Dict[str, Any], list, str]]) -> Optional[str]:
+        """将请求体编码为签名和发送所用的字符串（非ASCII字符转义，按字符串发送）"""
+        if body is None or isinstance(body, str):
+            return body
+        return jsoncodec.dumps(body, ensure_ascii=True)
+
+    def sign(self, method: str, url: str,
+             query_params: Optional[Dict[str, Any]] = None,
+             body: Optional[str] = None,
+             extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """
+        生成EOP签名请求头
+
+        Args:
+            method: HTTP方法
+            url: 请求URL
+            query_params: 查询参数
+            body: 已编码的请求体
+            extra_headers: 额外的请求头
+
+        Returns:
+            包含签名的请求头字典
+        """
+        return self.signer.sign_request(
+            method=method,
+            url=url,
+            query_params=query_params,
+            body=body,
+            extra_headers=extra_headers or {}
+        )
+
+    def request(self, method: str, url: str,
+                query_params: Optional[Dict[str, Any]] = None,
+                body: Optional[Union[Dict[str, Any], list, str]] = None,
+                extra_headers: Optional[Dict[str, str]] = None,
+                timeout: Optional[int] = None,
+                verify: bool = True) -> requests.Response:
+        """
+        签名并发送请求
+
+        Args:
+            method: HTTP方法
+            url: 请求URL
+            query_params: 查询参数
+            body: 请求体，字典会被编码为JSON
+            extra_headers: 额外的请求头（参与签名）
+            timeout: 请求超时时间，默认使用配置值
+            verify: 是否校验TLS证书
+
+        Returns:
+            响应对象
+        """
+        method = method.upper()
+        body = self.encode_body(body)
+        headers = self.sign(method, url, query_params, body, extra_headers)
+        return self.session.request(
+            method,
+            url,
+            params=query_params,
+            data=body if body else None,
+            headers=headers,
+            timeout=timeout or self.timeout,
+            verify=verify
+        )
+
+    def request_json(self, method: str, url: str,
+                     query_params: Optional[Dict[str, Any]] = None,
+                     body: Optional[Union[Dict[str, Any], list, str]] = None,
+                     extra_headers: Optional[Dict[str, str]] = None,
+                     timeout: Optional[int] = None,
+                     verify: bool = True) -> Dict[str, Any]:
+        """
+        签名发送请求并解码JSON响应
+
+        非200响应返回统一的错误结构：statusCode/error/message
+
+        Returns:
+            响应数据
+        """
+        response = self.request(method, url, query_params=query_params, body=body,
+                                extra_headers=extra_headers, timeout=timeout,
+                                verify=verify)
+        return self.decode(response)
+
+    @staticmethod
+    def decode(response: requests.Response) -> Dict[str, Any]:
+        """解码响应，非200时返回统一的错误结构"""
+        if response.status_code != 200:
+            return {
+                'statusCode': response.status_code,
+                'error': f'HTTP_{response.status_code}',
+                'message': response.text
+            }
+        return response.json()
+
+    def close(self) -> None:
+        """关闭所有连接池"""
+        self.session.close()
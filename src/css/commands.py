@@ -8,6 +8,7 @@ import sys
 from typing import Optional
 
 from .client import CSSClient
+from cli.paging import list_operation
 
 
 # CSS实例状态映射
@@ -34,6 +35,9 @@ def css():
     pass
 
 
+@list_operation(CSSClient.select_instance_page, 'region_id', 'project_id', cluster_name='name',
+                cluster_type=lambda p: int(p['type']) if p['type'] else None,
+                cluster_state_list=lambda p: list(p['status']) if p['status'] else None)
 @css.command('list')
 @click.option('--region-id', '-r', required=True, help='资源池ID (必需)')
 @click.option('--type', '-t', type=click.Choice(['1', '2']), help='实例类型 (1:OpenSearch 2:Elasticsearch)')
@@ -288,6 +292,8 @@ def _display_instance_detail_summary(result: dict, cluster_id: str):
     click.echo(f"⚙️ 规格: {inst.get('cpuNum', 'N/A')}核/{inst.get('memory', 'N/A')}GB/{inst.get('hostNum', 'N/A')}主机/{inst.get('diskVolumn', 'N/A')}GB磁盘")
 
 
+@list_operation(CSSClient.select_logstash_page, 'region_id', 'project_id', cluster_name='name',
+                cluster_state_list=lambda p: list(p['status']) if p['status'] else None)
 @css.command('logstash-list')
 @click.option('--region-id', '-r', required=True, help='资源池ID (必需)')
 @click.option('--name', '-n', help='实例名称')
@@ -7,7 +7,6 @@
 from typing import Dict, Any, Optional
 import json
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -20,7 +19,7 @@ class CSSCNClient:
         self.client = client
         self.service = 'csscn'
         self.base_endpoint = 'ctcsscn-global.ctapi.ctyun.cn'
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     def _post(self, path: str, body_data: Dict[str, Any], desc: str) -> Dict[str, Any]:
         """
@@ -41,7 +40,7 @@ class CSSCNClient:
 
         try:
             response = self.client.session.post(
-                url, data=body, headers=headers, timeout=30
+                url, data=body, headers=headers, timeout=self.client.timeout
             )
             response.raise_for_status()
             data = response.json()
@@ -66,7 +65,7 @@ class CSSCNClient:
         )
         try:
             response = self.client.session.get(
-                url, headers=headers, timeout=30
+                url, headers=headers, timeout=self.client.timeout
             )
             response.raise_for_status()
             data = response.json()
@@ -3,6 +3,7 @@
 import click
 from typing import Optional
 from utils import OutputFormatter
+from cli.paging import list_operation
 
 
 @click.group()
@@ -27,6 +28,13 @@ def _output(ctx, result: dict, output: Optional[str]):
 
 # ==================== 查询服务器列表 ====================
 
+@list_operation('csscn.client:CSSCNClient.list_servers', 'param', items_key='list',
+                guard_status=lambda p: int(p['guard_status']) if p['guard_status'] else None,
+                agent_state=lambda p: int(p['agent_state']) if p['agent_state'] else None,
+                risk_level=lambda p: int(p['risk_level']) if p['risk_level'] else None,
+                param_type=lambda p: int(p['param_type']) if p['param_type'] else None,
+                quota_version=lambda p: int(p['quota_version']) if p['quota_version'] else None,
+                server_status=lambda p: int(p['server_status']) if p['server_status'] else None)
 @csscn.command('list')
 @click.option('--page', type=int, default=1, show_default=True, help='当前页码')
 @click.option('--size', type=int, default=10, show_default=True, help='每页大小')
@@ -245,6 +253,11 @@ def vuln_stats(ctx, output: Optional[str]):
 
 # ==================== 告警列表 ====================
 
+@list_operation('csscn.client:CSSCNClient.alarm_list', 'time_type', 'alarm_type', items_key='list',
+                like_query_param='keyword',
+                severity_code=lambda p: int(p['severity']) if p['severity'] else None,
+                status=lambda p: int(p['status']) if p['status'] else None,
+                like_query_type=lambda p: int(p['keyword_type']) if p['keyword_type'] else None)
 @csscn.command('alarms')
 @click.option('--time-type', required=True,
               type=click.Choice(['LAST_ONE_DAY', 'LAST_THREE_DAY', 'LAST_ONE_WEEK',
@@ -301,6 +314,9 @@ def alarms(ctx, time_type: str, page: int, size: int,
 
 # ==================== 病毒事件列表 ====================
 
+@list_operation('csscn.client:CSSCNClient.virus_list', 'time_type', items_key='list',
+                os_type=lambda p: int(p['os_type']),
+                status=lambda p: int(p['status']) if p['status'] else None)
 @csscn.command('viruses')
 @click.option('--os-type', required=True, type=click.Choice(['1', '2', '3']),
               help='OS类型: 1=linux 2=windows 3=全部')
@@ -346,6 +362,9 @@ def viruses(ctx, os_type: str, time_type: str, page: int, size: int,
 
 # ==================== 配额列表 ====================
 
+@list_operation('csscn.client:CSSCNClient.quota_list', 'server_ip', items_key='list', cust_name='name',
+                quota_version=lambda p: int(p['version']) if p['version'] else None,
+                quota_status=lambda p: int(p['status']) if p['status'] else None)
 @csscn.command('quotas')
 @click.option('--page', type=int, default=1, show_default=True)
 @click.option('--size', type=int, default=10, show_default=True)
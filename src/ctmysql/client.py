@@ -6,7 +6,6 @@
 
 from typing import Dict, Any, Optional, List
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 import json
 
@@ -18,7 +17,7 @@ class RDSClient:
         self.client = client
         self.service = 'rds'
         self.base_endpoint = 'rds2-global.ctapi.ctyun.cn'
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     def _post(self, path: str, region_id: str, body_data: Dict[str, Any],
               desc: str, project_id: Optional[str] = None,
@@ -48,7 +47,7 @@ class RDSClient:
 
         try:
             response = self.client.session.post(
-                url, data=body, headers=headers, timeout=30
+                url, data=body, headers=headers, timeout=self.client.timeout
             )
             response.raise_for_status()
             data = response.json()
@@ -75,7 +74,7 @@ class RDSClient:
         )
         try:
             response = self.client.session.get(
-                url, params=query_params, headers=headers, timeout=30
+                url, params=query_params, headers=headers, timeout=self.client.timeout
             )
             response.raise_for_status()
             data = response.json()
@@ -258,7 +257,7 @@ class RDSClient:
         )
         try:
             response = self.client.session.get(
-                url, params=query_params, headers=headers, timeout=30
+                url, params=query_params, headers=headers, timeout=self.client.timeout
             )
             response.raise_for_status()
             raw = response.json()
@@ -7,6 +7,7 @@
 import click
 from typing import Optional, List
 from utils import OutputFormatter
+from cli.paging import list_operation
 
 
 @click.group()
@@ -31,6 +32,8 @@ def _output(ctx, result: dict, output: Optional[str]):
 
 # ==================== 查询实例列表 ====================
 
+@list_operation('ctmysql.client:RDSClient.list_instances', 'region_id', 'vip', 'project_id', items_key='list',
+                prod_inst_name='name', res_db_engine='engine')
 @ctmysql.command('list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-now', type=int, default=1, help='当前页码，默认1')
@@ -483,6 +486,8 @@ def label_list(ctx, region_id: str, instance_ids: str, tag_filter: Optional[str]
         click.echo(OutputFormatter.format_table(table_data))
 
 
+@list_operation('ctmysql.client:RDSClient.get_instance_labels', 'region_id', items_key='pageRecords',
+                outer_prod_inst_id='instance_id')
 @ctmysql.command('label-instance')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--instance-id', required=True, help='实例ID')
@@ -505,6 +510,7 @@ def label_instance(ctx, region_id: str, instance_id: str, page_now: int, page_si
         click.echo(OutputFormatter.format_table(records))
 
 
+@list_operation('ctmysql.client:RDSClient.get_all_labels', 'region_id', items_key='pageRecords')
 @ctmysql.command('label-all')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-now', type=int, default=1, show_default=True)
@@ -4,7 +4,6 @@
 
 from typing import Dict, Any, Optional, List
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -15,7 +14,7 @@ class DPSClient:
         self.client = client
         self.service = 'dps'
         self.base_endpoint = 'ebm-global.ctapi.ctyun.cn'
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     def _get(self, path: str, query_params: Dict[str, Any], desc: str) -> Dict[str, Any]:
         url = f'https://{self.base_endpoint}{path}'
@@ -24,7 +23,7 @@ class DPSClient:
         )
         try:
             response = self.client.session.get(
-                url, params=query_params, headers=headers, timeout=30
+                url, params=query_params, headers=headers, timeout=self.client.timeout
             )
             response.raise_for_status()
             data = response.json()
@@ -4,6 +4,7 @@ import click
 import sys
 from typing import Optional
 from utils import OutputFormatter
+from cli.paging import list_operation
 
 
 @click.group()
@@ -27,6 +28,7 @@ def _output(ctx, result: dict, output: Optional[str]):
 
 # ==================== 查询操作系统列表 ====================
 
+@list_operation('dps.client:DPSClient.list_os', 'region_id', 'az_name', page_size=1000, items_key='results')
 @dps.command('list-os')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--az-name', required=True, help='可用区名称(单可用区填default)')
@@ -327,6 +329,9 @@ def describe(ctx, region_id: str, az_name: str, instance_uuid: str, output: Opti
 
 # ==================== 批量查询物理机 ====================
 
+@list_operation('dps.client:DPSClient.list_instances', 'region_id', 'az_name', 'ip', 'instance_name',
+                'vpc_id', 'subnet_id', 'device_type', 'query_content', 'instance_uuid', 'status',
+                'project_id', page_size=1000, items_key='results')
 @dps.command('list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--az-name', required=True, help='可用区名称(单可用区填default)')
@@ -4,8 +4,8 @@
 
 from typing import Dict, Any, Optional
 import json
+import logging
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -22,7 +22,7 @@ class EBSClient:
         self.client = client
         self.service = 'ebs'
         self.base_endpoint = 'ebs-global.ctapi.ctyun.cn'
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     def list_ebs(self, region_id: str, page_no: int = 1, page_size: int = 10,
                  dec_pool_id: Optional[str] = None,
@@ -104,19 +104,20 @@ class EBSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -135,8 +136,7 @@ class EBSClient:
 
         except Exception as e:
             logger.error(f"查询云硬盘列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -154,14 +154,14 @@ class EBSClient:
                 method='GET', url=url, query_params=filtered, body='',
                 extra_headers={}
             )
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {filtered}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", filtered)
 
             response = self.client.session.get(
-                url, params=filtered, headers=headers, timeout=30
+                url, params=filtered, headers=headers, timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return {
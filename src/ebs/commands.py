@@ -7,6 +7,8 @@ from functools import wraps
 from typing import Optional
 from .client import EBSClient
 from utils import OutputFormatter
+from utils.query import query_output
+from cli.paging import list_operation
 
 
 def handle_error(func):
@@ -22,6 +24,7 @@ def handle_error(func):
     return wrapper
 
 
+@query_output
 def format_output(data, output_format='table'):
     """格式化输出"""
     if output_format == 'json':
@@ -54,6 +57,9 @@ def ebs():
     pass
 
 
+@list_operation(EBSClient.list_ebs, 'region_id', 'az_name', 'project_id', 'disk_type', 'disk_mode',
+                'disk_status', 'multi_attach', 'is_system_volume', 'is_encrypt', 'query_content',
+                'query_keys', page_size=300, items_key='diskList')
 @ebs.command('list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page', default=1, type=int, help='页码，默认1')
@@ -203,6 +209,7 @@ def ebs_info_by_name(ctx, region_id, disk_name, output):
             click.echo(f"  {k}: {v}")
 
 
+@list_operation(EBSClient.list_ebs_by_name, 'region_id', 'disk_name')
 @ebs.command('list-by-name')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--disk-name', '-n', required=True, help='云硬盘名称')
@@ -3,7 +3,6 @@
 from typing import Dict, Any, Optional
 import json
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -13,8 +12,8 @@ class ECClient:
     def __init__(self, client: CTYUNClient):
         self.client = client
         self.base_endpoint = 'ec-global.ctapi.ctyun.cn'
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
-        self.timeout = 30
+        self.eop_auth = client.eop_auth
+        self.timeout = client.timeout
 
     def _post(self, path: str, body: Dict[str, Any], desc: str) -> Dict[str, Any]:
         """通用 POST 请求"""
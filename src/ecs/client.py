@@ -4,9 +4,10 @@
 
 from typing import Dict, Any, List, Optional
 import json
+import logging
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
+from utils.cache import reference_data
 
 
 class ECSClient:
@@ -23,7 +24,7 @@ class ECSClient:
         self.service = 'ecs'
         self.base_endpoint = 'ctecs-global.ctapi.ctyun.cn'
         # 初始化EOP签名认证器
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     def get_customer_resources(self, region_id: str) -> Dict[str, Any]:
         """
@@ -52,19 +53,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -80,8 +82,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询用户资源失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._get_mock_customer_resources()
     
     def _get_mock_customer_resources(self) -> Dict[str, Any]:
@@ -199,19 +200,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -228,8 +230,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._get_mock_instances()
 
     def get_instance_statistics(self, region_id: str, project_id: Optional[str] = None) -> Dict[str, Any]:
@@ -264,19 +265,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -293,8 +295,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机统计信息失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._get_mock_statistics()
 
     def _get_mock_statistics(self) -> Dict[str, Any]:
@@ -374,19 +375,20 @@ class ECSClient:
                 extra_headers={}
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
 
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -400,8 +402,7 @@ class ECSClient:
 
         except Exception as e:
             logger.error(f"查询单台云主机详情失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -462,18 +463,18 @@ class ECSClient:
                 extra_headers={}
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
+            logger.debug("请求头: %s", headers)
 
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -487,14 +488,14 @@ class ECSClient:
 
         except Exception as e:
             logger.error(f"查询云主机列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
                 'returnObj': None
             }
 
+    @reference_data('regions')
     def list_regions(self, region_name: Optional[str] = None, use_cache: bool = True) -> Dict[str, Any]:
         """
         查询资源池列表
@@ -508,16 +509,6 @@ class ECSClient:
         """
         logger.info(f"查询资源池列表: regionName={region_name if region_name else '全部'}")
         
-        # 检查缓存
-        if use_cache:
-            from utils.cache import get_cache
-            cache = get_cache()
-            cache_key = f"ecs:regions:{region_name or 'all'}"
-            cached_data = cache.get(cache_key)
-            if cached_data:
-                logger.debug("使用缓存的资源池数据")
-                return cached_data
-        
         try:
             url = f'https://{self.base_endpoint}/v4/region/list-regions'
             
@@ -535,19 +526,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -560,19 +552,11 @@ class ECSClient:
                 logger.warning(f"API返回错误: {result.get('message', '未知错误')}")
                 return self._get_mock_regions()
             
-            # 缓存结果（资源池列表一般不常变化，缓存24小时）
-            if use_cache:
-                from utils.cache import get_cache
-                cache = get_cache()
-                cache_key = f"ecs:regions:{region_name or 'all'}"
-                cache.set(cache_key, result, ttl=86400)  # 24小时
-            
             return result
             
         except Exception as e:
             logger.error(f"查询资源池列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._get_mock_regions()
 
     def _get_mock_regions(self) -> Dict[str, Any]:
@@ -607,6 +591,7 @@ class ECSClient:
             '_mock': True
         }
 
+    @reference_data('flavors')
     def query_flavor_options(self) -> Dict[str, Any]:
         """
         查询云主机规格可售地域总览查询条件范围
@@ -627,17 +612,18 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -653,8 +639,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询规格查询条件范围失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._get_mock_flavor_options()
 
     def _get_mock_flavor_options(self) -> Dict[str, Any]:
@@ -704,19 +689,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -735,8 +721,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机自动续订配置失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -774,19 +759,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -805,8 +791,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机内网DNS记录失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -874,19 +859,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -905,8 +891,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机快照列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -944,19 +929,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -975,8 +961,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机快照详情失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -1036,19 +1021,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1067,8 +1053,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询密钥对列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -1108,19 +1093,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1139,8 +1125,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询多个异步任务结果失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -1178,19 +1163,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1209,8 +1195,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询异步任务结果失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -1249,19 +1234,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1280,8 +1266,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云硬盘统计信息失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -1319,19 +1304,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1350,8 +1336,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机固定IP失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -1405,19 +1390,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1436,8 +1422,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机备份策略列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -1475,19 +1460,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1506,8 +1492,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机备份状态失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -1545,19 +1530,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"查询参数: {query_params}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("查询参数: %s", query_params)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1576,8 +1562,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云硬盘信息失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -1621,19 +1606,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"查询参数: {query_params}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("查询参数: %s", query_params)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1652,8 +1638,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询备份策略绑定云主机失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -1697,19 +1682,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1728,8 +1714,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机云硬盘列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -1767,19 +1752,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1798,8 +1784,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机所在云主机组失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -1827,17 +1812,18 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1856,14 +1842,14 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询账户启用的资源池信息失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
                 'returnObj': None
             }
 
+    @reference_data('zones')
     def get_availability_zones_details(self, region_id: str) -> Dict[str, Any]:
         """
         查询账户资源池中可用区信息
@@ -1893,19 +1879,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1924,8 +1911,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询资源池可用区信息失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -1965,7 +1951,7 @@ class ECSClient:
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             if response.status_code != 200:
@@ -2012,18 +1998,19 @@ class ECSClient:
                 extra_headers={}
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
 
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2042,8 +2029,7 @@ class ECSClient:
 
         except Exception as e:
             logger.error(f"查询资源池概况失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -2077,18 +2063,19 @@ class ECSClient:
                 extra_headers={}
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
 
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2107,8 +2094,7 @@ class ECSClient:
 
         except Exception as e:
             logger.error(f"查询资源池产品信息失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -2172,18 +2158,19 @@ class ECSClient:
                 extra_headers={}
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
 
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2202,8 +2189,7 @@ class ECSClient:
 
         except Exception as e:
             logger.error(f"查询产品可售状态失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -2248,12 +2234,12 @@ class ECSClient:
                 body=body, extra_headers={}
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
 
-            response = self.client.session.post(url, data=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, data=body, headers=headers, timeout=self.client.timeout)
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2267,8 +2253,7 @@ class ECSClient:
 
         except Exception as e:
             logger.error(f"查询云助手命令列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {'statusCode': 500, 'message': str(e), 'returnObj': None}
 
     def get_command(self, region_id: str, command_id: str) -> Dict[str, Any]:
@@ -2296,7 +2281,7 @@ class ECSClient:
                 body=body, extra_headers={}
             )
 
-            response = self.client.session.post(url, data=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, data=body, headers=headers, timeout=self.client.timeout)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2310,8 +2295,7 @@ class ECSClient:
 
         except Exception as e:
             logger.error(f"查询云助手命令详情失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {'statusCode': 500, 'message': str(e), 'returnObj': None}
 
     def get_ca_agent(self, region_id: str, instance_ids: str,
@@ -2344,7 +2328,7 @@ class ECSClient:
                 body=body, extra_headers={}
             )
 
-            response = self.client.session.post(url, data=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, data=body, headers=headers, timeout=self.client.timeout)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2358,8 +2342,7 @@ class ECSClient:
 
         except Exception as e:
             logger.error(f"查询云助手agent状态失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {'statusCode': 500, 'message': str(e), 'returnObj': None}
 
     def describe_send_file_results(self, region_id: str,
@@ -2399,7 +2382,7 @@ class ECSClient:
                 body=body, extra_headers={}
             )
 
-            response = self.client.session.post(url, data=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, data=body, headers=headers, timeout=self.client.timeout)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2413,8 +2396,7 @@ class ECSClient:
 
         except Exception as e:
             logger.error(f"查询文件上传结果失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {'statusCode': 500, 'message': str(e), 'returnObj': None}
 
     # ========== 宿主机 (Dedicated Host) API ==========
@@ -2472,12 +2454,12 @@ class ECSClient:
                 body=body, extra_headers={}
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
 
-            response = self.client.session.post(url, data=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, data=body, headers=headers, timeout=self.client.timeout)
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2491,8 +2473,7 @@ class ECSClient:
 
         except Exception as e:
             logger.error(f"查询宿主机列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {'statusCode': 500, 'message': str(e), 'returnObj': None}
 
     def check_dedicated_host_demand(self, region_id: str, az_name: str,
@@ -2527,7 +2508,7 @@ class ECSClient:
                 body=body, extra_headers={}
             )
 
-            response = self.client.session.post(url, data=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, data=body, headers=headers, timeout=self.client.timeout)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2541,8 +2522,7 @@ class ECSClient:
 
         except Exception as e:
             logger.error(f"查询宿主机规格售罄失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {'statusCode': 500, 'message': str(e), 'returnObj': None}
 
     def list_dedicated_host_flavors(self, region_id: str,
@@ -2571,7 +2551,7 @@ class ECSClient:
                 body='', extra_headers={}
             )
 
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2585,8 +2565,7 @@ class ECSClient:
 
         except Exception as e:
             logger.error(f"查询宿主机支持的规格失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {'statusCode': 500, 'message': str(e), 'returnObj': None}
 
     # ========== 网卡 (Ports) API ==========
@@ -2632,12 +2611,12 @@ class ECSClient:
                 body='', extra_headers={}
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
 
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout)
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2651,8 +2630,7 @@ class ECSClient:
 
         except Exception as e:
             logger.error(f"查询网卡列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {'statusCode': 500, 'message': str(e), 'returnObj': None}
 
     def show_port(self, region_id: str, network_interface_id: str) -> Dict[str, Any]:
@@ -2680,7 +2658,7 @@ class ECSClient:
                 body='', extra_headers={}
             )
 
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2694,8 +2672,7 @@ class ECSClient:
 
         except Exception as e:
             logger.error(f"查询网卡信息失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {'statusCode': 500, 'message': str(e), 'returnObj': None}
 
     def list_instance_status(self, region_id: str, page_no: int = 1, page_size: int = 10,
@@ -2747,19 +2724,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2778,8 +2756,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"获取云主机状态信息失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -2815,19 +2792,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2846,8 +2824,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"根据订单ID查询云主机ID失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -2899,19 +2876,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2930,8 +2908,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机组列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -2967,19 +2944,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2998,8 +2976,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机快照状态失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -3033,19 +3010,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -3064,14 +3042,14 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机快照个数统计失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
                 'returnObj': None
             }
 
+    @reference_data('flavors')
     def list_flavor_families(self, region_id: str, az_name: Optional[str] = None) -> Dict[str, Any]:
         """
         查询云主机规格族列表
@@ -3104,19 +3082,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -3135,8 +3114,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机规格族列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -3201,19 +3179,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -3232,8 +3211,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机规格可售地域总览失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -3261,17 +3239,18 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -3290,8 +3269,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机规格可售地域总览查询条件范围失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -3330,19 +3308,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -3361,8 +3340,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机支持的冷变配规格信息失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -3401,19 +3379,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -3432,8 +3411,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机支持的热变配规格信息失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -3441,7 +3419,7 @@ class ECSClient:
             }
 
     def get_vnc_details(self, region_id: str, instance_id: str) -> Dict[str, Any]:
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -3477,19 +3455,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -3508,8 +3487,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机的WEB管理终端地址失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -3546,19 +3524,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -3577,8 +3556,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询用户云主机统计信息失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -3653,19 +3631,20 @@ class ECSClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -3684,8 +3663,7 @@ class ECSClient:
             
         except Exception as e:
             logger.error(f"查询云主机详细信息失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -3724,7 +3702,7 @@ class ECSClient:
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -3930,20 +3908,21 @@ class ECSClient:
             extra_headers={}
         )
 
-        logger.debug(f"请求URL: {url}")
-        logger.debug(f"请求体: {body}")
-        logger.debug(f"请求头: {headers}")
+        logger.debug("请求URL: %s", url)
+        logger.debug("请求体: %s", body)
+        logger.debug("请求头: %s", headers)
 
         try:
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -4011,19 +3990,20 @@ class ECSClient:
             extra_headers={}
         )
 
-        logger.debug(f"请求URL: {url}")
-        logger.debug(f"请求体: {body}")
+        logger.debug("请求URL: %s", url)
+        logger.debug("请求体: %s", body)
 
         try:
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -4089,11 +4069,12 @@ class ECSClient:
                 url,
                 json=body_data,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -4146,7 +4127,7 @@ class ECSClient:
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -4188,7 +4169,7 @@ class ECSClient:
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -4231,7 +4212,7 @@ class ECSClient:
             )
 
             response = self.client.session.post(
-                url, data=body, headers=headers, timeout=30
+                url, data=body, headers=headers, timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -4342,7 +4323,7 @@ class ECSClient:
         headers = self.eop_auth.sign_request(
             method='POST', url=url, query_params=None, body=body
         )
-        response = self.client.session.post(url, data=body, headers=headers, timeout=30)
+        response = self.client.session.post(url, data=body, headers=headers, timeout=self.client.timeout)
         response.raise_for_status()
         data = response.json()
         if data.get('statusCode') != 800:
@@ -4393,7 +4374,7 @@ class ECSClient:
                 method='GET', url=url, query_params=query_params,
                 body='', extra_headers={}
             )
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout)
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
                 return {'statusCode': response.status_code, 'message': f'HTTP {response.status_code}', 'returnObj': None}
@@ -4403,8 +4384,7 @@ class ECSClient:
             return result
         except Exception as e:
             logger.error(f"查询安全组列表失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {'statusCode': 500, 'message': str(e), 'returnObj': None}
 
     def describe_security_group_attribute(self, region_id: str,
@@ -4439,7 +4419,7 @@ class ECSClient:
                 method='GET', url=url, query_params=query_params,
                 body='', extra_headers={}
             )
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout)
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
                 return {'statusCode': response.status_code, 'message': f'HTTP {response.status_code}', 'returnObj': None}
@@ -4449,8 +4429,7 @@ class ECSClient:
             return result
         except Exception as e:
             logger.error(f"查询安全组详情失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {'statusCode': 500, 'message': str(e), 'returnObj': None}
 
     def list_instance_flavor_families(self, region_id: str,
@@ -4488,7 +4467,7 @@ class ECSClient:
                 method='POST', url=url, query_params=None,
                 body=body, extra_headers={}
             )
-            response = self.client.session.post(url, data=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, data=body, headers=headers, timeout=self.client.timeout)
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
                 return {'statusCode': response.status_code, 'message': f'HTTP {response.status_code}', 'returnObj': None}
@@ -4498,8 +4477,7 @@ class ECSClient:
             return result
         except Exception as e:
             logger.error(f"查询规格族云主机失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {'statusCode': 500, 'message': str(e), 'returnObj': None}
 
     def list_dedicated_host_flavor_list(self, region_id: str,
@@ -4525,7 +4503,7 @@ class ECSClient:
                 method='GET', url=url, query_params=query_params,
                 body='', extra_headers={}
             )
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout)
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
                 return {'statusCode': response.status_code, 'message': f'HTTP {response.status_code}', 'returnObj': None}
@@ -4535,8 +4513,7 @@ class ECSClient:
             return result
         except Exception as e:
             logger.error(f"查询专有宿主机规格失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {'statusCode': 500, 'message': str(e), 'returnObj': None}
 
     def describe_metadata(self, region_id: str,
@@ -4567,7 +4544,7 @@ class ECSClient:
                 method='GET', url=url, query_params=query_params,
                 body='', extra_headers={}
             )
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout)
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
                 return {'statusCode': response.status_code, 'message': f'HTTP {response.status_code}', 'returnObj': None}
@@ -4577,8 +4554,7 @@ class ECSClient:
             return result
         except Exception as e:
             logger.error(f"查询云主机元数据失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {'statusCode': 500, 'message': str(e), 'returnObj': None}
 
     def describe_invocation_results(self, region_id: str,
@@ -4617,7 +4593,7 @@ class ECSClient:
                 method='POST', url=url, query_params=None,
                 body=body, extra_headers={}
             )
-            response = self.client.session.post(url, data=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, data=body, headers=headers, timeout=self.client.timeout)
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
                 return {'statusCode': response.status_code, 'message': f'HTTP {response.status_code}', 'returnObj': None}
@@ -4627,8 +4603,7 @@ class ECSClient:
             return result
         except Exception as e:
             logger.error(f"查询云助手执行结果失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {'statusCode': 500, 'message': str(e), 'returnObj': None}
 
     # ==================== ECS 询价 API（新 URI） ====================
@@ -4641,7 +4616,7 @@ class ECSClient:
         try:
             headers = self.eop_auth.sign_request(
                 method='POST', url=url, query_params={}, body=body_str, extra_headers={})
-            response = self.client.session.post(url, json=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, json=body, headers=headers, timeout=self.client.timeout)
             if response.status_code != 200:
                 return {'statusCode': response.status_code,
                         'message': f'HTTP {response.status_code}: {response.text}',
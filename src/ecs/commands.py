@@ -8,6 +8,8 @@ from functools import wraps
 from typing import List, Optional
 from .client import ECSClient
 from utils import ValidationUtils, OutputFormatter
+from utils.query import query_output
+from cli.paging import list_operation
 
 
 def handle_error(func):
@@ -33,6 +35,7 @@ def handle_error(func):
     return wrapper
 
 
+@query_output
 def format_output(data, output_format='table'):
     """
     格式化输出
@@ -51,7 +54,7 @@ def format_output(data, output_format='table'):
             sys.exit(1)
     else:
         # 表格格式
-        if isinstance(data, list) and data:
+        if isinstance(data, list) and data and isinstance(data[0], dict):
             headers = list(data[0].keys())
             table = OutputFormatter.format_table(data, headers)
             click.echo(table)
@@ -75,7 +78,7 @@ def ecs():
 
 
 
-@ecs.command()
+@ecs.command('list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page', default=1, type=int, help='页码')
 @click.option('--page-size', default=20, type=int, help='每页数量')
@@ -84,8 +87,8 @@ def ecs():
 @click.option('--output', type=click.Choice(['table', 'json', 'yaml']), help='输出格式')
 @click.pass_context
 @handle_error
-def list(ctx, region_id: str, page: int, page_size: int, az_name: Optional[str], 
-         state: Optional[str], output: Optional[str]):
+def list_instances(ctx, region_id: str, page: int, page_size: int, az_name: Optional[str],
+                   state: Optional[str], output: Optional[str]):
     """列出云主机实例"""
     try:
         
@@ -2654,6 +2657,21 @@ def update_ecs_label(ctx, region_id: str, instance_id: str, action: str, labels:
             click.echo(f"  - {label['labelKey']} = {label['labelValue']}")
 
 
+def _command_filters(command_id: Optional[str], command_name: Optional[str],
+                     command_type: Optional[str]) -> Optional[list]:
+    """云助手命令列表的过滤条件，没有条件时返回None"""
+    filters = []
+    if command_id:
+        filters.append({"key": "commandID", "value": command_id})
+    if command_name:
+        filters.append({"key": "commandName", "value": command_name})
+    if command_type:
+        filters.append({"key": "commandType", "value": command_type})
+    return filters or None
+
+
+@list_operation(ECSClient.get_commands, 'region_id', 'is_public', page_size=100, items_key='commands',
+                filters=lambda p: _command_filters(p['command_id'], p['command_name'], p['command_type']))
 @ecs.command('get-commands')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--is-public', is_flag=True, help='是否为公共市场命令')
@@ -2676,19 +2694,9 @@ def get_commands(ctx, region_id: str, is_public: Optional[bool],
         client = ctx.obj['client']
         ecs_client = ECSClient(client)
         
-        # 构建过滤条件
-        filters = []
-        if command_id:
-            filters.append({"key": "commandID", "value": command_id})
-        if command_name:
-            filters.append({"key": "commandName", "value": command_name})
-        if command_type:
-            filters.append({"key": "commandType", "value": command_type})
-        filters = filters if filters else None
-        
         result = ecs_client.get_commands(
             region_id=region_id,
-            filters=filters,
+            filters=_command_filters(command_id, command_name, command_type),
             is_public=is_public,
             page_no=page,
             page_size=page_size
@@ -2771,6 +2779,8 @@ def get_command(ctx, region_id: str, command_id: str, output: Optional[str]):
         traceback.print_exc()
 
 
+@list_operation(ECSClient.get_ca_agent, 'region_id', 'instance_ids', page_size=100,
+                items_key='caAgentStatusSet')
 @ecs.command('get-ca-agent')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--instance-ids', required=True, help='实例ID列表，多台使用英文逗号分割（最多100台）')
@@ -2826,6 +2836,8 @@ def get_ca_agent(ctx, region_id: str, instance_ids: str,
         traceback.print_exc()
 
 
+@list_operation(ECSClient.describe_send_file_results, 'region_id', 'file_name', 'invoked_id', page_size=100,
+                items_key='results')
 @ecs.command('describe-send-file-results')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--file-name', help='文件名称')
@@ -2892,6 +2904,9 @@ def describe_send_file_results(ctx, region_id: str, file_name: Optional[str],
         traceback.print_exc()
 
 
+@list_operation(ECSClient.list_dedicated_hosts, 'region_id', 'keyword', 'sort', 'asc', page_size=50,
+                items_key='results', dedicated_host_status='status', dedicated_host_id_list='host_id_list',
+                dedicated_host_name='host_name')
 @ecs.command('list-dedicated-hosts')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--status', help='宿主机状态 (BUILD/ALLOCATED/FREEZING/MAINTENANCE/EXPIRED/UNSUBSCRIBED)')
@@ -3065,6 +3080,8 @@ def list_dedicated_host_flavors(ctx, region_id: str, host_id: str, output: Optio
         traceback.print_exc()
 
 
+@list_operation(ECSClient.list_ports, 'region_id', 'vpc_id', 'device_id', 'subnet_id', page_size=50,
+                items_key='returnObj')
 @ecs.command('list-ports')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--vpc-id', help='VPC ID')
@@ -3221,6 +3238,8 @@ def dedicated_host_label(ctx, region_id: str, host_ids: str, action: str, label:
         click.echo(f"运行出错: {e}", err=True)
 
 
+@list_operation(ECSClient.query_security_groups, 'region_id', 'vpc_id', 'query_content', 'project_id',
+                'instance_id', page_size=50)
 @ecs.command('query-security-groups')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--vpc-id', help='VPC ID（过滤指定VPC下的安全组）')
@@ -3325,6 +3344,8 @@ def describe_security_group(ctx, region_id: str, security_group_id: str,
         click.echo("\n无规则数据")
 
 
+@list_operation(ECSClient.list_instance_flavor_families, 'region_id', 'flavor_family', 'az_name',
+                page_size=50, items_key='results')
 @ecs.command('list-flavor-family-instances')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--flavor-family', required=True, help='规格族名称（如 s7）')
@@ -3445,6 +3466,8 @@ def describe_metadata(ctx, region_id: str, instance_id: str,
         click.echo(f"  {k} = {v}")
 
 
+@list_operation(ECSClient.describe_invocation_results, 'region_id', 'command_id', 'invoked_id', page_size=100,
+                items_key='results')
 @ecs.command('describe-invocation-results')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--command-id', help='命令ID')
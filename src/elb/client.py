@@ -5,7 +5,6 @@
 from typing import Dict, Any, Optional
 import json
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -23,7 +22,7 @@ class ELBClient:
         self.service = 'elb'
         self.base_endpoint = 'ctelb-global.ctapi.ctyun.cn'
         # 初始化EOP签名认证器
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     def list_load_balancers(self, region_id: str, ids: Optional[str] = None,
                           resource_type: Optional[str] = None, name: Optional[str] = None,
@@ -71,7 +70,7 @@ class ELBClient:
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -121,7 +120,7 @@ class ELBClient:
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -193,7 +192,7 @@ class ELBClient:
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -250,7 +249,7 @@ class ELBClient:
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -300,7 +299,7 @@ class ELBClient:
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -350,7 +349,7 @@ class ELBClient:
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -426,7 +425,7 @@ class ELBClient:
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -484,7 +483,7 @@ class ELBClient:
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -548,7 +547,7 @@ class ELBClient:
                 url,
                 json=request_body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -614,7 +613,7 @@ class ELBClient:
                 url,
                 json=request_body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -674,7 +673,7 @@ class ELBClient:
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
             response.raise_for_status()
@@ -756,7 +755,7 @@ class ELBClient:
         )
 
         try:
-            response = self.client.session.post(url, data=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, data=body, headers=headers, timeout=self.client.timeout)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -797,7 +796,7 @@ class ELBClient:
         )
 
         try:
-            response = self.client.session.post(url, data=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, data=body, headers=headers, timeout=self.client.timeout)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -835,7 +834,7 @@ class ELBClient:
         )
 
         try:
-            response = self.client.session.post(url, data=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, data=body, headers=headers, timeout=self.client.timeout)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -850,7 +849,7 @@ class ELBClient:
         headers = self.eop_auth.sign_request(
             method='GET', url=url, query_params=query_params, body=None
         )
-        response = self.client.session.get(url, params=query_params, headers=headers, timeout=30)
+        response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout)
         response.raise_for_status()
         return response.json()
 
@@ -860,13 +859,10 @@ class ELBClient:
         """通用GET请求"""
         params = {k: v for k, v in query_params.items() if v is not None}
         url = f'https://{self.base_endpoint}{path}'
-        headers = self.eop_auth.sign_request(
-            method='GET', url=url, query_params=params, body=None
-        )
-        logger.debug(f"GET {url} params={params}")
+        logger.debug("GET %s params=%s", url, params)
         try:
-            response = self.client.session.get(
-                url, params=params, headers=headers, timeout=30, verify=False
+            response = self.client.transport.request(
+                'GET', url, query_params=params, verify=False
             )
             if response.status_code != 200:
                 return {'statusCode': response.status_code, 'message': response.text}
@@ -879,13 +875,10 @@ class ELBClient:
         """通用POST请求"""
         url = f'https://{self.base_endpoint}{path}'
         body = json.dumps(body_data)
-        headers = self.eop_auth.sign_request(
-            method='POST', url=url, query_params=None, body=body, extra_headers={}
-        )
-        logger.debug(f"POST {url} body={body}")
+        logger.debug("POST %s body=%s", url, body)
         try:
-            response = self.client.session.post(
-                url, data=body, headers=headers, timeout=30, verify=False
+            response = self.client.transport.request(
+                'POST', url, body=body, verify=False
             )
             if response.status_code != 200:
                 return {'statusCode': response.status_code, 'message': response.text}
@@ -7,7 +7,9 @@ from functools import wraps
 from typing import Optional
 from core import CTYUNAPIError
 from utils import OutputFormatter, ValidationUtils, logger
+from utils.query import query_output
 from elb import ELBClient
+from cli.paging import list_operation
 
 
 def handle_error(func):
@@ -35,6 +37,11 @@ def get_elb_client(ctx) -> ELBClient:
     return ELBClient(client)
 
 
+def _split_ids(value: str) -> list:
+    """把逗号分隔的ID列表拆分为列表（忽略空项）"""
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
 @click.group()
 @click.pass_context
 def elb(ctx):
@@ -919,6 +926,8 @@ def monitor():
     pass
 
 
+@list_operation(ELBClient.query_realtime_monitor, 'region_id', items_key='monitors',
+                device_ids=lambda p: _split_ids(p['device_ids']) if p['device_ids'] else None)
 @monitor.command('realtime')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--device-ids', help='负载均衡ID列表，以,分隔')
@@ -949,9 +958,7 @@ def query_realtime_monitor(ctx, region_id: str, device_ids: Optional[str], page_
     elb_client = get_elb_client(ctx)
 
     # 处理device_ids参数
-    device_ids_list = None
-    if device_ids:
-        device_ids_list = [id.strip() for id in device_ids.split(',') if id.strip()]
+    device_ids_list = _split_ids(device_ids) if device_ids else None
 
     result = elb_client.query_realtime_monitor(
         region_id=region_id,
@@ -1013,6 +1020,9 @@ def query_realtime_monitor(ctx, region_id: str, device_ids: Optional[str], page_
         click.echo(table)
 
 
+@list_operation(ELBClient.query_history_monitor, 'region_id', 'start_time', 'end_time', 'period',
+                items_key='monitors', device_ids=lambda p: _split_ids(p['device_ids']),
+                metric_names=lambda p: _split_ids(p['metric_names']))
 @monitor.command('history')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--device-ids', required=True, help='负载均衡ID列表，以,分隔')
@@ -1072,8 +1082,8 @@ def query_history_monitor(ctx, region_id: str, device_ids: str, metric_names: st
     elb_client = get_elb_client(ctx)
 
     # 处理参数
-    device_ids_list = [id.strip() for id in device_ids.split(',') if id.strip()]
-    metric_names_list = [name.strip() for name in metric_names.split(',') if name.strip()]
+    device_ids_list = _split_ids(device_ids)
+    metric_names_list = _split_ids(metric_names)
 
     result = elb_client.query_history_monitor(
         region_id=region_id,
@@ -1486,6 +1496,7 @@ def list_labels(ctx, region_id: str, elb_id: str, output):
         click.echo(OutputFormatter.format_json(result))
 
 
+@query_output
 def format_elb_output(result, output_format='table'):
     """格式化ELB查询结果输出"""
     if output_format == 'json':
@@ -1528,6 +1539,7 @@ def show_access_control(ctx, region_id, access_control_id, output):
     result = ELBClient(ctx.obj['client']).show_access_control(region_id, access_control_id)
     format_elb_output(result, output or ctx.obj.get('output', 'table'))
 
+@list_operation(ELBClient.list_access_controls, 'region_id', page_size=50)
 @elb.command('list-access-controls')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--page-no', type=int, default=None, help='页码')
@@ -1543,6 +1555,9 @@ def list_access_controls(ctx, region_id, page_no, page_size, output):
 
 # ==================== 监控(旧版) ====================
 
+@list_operation(ELBClient.query_legacy_history_monitor, 'region_id', 'start_time', 'end_time', 'period',
+                page_size=50, device_ids=lambda p: p['device_ids'].split(','),
+                metric_names=lambda p: p['metric_names'].split(','))
 @elb.command('legacy-history-monitor')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--device-ids', required=True, help='负载均衡ID列表(逗号分隔)')
@@ -1563,6 +1578,8 @@ def legacy_history_monitor(ctx, region_id, device_ids, metric_names,
         start_time, end_time, period=period, page_no=page_no, page_size=page_size)
     format_elb_output(result, output or ctx.obj.get('output', 'table'))
 
+@list_operation(ELBClient.query_legacy_realtime_monitor, 'region_id',
+                device_ids=lambda p: p['device_ids'].split(',') if p['device_ids'] else None)
 @elb.command('legacy-realtime-monitor')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--device-ids', help='负载均衡ID列表(逗号分隔)')
@@ -1590,6 +1607,7 @@ def list_sla(ctx, region_id, output):
     result = ELBClient(ctx.obj['client']).list_sla(region_id)
     format_elb_output(result, output or ctx.obj.get('output', 'table'))
 
+@list_operation(ELBClient.list_certificates, 'region_id', page_size=50)
 @elb.command('list-certificates')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--page-no', type=int, default=None, help='页码')
@@ -1614,6 +1632,7 @@ def show_certificate(ctx, region_id, certificate_id, output):
     result = ELBClient(ctx.obj['client']).show_certificate(region_id, certificate_id)
     format_elb_output(result, output or ctx.obj.get('output', 'table'))
 
+@list_operation(ELBClient.list_domain_cert_links, 'region_id', page_size=50)
 @elb.command('list-domain-cert-links')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--page-no', type=int, default=None, help='页码')
@@ -1629,6 +1648,7 @@ def list_domain_cert_links(ctx, region_id, page_no, page_size, output):
 
 # ==================== 转发规则 ====================
 
+@list_operation(ELBClient.list_rules, 'region_id', 'listener_id', page_size=50)
 @elb.command('list-rules')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--listener-id', help='监听器ID')
@@ -1656,6 +1676,7 @@ def show_rule(ctx, region_id, policy_id, output):
 
 # ==================== 健康检查 ====================
 
+@list_operation(ELBClient.list_health_checks, 'region_id', page_size=50)
 @elb.command('list-health-checks')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--page-no', type=int, default=None, help='页码')
@@ -1671,6 +1692,7 @@ def list_health_checks(ctx, region_id, page_no, page_size, output):
 
 # ==================== GWLB网关负载均衡 ====================
 
+@list_operation(ELBClient.list_gwlb, 'region_id', page_size=50)
 @elb.command('list-gwlb')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--page-no', type=int, default=None, help='页码')
@@ -1695,6 +1717,7 @@ def show_gwlb(ctx, region_id, gwlb_id, output):
     result = ELBClient(ctx.obj['client']).show_gwlb(region_id, gwlb_id)
     format_elb_output(result, output or ctx.obj.get('output', 'table'))
 
+@list_operation(ELBClient.gwlb_list_targets, 'region_id', page_size=50)
 @elb.command('gwlb-list-targets')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--page-no', type=int, default=None, help='页码')
@@ -1719,6 +1742,7 @@ def gwlb_show_target(ctx, region_id, target_id, output):
     result = ELBClient(ctx.obj['client']).gwlb_show_target(region_id, target_id)
     format_elb_output(result, output or ctx.obj.get('output', 'table'))
 
+@list_operation(ELBClient.gwlb_list_target_groups, 'region_id', page_size=50)
 @elb.command('gwlb-list-target-groups')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--page-no', type=int, default=None, help='页码')
@@ -1745,6 +1769,7 @@ def gwlb_show_target_group(ctx, region_id, target_group_id, output):
 
 # ==================== IP监听器 ====================
 
+@list_operation(ELBClient.list_ip_listeners, 'region_id', page_size=50)
 @elb.command('list-ip-listeners')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--page-no', type=int, default=None, help='页码')
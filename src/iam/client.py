@@ -6,7 +6,6 @@
 from typing import Dict, Any, Optional, List
 import json
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -23,7 +22,7 @@ class IAMClient:
         self.client = client
         self.service = 'iam'
         self.base_endpoint = 'ctiam-global.ctapi.ctyun.cn'
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     def _post(self, path: str, body_data: dict,
               extra_headers: Optional[dict] = None,
@@ -33,15 +32,11 @@ class IAMClient:
         try:
             url = f"https://{self.base_endpoint}{path}"
             body = json.dumps(body_data)
-            headers = self.eop_auth.sign_request(
-                method='POST', url=url, query_params=None, body=body,
-                extra_headers=extra_headers or {}
+            logger.debug("请求URL: %s, 请求体: %s", url, body)
+            response = self.client.transport.request(
+                'POST', url, body=body, extra_headers=extra_headers, verify=False
             )
-            logger.debug(f"请求URL: {url}, 请求体: {body}")
-            response = self.client.session.post(
-                url, data=body, headers=headers, timeout=30, verify=False
-            )
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
             if response.status_code != 200:
                 return {
                     'statusCode': str(response.status_code),
@@ -60,16 +55,12 @@ class IAMClient:
         logger.info(f"{description}: {query_params}")
         try:
             url = f"https://{self.base_endpoint}{path}"
-            headers = self.eop_auth.sign_request(
-                method='GET', url=url, query_params=query_params or {},
-                body=None, extra_headers=extra_headers or {}
-            )
-            logger.debug(f"请求URL: {url}, 参数: {query_params}")
-            response = self.client.session.get(
-                url, params=query_params, headers=headers,
-                timeout=30, verify=False
+            logger.debug("请求URL: %s, 参数: %s", url, query_params)
+            response = self.client.transport.request(
+                'GET', url, query_params=query_params,
+                extra_headers=extra_headers, verify=False
             )
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
             if response.status_code != 200:
                 return {
                     'statusCode': str(response.status_code),
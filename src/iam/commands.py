@@ -6,8 +6,12 @@ import click
 from typing import Optional, List
 from iam import IAMClient
 from utils import OutputFormatter
+from utils.query import query_output
+from cli.paging import (LIST_OUTPUT_FORMATS, STREAM_FORMATS, all_pages_option, echo_items,
+                        explicit_page_size, iter_all, list_operation)
 
 
+@query_output
 def format_output(data, output_format='table'):
     """格式化输出"""
     if output_format == 'json':
@@ -60,6 +64,7 @@ def iam():
 
 # ==================== 企业项目管理 (3 existing) ====================
 
+@list_operation(IAMClient.list_enterprise_projects, 'account_id', items_key='recordList')
 @iam.command('list-projects')
 @click.option('--account-id', required=True, help='账号ID')
 @click.option('--page', default=1, type=int, help='当前页，默认1')
@@ -142,6 +147,7 @@ def get_project(ctx, project_id: str, output: Optional[str]):
             click.echo("未找到企业项目")
 
 
+@list_operation(IAMClient.list_resources, 'project_set_id', items_key='recordList')
 @iam.command('list-resources')
 @click.option('--project-set-id', required=True, help='企业项目ID')
 @click.option('--page', default=1, type=int, help='当前页，默认1')
@@ -251,33 +257,53 @@ def get_user(ctx, user_id: str, output: Optional[str]):
             click.echo("未找到用户")
 
 
+USER_HEADERS = ['用户ID', '用户名', '邮箱', '手机号', '描述', '是否主用户', '状态']
+
+
+def _user_row(u):
+    """用户列表中的一行"""
+    is_root = '是' if u.get('isRoot') == '1' or u.get('isRoot') == 1 else '否'
+    prohibit = '禁用' if u.get('prohibit') == 1 else '启用'
+    return [
+        u.get('userId', ''), u.get('userName', ''),
+        u.get('loginEmail', ''), u.get('mobilePhone', ''),
+        u.get('remark', ''), is_root, prohibit
+    ]
+
+
+@list_operation(IAMClient.list_users, items_key='result')
 @iam.command('list-users')
 @click.option('--page', default=1, type=int, help='页数，默认1')
 @click.option('--page-size', default=10, type=int, help='每页条数，默认10')
-@click.option('--output', type=click.Choice(['table', 'json', 'yaml']), help='输出格式')
+@all_pages_option
+@click.option('--output', type=click.Choice(LIST_OUTPUT_FORMATS), help='输出格式')
 @click.pass_context
-def list_users(ctx, page: int, page_size: int, output: Optional[str]):
+def list_users(ctx, page: int, page_size: int, all_pages: bool, output: Optional[str]):
     """分页查询用户"""
     iam_client = get_client(ctx)
-    output_format = output or ctx.obj.get('output', 'table')
+    output_format = output or ctx.obj.get('output') or 'table'
+
+    if all_pages:
+        users = iter_all(iam_client.list_users, page_size=explicit_page_size(ctx))
+        if output_format == 'table':
+            click.echo("用户列表")
+        count = echo_items(users, output_format, format_output, USER_HEADERS, _user_row)
+        if output_format == 'table':
+            click.echo(f"\n总计: {count} 个" if count else "未找到用户")
+        return
+
     result = iam_client.list_users(page_num=page, page_size=page_size)
     return_obj = check_result(result)
     user_list = return_obj.get('result', [])
 
     if output_format in ['json', 'yaml']:
         format_output(user_list, output_format)
+    elif output_format in STREAM_FORMATS:
+        echo_items(user_list, output_format, format_output, USER_HEADERS, _user_row)
     else:
         if user_list:
-            table_data = []
-            headers = ['用户ID', '用户名', '邮箱', '手机号', '描述', '是否主用户', '状态']
-            for u in user_list:
-                is_root = '是' if u.get('isRoot') == '1' or u.get('isRoot') == 1 else '否'
-                prohibit = '禁用' if u.get('prohibit') == 1 else '启用'
-                table_data.append([
-                    u.get('userId', ''), u.get('userName', ''),
-                    u.get('loginEmail', ''), u.get('mobilePhone', ''),
-                    u.get('remark', ''), is_root, prohibit
-                ])
+            table_data = [_user_row(u) for u in user_list]
+            headers = USER_HEADERS
             total = return_obj.get('total', 0)
             pages_n = return_obj.get('pages', 1)
             format_table(table_data, headers,
@@ -341,6 +367,7 @@ def get_group(ctx, group_id: str, output: Optional[str]):
             click.echo("未找到用户组")
 
 
+@list_operation(IAMClient.list_group_users, items_key='result', group_ids=lambda p: list(p['group_id']))
 @iam.command('list-group-users')
 @click.option('--group-id', required=True, multiple=True, help='用户组ID（可重复）')
 @click.option('--page', default=1, type=int, help='页码，默认1')
@@ -378,6 +405,7 @@ def list_group_users(ctx, group_id: List[str], page: int, page_size: int,
             click.echo("该用户组下无用户")
 
 
+@list_operation(IAMClient.list_groups, 'group_name', items_key='result')
 @iam.command('list-groups')
 @click.option('--page', default=1, type=int, help='页码，默认1')
 @click.option('--page-size', default=10, type=int, help='每页条数，默认10')
@@ -425,6 +453,7 @@ def list_groups(ctx, page: int, page_size: int, group_name: Optional[str],
 
 # ==================== 权限管理 ====================
 
+@list_operation(IAMClient.list_permissions_by_account, items_key='list')
 @iam.command('list-permissions')
 @click.option('--page', default=1, type=int, help='页码，默认1')
 @click.option('--page-size', default=10, type=int, help='每页条数，默认10')
@@ -607,6 +636,8 @@ def list_user_inherited_policies(ctx, user_id: str, output: Optional[str]):
 
 # ==================== 策略管理 ====================
 
+@list_operation(IAMClient.list_policies, 'policy_type', 'policy_range', 'policy_name', 'policy_description',
+                items_key='list')
 @iam.command('list-policies')
 @click.option('--page', default=1, type=int, help='页码，默认1')
 @click.option('--page-size', default=10, type=int, help='每页条数，默认10')
@@ -773,6 +804,7 @@ def query_delegate_list(ctx, account_id: str, service_code: Optional[str],
             click.echo("未找到委托")
 
 
+@list_operation(IAMClient.list_delegate_roles, items_key='list')
 @iam.command('list-delegate-roles')
 @click.option('--page', default=1, type=int, help='页码，默认1')
 @click.option('--page-size', default=10, type=int, help='每页条数，默认10')
@@ -816,6 +848,7 @@ def list_delegate_roles(ctx, page: int, page_size: int, output: Optional[str]):
 
 # ==================== 企业项目扩展 ====================
 
+@list_operation(IAMClient.list_ep_group_page, 'project_id', items_key='list')
 @iam.command('list-ep-groups')
 @click.option('--project-id', required=True, help='企业项目ID')
 @click.option('--page', default=1, type=int, help='页码，默认1')
@@ -960,6 +993,7 @@ def list_recycle_bin_aks(ctx, user_id: List[str], output: Optional[str]):
 
 # ==================== 身份供应商 ====================
 
+@list_operation(IAMClient.list_identity_providers, 'name', items_key='list')
 @iam.command('list-identity-providers')
 @click.option('--page', default=1, type=int, help='页码，默认1')
 @click.option('--page-size', default=10, type=int, help='每页条数，默认10')
@@ -1067,6 +1101,7 @@ def check_totp(ctx, output: Optional[str]):
 
 # ==================== 敏感操作 ====================
 
+@list_operation(IAMClient.query_sensitive_events, 'start_time', 'end_time', items_key='list')
 @iam.command('query-sensitive-events')
 @click.option('--page', default=1, type=int, help='页码，默认1')
 @click.option('--page-size', default=10, type=int, help='每页条数，默认10')
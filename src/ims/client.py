@@ -6,7 +6,8 @@ import json
 import logging
 from typing import Any, Dict, Optional
 
-from auth.eop_signature import CTYUNEOPAuth
+from utils.cache import reference_data
+
 
 logger = logging.getLogger('ctyun_cli')
 
@@ -17,8 +18,8 @@ class IMSClient:
     def __init__(self, client):
         self.base_endpoint = 'ctimage-global.ctapi.ctyun.cn'
         self.client = client
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
-        self.timeout = 30
+        self.eop_auth = client.eop_auth
+        self.timeout = client.timeout
 
     def _make_extra_headers(self, region_id: Optional[str] = None,
                             account_id: Optional[str] = None,
@@ -42,14 +43,14 @@ class IMSClient:
 
     def _log_request(self, url: str, method: str, body: Optional[str] = None,
                      headers: Optional[Dict] = None, query_params: Optional[Dict] = None):
-        logger.debug(f"请求URL [{method}]: {url}")
+        logger.debug("请求URL [%s]: %s", method, url)
         if query_params:
-            logger.debug(f"查询参数: {query_params}")
+            logger.debug("查询参数: %s", query_params)
         if body:
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求体: %s", body)
         if headers:
             safe_headers = {k: v for k, v in headers.items() if k.lower() != 'eop-authorization'}
-            logger.debug(f"请求头: {safe_headers}")
+            logger.debug("请求头: %s", safe_headers)
 
     def _build_get_url(self, base_url: str, query_params: Optional[Dict[str, Any]] = None) -> str:
         """手动构造GET请求URL，避免requests对params编码与EOP签名不一致"""
@@ -63,20 +64,22 @@ class IMSClient:
         return f"{base_url}?{encoded}"
 
     def _handle_response(self, response) -> Dict[str, Any]:
-        logger.debug(f"响应状态码: {response.status_code}")
+        logger.debug("响应状态码: %s", response.status_code)
         if response.status_code != 200:
             logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
             return self._create_error_response(
                 f'HTTP {response.status_code}', response.status_code
             )
         result = response.json()
-        logger.debug(f"响应内容: {json.dumps(result, ensure_ascii=False)[:500]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("响应内容: %s", json.dumps(result, ensure_ascii=False)[:500])
         if result.get('statusCode') not in (0, '0', 800):
             logger.warning(f"API返回错误: {result.get('message', '未知错误')}")
         return result
 
     # ========== 查询可以使用的镜像资源 ==========
 
+    @reference_data('images')
     def list_available_images(self, region_id: str,
                               az_name: Optional[str] = None,
                               cwai_type: Optional[str] = None,
@@ -141,8 +144,7 @@ class IMSClient:
             return self._handle_response(response)
         except Exception as e:
             logger.error(f"查询可以使用的镜像资源失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._create_error_response(str(e))
 
     # ========== 查询镜像详细信息 ==========
@@ -176,6 +178,5 @@ class IMSClient:
             return self._handle_response(response)
         except Exception as e:
             logger.error(f"查询镜像详细信息失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._create_error_response(str(e))
@@ -9,10 +9,13 @@ import click
 
 from core import CTYUNClient
 from utils import OutputFormatter
+from utils.query import query_output
 
 from .client import IMSClient
+from cli.paging import list_operation
 
 
+@query_output
 def format_output(data, output_format='table'):
     """格式化输出"""
     if output_format == 'json':
@@ -44,6 +47,10 @@ def ims():
 
 # ========== 查询可以使用的镜像资源 ==========
 
+@list_operation(IMSClient.list_available_images, 'region_id', 'az_name', 'cwai_type', 'flavor_name',
+                'image_name', 'image_scene', 'image_status', 'image_subcategory', 'image_type',
+                'image_visibility_code', 'project_id', 'query_content', page_size=200, items_key='images',
+                os_type_code=lambda p: int(p['os_type_code']) if p['os_type_code'] else None)
 @ims.command('list-available')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--az-name', help='可用区名称（仅多可用区资源池下物理机镜像）')
@@ -4,7 +4,6 @@
 
 from typing import Dict, List, Optional, Any
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -20,8 +19,8 @@ class KafkaClient:
         """
         self.client = client
         self.base_endpoint = 'ctgkafka-global.ctapi.ctyun.cn'
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
-        self.timeout = 30
+        self.eop_auth = client.eop_auth
+        self.timeout = client.timeout
 
     def set_timeout(self, timeout: int):
         """
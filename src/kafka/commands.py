@@ -8,6 +8,7 @@ import sys
 from typing import Optional
 
 from .client import KafkaClient
+from cli.paging import list_operation
 
 
 # Kafka实例状态映射
@@ -25,6 +26,8 @@ def kafka():
     pass
 
 
+@list_operation(KafkaClient.inst_query, 'region_id', 'name', 'status', prod_inst_id='instance_id',
+                exact_match_name='exact_match', outer_project_id='project_id')
 @kafka.command('list')
 @click.option('--region-id', '-r', required=True, help='资源池ID (必需)')
 @click.option('--instance-id', '-i', help='实例ID')
@@ -260,6 +263,7 @@ def _display_node_status_summary(result: dict, instance_id: str):
             click.echo(f"   {emoji} {ip} ({'正常' if status else '异常'})")
 
 
+@list_operation(KafkaClient.page_query_floatingips, 'region_id')
 @kafka.command('floating-ips')
 @click.option('--region-id', '-r', required=True, help='资源池ID (必需)')
 @click.option('--page', '-p', default=1, help='页码，默认1')
@@ -480,6 +484,7 @@ def _display_config_summary(result: dict, instance_id: str):
                 click.echo(f"   • {name}: {value} ({desc})")
 
 
+@list_operation(KafkaClient.list_tags, 'region_id', 'tag_name', items_key='data')
 @kafka.command('list-tags')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--tag-name', default=None, help='标签名称(模糊查询)')
@@ -4,8 +4,10 @@ import click
 from typing import Optional
 from .client import LTSClient
 from utils import OutputFormatter
+from utils.query import query_output
 
 
+@query_output
 def format_output(data, output_format='table'):
     """格式化输出"""
     if output_format == 'json':
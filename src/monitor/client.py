@@ -5,9 +5,9 @@
 
 from typing import Dict, Any, List, Optional, Union
 import json
+import logging
 from datetime import datetime, timedelta
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -24,7 +24,7 @@ class MonitorClient:
         self.client = client
         self.service = 'monitor'
         self.base_endpoint = 'monitor-global.ctapi.ctyun.cn'
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     def query_custom_item_trendmetricdata(
             self,
@@ -80,20 +80,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -184,20 +185,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -262,20 +264,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -339,20 +342,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -416,20 +420,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -493,20 +498,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -587,20 +593,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -658,20 +665,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -733,20 +741,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -842,20 +851,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -917,20 +927,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1025,20 +1036,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1115,20 +1127,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1201,20 +1214,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1326,20 +1340,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1486,20 +1501,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1569,20 +1585,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1687,20 +1704,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1811,20 +1829,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1927,20 +1946,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2013,20 +2033,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2099,20 +2120,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2190,20 +2212,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2265,20 +2288,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2381,20 +2405,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2452,20 +2477,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2527,20 +2553,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2611,20 +2638,21 @@ class MonitorClient:
                 extra_headers={}
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -2674,7 +2702,7 @@ class MonitorClient:
             if time_range:
                 query_params['range'] = time_range
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
             result = response.json()
@@ -2695,7 +2723,7 @@ class MonitorClient:
             if time_range:
                 query_params['range'] = time_range
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
             result = response.json()
@@ -2730,7 +2758,7 @@ class MonitorClient:
             if res_group_id: query_params['resGroupID'] = res_group_id
             
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -2767,7 +2795,7 @@ class MonitorClient:
                 url,
                 params=query_params,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
@@ -2821,7 +2849,7 @@ class MonitorClient:
                 url,
                 json=body if body else None,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
@@ -2872,7 +2900,7 @@ class MonitorClient:
                 url,
                 json=body if body else None,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
@@ -2928,7 +2956,7 @@ class MonitorClient:
                 url,
                 json=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
@@ -2982,7 +3010,7 @@ class MonitorClient:
                 url,
                 json=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
@@ -3034,7 +3062,7 @@ class MonitorClient:
                 url,
                 json=body,
                 headers=headers,
-                timeout=30,
+                timeout=self.client.timeout,
                 verify=False
             )
             
@@ -3072,7 +3100,7 @@ class MonitorClient:
             if page_size: query_params['pageSize'] = page_size
             
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3104,7 +3132,7 @@ class MonitorClient:
             if page_size: query_params['pageSize'] = page_size
             
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3127,7 +3155,7 @@ class MonitorClient:
             query_params = {'regionID': region_id, 'alarmRuleID': alarm_rule_id}
             
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3160,7 +3188,7 @@ class MonitorClient:
             if page_size: query_params['pageSize'] = page_size
 
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
 
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3200,7 +3228,7 @@ class MonitorClient:
             if page_size: query_params['pageSize'] = page_size
 
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
 
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3230,7 +3258,7 @@ class MonitorClient:
             if page_size: query_params['pageSize'] = page_size
             
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3253,7 +3281,7 @@ class MonitorClient:
             query_params = {'noticeTemplateID': notice_template_id}
             
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3276,7 +3304,7 @@ class MonitorClient:
             query_params = {'group': group, 'dimension': dimension}
             
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3299,7 +3327,7 @@ class MonitorClient:
             query_params = {'regionID': region_id, 'templateID': template_id}
             
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3333,7 +3361,7 @@ class MonitorClient:
             
             headers = self.eop_auth.sign_request(method='POST', url=url, query_params=None, body=body_json,
                                                 extra_headers={'Content-Type': 'application/json'})
-            response = self.client.session.post(url, json=body, headers=headers, timeout=30, verify=False)
+            response = self.client.session.post(url, json=body, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3356,7 +3384,7 @@ class MonitorClient:
             query_params = {'contactID': contact_id}
             
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3379,7 +3407,7 @@ class MonitorClient:
             query_params = {'contactGroupID': contact_group_id}
             
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3417,7 +3445,7 @@ class MonitorClient:
             if page_size: query_params['pageSize'] = page_size
             
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3451,7 +3479,7 @@ class MonitorClient:
             if page_size: query_params['pageSize'] = page_size
             
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3510,7 +3538,7 @@ class MonitorClient:
             
             headers = self.eop_auth.sign_request(method='POST', url=url, query_params=None, body=body_json,
                                                 extra_headers={'Content-Type': 'application/json'})
-            response = self.client.session.post(url, json=body, headers=headers, timeout=30, verify=False)
+            response = self.client.session.post(url, json=body, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3538,7 +3566,7 @@ class MonitorClient:
             
             headers = self.eop_auth.sign_request(method='POST', url=url, query_params=None, body=body_json,
                                                 extra_headers={'Content-Type': 'application/json'})
-            response = self.client.session.post(url, json=body, headers=headers, timeout=30, verify=False)
+            response = self.client.session.post(url, json=body, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3563,7 +3591,7 @@ class MonitorClient:
             if search: query_params['search'] = search
             
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3594,7 +3622,7 @@ class MonitorClient:
             
             headers = self.eop_auth.sign_request(method='POST', url=url, query_params=None, body=body_json,
                                                 extra_headers={'Content-Type': 'application/json'})
-            response = self.client.session.post(url, json=body, headers=headers, timeout=30, verify=False)
+            response = self.client.session.post(url, json=body, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3622,7 +3650,7 @@ class MonitorClient:
             
             headers = self.eop_auth.sign_request(method='POST', url=url, query_params=None, body=body_json,
                                                 extra_headers={'Content-Type': 'application/json'})
-            response = self.client.session.post(url, json=body, headers=headers, timeout=30, verify=False)
+            response = self.client.session.post(url, json=body, headers=headers, timeout=self.client.timeout, verify=False)
             
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -3646,7 +3674,7 @@ class MonitorClient:
             url = f"https://{self.base_endpoint}/v4/monitor/query-message-subscription"
             query_params = {'regionID': region_id}
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
             result = response.json()
@@ -3666,7 +3694,7 @@ class MonitorClient:
             url = f"https://{self.base_endpoint}/v4/monitor/describe-message-subscription"
             query_params = {'subscriptionID': subscription_id}
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
             result = response.json()
@@ -3700,7 +3728,7 @@ class MonitorClient:
             if page_size: query_params['pageSize'] = page_size
 
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
             result = response.json()
@@ -3720,7 +3748,7 @@ class MonitorClient:
             url = f"https://{self.base_endpoint}/v4/monitor/order/notice-pack-used"
             query_params = {'method': method}
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
             result = response.json()
@@ -3740,7 +3768,7 @@ class MonitorClient:
             url = f"https://{self.base_endpoint}/v4/monitor/order/notice-pack-limit-detail"
             query_params = {'method': method}
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
             result = response.json()
@@ -3767,7 +3795,7 @@ class MonitorClient:
             if page_no is not None: query_params['pageNo'] = page_no
             if page_size is not None: query_params['pageSize'] = page_size
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
             result = response.json()
@@ -3798,7 +3826,7 @@ class MonitorClient:
             if page_no is not None: query_params['pageNo'] = page_no
             if page_size is not None: query_params['pageSize'] = page_size
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
             result = response.json()
@@ -3818,7 +3846,7 @@ class MonitorClient:
             url = f"https://{self.base_endpoint}/v4/monitor/monitor-board/query-sys-services"
             query_params = {'regionID': region_id}
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
             result = response.json()
@@ -3848,7 +3876,7 @@ class MonitorClient:
             body_json = json.dumps(body)
             headers = self.eop_auth.sign_request(method='POST', url=url, query_params=None, body=body_json,
                                                 extra_headers={'Content-Type': 'application/json'})
-            response = self.client.session.post(url, json=body, headers=headers, timeout=30, verify=False)
+            response = self.client.session.post(url, json=body, headers=headers, timeout=self.client.timeout, verify=False)
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
             result = response.json()
@@ -3933,7 +3961,7 @@ class MonitorClient:
             query_params = {}
             if device_type: query_params['deviceType'] = device_type
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params, body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
             result = response.json()
@@ -3986,17 +4014,18 @@ class MonitorClient:
                 body=None, extra_headers={}
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
 
             response = self.client.session.get(
                 url, params=query_params, headers=headers,
-                timeout=30, verify=False
+                timeout=self.client.timeout, verify=False
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -4058,17 +4087,18 @@ class MonitorClient:
                 body=body, extra_headers={}
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
+            logger.debug("请求头: %s", headers)
 
             response = self.client.session.post(
                 url, data=body, headers=headers,
-                timeout=30, verify=False
+                timeout=self.client.timeout, verify=False
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -4129,17 +4159,18 @@ class MonitorClient:
                 body=body, extra_headers={}
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
+            logger.debug("请求头: %s", headers)
 
             response = self.client.session.post(
                 url, data=body, headers=headers,
-                timeout=30, verify=False
+                timeout=self.client.timeout, verify=False
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -4200,17 +4231,18 @@ class MonitorClient:
                 body=body, extra_headers={}
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求体: {body}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求体: %s", body)
+            logger.debug("请求头: %s", headers)
 
             response = self.client.session.post(
                 url, data=body, headers=headers,
-                timeout=30, verify=False
+                timeout=self.client.timeout, verify=False
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -4256,7 +4288,7 @@ class MonitorClient:
 
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=query_params,
                                                   body=None, extra_headers={})
-            response = self.client.session.get(url, params=query_params, headers=headers, timeout=30, verify=False)
+            response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.client.timeout, verify=False)
 
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -4281,7 +4313,7 @@ class MonitorClient:
 
             headers = self.eop_auth.sign_request(method='POST', url=url, query_params=None, body=body_json,
                                                   extra_headers={'Content-Type': 'application/json'})
-            response = self.client.session.post(url, json=body, headers=headers, timeout=30, verify=False)
+            response = self.client.session.post(url, json=body, headers=headers, timeout=self.client.timeout, verify=False)
 
             if response.status_code != 200:
                 return {'success': False, 'error': f'HTTP {response.status_code}', 'message': response.text}
@@ -9,7 +9,9 @@ from typing import Optional, List
 from datetime import datetime, timedelta
 from core import CTYUNAPIError
 from utils import OutputFormatter, logger
+from utils.query import query_output
 from monitor import MonitorClient
+from cli.paging import list_operation
 
 
 def handle_error(func):
@@ -31,6 +33,7 @@ def handle_error(func):
     return wrapper
 
 
+@query_output
 def format_output(data, output_format='table'):
     """格式化输出"""
     if output_format == 'json':
@@ -919,6 +922,8 @@ def describe_board(ctx, region_id: str, board_id: str):
         click.echo(f"\n{'='*60}")
 
 
+@list_operation(MonitorClient.list_monitor_boards, 'region_id', 'board_type', 'name', 'service', 'dimension',
+                items_key='boardList')
 @monitor.command('list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--board-type', type=click.Choice(['all', 'system', 'custom']), 
@@ -1263,6 +1268,8 @@ def query_view_data_cmd(ctx, region_id: str, view_id: str, start_time: Optional[
         click.echo(f"\n{'='*60}")
 
 
+@list_operation(MonitorClient.query_resource_groups, 'region_id', 'name', 'res_group_id',
+                items_key='resGroupList')
 @monitor.command('query-resource-groups')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--name', help='名称模糊搜索')
@@ -2074,6 +2081,9 @@ def count_event_data(ctx, region_id: str, event_name: str, service: str, dimensi
         click.echo(f"\n{'='*80}")
 
 
+@list_operation(MonitorClient.query_event_list, 'region_id', 'service', 'dimension', 'start_time', 'end_time',
+                'res_group_id', items_key='eventList',
+                event_name_list=lambda p: list(p['event_name_list']) if p['event_name_list'] else None)
 @monitor.command('query-event-list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--service', required=True, help='服务')
@@ -2221,6 +2231,8 @@ def query_event_list(ctx, region_id: str, service: str, dimension: str,
         click.echo(f"\n{'='*80}")
 
 
+@list_operation(MonitorClient.query_event_detail, 'region_id', 'event_name', 'service', 'dimension',
+                'start_time', 'end_time', 'res_group_id', items_key='eventDetail')
 @monitor.command('query-event-detail')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--event-name', required=True, help='事件指标名称')
@@ -2402,6 +2414,8 @@ def query_events(ctx, region_id: str, service: str, dimension: str):
         click.echo(f"\n{'='*80}")
 
 
+@list_operation(MonitorClient.query_custom_events, 'region_id', 'custom_event_id', 'name',
+                items_key='customEventList')
 @monitor.command('query-custom-events')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--custom-event-id', help='自定义事件ID')
@@ -2497,6 +2511,8 @@ def query_custom_events(ctx, region_id: str, custom_event_id: Optional[str],
         click.echo(f"\n{'='*80}")
 
 
+@list_operation(MonitorClient.query_event_alarm_rules, 'region_id', 'service', 'dimension', 'status',
+                'alarm_status', 'name', 'project_id', 'sort', items_key='alarmRules')
 @monitor.command('query-event-alarm-rules')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--service', help='云监控服务')
@@ -2567,6 +2583,9 @@ def query_event_alarm_rules(ctx, region_id, service, dimension, status, alarm_st
         click.echo("\n" + "=" * 80)
 
 
+@list_operation(MonitorClient.query_custom_event_data, 'region_id', 'start_time', 'end_time',
+                items_key='customEventMonitorList',
+                custom_event_id_list=lambda p: list(p['custom_event_id']) if p['custom_event_id'] else None)
 @monitor.command('query-custom-event-data')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--custom-event-id', multiple=True, help='自定义事件ID，可多次指定')
@@ -2675,6 +2694,8 @@ def query_custom_event_data(ctx, region_id: str, custom_event_id: tuple,
         click.echo(f"\n{'='*80}")
 
 
+@list_operation(MonitorClient.query_custom_event_alarm_rules, 'region_id', 'status', 'alarm_status', 'name',
+                'sort', items_key='alarmRules')
 @monitor.command('query-custom-event-alarm-rules')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--status', type=int, help='规则状态(0:启用,1:停用)')
@@ -2850,6 +2871,9 @@ def describe_custom_event_alarm_rule(ctx, region_id: str, alarm_rule_id: str):
         click.echo(f"\n{'='*80}")
 
 
+@list_operation(MonitorClient.query_alert_history, 'region_id', 'status', 'resource_group_id', 'search_key',
+                'search_value', 'start_time', 'end_time', items_key='issues',
+                service=lambda p: list(p['service']) if p['service'] else None)
 @monitor.command('query-alert-history')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--status', required=True, type=int, help='状态（0：正在告警，1：告警历史）')
@@ -3387,6 +3411,9 @@ def query_alarm_top_event(ctx, region_id: str, range: str):
         click.echo(f"\n{tabulate(table_data, headers=['排名','服务/维度','事件','告警次数'], tablefmt='grid')}\n" + "="*80)
 
 
+@list_operation(MonitorClient.query_alarm_rules, 'region_id', 'service', 'alarm_status', 'status', 'name',
+                'contact_group_name', 'instance_name', 'sort_key', 'sort_type', 'res_group_id',
+                items_key='alarmRules')
 @monitor.command('query-alarm-rules')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--service', required=True, help='服务')
@@ -3539,6 +3566,7 @@ def describe_alarm_rule(ctx, region_id, alarm_rule_id):
         click.echo("\n" + "="*80)
 
 
+@list_operation(MonitorClient.query_contacts, 'name', 'email', 'phone', 'search', items_key='contactList')
 @monitor.command('query-contacts')
 @click.option('--name', help='联系人姓名')
 @click.option('--email', help='邮箱')
@@ -3594,6 +3622,7 @@ def query_contacts(ctx, name, email, phone, search, page_no, page_size):
         click.echo("\n" + "="*80)
 
 
+@list_operation(MonitorClient.query_contact_groups, 'name', 'search', items_key='contactGroupList')
 @monitor.command('query-contact-groups')
 @click.option('--name', help='联系人组名称')
 @click.option('--search', help='模糊搜索（组名/联系人姓名/手机/邮箱）')
@@ -3824,6 +3853,8 @@ def query_custom_dimension_values(ctx, region_id, custom_item_id, dimension_name
         click.echo("\n" + "="*80)
 
 
+@list_operation(MonitorClient.query_custom_items, 'region_id', 'custom_item_id', 'name',
+                items_key='customItemList')
 @monitor.command('query-custom-items')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--custom-item-id', help='自定义监控项ID')
@@ -3875,6 +3906,8 @@ def query_custom_items(ctx, region_id, custom_item_id, name, page_no, page_size)
         click.echo("\n" + "="*80)
 
 
+@list_operation(MonitorClient.query_custom_alarm_rules, 'region_id', 'status', 'alarm_status', 'sort', 'name',
+                items_key='alarmRules')
 @monitor.command('query-custom-alarm-rules')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--status', type=int, help='规则状态(0:启用,1:停用)')
@@ -4008,6 +4041,8 @@ def describe_custom_alarm_rule(ctx, region_id, alarm_rule_id):
         click.echo("\n" + "="*80)
 
 
+@list_operation(MonitorClient.query_notice_templates, 'service', 'dimension', 'name',
+                items_key='noticeTemplateList')
 @monitor.command('query-notice-templates')
 @click.option('--service', help='服务（如ecs）')
 @click.option('--dimension', help='维度（如ecs、disk）')
@@ -4194,6 +4229,9 @@ def describe_alarm_template(ctx, region_id, template_id):
         click.echo("\n" + "="*80)
 
 
+@list_operation(MonitorClient.query_alarm_templates, 'region_id', 'query_content', 'template_type',
+                items_key='templateList',
+                services=lambda p: json.loads(p['services']) if p['services'] else None)
 @monitor.command('query-alarm-templates')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--query-content', help='名称模糊搜索')
@@ -4352,6 +4390,9 @@ def describe_contact_group(ctx, contact_group_id):
         click.echo("\n" + "="*80)
 
 
+@list_operation(MonitorClient.query_alarm_blacklists, 'region_id', 'device_uuid', 'name', 'service',
+                'dimension', 'contact_group_id', 'contact_group_name', 'create_time_from', 'create_time_till',
+                items_key='AlarmBlacklists')
 @monitor.command('query-alarm-blacklists')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--device-uuid', help='设备UUID')
@@ -4413,6 +4454,8 @@ def query_alarm_blacklists(ctx, region_id, device_uuid, name, service, dimension
         click.echo("\n" + "="*80)
 
 
+@list_operation(MonitorClient.query_message_records, 'receiver', 'record_type', 'method', 'record_status',
+                'start_time', 'end_time', items_key='MessageRecords')
 @monitor.command('query-message-records')
 @click.option('--receiver', help='通知对象（邮箱或手机号）')
 @click.option('--record-type', type=int, help='通知类型(0:监控告警,1:外部告警)')
@@ -4568,6 +4611,8 @@ def query_inspection_task_overview(ctx, region_id, task_id):
         click.echo("\n" + "="*80)
 
 
+@list_operation(MonitorClient.query_inspection_task_detail, 'task_id', 'inspection_type',
+                items_key='inspectionResultList')
 @monitor.command('query-inspection-task-detail')
 @click.option('--task-id', required=True, help='巡检任务ID')
 @click.option('--inspection-type', required=True, type=int, help='巡检类型(1:健康评估,2:风险识别)')
@@ -4661,6 +4706,8 @@ def query_inspection_items(ctx, inspection_type, search):
         click.echo("\n" + "="*80)
 
 
+@list_operation(MonitorClient.query_inspection_history_list, 'region_id', 'start_time', 'end_time',
+                items_key='inspectionHistoryList')
 @monitor.command('query-inspection-history-list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--start-time', type=int, help='起始时间戳(秒)')
@@ -4710,6 +4757,8 @@ def query_inspection_history_list(ctx, region_id, start_time, end_time, page_no,
         click.echo("\n" + "="*80)
 
 
+@list_operation(MonitorClient.query_inspection_history_detail, 'task_id', 'inspection_item',
+                items_key='anomalyDetail')
 @monitor.command('query-inspection-history-detail')
 @click.option('--task-id', required=True, help='巡检任务ID')
 @click.option('--inspection-item', required=True, type=int, help='巡检项(1-4)')
@@ -4841,6 +4890,8 @@ def describe_message_subscription(ctx, subscription_id):
         click.echo("=" * 80)
 
 
+@list_operation(MonitorClient.notice_pack_list, 'pack_type', 'pack_id', 'status', 'sort_key', 'sort_type',
+                items_key='packList')
 @monitor.command('notice-pack-list')
 @click.option('--pack-type', required=True, type=click.Choice(['sms', 'voice']), help='套餐包类型(sms:短信,voice:语音)')
 @click.option('--pack-id', help='套餐包ID')
@@ -4974,6 +5025,8 @@ def notice_pack_limit_detail(ctx, method):
                 click.echo("\n无限流数据")
 
 
+@list_operation(MonitorClient.list_monitor_board, 'region_id', 'board_type', 'name', 'service', 'dimension',
+                items_key='boardList')
 @monitor.command('list-monitor-board')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--board-type', type=click.Choice(['all', 'system', 'custom']), help='看板类型')
@@ -5120,6 +5173,7 @@ def _query_resource_list_cmd(ctx, client_method, title, id_label='实例ID', nam
         _render_resource_list(data, title, id_label, name_label, extra_headers, extra_fields)
 
 
+@list_operation(MonitorClient.query_ecs_list, 'region_id')
 @monitor.command('query-ecs-list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-no', type=int, default=1, help='页码')
@@ -5141,6 +5195,7 @@ def query_ecs_list(ctx, region_id, page_no, page_size):
         _render_resource_list(data, '云主机列表')
 
 
+@list_operation(MonitorClient.query_pms_list, 'region_id')
 @monitor.command('query-pms-list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-no', type=int, default=1, help='页码')
@@ -5162,6 +5217,7 @@ def query_pms_list(ctx, region_id, page_no, page_size):
         _render_resource_list(data, '物理机列表')
 
 
+@list_operation(MonitorClient.query_evs_list, 'region_id')
 @monitor.command('query-evs-list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-no', type=int, default=1, help='页码')
@@ -5183,6 +5239,7 @@ def query_evs_list(ctx, region_id, page_no, page_size):
         _render_resource_list(data, '磁盘列表')
 
 
+@list_operation(MonitorClient.query_eip_list, 'region_id')
 @monitor.command('query-eip-list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-no', type=int, default=1, help='页码')
@@ -5204,6 +5261,7 @@ def query_eip_list(ctx, region_id, page_no, page_size):
         _render_resource_list(data, '弹性IP列表', extra_headers=['IP地址'], extra_fields=['IP'])
 
 
+@list_operation(MonitorClient.query_traffic_list, 'region_id')
 @monitor.command('query-traffic-list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-no', type=int, default=1, help='页码')
@@ -5225,6 +5283,7 @@ def query_traffic_list(ctx, region_id, page_no, page_size):
         _render_resource_list(data, '共享带宽列表')
 
 
+@list_operation(MonitorClient.query_elb_list, 'region_id')
 @monitor.command('query-elb-list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-no', type=int, default=1, help='页码')
@@ -5246,6 +5305,7 @@ def query_elb_list(ctx, region_id, page_no, page_size):
         _render_resource_list(data, '负载均衡列表')
 
 
+@list_operation(MonitorClient.query_listener_list, 'region_id')
 @monitor.command('query-listener-list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-no', type=int, default=1, help='页码')
@@ -5267,6 +5327,7 @@ def query_listener_list(ctx, region_id, page_no, page_size):
         _render_resource_list(data, '监听器列表')
 
 
+@list_operation(MonitorClient.query_scaling_group_list, 'region_id')
 @monitor.command('query-scaling-group-list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-no', type=int, default=1, help='页码')
@@ -5288,6 +5349,7 @@ def query_scaling_group_list(ctx, region_id, page_no, page_size):
         _render_resource_list(data, '弹性伸缩组列表')
 
 
+@list_operation(MonitorClient.query_zos_user_list, 'region_id')
 @monitor.command('query-zos-user-list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-no', type=int, default=1, help='页码')
@@ -5309,6 +5371,7 @@ def query_zos_user_list(ctx, region_id, page_no, page_size):
         _render_resource_list(data, '对象存储（用户）列表')
 
 
+@list_operation(MonitorClient.query_zos_bucket_list, 'region_id')
 @monitor.command('query-zos-bucket-list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-no', type=int, default=1, help='页码')
@@ -5330,6 +5393,7 @@ def query_zos_bucket_list(ctx, region_id, page_no, page_size):
         _render_resource_list(data, '对象存储（存储桶）列表')
 
 
+@list_operation(MonitorClient.query_vpc_endpoint_list, 'region_id')
 @monitor.command('query-vpc-endpoint-list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-no', type=int, default=1, help='页码')
@@ -5351,6 +5415,7 @@ def query_vpc_endpoint_list(ctx, region_id, page_no, page_size):
         _render_resource_list(data, 'VPC终端节点列表')
 
 
+@list_operation(MonitorClient.query_vpc_endpoint_service_list, 'region_id')
 @monitor.command('query-vpc-endpoint-service-list')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--page-no', type=int, default=1, help='页码')
@@ -5402,6 +5467,7 @@ def query_monitor_items_by_device(ctx, device_type):
             click.echo("\n无监控项数据")
 
 
+@list_operation(MonitorClient.query_data_export_task, 'region_id', 'task_id', 'name', items_key='taskList')
 @monitor.command('data-export-tasks')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--task-id', help='任务ID（可选）')
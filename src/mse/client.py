@@ -3,7 +3,6 @@
 from typing import Dict, Any, Optional
 import json
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -13,8 +12,8 @@ class MSEClient:
     def __init__(self, client: CTYUNClient):
         self.client = client
         self.base_endpoint = 'mse-global.ctapi.ctyun.cn'
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
-        self.timeout = 30
+        self.eop_auth = client.eop_auth
+        self.timeout = client.timeout
 
     def _get(self, path: str, region_id: str,
              query_params: Optional[Dict[str, Any]] = None,
@@ -23,11 +22,10 @@ class MSEClient:
         url = f'https://{self.base_endpoint}{path}'
         qp = {k: v for k, v in (query_params or {}).items() if v is not None}
         try:
-            headers = self.eop_auth.sign_request(
-                method='GET', url=url, query_params=qp, body='',
-                extra_headers={'regionId': region_id})
-            logger.debug(f"GET {url} | 参数: {qp}")
-            response = self.client.session.get(url, params=qp, headers=headers, timeout=self.timeout)
+            logger.debug("GET %s | 参数: %s", url, qp)
+            response = self.client.transport.request(
+                'GET', url, query_params=qp, extra_headers={'regionId': region_id},
+                timeout=self.timeout)
             if response.status_code != 200:
                 return {'statusCode': response.status_code,
                         'message': f'HTTP {response.status_code}: {response.text}',
@@ -47,11 +45,10 @@ class MSEClient:
         if region_id:
             extra_headers['regionId'] = region_id
         try:
-            headers = self.eop_auth.sign_request(
-                method='POST', url=url, query_params={}, body=body_str,
-                extra_headers=extra_headers)
-            logger.debug(f"POST {url} | body: {bd}")
-            response = self.client.session.post(url, json=bd, headers=headers, timeout=self.timeout)
+            logger.debug("POST %s | body: %s", url, bd)
+            response = self.client.transport.request(
+                'POST', url, body=body_str, extra_headers=extra_headers,
+                timeout=self.timeout)
             if response.status_code != 200:
                 return {'statusCode': response.status_code,
                         'message': f'HTTP {response.status_code}: {response.text}',
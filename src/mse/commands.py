@@ -3,6 +3,7 @@
 import click
 import json
 from .client import MSEClient
+from cli.paging import list_operation
 
 
 def _get_client(ctx):
@@ -52,6 +53,7 @@ def instance():
     pass
 
 
+@list_operation(MSEClient.list_instances, 'region_id', 'instance_id', 'inst_name', 'engine_type', 'status')
 @instance.command('list')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--instance-id', help='实例ID过滤')
@@ -116,6 +118,8 @@ def service():
     pass
 
 
+@list_operation(MSEClient.list_nacos_services, 'region_id', 'instance_id', 'namespace_id', 'service_name',
+                'group_name', 'has_ip_count', 'with_instances')
 @service.command('list')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--instance-id', '-i', required=True, help='实例ID')
@@ -213,6 +217,8 @@ def nacos_service_clusters(ctx, region_id, instance_id, service_name, group_name
         region_id, instance_id, service_name, group_name, namespace_id=namespace_id))
 
 
+@list_operation(MSEClient.get_nacos_cluster_instances, 'region_id', 'instance_id', 'service_name',
+                'group_name', 'namespace_id', 'cluster_name')
 @service.command('cluster-instances')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--instance-id', '-i', required=True, help='实例ID')
@@ -232,6 +238,8 @@ def nacos_cluster_instances(ctx, region_id, instance_id, service_name, group_nam
         page_num=page_num, page_size=page_size))
 
 
+@list_operation(MSEClient.list_service_push_trace, 'region_id', 'spu_inst_id', 'query_type', 'start_time',
+                'end_time', 'service_name', 'group', 'ip', 'namespace')
 @service.command('push-trace')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--spu-inst-id', '-i', required=True, help='实例ID')
@@ -254,6 +262,7 @@ def nacos_push_trace(ctx, region_id, spu_inst_id, query_type, start_time, end_ti
         page_number=page_number, page_size=page_size))
 
 
+@list_operation(MSEClient.list_nacos_properties, 'region_id', 'instance_id')
 @service.command('properties')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--instance-id', '-i', required=True, help='实例ID')
@@ -272,6 +281,8 @@ def config():
     pass
 
 
+@list_operation(MSEClient.list_nacos_configs, 'region_id', 'instance_id', 'namespace_id', 'data_id', 'group',
+                'app_name', 'config_tags')
 @config.command('list')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--instance-id', '-i', required=True, help='实例ID')
@@ -331,6 +342,8 @@ def nacos_dataid_and_group(ctx, region_id, instance_id, namespace_id):
         region_id, instance_id, namespace_id=namespace_id))
 
 
+@list_operation(MSEClient.get_nacos_config_history_list, 'region_id', 'instance_id', 'data_id', 'group',
+                'namespace_id')
 @config.command('history-list')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--instance-id', '-i', required=True, help='实例ID')
@@ -362,6 +375,8 @@ def nacos_config_history_detail(ctx, region_id, instance_id, data_id, group, id_
         region_id, instance_id, data_id, group, id_, namespace_id=namespace_id))
 
 
+@list_operation(MSEClient.list_config_trace, 'region_id', 'spu_inst_id', 'namespace', 'query_type',
+                'start_time', 'end_time', 'data_id', 'group', 'ip')
 @config.command('trace')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--spu-inst-id', '-i', required=True, help='实例ID')
@@ -408,6 +423,7 @@ def namespace():
     pass
 
 
+@list_operation(MSEClient.list_nacos_namespaces, 'region_id', 'instance_id')
 @namespace.command('list')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--instance-id', '-i', required=True, help='实例ID')
@@ -445,6 +461,7 @@ def user():
     pass
 
 
+@list_operation(MSEClient.list_nacos_users, 'region_id', 'instance_id')
 @user.command('list')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--instance-id', '-i', required=True, help='实例ID')
@@ -457,6 +474,7 @@ def nacos_user_list(ctx, region_id, instance_id, page_num, page_size):
         region_id, instance_id, page_num=page_num, page_size=page_size))
 
 
+@list_operation(MSEClient.list_nacos_roles, 'region_id', 'instance_id', 'username')
 @user.command('roles')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--instance-id', '-i', required=True, help='实例ID')
@@ -471,6 +489,7 @@ def nacos_user_roles(ctx, region_id, instance_id, username, page_num, page_size)
         page_num=page_num, page_size=page_size))
 
 
+@list_operation(MSEClient.get_nacos_role_permission, 'region_id', 'instance_id', 'role')
 @user.command('permissions')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--instance-id', '-i', required=True, help='实例ID')
@@ -491,6 +510,7 @@ def aksk():
     pass
 
 
+@list_operation(MSEClient.list_nacos_aksk, 'region_id', 'instance_id')
 @aksk.command('list')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--instance-id', '-i', required=True, help='实例ID')
@@ -521,6 +541,7 @@ def gateway():
     pass
 
 
+@list_operation(MSEClient.list_gateways, 'region_id', 'spu_inst_id', 'spu_inst_name', 'biz_state')
 @gateway.command('list')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--spu-inst-id', help='实例ID过滤')
@@ -578,6 +599,8 @@ def route():
     pass
 
 
+@list_operation(MSEClient.list_gateway_routes, 'region_id', 'inst_id', 'route_name', 'route_status', 'type_',
+                'destination_type')
 @route.command('list')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--inst-id', '-i', required=True, help='实例ID')
@@ -607,6 +630,8 @@ def gateway_route_detail(ctx, region_id, inst_id, id_):
     _echo(_get_client(ctx).get_gateway_route_detail(region_id, inst_id, id_))
 
 
+@list_operation(MSEClient.list_route_snapshots, 'region_id', 'inst_id', 'route_id', 'operation_version',
+                'operation_id')
 @route.command('snapshots')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--inst-id', '-i', required=True, help='实例ID')
@@ -642,6 +667,8 @@ def upstream():
     pass
 
 
+@list_operation(MSEClient.list_gateway_upstreams, 'region_id', 'inst_id', 'service_name',
+                'service_source_type')
 @upstream.command('list')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--inst-id', '-i', required=True, help='实例ID')
@@ -694,6 +721,7 @@ def domain():
     pass
 
 
+@list_operation(MSEClient.list_gateway_domains, 'region_id', 'inst_id')
 @domain.command('list')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--inst-id', '-i', required=True, help='实例ID')
@@ -716,6 +744,7 @@ def gateway_domain_detail(ctx, region_id, inst_id, id_):
     _echo(_get_client(ctx).get_gateway_domain_detail(region_id, inst_id, id_))
 
 
+@list_operation(MSEClient.list_routes_used_domain, 'region_id', 'inst_id', 'domain_code', 'domain_name')
 @domain.command('routes')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--inst-id', '-i', required=True, help='实例ID')
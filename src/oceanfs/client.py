@@ -3,7 +3,6 @@
 import json
 from typing import Dict, Any, Optional
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -20,7 +19,7 @@ class OceanFSClient:
         self.client = client
         self.service = 'oceanfs'
         self.base_endpoint = 'oceanfs-global.ctapi.ctyun.cn'
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     def renew_order_query_prices(self, region_id: str, sfs_uid: str,
                                   cycle_type: str, cycle_cnt: int) -> Dict[str, Any]:
@@ -53,7 +52,7 @@ class OceanFSClient:
         )
 
         try:
-            response = self.client.session.post(url, data=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, data=body, headers=headers, timeout=self.client.timeout)
 
             if response.status_code != 200:
                 return {'statusCode': response.status_code,
@@ -98,7 +97,7 @@ class OceanFSClient:
         )
 
         try:
-            response = self.client.session.post(url, data=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, data=body, headers=headers, timeout=self.client.timeout)
 
             if response.status_code != 200:
                 return {'statusCode': response.status_code,
@@ -121,7 +120,7 @@ class OceanFSClient:
         body_str = _json.dumps(body)
         try:
             headers = self.eop_auth.sign_request(method='POST', url=url, query_params={}, body=body_str, extra_headers={})
-            response = self.client.session.post(url, json=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, json=body, headers=headers, timeout=self.client.timeout)
             if response.status_code != 200:
                 return {'statusCode': response.status_code, 'message': f'HTTP {response.status_code}', 'returnObj': None}
             return response.json()
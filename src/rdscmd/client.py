@@ -4,10 +4,11 @@ Redis分布式缓存服务API客户端
 """
 
 import json
+import logging
 from typing import Dict, List, Optional, Any
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
+from utils.cache import reference_data
 
 
 class RedisClient:
@@ -24,12 +25,12 @@ class RedisClient:
         self.region_id = getattr(client, 'region_id', "200000001852")  # 确保region_id不为None
 
         # 初始化EOP签名认证器
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
         # Redis服务端点 - 使用正确的API端点
         self.service_endpoint = 'https://dcs2-global.ctapi.ctyun.cn'
         self.api_path = "/v2/lifeCycleServant"
-        self.timeout = 30
+        self.timeout = client.timeout
 
     def describe_instances(self, region_id: str = None, instance_name: str = None,
                          status: str = None, page_num: int = 1, page_size: int = 20) -> Optional[Dict[str, Any]]:
@@ -99,6 +100,7 @@ class RedisClient:
             return None
 
 
+    @reference_data('zones')
     def get_zones(self, region_id: str = None) -> Optional[Dict[str, Any]]:
         """
         查询Redis实例可用区
@@ -136,9 +138,9 @@ class RedisClient:
                 extra_headers=extra_headers
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
 
             # 发送请求
             response = self.client.session.get(
@@ -148,8 +150,9 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -309,7 +312,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -366,7 +369,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -419,7 +422,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -487,7 +490,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -558,7 +561,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -616,7 +619,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -671,7 +674,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -728,7 +731,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -781,7 +784,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -836,7 +839,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -938,8 +941,9 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -1128,8 +1132,9 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -1205,7 +1210,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -1273,9 +1278,9 @@ class RedisClient:
                 extra_headers=extra_headers
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
 
             # 发送请求
             response = self.client.session.get(
@@ -1285,8 +1290,9 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1300,8 +1306,7 @@ class RedisClient:
 
         except Exception as e:
             logger.error(f"查询Redis实例引擎版本失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -1346,9 +1351,9 @@ class RedisClient:
                 extra_headers=extra_headers
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"查询参数: {query_params}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("查询参数: %s", query_params)
+            logger.debug("请求头: %s", headers)
 
             # 发送请求
             response = self.client.session.get(
@@ -1358,8 +1363,9 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}")
@@ -1373,8 +1379,7 @@ class RedisClient:
 
         except Exception as e:
             logger.error(f"查询Redis实例详细版本失败: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return {
                 'statusCode': 500,
                 'message': str(e),
@@ -1421,7 +1426,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -1483,7 +1488,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -1538,7 +1543,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -1602,7 +1607,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -1660,7 +1665,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -1726,7 +1731,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -1789,7 +1794,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -1844,7 +1849,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -1950,7 +1955,7 @@ class RedisClient:
                 timeout=self.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -2009,7 +2014,7 @@ class RedisClient:
 
             encoded_qs = urlencode(query_params, quote_via=quote)
             response = self.client.session.get(f"{url}?{encoded_qs}", headers=headers, timeout=self.timeout)
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -2045,7 +2050,7 @@ class RedisClient:
             )
 
             response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.timeout)
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -2081,7 +2086,7 @@ class RedisClient:
             )
 
             response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.timeout)
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -2117,7 +2122,7 @@ class RedisClient:
             )
 
             response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.timeout)
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -2160,7 +2165,7 @@ class RedisClient:
             )
 
             response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.timeout)
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -2203,7 +2208,7 @@ class RedisClient:
             )
 
             response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.timeout)
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
@@ -2238,7 +2243,7 @@ class RedisClient:
             )
 
             response = self.client.session.get(url, params=query_params, headers=headers, timeout=self.timeout)
-            logger.debug(f"响应状态码: {response.status_code}")
+            logger.debug("响应状态码: %s", response.status_code)
 
             if response.status_code != 200:
                 return self._create_error_response(response.status_code, response.text)
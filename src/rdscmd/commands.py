@@ -9,6 +9,7 @@ import sys
 from typing import Optional
 
 from rdscmd import RedisClient
+from cli.paging import list_operation
 
 
 def validate_credentials(func):
@@ -254,6 +255,8 @@ def _display_multi_summary(all_results: dict):
 
 # ========== 查询类命令 ==========
 
+@list_operation(RedisClient.describe_instances, page_size=100, items_key='rows',
+                region_id=lambda p: p['region_id'] or '200000001852', instance_name='name')
 @redis_group.command('list')
 @click.option('--region-id', '-r', default=None, help='区域ID (默认使用配置中的区域)')
 @click.option('--name', '-n', help='实例名称，支持模糊查询')
@@ -2460,6 +2463,7 @@ def _display_topology_summary(result: dict, instance_id: str):
         click.echo(f"❌ 查询状态: 失败 - {result.get('message', '未知错误')}")
 
 
+@list_operation(RedisClient.describe_instances_cluster_member_info, 'region_id', 'project_id')
 @redis_group.command('cluster-nodes')
 @click.option('--region-id', '-r', default=None, help='区域ID (默认使用配置中的区域)')
 @click.option('--project-id', default=None, help='企业项目ID (默认: 0)')
@@ -2785,6 +2789,7 @@ def replication_state(ctx, prod_inst_id, fragment_name, region_id, output):
         sys.exit(1)
 
 
+@list_operation(RedisClient.query_labels, 'region_id', 'label_key', 'label_val', page_size=50)
 @redis_group.command('labels')
 @click.option('--region-id', '-r', default=None, help='资源池ID')
 @click.option('--page-index', default=1, type=int, help='页码，默认1')
@@ -2846,6 +2851,7 @@ def labels(ctx, region_id, page_index, page_size, label_key, label_val, output):
         sys.exit(1)
 
 
+@list_operation(RedisClient.query_running_logs, 'prod_inst_id', 'node_name', 'region_id', items_key='list')
 @redis_group.command('running-logs')
 @click.option('--prod-inst-id', required=True, help='实例ID')
 @click.option('--node-name', required=True, help='节点名称（可通过 node-list 命令获取）')
@@ -3428,6 +3434,7 @@ def label_by_resources(ctx, region_id: str, instance_ids: str, output: str):
 
 # ==================== 批量新增查询类命令（10个） ====================
 
+@list_operation(RedisClient.describe_recycle_bin_instances, 'region_id', 'instance_name')
 @redis_group.command('recycle-bin')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--page-index', type=int, default=1, help='页码，默认1')
@@ -3637,6 +3644,8 @@ def slow_log(ctx, prod_inst_id, node_name, size, min_cost, max_cost, region_id,
 
 # ==================== 批量新增查询类命令（第2批，5个） ====================
 
+@list_operation(RedisClient.describe_instance_experiments, 'region_id', 'prod_inst_id', 'action_code',
+                page_size=100)
 @redis_group.command('experiments')
 @click.option('--prod-inst-id', '-i', required=True, help='实例ID')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
@@ -3825,6 +3834,8 @@ def maintain_az(ctx, prod_inst_id, region_id, output):
         click.echo(f"  returnObj: {ro}")
 
 
+@list_operation(RedisClient.describe_dedicated_cluster_instances, 'region_id', 'instance_name',
+                'prod_inst_id')
 @redis_group.command('dedicated-cluster-instances')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--page-index', type=int, default=1, help='页码，默认1')
@@ -3926,6 +3937,8 @@ def node_monitor_values(ctx, prod_inst_id, type_, node_name, start_time, end_tim
             click.echo(f"  {item}")
 
 
+@list_operation(RedisClient.find_history_slow_log, 'region_id', 'prod_inst_id', 'node_name', 'start_time',
+                'end_time', 'min_cost', 'max_cost', page_size=100)
 @redis_group.command('slow-log-history')
 @click.option('--prod-inst-id', '-i', required=True, help='实例ID')
 @click.option('--node-name', required=True, help='节点名称（多个逗号分隔）')
@@ -4053,6 +4066,8 @@ def instance_config_v3(ctx, prod_inst_id, region_id, output):
             click.echo(f"  {k}: {v}")
 
 
+@list_operation(RedisClient.describe_parameter_modification_history, 'region_id', 'prod_inst_id',
+                'start_time', 'end_time', 'history_id')
 @redis_group.command('param-history')
 @click.option('--prod-inst-id', '-i', required=True, help='实例ID')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
@@ -4080,6 +4095,7 @@ def param_history(ctx, prod_inst_id, region_id, start_time, end_time, history_id
                 click.echo(f"  {r.get('modifyTime','')} | {r.get('paramName','')} | {r.get('oldValue','')} -> {r.get('newValue','')}")
 
 
+@list_operation(RedisClient.describe_redis_templates, 'region_id', 'type_')
 @redis_group.command('templates')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
 @click.option('--type', 'type_', type=click.Choice(['sys', 'custom']), required=True,
@@ -4146,6 +4162,7 @@ def auto_scan_conf(ctx, prod_inst_id, region_id, output):
         click.echo(f"  returnObj: {ro}")
 
 
+@list_operation(RedisClient.query_scan_logs, 'region_id', 'prod_inst_id', page_size=100)
 @redis_group.command('scan-logs')
 @click.option('--prod-inst-id', '-i', required=True, help='实例ID')
 @click.option('--region-id', '-r', required=True, help='资源池ID')
@@ -4481,6 +4498,9 @@ def export_task(ctx, task_id, region_id, output):
             click.echo(f"  {k}: {v}")
 
 
+@list_operation(RedisClient.list_task_center_tasks, 'region_id', 'start_time', 'end_time', 'task_type_str',
+                'prod_inst_id', page_size=100, status=lambda p: int(p['status']),
+                start_time_desc=lambda p: int(p['start_time_desc']))
 @redis_group.command('task-center-list')
 @click.option('--start-time', required=True, help='开始时间（yyyyMMdd）')
 @click.option('--end-time', required=True, help='结束时间（yyyyMMdd，最长31天）')
@@ -4533,6 +4553,8 @@ def task_center_info(ctx, task_id, region_id, output):
             click.echo(f"  {k}: {v}")
 
 
+@list_operation(RedisClient.list_transfer_tasks, 'region_id', page_size=100,
+                status=lambda p: int(p['status']) if p['status'] else None)
 @redis_group.command('transfer-tasks')
 @click.option('--page-num', required=True, type=int, help='页码（>0）')
 @click.option('--page-size', required=True, type=int, help='每页数量（1-100）')
@@ -5,8 +5,8 @@
 
 from typing import Dict, Any, List, Optional
 import json
+import logging
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -24,7 +24,7 @@ class SecurityClient:
         self.service = 'security'
         self.base_endpoint = 'ctcsscn-global.ctapi.ctyun.cn'
         # 初始化EOP签名认证器
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     def get_vulnerability_list(self, agent_guid: str, current_page: int = 1,
                               page_size: int = 10, title: Optional[str] = None,
@@ -78,19 +78,20 @@ class SecurityClient:
                 }
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}，使用模拟数据")
@@ -111,8 +112,7 @@ class SecurityClient:
 
         except Exception as e:
             logger.warning(f"获取漏洞列表失败: {e}，使用模拟数据")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._get_mock_vulnerability_data(current_page, page_size, agent_guid,
                                                     title, cve, handle_status)
 
@@ -420,19 +420,20 @@ class SecurityClient:
                 }
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
 
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}，使用模拟数据")
@@ -451,8 +452,7 @@ class SecurityClient:
 
         except Exception as e:
             logger.warning(f"获取客户端列表失败: {e}，使用模拟数据")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._get_mock_agent_data()
 
     def _get_mock_agent_data(self) -> Dict[str, Any]:
@@ -537,19 +537,20 @@ class SecurityClient:
                 }
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
 
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}，使用模拟数据")
@@ -568,8 +569,7 @@ class SecurityClient:
 
         except Exception as e:
             logger.warning(f"获取扫描结果失败: {e}，使用模拟数据")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._get_mock_scan_result(task_id)
 
     def get_vulnerability_detail(self, vul_announcement_id: str, 
@@ -611,19 +611,20 @@ class SecurityClient:
                 }
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
 
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}，使用模拟数据")
@@ -642,8 +643,7 @@ class SecurityClient:
 
         except Exception as e:
             logger.warning(f"获取漏洞详情失败: {e}，使用模拟数据")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._get_mock_vulnerability_detail(vul_announcement_id, current_page, page_size)
 
     def _get_mock_vulnerability_detail(self, vul_announcement_id: str, 
@@ -716,19 +716,20 @@ class SecurityClient:
                 }
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
 
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}，使用模拟数据")
@@ -747,8 +748,7 @@ class SecurityClient:
 
         except Exception as e:
             logger.warning(f"获取漏洞统计失败: {e}，使用模拟数据")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._get_mock_vulnerability_statistics()
 
     def _get_mock_vulnerability_statistics(self) -> Dict[str, Any]:
@@ -796,17 +796,18 @@ class SecurityClient:
                 }
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
 
             response = self.client.session.get(
                 url,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}，使用模拟数据")
@@ -825,8 +826,7 @@ class SecurityClient:
 
         except Exception as e:
             logger.warning(f"获取最近一次扫描结果失败: {e}，使用模拟数据")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._get_mock_last_scan()
 
     def _get_mock_last_scan(self) -> Dict[str, Any]:
@@ -880,19 +880,20 @@ class SecurityClient:
                 }
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
 
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}，使用模拟数据")
@@ -911,8 +912,7 @@ class SecurityClient:
 
         except Exception as e:
             logger.warning(f"获取扫描详情失败: {e}，使用模拟数据")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._get_mock_last_scan_detail(task_id)
 
     def _get_mock_last_scan_detail(self, task_id: str) -> Dict[str, Any]:
@@ -1041,19 +1041,20 @@ class SecurityClient:
                 }
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
             
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}，使用模拟数据")
@@ -1072,8 +1073,7 @@ class SecurityClient:
             
         except Exception as e:
             logger.warning(f"获取主机趋势失败: {e}，使用模拟数据")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._get_mock_host_trend(trend_type)
     
     def _get_mock_host_trend(self, trend_type: int) -> Dict[str, Any]:
@@ -1131,17 +1131,18 @@ class SecurityClient:
                 }
             )
             
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
             
             response = self.client.session.get(
                 url,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
             
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
             
             if response.status_code != 200:
                 logger.warning(f"API调用失败 (HTTP {response.status_code}): {response.text}，使用模拟数据")
@@ -1160,8 +1161,7 @@ class SecurityClient:
             
         except Exception as e:
             logger.warning(f"获取待处理风险失败: {e}，使用模拟数据")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("异常详情", exc_info=True)
             return self._get_mock_untreated_risks()
     
     def _get_mock_untreated_risks(self) -> Dict[str, Any]:
@@ -1237,19 +1237,20 @@ class SecurityClient:
                 }
             )
 
-            logger.debug(f"请求URL: {url}")
-            logger.debug(f"请求头: {headers}")
-            logger.debug(f"请求体: {body}")
+            logger.debug("请求URL: %s", url)
+            logger.debug("请求头: %s", headers)
+            logger.debug("请求体: %s", body)
 
             response = self.client.session.post(
                 url,
                 data=body,
                 headers=headers,
-                timeout=30
+                timeout=self.client.timeout
             )
 
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 logger.error(f"API调用失败 (HTTP {response.status_code}): {response.text}")
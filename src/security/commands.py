@@ -7,7 +7,9 @@ from functools import wraps
 from typing import Optional
 from core import CTYUNAPIError
 from utils import OutputFormatter, ValidationUtils, logger
+from utils.query import query_output
 from security import SecurityClient
+from cli.paging import list_operation
 
 
 def handle_error(func):
@@ -29,6 +31,7 @@ def handle_error(func):
     return wrapper
 
 
+@query_output
 def format_output(data, output_format='table'):
     """格式化输出"""
     if output_format == 'json':
@@ -96,6 +99,8 @@ def security():
     pass
 
 
+@list_operation(SecurityClient.get_vulnerability_list, 'agent_guid', 'title', 'cve', 'handle_status',
+                items_key='list')
 @security.command()
 @click.argument('agent_guid')
 @click.option('--page', default=1, type=int, help='页码')
@@ -2,7 +2,6 @@
 
 from typing import Dict, Any, Optional
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -19,7 +18,7 @@ class SFSClient:
         self.client = client
         self.service = 'sfs'
         self.base_endpoint = 'ctsfs-global.ctapi.ctyun.cn'
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     def _post_price(self, path: str, body: Dict[str, Any], desc: str) -> Dict[str, Any]:
         import json as _json
@@ -27,7 +26,7 @@ class SFSClient:
         body_str = _json.dumps(body)
         try:
             headers = self.eop_auth.sign_request(method='POST', url=url, query_params={}, body=body_str, extra_headers={})
-            response = self.client.session.post(url, json=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, json=body, headers=headers, timeout=self.client.timeout)
             if response.status_code != 200:
                 return {'statusCode': response.status_code, 'message': f'HTTP {response.status_code}', 'returnObj': None}
             return response.json()
@@ -1,176 +1,615 @@
 """
 缓存工具模块
-提供文件缓存功能，避免重复查询常用数据
+提供本地持久化缓存功能，避免重复查询常用数据
+
+所有缓存条目保存在单个SQLite数据库（默认 ~/.ctyun/cache/cache.db）中：
+过期时间和最近访问时间均建有索引，总大小超过上限时按LRU淘汰，
+写入在事务中完成，多个CLI进程并发读写也是安全的。
 """
 
+import atexit
+import functools
+import hashlib
+import inspect
 import json
+import logging
 import os
+import sqlite3
+import threading
 import time
-from typing import Any, Dict, Optional
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from utils import jsoncodec
+
+
+logger = logging.getLogger('ctyun_cli')
+
+
+# 默认容量上限（字节）
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# 超出容量上限时，淘汰到上限的这一比例，避免每次写入都触发淘汰
+EVICT_LOW_WATERMARK = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL DEFAULT '',
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_time REAL NOT NULL,
+    expire_time REAL NOT NULL,
+    access_time REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_expire ON entries (expire_time);
+CREATE INDEX IF NOT EXISTS idx_entries_access ON entries (access_time);
+CREATE TABLE IF NOT EXISTS counters (
+    namespace TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (namespace, name)
+);
+"""
+
+# 统计计数器名称
+COUNTER_NAMES = ('hits', 'misses', 'writes', 'evictions', 'expired')
+
+
+def cache_namespace(profile: Optional[str], access_key: Optional[str],
+                    region: Optional[str]) -> str:
+    """
+    计算缓存命名空间
+
+    由配置文件名、访问密钥指纹（不保存明文）和区域组成，
+    不同账号、不同配置之间的缓存条目互不可见。
+
+    Args:
+        profile: 配置文件名称
+        access_key: 访问密钥
+        region: 区域
+
+    Returns:
+        形如 ``default/3f2a9c1d0b7e/cn-north-1`` 的命名空间
+    """
+    fingerprint = hashlib.sha256((access_key or '').encode('utf-8')).hexdigest()[:12]
+    return f"{profile or 'default'}/{fingerprint}/{region or '-'}"
+
 
+class SQLiteCache:
+    """基于SQLite的缓存管理器（线程安全、多进程安全）"""
 
-class FileCache:
-    """文件缓存管理器"""
-    
-    def __init__(self, cache_dir: Optional[str] = None, default_ttl: int = 3600):
+    def __init__(self, cache_dir: Optional[str] = None, default_ttl: int = 3600,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
         """
         初始化缓存管理器
-        
+
         Args:
             cache_dir: 缓存目录，默认为 ~/.ctyun/cache
             default_ttl: 默认缓存时间（秒），默认1小时
+            max_bytes: 缓存数据总大小上限（字节），超出时按LRU淘汰
         """
         if cache_dir is None:
             cache_dir = os.path.expanduser('~/.ctyun/cache')
-        
+
         self.cache_dir = Path(cache_dir)
+        self.db_path = self.cache_dir / 'cache.db'
         self.default_ttl = default_ttl
-        
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # 尚未写入数据库的计数增量：{(命名空间, 计数器名): 增量}
+        self._pending_counters: Dict[Tuple[str, str], int] = {}
+
         # 确保缓存目录存在
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-    
-    def _get_cache_path(self, key: str) -> Path:
-        """获取缓存文件路径"""
-        # 将key转换为安全的文件名
-        safe_key = key.replace('/', '_').replace(':', '_')
-        return self.cache_dir / f"{safe_key}.json"
-    
-    def get(self, key: str) -> Optional[Any]:
+
+    def _connect(self) -> sqlite3.Connection:
+        """打开数据库连接（首次使用时创建表结构）"""
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=10,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA busy_timeout = 10000')
+            try:
+                conn.execute('PRAGMA journal_mode = WAL')
+            except sqlite3.OperationalError:
+                # 部分网络文件系统不支持WAL，退回默认的回滚日志
+                pass
+            conn.execute('PRAGMA synchronous = NORMAL')
+            conn.executescript(_SCHEMA)
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(entries)')}
+            if 'namespace' not in columns:
+                # 早期版本的数据库没有命名空间列
+                conn.execute("ALTER TABLE entries ADD COLUMN namespace TEXT NOT NULL DEFAULT ''")
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_entries_namespace ON entries (namespace)')
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _scoped_key(key: str, namespace: str) -> str:
+        return f"{namespace}|{key}" if namespace else key
+
+    def _count(self, namespace: str, name: str, amount: int = 1) -> None:
+        """累加计数器（调用方需持有锁）"""
+        if amount:
+            counter = (namespace, name)
+            self._pending_counters[counter] = self._pending_counters.get(counter, 0) + amount
+
+    def _flush_counters(self, conn: sqlite3.Connection) -> None:
+        """把计数增量写入数据库（调用方需持有锁并处于事务中）"""
+        if not self._pending_counters:
+            return
+        # 不使用UPSERT语法，兼容较旧的SQLite版本
+        conn.executemany(
+            'INSERT OR IGNORE INTO counters (namespace, name, value) VALUES (?, ?, 0)',
+            list(self._pending_counters)
+        )
+        conn.executemany(
+            'UPDATE counters SET value = value + ? WHERE namespace = ? AND name = ?',
+            [(value, ns, name) for (ns, name), value in self._pending_counters.items()]
+        )
+        self._pending_counters.clear()
+
+    def flush_stats(self) -> None:
+        """把内存中的统计计数写入数据库"""
+        try:
+            with self._lock:
+                if not self._pending_counters:
+                    return
+                conn = self._connect()
+                conn.execute('BEGIN IMMEDIATE')
+                try:
+                    self._flush_counters(conn)
+                    conn.execute('COMMIT')
+                except BaseException:
+                    conn.execute('ROLLBACK')
+                    raise
+        except sqlite3.Error:
+            pass
+
+    def get(self, key: str, namespace: str = '') -> Optional[Any]:
         """
         获取缓存数据
-        
+
         Args:
             key: 缓存键
-            
+            namespace: 命名空间，见 cache_namespace()
+
         Returns:
             缓存的数据，如果不存在或已过期则返回None
         """
-        cache_path = self._get_cache_path(key)
-        
-        if not cache_path.exists():
-            return None
-        
+        now = time.time()
+        scoped_key = self._scoped_key(key, namespace)
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
-            # 检查是否过期
-            if 'expire_time' in cache_data:
-                if time.time() > cache_data['expire_time']:
-                    # 缓存已过期，删除文件
-                    cache_path.unlink(missing_ok=True)
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    'SELECT value, expire_time FROM entries WHERE key = ?', (scoped_key,)
+                ).fetchone()
+                if row is None:
+                    self._count(namespace, 'misses')
                     return None
-            
-            return cache_data.get('data')
-            
-        except (json.JSONDecodeError, IOError):
-            # 缓存文件损坏，删除
-            cache_path.unlink(missing_ok=True)
+                if now > row[1]:
+                    # 缓存已过期，删除条目
+                    conn.execute('DELETE FROM entries WHERE key = ? AND expire_time < ?',
+                                 (scoped_key, now))
+                    self._count(namespace, 'misses')
+                    self._count(namespace, 'expired')
+                    return None
+                conn.execute('UPDATE entries SET access_time = ? WHERE key = ?', (now, scoped_key))
+                self._count(namespace, 'hits')
+            return jsoncodec.loads(row[0])
+        except (sqlite3.Error, ValueError):
             return None
-    
-    def set(self, key: str, data: Any, ttl: Optional[int] = None) -> bool:
+
+    def set(self, key: str, data: Any, ttl: Optional[int] = None, namespace: str = '') -> bool:
         """
         设置缓存数据
-        
+
         Args:
             key: 缓存键
             data: 要缓存的数据
             ttl: 缓存时间（秒），None表示使用默认值
-            
+            namespace: 命名空间，见 cache_namespace()
+
         Returns:
             是否设置成功
         """
         if ttl is None:
             ttl = self.default_ttl
-        
-        cache_path = self._get_cache_path(key)
-        
-        cache_data = {
-            'data': data,
-            'expire_time': time.time() + ttl,
-            'created_time': time.time()
-        }
-        
+
+        try:
+            value = jsoncodec.dumps(data)
+        except (TypeError, ValueError):
+            return False
+
+        now = time.time()
         try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            with self._lock:
+                conn = self._connect()
+                conn.execute('BEGIN IMMEDIATE')
+                try:
+                    conn.execute(
+                        'INSERT OR REPLACE INTO entries '
+                        '(key, namespace, value, size, created_time, expire_time, access_time) '
+                        'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                        (self._scoped_key(key, namespace), namespace, value,
+                         len(value.encode('utf-8')), now, now + ttl, now)
+                    )
+                    self._count(namespace, 'writes')
+                    self._evict(conn, now)
+                    self._flush_counters(conn)
+                    conn.execute('COMMIT')
+                except BaseException:
+                    conn.execute('ROLLBACK')
+                    raise
             return True
-        except IOError:
+        except sqlite3.Error:
             return False
-    
-    def delete(self, key: str) -> bool:
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> int:
+        """总大小超出上限时先删除过期条目，再按最近访问时间淘汰"""
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        for namespace, count in conn.execute(
+                'SELECT namespace, COUNT(*) FROM entries WHERE expire_time < ? GROUP BY namespace',
+                (now,)).fetchall():
+            self._count(namespace, 'expired', count)
+        evicted = conn.execute('DELETE FROM entries WHERE expire_time < ?', (now,)).rowcount
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        target = self.max_bytes * EVICT_LOW_WATERMARK
+        if total <= target:
+            return evicted
+
+        victims = []
+        for key, namespace, size in conn.execute(
+                'SELECT key, namespace, size FROM entries ORDER BY access_time'):
+            if total <= target:
+                break
+            victims.append((key,))
+            self._count(namespace, 'evictions')
+            total -= size
+        conn.executemany('DELETE FROM entries WHERE key = ?', victims)
+        return evicted + len(victims)
+
+    def add(self, key: str, data: Any, ttl: Optional[int] = None, namespace: str = '') -> bool:
+        """
+        仅当键不存在（或已过期）时写入缓存，可用作跨进程的简单租约
+
+        Args:
+            key: 缓存键
+            data: 要缓存的数据
+            ttl: 缓存时间（秒），None表示使用默认值
+            namespace: 命名空间，见 cache_namespace()
+
+        Returns:
+            是否写入成功（键已存在时返回False）
+        """
+        if ttl is None:
+            ttl = self.default_ttl
+
+        value = jsoncodec.dumps(data)
+        scoped_key = self._scoped_key(key, namespace)
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute('BEGIN IMMEDIATE')
+                try:
+                    conn.execute('DELETE FROM entries WHERE key = ? AND expire_time < ?',
+                                 (scoped_key, now))
+                    inserted = conn.execute(
+                        'INSERT OR IGNORE INTO entries '
+                        '(key, namespace, value, size, created_time, expire_time, access_time) '
+                        'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                        (scoped_key, namespace, value, len(value.encode('utf-8')),
+                         now, now + ttl, now)
+                    ).rowcount
+                    conn.execute('COMMIT')
+                except BaseException:
+                    conn.execute('ROLLBACK')
+                    raise
+            return inserted > 0
+        except sqlite3.Error:
+            return False
+
+    def delete(self, key: str, namespace: str = '') -> bool:
         """
         删除缓存
-        
+
         Args:
             key: 缓存键
-            
+            namespace: 命名空间，见 cache_namespace()
+
         Returns:
             是否删除成功
         """
-        cache_path = self._get_cache_path(key)
-        
         try:
-            cache_path.unlink(missing_ok=True)
+            with self._lock:
+                self._connect().execute('DELETE FROM entries WHERE key = ?',
+                                        (self._scoped_key(key, namespace),))
             return True
-        except IOError:
+        except sqlite3.Error:
             return False
-    
-    def clear(self) -> int:
+
+    def clear(self, namespace: Optional[str] = None) -> int:
         """
-        清空所有缓存
-        
+        清空缓存
+
+        Args:
+            namespace: 只清空该命名空间的条目，None表示全部清空
+
         Returns:
-            删除的缓存文件数量
+            删除的缓存条目数量
         """
         count = 0
         try:
-            for cache_file in self.cache_dir.glob('*.json'):
-                cache_file.unlink(missing_ok=True)
-                count += 1
-        except IOError:
+            with self._lock:
+                conn = self._connect()
+                if namespace is None:
+                    count = conn.execute('DELETE FROM entries').rowcount
+                else:
+                    count = conn.execute('DELETE FROM entries WHERE namespace = ?',
+                                         (namespace,)).rowcount
+        except sqlite3.Error:
             pass
-        
+
+        if namespace is None:
+            # 清理旧版本遗留的单文件JSON缓存
+            try:
+                for cache_file in self.cache_dir.glob('*.json'):
+                    cache_file.unlink(missing_ok=True)
+                    count += 1
+            except IOError:
+                pass
+
         return count
-    
+
     def clean_expired(self) -> int:
         """
         清理过期缓存
-        
+
         Returns:
             删除的过期缓存数量
         """
-        count = 0
-        current_time = time.time()
-        
         try:
-            for cache_file in self.cache_dir.glob('*.json'):
-                try:
-                    with open(cache_file, 'r', encoding='utf-8') as f:
-                        cache_data = json.load(f)
-                    
-                    if 'expire_time' in cache_data:
-                        if current_time > cache_data['expire_time']:
-                            cache_file.unlink(missing_ok=True)
-                            count += 1
-                except (json.JSONDecodeError, IOError):
-                    # 损坏的缓存文件也删除
-                    cache_file.unlink(missing_ok=True)
-                    count += 1
-        except IOError:
-            pass
-        
-        return count
+            with self._lock:
+                conn = self._connect()
+                for namespace, count in conn.execute(
+                        'SELECT namespace, COUNT(*) FROM entries WHERE expire_time < ? '
+                        'GROUP BY namespace', (time.time(),)).fetchall():
+                    self._count(namespace, 'expired', count)
+                removed = conn.execute(
+                    'DELETE FROM entries WHERE expire_time < ?', (time.time(),)
+                ).rowcount
+        except sqlite3.Error:
+            return 0
+        self.flush_stats()
+        return removed
+
+    def reset_stats(self) -> None:
+        """清零统计计数器"""
+        with self._lock:
+            self._pending_counters.clear()
+            self._connect().execute('DELETE FROM counters')
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取缓存统计信息
+
+        Returns:
+            总体的条目数、数据大小、命中/未命中/淘汰次数，以及按命名空间的明细
+        """
+        self.flush_stats()
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            entries, data_bytes, oldest, newest = conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0), MIN(created_time), MAX(created_time) '
+                'FROM entries'
+            ).fetchone()
+            expired = conn.execute(
+                'SELECT COUNT(*) FROM entries WHERE expire_time < ?', (now,)
+            ).fetchone()[0]
+
+            namespaces: Dict[str, Dict[str, Any]] = {}
+
+            def _namespace(name: str) -> Dict[str, Any]:
+                if name not in namespaces:
+                    namespaces[name] = {'namespace': name, 'entries': 0, 'data_bytes': 0}
+                    namespaces[name].update({counter: 0 for counter in COUNTER_NAMES})
+                return namespaces[name]
+
+            for name, count, size in conn.execute(
+                    'SELECT namespace, COUNT(*), COALESCE(SUM(size), 0) FROM entries '
+                    'GROUP BY namespace'):
+                _namespace(name).update({'entries': count, 'data_bytes': size})
+            for name, counter, value in conn.execute(
+                    'SELECT namespace, name, value FROM counters'):
+                _namespace(name)[counter] = value
+
+        totals = {counter: sum(ns[counter] for ns in namespaces.values())
+                  for counter in COUNTER_NAMES}
+        lookups = totals['hits'] + totals['misses']
+
+        file_bytes = 0
+        for suffix in ('', '-wal', '-shm'):
+            path = Path(str(self.db_path) + suffix)
+            if path.exists():
+                file_bytes += path.stat().st_size
+
+        result = {
+            'path': str(self.db_path),
+            'entries': entries,
+            'expired_entries': expired,
+            'data_bytes': data_bytes,
+            'file_bytes': file_bytes,
+            'max_bytes': self.max_bytes,
+            'oldest': oldest,
+            'newest': newest,
+        }
+        result.update(totals)
+        result['hit_rate'] = round(totals['hits'] / lookups, 4) if lookups else None
+        result['namespaces'] = sorted(namespaces.values(), key=lambda ns: ns['namespace'])
+        return result
+
+    def close(self) -> None:
+        """写入统计计数并关闭数据库连接"""
+        self.flush_stats()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# 兼容旧名称
+FileCache = SQLiteCache
 
 
 # 全局缓存实例
-_global_cache: Optional[FileCache] = None
+_global_cache: Optional[SQLiteCache] = None
 
 
-def get_cache() -> FileCache:
+def get_cache() -> SQLiteCache:
     """获取全局缓存实例"""
     global _global_cache
     if _global_cache is None:
-        _global_cache = FileCache()
+        import atexit
+        from config.settings import config
+        _global_cache = SQLiteCache(max_bytes=config.get_cache_max_bytes())
+        # 命中/未命中计数在内存中累加，进程退出时统一写入
+        atexit.register(_global_cache.flush_stats)
     return _global_cache
+
+
+# 参考数据（资源池、可用区、规格、镜像等）的缓存策略：
+# {类型: (新鲜期秒, 过期后仍可先返回旧数据的时长秒)}
+REFERENCE_TTL_POLICIES = {
+    'regions': (24 * 3600, 7 * 24 * 3600),
+    'zones': (6 * 3600, 7 * 24 * 3600),
+    'flavors': (6 * 3600, 3 * 24 * 3600),
+    'images': (3600, 24 * 3600),
+}
+
+# 后台刷新租约的有效期（秒），同一时间只有一个进程/线程刷新同一条数据
+REFRESH_LEASE_TTL = 60
+
+# 进程退出时最多等待后台刷新完成的时间（秒）；超时未完成的刷新由之后的命令重新发起
+REFRESH_EXIT_TIMEOUT = 2.0
+
+# 进行中的后台刷新线程
+_refresh_threads: 'set[threading.Thread]' = set()
+_refresh_lock = threading.Lock()
+
+
+def _is_valid_reference(result: Any) -> bool:
+    """
+    只缓存成功的响应，错误响应和模拟数据不缓存
+
+    除了原始响应（statusCode 为 800/0，部分服务以字符串返回），也接受整理后的结果
+    （如 {"success": True, "zones": [...], "full_result": 原始响应}）：
+    带有原始响应时以原始响应为准
+    """
+    if not isinstance(result, dict) or result.get('error') or result.get('_mock'):
+        return False
+    if 'statusCode' not in result and result.get('success') is True:
+        full_result = result.get('full_result')
+        return _is_valid_reference(full_result) if isinstance(full_result, dict) else True
+    return str(result.get('statusCode')) in ('800', '0')
+
+
+def _refresh_reference(cache: SQLiteCache, key: str, namespace: str, ttl: int,
+                       fetch: Callable[[], Any]) -> None:
+    """重新获取参考数据并写入缓存，完成后释放刷新租约"""
+    try:
+        result = fetch()
+        if _is_valid_reference(result):
+            cache.set(key, {'fetched_time': time.time(), 'data': result}, ttl=ttl,
+                      namespace=namespace)
+            logger.debug("参考数据已在后台刷新: %s", key)
+    except Exception as e:
+        logger.debug("后台刷新参考数据失败: %s: %s", key, e)
+    finally:
+        cache.delete(f"{key}:refreshing", namespace=namespace)
+
+
+def _start_refresh(name: str, *args: Any) -> None:
+    """在守护线程中刷新参考数据"""
+    thread = threading.Thread(target=_run_refresh, args=args, name=name, daemon=True)
+    with _refresh_lock:
+        _refresh_threads.add(thread)
+    thread.start()
+
+
+def _run_refresh(*args: Any) -> None:
+    try:
+        _refresh_reference(*args)
+    finally:
+        with _refresh_lock:
+            _refresh_threads.discard(threading.current_thread())
+
+
+def _join_refreshes(timeout: float = REFRESH_EXIT_TIMEOUT) -> None:
+    """进程退出前等待后台刷新完成，总共最多等待 timeout 秒"""
+    deadline = time.monotonic() + timeout
+    with _refresh_lock:
+        threads = list(_refresh_threads)
+    for thread in threads:
+        thread.join(max(0.0, deadline - time.monotonic()))
+
+
+atexit.register(_join_refreshes)
+
+
+def reference_data(kind: str):
+    """
+    参考数据缓存装饰器（stale-while-revalidate）
+
+    新鲜期内直接返回缓存；超过新鲜期但仍在可用期内时立即返回旧数据，
+    同时在后台线程中刷新；没有可用缓存时才同步请求API。
+    被装饰方法若有 use_cache 参数且为False，则跳过缓存。
+    缓存条目按服务客户端所属 CTYUNClient 的 cache_namespace 隔离。
+
+    Args:
+        kind: 数据类型，对应 REFERENCE_TTL_POLICIES 中的策略
+    """
+    fresh_ttl, stale_ttl = REFERENCE_TTL_POLICIES[kind]
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = {k: v for k, v in bound.arguments.items() if k not in ('self', 'use_cache')}
+            if not bound.arguments.get('use_cache', True):
+                return func(self, *args, **kwargs)
+
+            cache = get_cache()
+            namespace = getattr(getattr(self, 'client', None), 'cache_namespace', '')
+            key = (f"ref:{kind}:{type(self).__name__}.{func.__name__}:"
+                   f"{json.dumps(params, sort_keys=True, default=str)}")
+            entry = cache.get(key, namespace=namespace)
+            if isinstance(entry, dict) and 'data' in entry:
+                age = time.time() - entry.get('fetched_time', 0)
+                if age > fresh_ttl and cache.add(f"{key}:refreshing", os.getpid(),
+                                                 ttl=REFRESH_LEASE_TTL, namespace=namespace):
+                    # 先返回旧数据，刷新在后台的守护线程中完成；
+                    # 进程退出时最多等待 REFRESH_EXIT_TIMEOUT 秒，不会因刷新卡住而无法退出
+                    _start_refresh(f'ctyun-refresh-{kind}', cache, key, namespace, fresh_ttl + stale_ttl,
+                                   functools.partial(func, self, *args, **kwargs))
+                logger.debug("使用缓存的参考数据: %s", key)
+                return entry['data']
+
+            result = func(self, *args, **kwargs)
+            if _is_valid_reference(result):
+                cache.set(key, {'fetched_time': time.time(), 'data': result},
+                          ttl=fresh_ttl + stale_ttl, namespace=namespace)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -8,12 +8,9 @@ import logging
 import sys
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
-from tabulate import tabulate
-import colorama
-from colorama import Fore, Style
 
-# 初始化colorama
-colorama.init()
+# tabulate 与 colorama 在首次使用时导入，避免拖慢CLI启动
+_colorama_initialized = False
 
 
 class OutputFormatter:
@@ -36,6 +33,8 @@ class OutputFormatter:
         if not data:
             return "没有数据"
 
+        from tabulate import tabulate
+
         if headers is None:
             headers = list(data[0].keys()) if data else []
 
@@ -80,6 +79,15 @@ class OutputFormatter:
             color: 颜色名称
             bold: 是否加粗
         """
+        global _colorama_initialized
+        import colorama
+        from colorama import Fore, Style
+
+        # 初始化colorama
+        if not _colorama_initialized:
+            colorama.init()
+            _colorama_initialized = True
+
         color_code = ''
         if color.lower() == 'red':
             color_code = Fore.RED
@@ -101,6 +109,23 @@ class OutputFormatter:
         print(f"{color_code}{style_code}{text}{Style.RESET_ALL}")
 
 
+class _ConsoleHandler(logging.StreamHandler):
+    """
+    写到当前 sys.stderr 的日志处理器
+
+    每条日志都取当时的 sys.stderr，而不是创建时的：命令扇出按线程收集各目标的输出、
+    守护进程把输出转发给客户端时，日志随命令的其他错误输出一起被收集
+    """
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value) -> None:
+        pass
+
+
 class Logger:
     """日志管理器"""
 
@@ -125,8 +150,8 @@ class Logger:
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
 
-        # 添加控制台处理器
-        console_handler = logging.StreamHandler(sys.stdout)
+        # 添加控制台处理器：日志写到标准错误，标准输出只有命令结果（可直接交给 jq 等工具）
+        console_handler = _ConsoleHandler()
         console_handler.setFormatter(formatter)
         self.logger.addHandler(console_handler)
 
@@ -136,25 +161,34 @@ class Logger:
             file_handler.setFormatter(formatter)
             self.logger.addHandler(file_handler)
 
-    def debug(self, message: str) -> None:
-        """记录调试信息"""
-        self.logger.debug(message)
+    def isEnabledFor(self, level: int) -> bool:
+        """
+        是否会输出指定级别的日志
+
+        拼接代价较高的调试内容（完整响应体、序列化的请求头等）前先检查，
+        避免在未开启调试时白白构造字符串
+        """
+        return self.logger.isEnabledFor(level)
+
+    def debug(self, message: str, *args, **kwargs) -> None:
+        """记录调试信息，message 中的 %s 占位符在确实输出时才用 args 填充"""
+        self.logger.debug(message, *args, **kwargs)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args, **kwargs) -> None:
         """记录信息"""
-        self.logger.info(message)
+        self.logger.info(message, *args, **kwargs)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args, **kwargs) -> None:
         """记录警告"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args, **kwargs)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args, **kwargs) -> None:
         """记录错误"""
-        self.logger.error(message)
+        self.logger.error(message, *args, **kwargs)
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args, **kwargs) -> None:
         """记录严重错误"""
-        self.logger.critical(message)
+        self.logger.critical(message, *args, **kwargs)
 
 
 class DateTimeUtils:
@@ -0,0 +1,87 @@
+"""
+JSON编解码
+安装了 orjson 时用它编解码，否则使用标准库 json。传输层（请求体、响应解析）、
+本地缓存和NDJSON输出统一经过这里，输出格式与标准库的紧凑格式一致。
+环境变量 CTYUN_JSON_BACKEND=json 可强制使用标准库。
+"""
+
+import json
+import os
+from typing import Any, Callable, Optional, Union
+
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# 解码失败时抛出的异常（orjson.JSONDecodeError 是它的子类）
+JSONDecodeError = json.JSONDecodeError
+
+_backend = None
+
+
+def set_backend(name: str) -> str:
+    """
+    选择编解码实现
+
+    Args:
+        name: orjson 或 json；orjson 未安装时使用 json
+
+    Returns:
+        实际使用的实现名称
+    """
+    global _backend
+    if name not in ('orjson', 'json'):
+        raise ValueError(f"未知的JSON实现: {name}")
+    _backend = _orjson if name == 'orjson' else None
+    return backend()
+
+
+def backend() -> str:
+    """当前使用的实现名称"""
+    return 'orjson' if _backend is not None else 'json'
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """解析JSON文本（字符串或UTF-8字节）"""
+    if _backend is not None:
+        return _backend.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, ensure_ascii: bool = False, sort_keys: bool = False,
+          indent: Optional[int] = None, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    编码为JSON字符串
+
+    Args:
+        obj: 待编码对象
+        ensure_ascii: 是否把非ASCII字符转义（HTTP请求体需要）
+        sort_keys: 是否按键排序
+        indent: 缩进空格数，None为紧凑格式
+        default: 无法编码的对象的转换函数
+
+    Returns:
+        JSON字符串
+    """
+    # orjson 不支持转义非ASCII字符，这种情况下标准库的C实现更快
+    if _backend is not None and not ensure_ascii and indent in (None, 2):
+        option = _backend.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= _backend.OPT_SORT_KEYS
+        if indent:
+            option |= _backend.OPT_INDENT_2
+        try:
+            text = _backend.dumps(obj, default=default, option=option).decode('utf-8')
+        except TypeError:
+            # 超出64位的整数等 orjson 不支持的值，交给标准库处理
+            pass
+        else:
+            return text
+    separators = (',', ': ') if indent else (',', ':')
+    return json.dumps(obj, ensure_ascii=ensure_ascii, sort_keys=sort_keys, indent=indent,
+                      separators=separators, default=default)
+
+
+set_backend(os.environ.get('CTYUN_JSON_BACKEND') or 'orjson')
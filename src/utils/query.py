@@ -0,0 +1,510 @@
+"""
+客户端查询（--query）
+实现 JMESPath 的常用子集：表达式只解析、编译一次，得到可反复调用的函数，
+流式输出时逐条应用到记录上
+
+支持的语法：
+    字段与子表达式    returnObj.results、"带空格的字段"、@
+    下标              [0]、[-1]
+    投影              [*].name、*.name、[].name（展开）
+    过滤              [?instanceStatus=='running']、[?cpu > `2` && !locked]
+    多选              [instanceID, displayName]、{id: instanceID, name: displayName}
+    管道              results[*].name | [0]
+    字面量            'raw string'、`{"json": true}`、`3`
+    函数              length、keys、values、contains、starts_with、join、to_string、to_number
+"""
+
+import json
+import re
+from functools import wraps
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+
+class QueryError(ValueError):
+    """查询表达式错误"""
+
+
+# ==================== 词法分析 ====================
+
+_TOKEN_RE = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<number>-?\d+)
+  | (?P<ident>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<quoted>"(?:\\.|[^"\\])*")
+  | (?P<raw>'(?:\\.|[^'\\])*')
+  | (?P<literal>`(?:\\.|[^`\\])*`)
+  | (?P<op>\[\?|\[\]|\|\||&&|==|!=|<=|>=|[.*\[\]{}(),:|<>!@])
+''', re.VERBOSE)
+
+# 运算符的左结合力；小于 _PROJECTION_STOP 的运算符会结束投影右侧表达式
+_BINDING_POWER = {
+    'eof': 0, 'ident': 0, 'quoted': 0, 'literal': 0, 'number': 0, '@': 0,
+    ']': 0, ')': 0, '}': 0, ',': 0, ':': 0,
+    '|': 1, '||': 2, '&&': 3,
+    '==': 5, '!=': 5, '<': 5, '<=': 5, '>': 5, '>=': 5,
+    '[]': 9, '*': 20, '[?': 21, '.': 40, '!': 45, '{': 50, '[': 55, '(': 60,
+}
+_PROJECTION_STOP = 10
+
+
+def _tokenize(expression: str) -> List[Tuple[str, Any]]:
+    tokens = []
+    pos = 0
+    while pos < len(expression):
+        match = _TOKEN_RE.match(expression, pos)
+        if not match:
+            raise QueryError(f"无法识别的字符 {expression[pos]!r}（位置 {pos}）")
+        pos = match.end()
+        kind = match.lastgroup
+        text = match.group()
+        if kind == 'ws':
+            continue
+        if kind == 'number':
+            tokens.append(('number', int(text)))
+        elif kind == 'ident':
+            tokens.append(('ident', text))
+        elif kind == 'quoted':
+            tokens.append(('quoted', json.loads(text)))
+        elif kind == 'raw':
+            tokens.append(('literal', text[1:-1].replace("\\'", "'")))
+        elif kind == 'literal':
+            body = text[1:-1].replace('\\`', '`')
+            try:
+                tokens.append(('literal', json.loads(body)))
+            except ValueError:
+                raise QueryError(f"无效的JSON字面量 {text}")
+        else:
+            tokens.append((text, text))
+    tokens.append(('eof', None))
+    return tokens
+
+
+# ==================== 求值辅助 ====================
+
+def _truthy(value: Any) -> bool:
+    """JMESPath 真值：None、False、空字符串、空列表、空对象为假"""
+    return not (value is None or value is False or value == '' or value == [] or value == {})
+
+
+def _field(name: str) -> Callable[[Any], Any]:
+    def get(value):
+        return value.get(name) if isinstance(value, dict) else None
+    return get
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _constant(literal: Any) -> Callable[[Any], Any]:
+    return lambda value: literal
+
+
+def _index(position: int) -> Callable[[Any], Any]:
+    def get(value):
+        if not isinstance(value, list):
+            return None
+        try:
+            return value[position]
+        except IndexError:
+            return None
+    return get
+
+
+def _project(items: Optional[list], rhs: Callable[[Any], Any]) -> Optional[list]:
+    if items is None:
+        return None
+    result = []
+    for item in items:
+        value = rhs(item)
+        if value is not None:
+            result.append(value)
+    return result
+
+
+def _compare(op: str, left: Callable, right: Callable) -> Callable[[Any], Any]:
+    def compare(value):
+        a, b = left(value), right(value)
+        if op == '==':
+            return a == b
+        if op == '!=':
+            return a != b
+        numeric = (int, float)
+        if not (isinstance(a, numeric) and isinstance(b, numeric)) \
+                or isinstance(a, bool) or isinstance(b, bool):
+            return None
+        if op == '<':
+            return a < b
+        if op == '<=':
+            return a <= b
+        if op == '>':
+            return a > b
+        return a >= b
+    return compare
+
+
+def _to_number(value: Any) -> Any:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+
+_FUNCTIONS = {
+    'length': (1, lambda v: len(v) if isinstance(v, (str, list, dict)) else None),
+    'keys': (1, lambda v: list(v.keys()) if isinstance(v, dict) else None),
+    'values': (1, lambda v: list(v.values()) if isinstance(v, dict) else None),
+    'contains': (2, lambda s, x: (x in s) if isinstance(s, (str, list)) else None),
+    'starts_with': (2, lambda s, p: s.startswith(p)
+                    if isinstance(s, str) and isinstance(p, str) else None),
+    'join': (2, lambda sep, items: sep.join(items)
+             if isinstance(items, list) and all(isinstance(i, str) for i in items) else None),
+    'to_string': (1, lambda v: v if isinstance(v, str)
+                  else json.dumps(v, ensure_ascii=False, separators=(',', ':'))),
+    'to_number': (1, _to_number),
+}
+
+
+# ==================== 语法分析（Pratt） ====================
+
+class _Parser:
+    """把表达式编译为 value -> value 的函数"""
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens = _tokenize(expression)
+        self.pos = 0
+        # 根节点是对输入列表的投影时，记录逐条求值函数
+        self.record: Optional[Callable[[Any], Any]] = None
+
+    def _peek(self, offset: int = 0) -> str:
+        return self.tokens[self.pos + offset][0]
+
+    def _advance(self) -> Tuple[str, Any]:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def _expect(self, kind: str) -> Any:
+        token_kind, value = self._advance()
+        if token_kind != kind:
+            found = '表达式结尾' if token_kind == 'eof' else repr(value)
+            raise QueryError(f"期望 {kind!r}，实际为 {found}")
+        return value
+
+    def parse(self) -> Callable[[Any], Any]:
+        self.pos = 0
+        start = self._peek()
+        func = self._expression(0)
+        if self._peek() != 'eof':
+            raise QueryError(f"多余的内容: {self.tokens[self.pos][1]!r}")
+        self._detect_record(start)
+        return func
+
+    def _detect_record(self, start: str) -> None:
+        """识别 [*]...、[?...]... 形式，流式输出时可逐条求值"""
+        if start not in ('[', '[?'):
+            return
+        try:
+            self.pos = 0
+            kind, _ = self._advance()
+            if kind == '[':
+                if self._peek() != '*' or self._peek(1) != ']':
+                    return
+                self.pos += 2
+                condition = None
+            elif kind == '[?':
+                condition = self._expression(0)
+                self._expect(']')
+            rhs = self._projection_rhs(_BINDING_POWER['*' if kind == '[' else kind])
+            if self._peek() != 'eof':
+                return
+        except QueryError:
+            return
+
+        if condition is None:
+            self.record = rhs
+        else:
+            self.record = lambda value: rhs(value) if _truthy(condition(value)) else None
+
+    def _expression(self, rbp: int) -> Callable[[Any], Any]:
+        left = self._nud(self._advance())
+        while rbp < _BINDING_POWER.get(self._peek(), 0):
+            left = self._led(self._advance(), left)
+        return left
+
+    # ---- 前缀 ----
+
+    def _nud(self, token: Tuple[str, Any]) -> Callable[[Any], Any]:
+        kind, value = token
+        if kind == 'literal':
+            return _constant(value)
+        if kind == 'ident':
+            if self._peek() == '(':
+                self._advance()
+                return self._function(value)
+            return _field(value)
+        if kind == 'quoted':
+            return _field(value)
+        if kind == '@':
+            return _identity
+        if kind == '*':
+            rhs = self._projection_rhs(_BINDING_POWER['*'])
+            return lambda v: _project(list(v.values()) if isinstance(v, dict) else None, rhs)
+        if kind == '[?':
+            return self._filter(_identity)
+        if kind == '[]':
+            return self._flatten(_identity)
+        if kind == '[':
+            if self._peek() == 'number':
+                position = self._advance()[1]
+                self._expect(']')
+                return _index(position)
+            if self._peek() == '*' and self._peek(1) == ']':
+                self.pos += 2
+                rhs = self._projection_rhs(_BINDING_POWER['*'])
+                return lambda v: _project(v if isinstance(v, list) else None, rhs)
+            return self._multiselect_list()
+        if kind == '{':
+            return self._multiselect_hash()
+        if kind == '!':
+            operand = self._expression(_BINDING_POWER['!'])
+            return lambda v: not _truthy(operand(v))
+        if kind == '(':
+            inner = self._expression(0)
+            self._expect(')')
+            return inner
+        if kind == 'eof':
+            raise QueryError("表达式不完整")
+        raise QueryError(f"意外的 {value!r}")
+
+    # ---- 中缀 ----
+
+    def _led(self, token: Tuple[str, Any], left: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        kind, _ = token
+        if kind == '.':
+            if self._peek() == '*':
+                self._advance()
+                rhs = self._projection_rhs(_BINDING_POWER['*'])
+                return lambda v: _project(
+                    (lambda base: list(base.values()) if isinstance(base, dict) else None)(left(v)),
+                    rhs)
+            right = self._dot_rhs(_BINDING_POWER['.'])
+            return lambda v: right(left(v))
+        if kind == '|':
+            right = self._expression(_BINDING_POWER['|'])
+            return lambda v: right(left(v))
+        if kind == '||':
+            right = self._expression(_BINDING_POWER['||'])
+            return lambda v: (lambda a: a if _truthy(a) else right(v))(left(v))
+        if kind == '&&':
+            right = self._expression(_BINDING_POWER['&&'])
+            return lambda v: (lambda a: right(v) if _truthy(a) else a)(left(v))
+        if kind in ('==', '!=', '<', '<=', '>', '>='):
+            return _compare(kind, left, self._expression(_BINDING_POWER[kind]))
+        if kind == '[':
+            if self._peek() == 'number':
+                position = self._advance()[1]
+                self._expect(']')
+                get = _index(position)
+                return lambda v: get(left(v))
+            if self._peek() == '*':
+                self._advance()
+                self._expect(']')
+                rhs = self._projection_rhs(_BINDING_POWER['*'])
+                return lambda v: _project(
+                    (lambda base: base if isinstance(base, list) else None)(left(v)), rhs)
+            raise QueryError("[ 之后应为下标或 *")
+        if kind == '[]':
+            return self._flatten(left)
+        if kind == '[?':
+            return self._filter(left)
+        raise QueryError(f"意外的 {kind!r}")
+
+    # ---- 组成部分 ----
+
+    def _projection_rhs(self, rbp: int) -> Callable[[Any], Any]:
+        kind = self._peek()
+        if _BINDING_POWER.get(kind, 0) < _PROJECTION_STOP:
+            return _identity
+        if kind in ('[', '[?', '[]'):
+            return self._expression(rbp)
+        if kind == '.':
+            self._advance()
+            return self._dot_rhs(rbp)
+        raise QueryError(f"投影之后不能直接跟 {self.tokens[self.pos][1]!r}")
+
+    def _dot_rhs(self, rbp: int) -> Callable[[Any], Any]:
+        kind = self._peek()
+        if kind in ('ident', 'quoted', '*'):
+            return self._expression(rbp)
+        if kind == '[':
+            self._advance()
+            return self._multiselect_list()
+        if kind == '{':
+            self._advance()
+            return self._multiselect_hash()
+        raise QueryError(". 之后应为字段名、*、[ 或 {")
+
+    def _filter(self, left: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        condition = self._expression(0)
+        self._expect(']')
+        rhs = self._projection_rhs(_BINDING_POWER['[?'])
+
+        def run(value):
+            base = left(value)
+            if not isinstance(base, list):
+                return None
+            return _project([item for item in base if _truthy(condition(item))], rhs)
+        return run
+
+    def _flatten(self, left: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        rhs = self._projection_rhs(_BINDING_POWER['[]'])
+
+        def run(value):
+            base = left(value)
+            if not isinstance(base, list):
+                return None
+            merged = []
+            for item in base:
+                if isinstance(item, list):
+                    merged.extend(item)
+                else:
+                    merged.append(item)
+            return _project(merged, rhs)
+        return run
+
+    def _multiselect_list(self) -> Callable[[Any], Any]:
+        parts = [self._expression(0)]
+        while self._peek() == ',':
+            self._advance()
+            parts.append(self._expression(0))
+        self._expect(']')
+        return lambda v: None if v is None else [part(v) for part in parts]
+
+    def _multiselect_hash(self) -> Callable[[Any], Any]:
+        pairs = []
+        while True:
+            kind, key = self._advance()
+            if kind not in ('ident', 'quoted'):
+                raise QueryError("{ } 中应为 键: 表达式")
+            self._expect(':')
+            pairs.append((key, self._expression(0)))
+            if self._peek() != ',':
+                break
+            self._advance()
+        self._expect('}')
+        return lambda v: None if v is None else {key: part(v) for key, part in pairs}
+
+    def _function(self, name: str) -> Callable[[Any], Any]:
+        if name not in _FUNCTIONS:
+            raise QueryError(f"不支持的函数 {name}()")
+        arity, impl = _FUNCTIONS[name]
+        args = []
+        if self._peek() != ')':
+            args.append(self._expression(0))
+            while self._peek() == ',':
+                self._advance()
+                args.append(self._expression(0))
+        self._expect(')')
+        if len(args) != arity:
+            raise QueryError(f"{name}() 需要 {arity} 个参数")
+        return lambda v: impl(*[arg(v) for arg in args])
+
+
+# ==================== 对外接口 ====================
+
+class Query:
+    """编译后的查询表达式"""
+
+    def __init__(self, expression: str):
+        """
+        解析并编译表达式
+
+        Args:
+            expression: 查询表达式
+
+        Raises:
+            QueryError: 表达式语法错误
+        """
+        parser = _Parser(expression)
+        self.expression = expression
+        self._search = parser.parse()
+        self._record = parser.record
+
+    def search(self, data: Any) -> Any:
+        """对完整数据求值"""
+        return self._search(data)
+
+    @property
+    def streamable(self) -> bool:
+        """是否可以逐条求值（表达式以 [*] 或 [?...] 开头，且其后没有管道）"""
+        return self._record is not None
+
+    def iter_records(self, items: Iterable[Any]) -> Iterator[Any]:
+        """
+        逐条求值，结果为 None 的记录被丢弃
+
+        等价于 search(list(items)) 的各个元素，但不需要先收集全部记录；
+        仅在 streamable 为真时可用。
+        """
+        record = self._record
+        for item in items:
+            value = record(item)
+            if value is not None:
+                yield value
+
+    def __repr__(self) -> str:
+        return f"Query({self.expression!r})"
+
+
+def current_query() -> Optional[Query]:
+    """
+    当前命令行指定的 --query（已编译），未指定时返回None
+
+    调用方负责把查询应用到输出的数据上；取得查询即视为已应用，
+    命令结束时若查询未被取用，根命令会提示查询没有生效。
+    """
+    import click
+
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return None
+    obj = ctx.find_root().obj
+    if not isinstance(obj, dict) or obj.get('query') is None:
+        return None
+    obj['query_applied'] = True
+    return obj['query']
+
+
+def query_output(func: Callable) -> Callable:
+    """
+    格式化输出函数的装饰器：输出前先对数据应用 --query
+
+    被装饰函数的签名应为 func(data, output_format, ...)；
+    未经查询处理的原函数可通过 __wrapped__ 访问。
+    命令自己绘制表格时，cli.paging 改为按 JSON 输出执行命令并设置 query_as_table，
+    查询结果在这里以通用表格输出。
+    """
+    @wraps(func)
+    def wrapper(data, *args, **kwargs):
+        query = current_query()
+        if query is None:
+            return func(data, *args, **kwargs)
+        data = query.search(data)
+        import click
+
+        obj = click.get_current_context().find_root().obj
+        if obj.get('query_as_table'):
+            from utils.streaming import write_result_table
+            write_result_table(data)
+            return None
+        return func(data, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,225 @@
+"""
+流式输出
+逐条写出记录（NDJSON、CSV、表格），配合分页器使用时内存中只保留当前页，
+不会先把全部结果收集起来再格式化
+"""
+
+import csv
+import sys
+import unicodedata
+import itertools
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from utils import jsoncodec
+
+
+# 表格列宽取样的行数
+DEFAULT_SAMPLE_SIZE = 200
+
+# 按样本计算列宽时单列的最大宽度，更长的单元格原样输出（不截断）
+MAX_COLUMN_WIDTH = 60
+
+
+def _cell(value: Any) -> str:
+    """单元格文本：嵌套结构输出为紧凑JSON"""
+    if value is None:
+        return ''
+    if isinstance(value, (list, dict)):
+        return jsoncodec.dumps(value, default=str)
+    return str(value)
+
+
+def _table_cell(value: Any) -> str:
+    """表格单元格文本：多行内容合并为一行"""
+    return _cell(value).replace('\n', ' ')
+
+
+def display_width(text: str) -> int:
+    """终端显示宽度（中日韩全角字符占两列）"""
+    return sum(2 if unicodedata.east_asian_width(ch) in ('W', 'F') else 1 for ch in text)
+
+
+def _pad(text: str, width: int) -> str:
+    return text + ' ' * max(width - display_width(text), 0)
+
+
+def discard_stdout() -> None:
+    """标准输出的管道已被下游关闭（如 | head）：之后的写出和退出时的刷新都丢弃，避免再次报错"""
+    import os
+
+    try:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+    except (AttributeError, OSError, ValueError):
+        # 标准输出没有文件描述符（如守护进程中转发给客户端的输出）
+        sys.stdout = open(os.devnull, 'w')
+
+
+def write_ndjson(items: Iterable[Any], stream: Optional[TextIO] = None) -> int:
+    """
+    每行输出一条JSON记录
+
+    Args:
+        items: 记录迭代器
+        stream: 输出流，默认标准输出
+
+    Returns:
+        输出的条数
+    """
+    stream = stream or sys.stdout
+    dumps = jsoncodec.dumps
+    count = 0
+    for item in items:
+        stream.write(dumps(item, default=str))
+        stream.write('\n')
+        count += 1
+    stream.flush()
+    return count
+
+
+def write_csv(rows: Iterable[Any], headers: Optional[Sequence[str]] = None,
+              stream: Optional[TextIO] = None) -> int:
+    """
+    输出CSV
+
+    Args:
+        rows: 行迭代器，元素为字典或列表
+        headers: 表头；未指定时使用第一条字典记录的键
+        stream: 输出流，默认标准输出
+
+    Returns:
+        输出的行数（不含表头）
+    """
+    stream = stream or sys.stdout
+    writer = csv.writer(stream, lineterminator='\n')
+    count = 0
+    for row in rows:
+        if count == 0:
+            if headers is None and isinstance(row, dict):
+                headers = list(row.keys())
+            if headers:
+                writer.writerow(headers)
+        if isinstance(row, dict):
+            row = [row.get(header) for header in headers]
+        elif not isinstance(row, (list, tuple)):
+            row = [row]
+        writer.writerow([_cell(value) for value in row])
+        count += 1
+    stream.flush()
+    return count
+
+
+def write_table(rows: Iterable[Sequence[Any]], headers: Sequence[str],
+                sample_size: int = DEFAULT_SAMPLE_SIZE,
+                stream: Optional[TextIO] = None) -> int:
+    """
+    流式输出对齐的表格
+
+    列宽只根据表头和前 sample_size 行计算，之后的行到达即输出；
+    超出列宽的单元格不截断，仅该行不再对齐。
+
+    Args:
+        rows: 行迭代器
+        headers: 表头
+        sample_size: 计算列宽的样本行数
+        stream: 输出流，默认标准输出
+
+    Returns:
+        输出的行数
+    """
+    stream = stream or sys.stdout
+    iterator = iter(rows)
+    sample: List[List[str]] = []
+    for row in iterator:
+        sample.append([_table_cell(value) for value in row])
+        if len(sample) >= sample_size:
+            break
+    if not sample:
+        return 0
+
+    widths = [display_width(str(header)) for header in headers]
+    for row in sample:
+        for i, text in enumerate(row[:len(widths)]):
+            widths[i] = max(widths[i], min(display_width(text), MAX_COLUMN_WIDTH))
+
+    def emit(cells: Sequence[str]) -> None:
+        stream.write('  '.join(_pad(text, width) for text, width in zip(cells, widths)).rstrip())
+        stream.write('\n')
+
+    emit([str(header) for header in headers])
+    emit(['-' * width for width in widths])
+    for row in sample:
+        emit(row)
+    count = len(sample)
+    del sample
+    for row in iterator:
+        emit([_table_cell(value) for value in row])
+        count += 1
+    stream.flush()
+    return count
+
+
+def write_records(items: Iterable[Any], output_format: str,
+                  headers: Optional[Sequence[str]] = None,
+                  row: Optional[Callable[[Any], Sequence[Any]]] = None,
+                  stream: Optional[TextIO] = None) -> int:
+    """
+    按格式流式输出记录
+
+    ndjson 和 csv 输出记录的原始字段（csv 的列为第一条记录的字段，嵌套结构为紧凑JSON）；
+    表格按 headers 和 row 输出便于阅读的列。
+
+    Args:
+        items: 原始记录迭代器
+        output_format: ndjson、csv 或 table
+        headers: 表头（table）
+        row: 把原始记录转换为表格一行的函数（table）
+        stream: 输出流，默认标准输出
+
+    Returns:
+        输出的条数
+    """
+    if output_format == 'ndjson':
+        return write_ndjson(items, stream)
+    if output_format == 'csv':
+        return write_csv(items, stream=stream)
+    rows = (row(item) for item in items) if row else items
+    return write_table(rows, headers, stream=stream)
+
+
+def table_columns(items: Iterable[Any]) -> Tuple[Iterator[Any], Optional[List[str]], Optional[Callable]]:
+    """
+    通用表格的列：第一条记录中值不是对象或列表的字段
+
+    Returns:
+        (结果迭代器, 表头, 把一条结果转换为一行的函数)；没有结果时表头为None
+    """
+    iterator = iter(items)
+    first = next(iterator, None)
+    if first is None:
+        return iter(()), None, None
+    items = itertools.chain([first], iterator)
+    if not isinstance(first, dict):
+        return items, ['value'], lambda item: [item]
+    headers = [key for key, value in first.items() if not isinstance(value, (dict, list))] or list(first)
+    return items, headers, lambda item: [item.get(key) if isinstance(item, dict) else item for key in headers]
+
+
+def write_result_table(result: Any, stream: Optional[TextIO] = None) -> int:
+    """
+    以通用表格输出查询结果：列表每条一行，对象每个字段一行，其他值原样输出
+
+    Returns:
+        输出的行数
+    """
+    if isinstance(result, list):
+        items, headers, row = table_columns(result)
+        return write_records(items, 'table', headers=headers, row=row, stream=stream) if headers else 0
+    if isinstance(result, dict):
+        return write_table(([key, value] for key, value in result.items()), ['字段', '值'], stream=stream)
+    if result is None:
+        return 0
+    stream = stream or sys.stdout
+    stream.write(f"{result}\n")
+    stream.flush()
+    return 1
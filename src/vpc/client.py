@@ -4,9 +4,9 @@ VPC(虚拟私有云)管理模块客户端
 
 from typing import Dict, Any, List, Optional
 import json
+import logging
 import uuid
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -24,7 +24,7 @@ class VPCClient:
         self.service = 'vpc'
         self.base_endpoint = 'ctvpc-global.ctapi.ctyun.cn'
         # 初始化EOP签名认证器
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     # ==================== VPC查询 ====================
 
@@ -87,8 +87,9 @@ class VPCClient:
             )
 
             # 记录响应
-            logger.debug(f"VPC列表查询响应状态码: {response.status_code}")
-            logger.debug(f"VPC列表查询响应内容: {response.text}")
+            logger.debug("VPC列表查询响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("VPC列表查询响应内容: %s", response.text)
 
             # 解析响应
             if response.status_code == 200:
@@ -228,8 +229,9 @@ class VPCClient:
             )
 
             # 记录响应
-            logger.debug(f"新版VPC列表查询响应状态码: {response.status_code}")
-            logger.debug(f"新版VPC列表查询响应内容: {response.text}")
+            logger.debug("新版VPC列表查询响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("新版VPC列表查询响应内容: %s", response.text)
 
             # 解析响应
             if response.status_code == 200:
@@ -340,8 +342,9 @@ class VPCClient:
             )
 
             # 记录响应
-            logger.debug(f"VPC详情查询响应状态码: {response.status_code}")
-            logger.debug(f"VPC详情查询响应内容: {response.text}")
+            logger.debug("VPC详情查询响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("VPC详情查询响应内容: %s", response.text)
 
             # 解析响应
             if response.status_code == 200:
@@ -455,8 +458,9 @@ class VPCClient:
             )
 
             # 记录响应
-            logger.debug(f"新版子网列表查询响应状态码: {response.status_code}")
-            logger.debug(f"新版子网列表查询响应内容: {response.text}")
+            logger.debug("新版子网列表查询响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("新版子网列表查询响应内容: %s", response.text)
 
             # 解析响应
             if response.status_code == 200:
@@ -586,8 +590,9 @@ class VPCClient:
             )
 
             # 记录响应
-            logger.debug(f"子网列表查询响应状态码: {response.status_code}")
-            logger.debug(f"子网列表查询响应内容: {response.text}")
+            logger.debug("子网列表查询响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("子网列表查询响应内容: %s", response.text)
 
             # 解析响应
             if response.status_code == 200:
@@ -743,13 +748,14 @@ class VPCClient:
                 headers=headers
             )
 
-            logger.debug(f"安全组API响应状态码: {response.status_code}")
-            logger.debug(f"安全组API响应内容: {response.text}")
+            logger.debug("安全组API响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("安全组API响应内容: %s", response.text)
 
             if response.status_code == 200:
                 try:
                     result = response.json()
-                    logger.debug(f"安全组API响应数据: {result}")
+                    logger.debug("安全组API响应数据: %s", result)
                     return result
                 except ValueError:
                     return {"error": "Invalid JSON response", "text": response.text}
@@ -861,13 +867,14 @@ class VPCClient:
                 headers=headers
             )
 
-            logger.debug(f"新版安全组API响应状态码: {response.status_code}")
-            logger.debug(f"新版安全组API响应内容: {response.text}")
+            logger.debug("新版安全组API响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("新版安全组API响应内容: %s", response.text)
 
             if response.status_code == 200:
                 try:
                     result = response.json()
-                    logger.debug(f"新版安全组API响应数据: {result}")
+                    logger.debug("新版安全组API响应数据: %s", result)
                     return result
                 except ValueError:
                     return {"error": "Invalid JSON response", "text": response.text}
@@ -1000,8 +1007,9 @@ class VPCClient:
             )
 
             # 记录响应
-            logger.debug(f"子网详情查询响应状态码: {response.status_code}")
-            logger.debug(f"子网详情查询响应内容: {response.text}")
+            logger.debug("子网详情查询响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("子网详情查询响应内容: %s", response.text)
 
             # 解析响应
             if response.status_code == 200:
@@ -1148,8 +1156,9 @@ class VPCClient:
             )
 
             # 记录响应
-            logger.debug(f"子网已使用IP查询响应状态码: {response.status_code}")
-            logger.debug(f"子网已使用IP查询响应内容: {response.text}")
+            logger.debug("子网已使用IP查询响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("子网已使用IP查询响应内容: %s", response.text)
 
             # 解析响应
             if response.status_code == 200:
@@ -1279,8 +1288,9 @@ class VPCClient:
             )
 
             # 记录响应
-            logger.debug(f"安全组详情查询响应状态码: {response.status_code}")
-            logger.debug(f"安全组详情查询响应内容: {response.text}")
+            logger.debug("安全组详情查询响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("安全组详情查询响应内容: %s", response.text)
 
             # 解析响应
             if response.status_code == 200:
@@ -1425,7 +1435,7 @@ class VPCClient:
             )
 
             response = self.client.session.post(
-                url, data=body_json, headers=headers, timeout=30
+                url, data=body_json, headers=headers, timeout=self.client.timeout
             )
 
             if response.status_code != 200:
@@ -1504,7 +1514,7 @@ class VPCClient:
             )
 
             response = self.client.session.post(
-                url, data=body_json, headers=headers, timeout=30
+                url, data=body_json, headers=headers, timeout=self.client.timeout
             )
 
             if response.status_code != 200:
@@ -1558,7 +1568,7 @@ class VPCClient:
             )
 
             response = self.client.session.post(
-                url, data=body_json, headers=headers, timeout=30
+                url, data=body_json, headers=headers, timeout=self.client.timeout
             )
 
             if response.status_code != 200:
@@ -1607,7 +1617,7 @@ class VPCClient:
             )
 
             response = self.client.session.get(
-                url, params=query_params, headers=headers, timeout=30
+                url, params=query_params, headers=headers, timeout=self.client.timeout
             )
 
             if response.status_code != 200:
@@ -1652,7 +1662,7 @@ class VPCClient:
             )
 
             response = self.client.session.get(
-                url, params=query_params, headers=headers, timeout=30
+                url, params=query_params, headers=headers, timeout=self.client.timeout
             )
 
             if response.status_code != 200:
@@ -2424,8 +2434,8 @@ class VPCClient:
             import json as _json
             headers = self.eop_auth.sign_request(method='POST', url=url, query_params={},
                                                  body=_json.dumps(bd), extra_headers={})
-            logger.debug(f"POST {url} | body={bd}")
-            response = self.client.session.post(url, json=bd, headers=headers, timeout=30)
+            logger.debug("POST %s | body=%s", url, bd)
+            response = self.client.session.post(url, json=bd, headers=headers, timeout=self.client.timeout)
             if response.status_code != 200:
                 return {'statusCode': response.status_code,
                         'message': f'HTTP {response.status_code}: {response.text}',
@@ -2552,8 +2562,8 @@ class VPCClient:
         qp = {k: v for k, v in query_params.items() if v is not None}
         try:
             headers = self.eop_auth.sign_request(method='GET', url=url, query_params=qp, body='', extra_headers={})
-            logger.debug(f"请求URL: {url} | 参数: {qp}")
-            response = self.client.session.get(url, params=qp, headers=headers, timeout=30)
+            logger.debug("请求URL: %s | 参数: %s", url, qp)
+            response = self.client.session.get(url, params=qp, headers=headers, timeout=self.client.timeout)
             if response.status_code != 200:
                 return {
                     'statusCode': response.status_code,
@@ -2572,7 +2582,7 @@ class VPCClient:
         url = f'https://{self.base_endpoint}{path}'
         qp = {'regionID': region_id, **query_params}
         headers = self.eop_auth.sign_request(method='GET', url=url, query_params=qp, body='', extra_headers={})
-        response = self.client.session.get(url, params=qp, headers=headers, timeout=30)
+        response = self.client.session.get(url, params=qp, headers=headers, timeout=self.client.timeout)
         response.raise_for_status()
         data = response.json()
         if data.get('statusCode') != 800:
@@ -2638,7 +2648,7 @@ class VPCClient:
         try:
             headers = self.eop_auth.sign_request(method='POST', url=url, query_params={},
                                                  body=body_str, extra_headers={})
-            response = self.client.session.post(url, json=bd, headers=headers, timeout=30)
+            response = self.client.session.post(url, json=bd, headers=headers, timeout=self.client.timeout)
             if response.status_code != 200:
                 return {'statusCode': response.status_code,
                         'message': f'HTTP {response.status_code}: {response.text}',
@@ -8,6 +8,9 @@ from typing import List, Optional
 # 直接定义装饰器，避免循环导入
 from vpc import VPCClient
 from utils import ValidationUtils, OutputFormatter
+from utils.query import query_output
+from cli.paging import (LIST_OUTPUT_FORMATS, STREAM_FORMATS, all_pages_option, echo_items,
+                        explicit_page_size, iter_all, list_operation)
 
 
 def handle_error(func):
@@ -33,6 +36,7 @@ def handle_error(func):
     return wrapper
 
 
+@query_output
 def format_output(data, output_format='table'):
     """
     格式化输出
@@ -332,6 +336,7 @@ def vpc():
 
 # ==================== VPC管理命令 ====================
 
+@list_operation(VPCClient.describe_vpcs, 'region_id', 'vpc_id', 'vpc_name', 'project_id', page_size=200)
 @vpc.command('list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--vpc-id', help='VPC ID，多个ID用半角逗号分隔')
@@ -361,6 +366,7 @@ def describe_vpcs(ctx, region_id: str, vpc_id: Optional[str], vpc_name: Optional
     format_output(result, output_format)
 
 
+@list_operation(VPCClient.new_describe_vpcs, 'region_id', 'vpc_id', 'vpc_name', 'project_id', page_size=200)
 @vpc.command('new-list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--vpc-id', help='VPC ID，多个ID用半角逗号分隔')
@@ -426,6 +432,7 @@ def subnet():
     pass
 
 
+@list_operation(VPCClient.describe_subnets, 'region_id', 'vpc_id', 'subnet_id', 'client_token', page_size=200)
 @subnet.command('list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--vpc-id', help='VPC ID')
@@ -460,6 +467,8 @@ def describe_subnets(ctx, region_id: str, vpc_id: Optional[str], subnet_id: Opti
     format_output(result, output_format)
 
 
+@list_operation(VPCClient.new_describe_subnets, 'region_id', 'vpc_id', 'subnet_id', 'client_token',
+                'next_token', page_size=200)
 @subnet.command('new-list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--vpc-id', help='VPC ID')
@@ -470,17 +479,23 @@ def describe_subnets(ctx, region_id: str, vpc_id: Optional[str], subnet_id: Opti
 @click.option('--page-size', type=int, default=10, help='分页查询时每页的行数，最大值为200，默认值为10')
 @click.option('--next-token', help='下一页游标')
 @click.option('--max-results', type=int, help='最大数量')
-@click.option('--output', type=click.Choice(['table', 'json', 'yaml']), help='输出格式')
+@all_pages_option
+@click.option('--output', type=click.Choice(LIST_OUTPUT_FORMATS), help='输出格式')
 @click.pass_context
 @handle_error
 def new_describe_subnets(ctx, region_id: str, vpc_id: Optional[str], subnet_id: Optional[str],
                          client_token: Optional[str], page_no: int, page_number: Optional[int],
                          page_size: int, next_token: Optional[str], max_results: Optional[int],
-                         output: Optional[str]):
+                         all_pages: bool, output: Optional[str]):
     """
     查询子网列表 (新版API，支持游标分页)
     """
     client = get_vpc_client(ctx)
+    if all_pages:
+        subnets = iter_all(client.new_describe_subnets, page_size=explicit_page_size(ctx),
+                           region_id=region_id, vpc_id=vpc_id, subnet_id=subnet_id)
+        echo_items(subnets, output or ctx.obj.get('output') or 'table', format_output)
+        return
     result = client.new_describe_subnets(
         region_id=region_id,
         vpc_id=vpc_id,
@@ -494,6 +509,10 @@ def new_describe_subnets(ctx, region_id: str, vpc_id: Optional[str], subnet_id:
     )
     # 优先使用子命令的output参数，否则使用全局output设置
     output_format = output or ctx.obj['output']
+    if output_format in STREAM_FORMATS:
+        from core.paginator import extract_items
+        echo_items(extract_items(result), output_format, format_output)
+        return
     format_output(result, output_format)
 
 
@@ -517,6 +536,7 @@ def show_subnet(ctx, region_id: str, subnet_id: str, output: Optional[str]):
     format_output(result, output_format)
 
 
+@list_operation(VPCClient.list_subnet_used_ips, 'region_id', 'subnet_id', 'ip', page_size=50)
 @subnet.command('used-ips')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--subnet-id', required=True, help='子网ID')
@@ -584,6 +604,8 @@ def security_group():
     pass
 
 
+@list_operation(VPCClient.describe_security_groups, 'region_id', 'vpc_id', 'query_content', 'project_id',
+                'instance_id', page_size=50)
 @security_group.command('list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--vpc-id', help='安全组所在的专有网络ID')
@@ -620,6 +642,8 @@ def describe_security_groups(ctx, region_id: str, vpc_id: Optional[str], query_c
     format_output(result, output_format)
 
 
+@list_operation(VPCClient.new_describe_security_groups, 'region_id', 'vpc_id', 'query_content', 'instance_id',
+                page_size=50)
 @security_group.command('new-query')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--vpc-id', help='安全组所在的专有网络ID')
@@ -689,6 +713,8 @@ def eip():
     pass
 
 
+@list_operation(VPCClient.describe_eips, 'region_id', 'eip_id', 'eip_address', 'status', 'instance_id',
+                page_size=50)
 @eip.command('list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--eip-id', help='弹性公网IP ID')
@@ -732,6 +758,7 @@ def eip_detail(ctx, region_id: str, eip_id: str):
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.list_bandwidths_new, 'region_id', 'query_content', 'project_id')
 @eip.command('shared-bandwidths')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--query-content', help='模糊查询（实例名称/带宽ID）')
@@ -838,6 +865,8 @@ def snat():
     pass
 
 
+@list_operation(VPCClient.list_snats, 'region_id', 'nat_gateway_id', 'subnet_id', page_size=50,
+                s_nat_id='snat_id')
 @snat.command('list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--nat-gateway-id', help='NAT网关ID')
@@ -922,6 +951,8 @@ def flow_log():
 
 # ==================== 路由表/安全组/网卡 列表查询命令 ====================
 
+@list_operation(VPCClient.new_list_route_tables, 'region_id', 'vpc_id', 'query_content', 'route_table_id',
+                page_size=50, type_=lambda p: int(p['type_']) if p['type_'] is not None else None)
 @route_table.command('new-list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--vpc-id', help='VPC ID')
@@ -945,6 +976,7 @@ def new_list_route_tables(ctx, region_id: str, vpc_id: Optional[str], query_cont
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.list_route_table_rules, 'region_id', 'route_table_id', page_size=50)
 @route_table.command('rules')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--route-table-id', required=True, help='路由表ID')
@@ -961,6 +993,7 @@ def list_route_table_rules_cmd(ctx, region_id: str, route_table_id: str,
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.new_list_route_table_rules, 'region_id', 'route_table_id', page_size=50)
 @route_table.command('new-rules')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--route-table-id', required=True, help='路由表ID')
@@ -977,6 +1010,8 @@ def new_list_route_table_rules_cmd(ctx, region_id: str, route_table_id: str,
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.list_security_group_rules, 'region_id', 'security_group_id',
+                'remote_security_group_id', 'security_group_rule_ids', page_size=50)
 @security_group.command('rules')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--security-group-id', help='安全组ID')
@@ -1000,6 +1035,7 @@ def list_security_group_rules_cmd(ctx, region_id: str, security_group_id: Option
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.list_security_group_vms, 'region_id', 'security_group_id', page_size=50)
 @security_group.command('vms')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--security-group-id', required=True, help='安全组ID')
@@ -1022,6 +1058,7 @@ def port():
     pass
 
 
+@list_operation(VPCClient.list_ports, 'region_id', 'vpc_id', 'device_id', 'subnet_id', page_size=50)
 @port.command('list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--vpc-id', help='所属VPC ID')
@@ -1044,6 +1081,7 @@ def list_ports_cmd(ctx, region_id: str, vpc_id: Optional[str], device_id: Option
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.new_list_ports, 'region_id', 'vpc_id', 'device_id', 'subnet_id', page_size=50)
 @port.command('new-list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--vpc-id', help='所属VPC ID')
@@ -1111,6 +1149,8 @@ def _label_output(ctx, result):
         click.echo(OutputFormatter.format_table(items))
 
 
+@list_operation(VPCClient.query_resources_by_label, 'region_id', 'label_id', 'label_key', 'label_value',
+                items_key='results')
 @vpc.command('label-query-resources')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--label-id', default=None, help='标签ID')
@@ -1135,6 +1175,7 @@ def label_query_resources(ctx, region_id, label_id, label_key, label_value, page
         click.echo(OutputFormatter.format_table(items))
 
 
+@list_operation(VPCClient.query_labels_by_resource, 'region_id', 'resource_type', 'resource_id')
 @vpc.command('label-query-by-resource')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--resource-type', required=True,
@@ -1152,6 +1193,7 @@ def label_query_by_resource(ctx, region_id, resource_type, resource_id, page_num
     _label_output(ctx, result)
 
 
+@list_operation(VPCClient.list_vpc_peer_labels, 'region_id', 'vpc_peer_id')
 @vpc.command('label-vpc-peer')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--vpc-peer-id', required=True, help='对等链接ID')
@@ -1166,6 +1208,7 @@ def label_vpc_peer(ctx, region_id, vpc_peer_id, page_number, page_size):
     _label_output(ctx, result)
 
 
+@list_operation(VPCClient.list_vpce_endpoint_labels, 'region_id', 'endpoint_id')
 @vpc.command('label-vpce-endpoint')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--endpoint-id', required=True, help='终端节点ID')
@@ -1180,6 +1223,7 @@ def label_vpce_endpoint(ctx, region_id, endpoint_id, page_number, page_size):
     _label_output(ctx, result)
 
 
+@list_operation(VPCClient.list_vpce_service_labels, 'region_id', 'endpoint_service_id')
 @vpc.command('label-vpce-service')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--endpoint-service-id', required=True, help='终端节点服务ID')
@@ -1195,6 +1239,7 @@ def label_vpce_service(ctx, region_id, endpoint_service_id, page_number, page_si
     _label_output(ctx, result)
 
 
+@list_operation(VPCClient.list_private_dns_labels, 'region_id', 'zone_id')
 @vpc.command('label-private-dns')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--zone-id', required=True, help='内网DNS ID')
@@ -1210,6 +1255,8 @@ def label_private_dns(ctx, region_id, zone_id, page_no, page_size):
 
 # ==================== EIP监控/共享带宽/流量包 命令 ====================
 
+@list_operation(VPCClient.query_eip_realtime_monitor, 'region_id', page_size=50,
+                device_ids=lambda p: p['device_ids'].split(',') if p['device_ids'] else None)
 @eip.command('realtime-monitor')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--device-ids', help='EIP地址列表，逗号分隔（例：192.2.3.3,192.2.3.4）')
@@ -1228,6 +1275,8 @@ def eip_realtime_monitor(ctx, region_id: str, device_ids: Optional[str],
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.query_eip_realtime_monitor_new, 'region_id', page_size=50,
+                device_ids=lambda p: p['device_ids'].split(',') if p['device_ids'] else None)
 @eip.command('new-realtime-monitor')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--device-ids', help='EIP地址列表，逗号分隔')
@@ -1246,6 +1295,9 @@ def eip_new_realtime_monitor(ctx, region_id: str, device_ids: Optional[str],
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.query_eip_history_monitor, 'region_id', 'start_time', 'end_time', 'period',
+                page_size=50, device_ids=lambda p: p['device_ids'].split(','),
+                metric_names=lambda p: p['metric_names'].split(','))
 @eip.command('history-monitor')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--device-ids', required=True, help='EIP地址列表，逗号分隔')
@@ -1269,6 +1321,9 @@ def eip_history_monitor(ctx, region_id: str, device_ids: str, metric_names: str,
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.query_eip_history_monitor_new, 'region_id', 'start_time', 'end_time', 'period',
+                page_size=50, device_ids=lambda p: p['device_ids'].split(','),
+                metric_names=lambda p: p['metric_names'].split(','))
 @eip.command('new-history-monitor')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--device-ids', required=True, help='EIP地址列表，逗号分隔')
@@ -1334,6 +1389,8 @@ def bandwidth_show(ctx, region_id: str, bandwidth_id: str):
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.new_list_shared_bandwidths, 'region_id', 'query_content', 'project_id',
+                page_size=50)
 @bandwidth.command('new-list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--query-content', help='模糊查询（名称/带宽ID）')
@@ -1404,6 +1461,8 @@ def vpce():
     pass
 
 
+@list_operation(VPCClient.list_vpce_endpoints, 'region_id', 'project_id', 'endpoint_name', 'query_content',
+                'endpoint_service_id', 'endpoint_id')
 @vpce.command('list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--page-no', type=int, help='页码（推荐使用）')
@@ -1429,6 +1488,8 @@ def vpce_list(ctx, region_id: str, page_no: Optional[int], page_size: Optional[i
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.new_list_vpce_endpoints, 'region_id', 'project_id', 'endpoint_name',
+                'query_content', 'endpoint_service_id', 'endpoint_id')
 @vpce.command('new-list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--page-no', type=int, help='页码（推荐使用）')
@@ -1460,6 +1521,7 @@ def service():
     pass
 
 
+@list_operation(VPCClient.list_vpce_services, 'region_id', 'id_', 'endpoint_service_name', 'query_content')
 @service.command('list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--page-no', type=int, help='页码（推荐使用）')
@@ -1480,6 +1542,8 @@ def vpce_service_list(ctx, region_id: str, page_no: Optional[int], page_size: Op
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.new_list_vpce_services, 'region_id', 'id_', 'endpoint_service_name',
+                'query_content')
 @service.command('new-list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--page-no', type=int, help='页码（推荐使用）')
@@ -1519,6 +1583,7 @@ def dns():
     pass
 
 
+@list_operation(VPCClient.list_private_zones, 'region_id', 'zone_id', 'zone_name', page_size=200)
 @dns.command('list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--zone-id', help='zoneID')
@@ -1537,6 +1602,7 @@ def dns_list(ctx, region_id: str, zone_id: Optional[str], zone_name: Optional[st
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.new_list_private_zones, 'region_id', 'zone_id', 'zone_name', page_size=200)
 @dns.command('new-list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--zone-id', help='zoneID')
@@ -1561,6 +1627,8 @@ def record():
     pass
 
 
+@list_operation(VPCClient.list_private_zone_records, 'region_id', 'zone_id', 'zone_record_name',
+                'zone_record_id', page_size=50)
 @record.command('list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--zone-id', help='zoneID')
@@ -1580,6 +1648,8 @@ def dns_record_list(ctx, region_id: str, zone_id: Optional[str], zone_record_nam
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.new_list_private_zone_records, 'region_id', 'zone_id', 'zone_record_name',
+                'zone_record_id', page_size=200)
 @record.command('new-list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--zone-id', help='zoneID')
@@ -1607,6 +1677,7 @@ def acl():
     pass
 
 
+@list_operation(VPCClient.list_acls, 'region_id', 'acl_id', 'project_id', 'name', page_size=50)
 @acl.command('list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--acl-id', help='aclID')
@@ -1625,6 +1696,7 @@ def acl_list(ctx, region_id: str, acl_id: Optional[str], project_id: Optional[st
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.new_list_acls, 'region_id', 'acl_id', 'name', page_size=50)
 @acl.command('new-list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--acl-id', help='aclID')
@@ -1660,6 +1732,7 @@ def prefix_list():
     pass
 
 
+@list_operation(VPCClient.list_prefix_lists, 'region_id', 'prefix_list_id', 'query_content', page_size=50)
 @prefix_list.command('list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--prefix-list-id', help='prefixlistID')
@@ -1689,6 +1762,7 @@ def prefix_list_show(ctx, region_id: str, prefix_list_id: str):
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.get_prefix_list_associations, 'region_id', 'prefix_list_id', page_size=50)
 @prefix_list.command('associations')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--prefix-list-id', required=True, help='prefixlistID')
@@ -1711,6 +1785,8 @@ def flow():
     pass
 
 
+@list_operation(VPCClient.list_flow_filter_rules, 'region_id', 'mirror_filter_id', 'direction',
+                'query_content', page_size=50)
 @flow.command('filter-rules')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--mirror-filter-id', required=True, help='过滤条件ID')
@@ -1730,6 +1806,7 @@ def flow_filter_rules(ctx, region_id: str, mirror_filter_id: str, direction: str
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.list_flow_filters, 'region_id', 'query_content', page_size=50)
 @flow.command('filters')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--query-content', help='按名字模糊过滤')
@@ -1746,6 +1823,7 @@ def flow_filters(ctx, region_id: str, query_content: Optional[str],
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.list_flow_sessions, 'region_id', 'mirror_filter_id', 'query_content', page_size=50)
 @flow.command('sessions')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--mirror-filter-id', help='过滤条件ID')
@@ -1769,6 +1847,7 @@ def gwlb():
     pass
 
 
+@list_operation(VPCClient.list_gwlbs, 'region_id', 'project_id', 'gw_lb_id', page_size=50)
 @gwlb.command('list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--project-id', help='企业项目ID')
@@ -1786,6 +1865,7 @@ def gwlb_list(ctx, region_id: str, project_id: Optional[str], gw_lb_id: Optional
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.list_ip_listeners, 'region_id', 'ip_listener_id', page_size=50)
 @gwlb.command('ip-listener-list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--ip-listener-id', help='监听器ID')
@@ -1808,6 +1888,7 @@ def l2gw():
     pass
 
 
+@list_operation(VPCClient.list_l2gws, 'region_id', 'l2gw_id', 'query_content', page_size=50)
 @l2gw.command('list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--l2gw-id', help='l2gw ID')
@@ -1825,6 +1906,7 @@ def l2gw_list(ctx, region_id: str, l2gw_id: Optional[str], query_content: Option
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.list_l2gw_connections, 'region_id', 'l2gw_id', 'l2_connection_id', page_size=50)
 @l2gw.command('connection-list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--l2gw-id', help='l2gw ID（3.0资源池必填）')
@@ -1878,6 +1960,8 @@ def diagnose():
     pass
 
 
+@list_operation(VPCClient.list_instance_diagnoses, 'region_id', 'resource_id', 'resource_type',
+                'diagnosis_record_id', page_size=50)
 @diagnose.command('instances')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--resource-id', help='资源ID')
@@ -1897,6 +1981,8 @@ def diagnose_instances(ctx, region_id: str, resource_id: Optional[str], resource
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.list_instance_diagnosis_records, 'region_id', 'resource_id', 'resource_type',
+                'diagnosis_record_id', page_size=50)
 @diagnose.command('records')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--resource-id', help='资源ID')
@@ -1916,6 +2002,7 @@ def diagnose_records(ctx, region_id: str, resource_id: Optional[str], resource_t
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.list_network_paths, 'region_id', 'network_path_id', page_size=50)
 @diagnose.command('paths')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--network-path-id', help='网络路径ID')
@@ -1932,6 +2019,8 @@ def diagnose_paths(ctx, region_id: str, network_path_id: Optional[str],
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.list_network_path_analyses, 'region_id', 'network_path_id', 'analysis_id',
+                page_size=50)
 @diagnose.command('analyses')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--network-path-id', help='网络路径ID')
@@ -1950,6 +2039,7 @@ def diagnose_analyses(ctx, region_id: str, network_path_id: Optional[str], analy
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.list_network_path_reports, 'region_id', 'analysis_id', page_size=50)
 @diagnose.command('reports')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--analysis-id', required=True, help='路径分析ID')
@@ -1973,6 +2063,7 @@ def dhcp():
     pass
 
 
+@list_operation(VPCClient.list_dhcp_bound_vpcs, 'region_id', 'dhcp_option_sets_id', page_size=50)
 @dhcp.command('bound-vpcs')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--dhcp-option-sets-id', required=True, help='DHCP 集合ID')
@@ -2019,6 +2110,7 @@ def ipv6():
     pass
 
 
+@list_operation(VPCClient.list_ipv6_gateways, 'region_id', 'project_id', page_size=50)
 @ipv6.command('gateways')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--project-id', help='企业项目ID')
@@ -2035,6 +2127,7 @@ def ipv6_gateways(ctx, region_id: str, project_id: Optional[str],
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.list_ipv6_addresses, 'region_id', 'vpc_id', 'subnet_id', 'ip_address', page_size=50)
 @ipv6.command('list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--vpc-id', help='VPC ID')
@@ -2053,6 +2146,8 @@ def ipv6_list(ctx, region_id: str, vpc_id: Optional[str], subnet_id: Optional[st
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.new_list_ipv6_addresses, 'region_id', 'vpc_id', 'subnet_id', 'ip_address',
+                page_size=50)
 @ipv6.command('new-list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--vpc-id', help='VPC ID')
@@ -2071,6 +2166,7 @@ def ipv6_new_list(ctx, region_id: str, vpc_id: Optional[str], subnet_id: Optiona
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.list_ipv6_bandwidths, 'region_id', 'query_content', 'bandwidth_id', page_size=50)
 @ipv6.command('bw-list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--query-content', help='模糊查询（名称/带宽ID）')
@@ -2089,6 +2185,8 @@ def ipv6_bw_list(ctx, region_id: str, query_content: Optional[str], bandwidth_id
     format_output(result, ctx.obj['output'])
 
 
+@list_operation(VPCClient.new_list_ipv6_bandwidths, 'region_id', 'query_content', 'bandwidth_id',
+                page_size=50)
 @ipv6.command('bw-new-list')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--query-content', help='模糊查询（名称/带宽ID）')
@@ -1,9 +1,9 @@
 """对象存储(ZOS)客户端"""
 
 import json
+import logging
 from typing import Dict, Any, Optional
 from core import CTYUNClient
-from auth.eop_signature import CTYUNEOPAuth
 from utils import logger
 
 
@@ -14,24 +14,21 @@ class ZOSClient:
         self.client = client
         self.service = 'zos'
         self.base_endpoint = 'zos-global.ctapi.ctyun.cn'
-        self.eop_auth = CTYUNEOPAuth(client.access_key, client.secret_key)
+        self.eop_auth = client.eop_auth
 
     def _get(self, path: str, query_params: Dict) -> Dict[str, Any]:
         """通用GET请求"""
         url = f'https://{self.base_endpoint}{path}'
-        headers = self.eop_auth.sign_request(
-            method='GET', url=url, query_params=query_params,
-            body=None, extra_headers={}
-        )
-        logger.debug(f"请求URL: {url}")
-        logger.debug(f"查询参数: {query_params}")
+        logger.debug("请求URL: %s", url)
+        logger.debug("查询参数: %s", query_params)
 
         try:
-            response = self.client.session.get(
-                url, params=query_params, headers=headers, timeout=30, verify=False
+            response = self.client.transport.request(
+                'GET', url, query_params=query_params, verify=False
             )
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 return {
@@ -47,19 +44,16 @@ class ZOSClient:
         """通用POST请求"""
         url = f'https://{self.base_endpoint}{path}'
         body = json.dumps(body_data)
-        headers = self.eop_auth.sign_request(
-            method='POST', url=url, query_params=None,
-            body=body, extra_headers={}
-        )
-        logger.debug(f"请求URL: {url}")
-        logger.debug(f"请求体: {body}")
+        logger.debug("请求URL: %s", url)
+        logger.debug("请求体: %s", body)
 
         try:
-            response = self.client.session.post(
-                url, data=body, headers=headers, timeout=30, verify=False
+            response = self.client.transport.request(
+                'POST', url, body=body, verify=False
             )
-            logger.debug(f"响应状态码: {response.status_code}")
-            logger.debug(f"响应内容: {response.text}")
+            logger.debug("响应状态码: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("响应内容: %s", response.text)
 
             if response.status_code != 200:
                 return {
@@ -403,7 +397,7 @@ class ZOSClient:
         )
 
         try:
-            response = self.client.session.post(url, data=body, headers=headers, timeout=30)
+            response = self.client.session.post(url, data=body, headers=headers, timeout=self.client.timeout)
 
             if response.status_code != 200:
                 return {'statusCode': response.status_code,
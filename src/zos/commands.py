@@ -4,6 +4,9 @@ import click
 import sys
 from typing import Optional
 from utils import OutputFormatter
+from utils.query import query_output
+from cli.paging import (LIST_OUTPUT_FORMATS, STREAM_FORMATS, all_pages_option, echo_items, iter_all,
+                        list_operation)
 
 
 @click.group()
@@ -12,6 +15,7 @@ def zos():
     pass
 
 
+@query_output
 def format_zos_output(result, output_format='table'):
     """格式化ZOS查询结果输出"""
     if output_format == 'json':
@@ -42,9 +46,21 @@ def format_zos_output(result, output_format='table'):
         click.echo(return_obj)
 
 
+def _format_object_list(objects, output_format='table'):
+    """输出 --all 收集到的对象列表"""
+    if output_format == 'yaml':
+        format_zos_output(objects, output_format)
+    elif objects:
+        headers = list(objects[0].keys()) if isinstance(objects[0], dict) else []
+        click.echo(OutputFormatter.format_table(objects, headers))
+    else:
+        click.echo("没有对象")
+
+
 # ==================== 桶查询命令 ====================
 
 
+@list_operation('zos.client:ZOSClient.list_buckets', 'region_id', 'project_id', page_size=50)
 @zos.command('list-buckets')
 @click.option('--region-id', required=True, help='区域ID。传public返回所有公共资源池的桶')
 @click.option('--project-id', help='企业项目ID，多个用逗号分隔')
@@ -237,6 +253,7 @@ def get_object_lock_conf(ctx, region_id, bucket, output):
 # ==================== 对象查询命令 ====================
 
 
+@list_operation('zos.client:ZOSClient.list_objects', 'region_id', 'bucket', 'delimiter', 'marker', 'prefix')
 @zos.command('list-objects')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--bucket', required=True, help='桶名')
@@ -244,16 +261,29 @@ def get_object_lock_conf(ctx, region_id, bucket, output):
 @click.option('--marker', help='从哪个对象开始列出')
 @click.option('--max-keys', type=int, help='一次返回keys的最大数目(默认和上限1000)')
 @click.option('--prefix', help='返回key的前缀')
-@click.option('--output', type=click.Choice(['table', 'json', 'yaml']), default=None, help='输出格式')
+@all_pages_option
+@click.option('--output', type=click.Choice(LIST_OUTPUT_FORMATS), default=None, help='输出格式')
 @click.pass_context
-def list_objects(ctx, region_id, bucket, delimiter, marker, max_keys, prefix, output):
+def list_objects(ctx, region_id, bucket, delimiter, marker, max_keys, prefix, all_pages, output):
     """查看对象列表"""
     from zos.client import ZOSClient
+    if all_pages:
+        objects = iter_all(
+            ZOSClient(client=ctx.obj['client']).list_objects, page_size=max_keys,
+            region_id=region_id, bucket=bucket, delimiter=delimiter, marker=marker, prefix=prefix,
+        )
+        echo_items(objects, output or ctx.obj.get('output') or 'table', _format_object_list)
+        return
     result = ZOSClient(client=ctx.obj['client']).list_objects(
         region_id, bucket, delimiter=delimiter, marker=marker,
         max_keys=max_keys, prefix=prefix,
     )
-    format_zos_output(result, output or ctx.obj.get('output', 'table'))
+    output_format = output or ctx.obj.get('output', 'table')
+    if output_format in STREAM_FORMATS:
+        from core.paginator import extract_items
+        echo_items(extract_items(result), output_format, format_zos_output)
+        return
+    format_zos_output(result, output_format)
 
 
 @zos.command('list-object-versions')
@@ -336,6 +366,7 @@ def get_object_retention(ctx, region_id, bucket, key, version_id, output):
     format_zos_output(result, output or ctx.obj.get('output', 'table'))
 
 
+@list_operation('zos.client:ZOSClient.list_all_parts', 'region_id', 'bucket', page_size=50)
 @zos.command('list-all-parts')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--bucket', required=True, help='桶名')
@@ -392,6 +423,8 @@ def list_parts(ctx, region_id, bucket, key, upload_id, max_parts, part_number_ma
     format_zos_output(result, output or ctx.obj.get('output', 'table'))
 
 
+@list_operation('zos.client:ZOSClient.list_migration_failed_detail', 'region_id', 'migration_id',
+                page_size=50)
 @zos.command('list-migration-failed-detail')
 @click.option('--region-id', required=True, help='资源池ID')
 @click.option('--migration-id', required=True, help='迁移任务ID')
@@ -433,6 +466,7 @@ def get_keys(ctx, region_id, output):
     format_zos_output(result, output or ctx.obj.get('output', 'table'))
 
 
+@list_operation('zos.client:ZOSClient.list_roles', 'region_id', 'keyword', page_size=50)
 @zos.command('list-roles')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--keyword', help='模糊查询角色名(不区分大小写)')
@@ -462,6 +496,7 @@ def get_role_detail(ctx, region_id, role_name, output):
     format_zos_output(result, output or ctx.obj.get('output', 'table'))
 
 
+@list_operation('zos.client:ZOSClient.list_policies', 'region_id', 'keyword', page_size=50)
 @zos.command('list-policies')
 @click.option('--region-id', required=True, help='区域ID')
 @click.option('--keyword', help='模糊查询策略名(不区分大小写)')
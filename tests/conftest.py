@@ -0,0 +1,73 @@
+"""
+测试公共夹具
+命令行测试在子进程中运行 ctyun-cli，请求通过 CTYUN_ENDPOINT_OVERRIDE 发往进程内的
+EOP模拟服务（scripts/eop_server.py），使用临时HOME中的测试凭证。
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / 'src'
+
+sys.path.insert(0, str(SRC))
+sys.path.insert(0, str(ROOT / 'scripts'))
+
+ACCESS_KEY = 'test-ak'
+SECRET_KEY = 'test-sk'
+
+# 模拟服务中的云主机数量（不是每页条数的整数倍，最后一页不满）
+INSTANCES = 237
+
+
+@pytest.fixture(scope='session')
+def standin():
+    """进程内运行的EOP模拟服务"""
+    from eop_server import StandIn, StandInServer
+
+    server = StandInServer(StandIn({ACCESS_KEY: SECRET_KEY}, instances=INSTANCES, regions=3)).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def write_config(home: Path, profiles: Dict[str, str]) -> None:
+    """写入配置文件：{配置文件名: SK}，AK 均为 ACCESS_KEY"""
+    config_dir = home / '.ctyun'
+    config_dir.mkdir(parents=True, exist_ok=True)
+    (config_dir / 'config').write_text(''.join(
+        f"[{name}]\n"
+        f"access_key = {ACCESS_KEY}\n"
+        f"secret_key = {secret_key}\n"
+        "region = cn-north-1\n"
+        "endpoint = https://api.ctyun.cn\n\n"
+        for name, secret_key in profiles.items()
+    ), encoding='utf-8')
+
+
+@pytest.fixture
+def cli(standin, tmp_path):
+    """
+    运行 ctyun-cli 的函数：cli(*args) 返回 CompletedProcess（stdout、stderr 分开）
+
+    cli.profiles 可在调用前改写为 {配置文件名: SK}
+    """
+    home = tmp_path / 'home'
+
+    def run(*args: str) -> subprocess.CompletedProcess:
+        write_config(home, run.profiles)
+        env = dict(os.environ, HOME=str(home), PYTHONPATH=str(SRC),
+                   CTYUN_ENDPOINT_OVERRIDE=standin.url, CTYUN_NO_DAEMON='1')
+        return subprocess.run(
+            [sys.executable, '-c', "from cli.main import cli; cli(prog_name='ctyun-cli')", *args],
+            capture_output=True, text=True, env=env, cwd=str(ROOT), timeout=120
+        )
+
+    run.profiles = {'default': SECRET_KEY}
+    return run
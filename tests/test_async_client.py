@@ -0,0 +1,83 @@
+"""异步客户端：并发信号量按事件循环、按实际端点主机分别创建"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core.async_client import AsyncCTYUNClient, service_host
+
+
+class FakeTransport:
+    pool_maxsize = 8
+
+    def request_json(self, method, url, **kwargs):
+        return {}
+
+
+class FakeClient:
+    eop_auth = None
+    timeout = 30
+    transport = FakeTransport()
+
+    def close(self):
+        pass
+
+
+def test_service_hosts_are_distinct():
+    from cfw.client import CFWClient
+    from ecs.client import ECSClient
+    from rdscmd.client import RedisClient
+
+    hosts = [service_host(cls(FakeClient())) for cls in (CFWClient, ECSClient, RedisClient)]
+    assert hosts == ['ctcfw-global.ctapi.ctyun.cn', 'ctecs-global.ctapi.ctyun.cn', 'dcs2-global.ctapi.ctyun.cn']
+
+
+def test_semaphore_per_event_loop():
+    aclient = AsyncCTYUNClient(FakeClient(), max_concurrency=1)
+
+    async def calls():
+        # 并发调用等待信号量，信号量绑定到当前事件循环
+        return await asyncio.gather(*(aclient.run('a.example', time.sleep, 0.01) for _ in range(3)))
+
+    # 每次 asyncio.run 都是新的事件循环，不能复用上一个循环中创建的信号量
+    assert asyncio.run(calls()) == [None] * 3
+    assert asyncio.run(calls()) == [None] * 3
+    aclient.close()
+
+
+def test_semaphore_limits_each_host():
+    aclient = AsyncCTYUNClient(FakeClient(), max_concurrency=2)
+    active, peak, lock = {}, {}, threading.Lock()
+
+    def work(host):
+        with lock:
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+        time.sleep(0.05)
+        with lock:
+            active[host] -= 1
+
+    async def main():
+        await asyncio.gather(*(aclient.run(host, work, host) for host in ('a', 'b') for _ in range(4)))
+
+    asyncio.run(main())
+    aclient.close()
+    assert peak == {'a': 2, 'b': 2}
+
+
+@pytest.mark.parametrize('url, host', [
+    ('https://ctecs-global.ctapi.ctyun.cn/v4/ecs/list-instances', 'ctecs-global.ctapi.ctyun.cn'),
+    ('http://127.0.0.1:8080/v4/ecs/list-instances', '127.0.0.1'),
+])
+def test_request_uses_url_host(url, host):
+    aclient = AsyncCTYUNClient(FakeClient(), max_concurrency=1)
+    hosts = []
+
+    async def run(h, func, *args, **kwargs):
+        hosts.append(h)
+
+    aclient.run = run
+    asyncio.run(aclient.request('GET', url))
+    assert hosts == [host]
@@ -0,0 +1,127 @@
+"""守护进程：转发来的命令逐个执行，同时发出的调用排队等待；环境不一致时在本地执行"""
+
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from cli import daemon as daemon_module
+from cli.daemon import CODE_VERSION, PROCESS_ENV, CLIDaemon
+
+
+def test_concurrent_commands_queue(monkeypatch, tmp_path):
+    from cli.main import cli
+
+    release = threading.Event()
+    running = []
+
+    def main(args=None, **kwargs):
+        running.append(args)
+        print(f"running {args}")
+        # 第一条命令阻塞，直到测试放行
+        if len(running) == 1:
+            release.wait(timeout=10)
+
+    monkeypatch.setattr(cli, 'main', main)
+    daemon = CLIDaemon(socket_path=str(tmp_path / 'daemon.sock'))
+    pairs = [socket.socketpair() for _ in range(2)]
+    threads = [
+        threading.Thread(target=daemon.run_command,
+                         args=(server, {'argv': [name], 'cwd': str(tmp_path)}))
+        for (server, _), name in zip(pairs, ('first', 'second'))
+    ]
+    try:
+        threads[0].start()
+        while not running:
+            time.sleep(0.01)
+        threads[1].start()
+        deadline = time.time() + 10
+        while daemon.status()['waiting'] != 1 and time.time() < deadline:
+            time.sleep(0.01)
+
+        # 第二条命令在第一条结束前不会执行
+        assert daemon.status()['waiting'] == 1
+        assert running == [['first']]
+
+        release.set()
+        for thread in threads:
+            thread.join(timeout=10)
+        assert running == [['first'], ['second']]
+        status = daemon.status()
+        assert status['waiting'] == 0
+        assert status['requests'] == 2
+        assert b'running [\'second\']' in pairs[1][1].recv(4096)
+    finally:
+        release.set()
+        for server, client in pairs:
+            server.close()
+            client.close()
+
+
+def _request(argv, **extra):
+    return dict({
+        'type': 'run', 'version': CODE_VERSION, 'argv': argv,
+        'process_env': {key: os.environ.get(key) for key in PROCESS_ENV},
+    }, **extra)
+
+
+@pytest.mark.parametrize('change, reason', [
+    ({'version': '1:0:0'}, '版本'),
+    ({'process_env': {'HOME': '/nonexistent'}}, 'HOME'),
+])
+def test_refuses_mismatched_caller(tmp_path, change, reason):
+    daemon = CLIDaemon(socket_path=str(tmp_path / 'daemon.sock'))
+    assert daemon.refusal(_request(['ecs', 'list', '--region-id', 'r1'])) is None
+    assert reason in daemon.refusal(dict(_request(['ecs', 'list', '--region-id', 'r1']), **change))
+
+
+def test_refuses_commands_that_prompt(tmp_path):
+    daemon = CLIDaemon(socket_path=str(tmp_path / 'daemon.sock'))
+    delete = ['--output', 'json', 'cce', 'delete-cluster', '--region-id', 'r1', '--cluster-id', 'c1']
+    assert daemon.refusal(_request(delete)) == '命令需要交互输入'
+    assert daemon.refusal(_request(delete + ['--yes'])) is None
+
+
+def test_forwards_env_and_cwd(monkeypatch, tmp_path):
+    from cli.main import cli
+
+    seen = []
+
+    def main(args=None, **kwargs):
+        seen.append((os.getcwd(), os.environ.get('CTYUN_ENDPOINT_OVERRIDE'), os.environ.get('CTYUN_OTHER')))
+
+    monkeypatch.setattr(cli, 'main', main)
+    monkeypatch.setenv('CTYUN_OTHER', 'daemon')
+    daemon = CLIDaemon(socket_path=str(tmp_path / 'daemon.sock'))
+    cleared = []
+    monkeypatch.setattr(daemon.registry, 'clear', lambda: cleared.append(True))
+    server, client = socket.socketpair()
+    try:
+        env = {'CTYUN_ENDPOINT_OVERRIDE': 'http://127.0.0.1:1'}
+        daemon.run_command(server, _request(['ecs', 'list'], cwd=str(tmp_path), env=env))
+        daemon.run_command(server, _request(['ecs', 'list'], cwd=str(tmp_path), env=env))
+        daemon.run_command(server, _request(['ecs', 'list'], cwd=str(tmp_path), env={}))
+    finally:
+        server.close()
+        client.close()
+
+    assert seen == [(str(tmp_path), 'http://127.0.0.1:1', None)] * 2 + [(str(tmp_path), None, None)]
+    # 命令结束后恢复守护进程自己的环境；环境变化时重建客户端
+    assert os.environ['CTYUN_OTHER'] == 'daemon'
+    assert 'CTYUN_ENDPOINT_OVERRIDE' not in os.environ or os.environ['CTYUN_ENDPOINT_OVERRIDE'] != 'http://127.0.0.1:1'
+    assert cleared == [True]
+
+
+def test_piped_stdin_runs_locally(monkeypatch, tmp_path):
+    read_end, write_end = os.pipe()
+    monkeypatch.delenv('CTYUN_NO_DAEMON', raising=False)
+    (tmp_path / 'daemon.sock').touch()
+    try:
+        with open(read_end, 'r') as stdin:
+            monkeypatch.setattr('sys.stdin', stdin)
+            assert daemon_module._stdin_has_input()
+            assert daemon_module.try_forward(['ecs', 'list'], socket_path=str(tmp_path / 'daemon.sock')) is None
+    finally:
+        os.close(write_end)
@@ -0,0 +1,126 @@
+"""多端点选择：只有端点不可用时才忘记记住的端点"""
+
+import pytest
+
+from core.endpoints import EndpointResolver
+from utils import cache as cache_module
+from utils.cache import SQLiteCache
+
+ENDPOINTS = ['a.example', 'b.example', 'c.example', 'd.example']
+PATH = '/v4/test/list'
+
+
+@pytest.fixture(autouse=True)
+def isolated_memo(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, '_global_cache', SQLiteCache(cache_dir=str(tmp_path / 'cache')))
+    monkeypatch.setattr(EndpointResolver, '_memo', {})
+
+
+class Attempts:
+    """按端点返回预设的结果，记录访问过的端点"""
+
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+        self.calls = []
+
+    def __call__(self, endpoint):
+        self.calls.append(endpoint)
+        return self.outcomes.get(endpoint, (False, None))
+
+
+@pytest.mark.parametrize('hedge', [False, True])
+def test_api_error_keeps_remembered_endpoint(hedge):
+    resolver = EndpointResolver('test', hedge=hedge)
+    resolver.remember(PATH, 'c.example')
+
+    attempts = Attempts({'c.example': (None, {'message': '参数错误'})})
+    assert resolver.call('GET', PATH, ENDPOINTS, attempts) == (False, {'message': '参数错误'})
+    assert attempts.calls == ['c.example']
+    assert resolver.remembered(PATH) == 'c.example'
+
+
+@pytest.mark.parametrize('hedge', [False, True])
+def test_unavailable_endpoint_is_forgotten(hedge):
+    resolver = EndpointResolver('test', hedge=hedge)
+    resolver.remember(PATH, 'c.example')
+
+    attempts = Attempts({'c.example': (False, None), 'b.example': (True, 'ok')})
+    assert resolver.call('GET', PATH, ENDPOINTS, attempts) == (True, 'ok')
+    assert attempts.calls[0] == 'c.example'
+    assert resolver.remembered(PATH) == 'b.example'
+
+
+def test_api_error_identifies_endpoint():
+    resolver = EndpointResolver('test', hedge=False)
+    attempts = Attempts({'b.example': (None, {'message': '参数错误'}), 'c.example': (True, 'ok')})
+    assert resolver.call('POST', PATH, ENDPOINTS, attempts) == (False, {'message': '参数错误'})
+    assert attempts.calls == ['a.example', 'b.example']
+    assert resolver.remembered(PATH) == 'b.example'
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self.payload = payload
+        self.text = str(payload)
+
+    def json(self):
+        return self.payload
+
+
+class FakeTransport:
+    def __init__(self, responses):
+        self.responses = responses
+        self.hosts = []
+
+    def request(self, method, url, **kwargs):
+        host = url.split('/')[2]
+        self.hosts.append(host)
+        response = self.responses.get(host)
+        if response is None:
+            raise ConnectionError(f"无法解析 {host}")
+        return response
+
+
+class FakeClient:
+    eop_auth = None
+
+    def __init__(self, transport):
+        self.transport = transport
+
+
+@pytest.mark.parametrize('response, hosts', [
+    # 业务错误与4xx：端点正确，不换端点
+    (FakeResponse(200, {'statusCode': 900, 'errorCode': 'Cda.Parameter', 'message': '参数错误'}), 1),
+    (FakeResponse(400, {'message': 'bad request'}), 1),
+    # 5xx：换下一个端点
+    (FakeResponse(503, {'message': 'unavailable'}), 4),
+])
+def test_cda_business_error_on_remembered_endpoint(response, hosts):
+    from cda.client import CDAClient
+
+    transport = FakeTransport({'cda.ctapi.ctyun.cn': response})
+    cda = CDAClient(FakeClient(transport))
+    cda.resolver.hedge = False
+    cda.resolver.remember(PATH, 'cda.ctapi.ctyun.cn')
+
+    result = cda.make_eop_request('POST', PATH, body_data={'regionID': 'r1'})
+    assert result['success'] is False
+    assert len(transport.hosts) == hosts
+    assert (cda.resolver.remembered(PATH) == 'cda.ctapi.ctyun.cn') == (hosts == 1)
+    if hosts == 1:
+        assert result['endpoint'] == 'cda.ctapi.ctyun.cn'
+    else:
+        assert result['error'] == 'ALL_ENDPOINTS_FAILED'
+
+
+def test_remembered_endpoint_is_per_account():
+    prod = EndpointResolver('test', hedge=False, namespace='prod/aaaaaaaaaaaa/cn-north-1')
+    staging = EndpointResolver('test', hedge=False, namespace='staging/bbbbbbbbbbbb/cn-north-1')
+    prod.remember(PATH, 'c.example')
+    assert staging.remembered(PATH) is None
+
+    # 持久化缓存同样按命名空间隔离
+    EndpointResolver._memo.clear()
+    assert EndpointResolver('test', namespace=prod.namespace).remembered(PATH) == 'c.example'
+    assert staging.remembered(PATH) is None
@@ -0,0 +1,112 @@
+"""命令扇出（--region-id all、--profiles）：合并输出是合法的JSON，只用于列表查询命令"""
+
+import json
+
+import click
+import pytest
+
+from cli.fanout import FanoutTarget, merge_records
+from conftest import INSTANCES
+
+REGIONS = ['standin-region-01', 'standin-region-02', 'standin-region-03']
+
+
+def test_region_fanout_merged_json(cli):
+    result = cli('ecs', 'list', '--region-id', 'all', '--page-size', '50', '--output', 'json')
+    assert result.returncode == 0, result.stderr
+    records = json.loads(result.stdout)
+    assert len(records) == 50 * len(REGIONS)
+    assert [record['regionID'] for record in records[::50]] == REGIONS
+    # 目标标识在每条记录的最后
+    assert all(list(record)[-1] == 'regionID' for record in records)
+    for region in REGIONS:
+        assert f"regionId={region}" in result.stderr
+
+
+def test_region_fanout_ndjson_all_pages(cli):
+    result = cli('ecs', 'list', '--region-id', 'all', '--all', '--output', 'ndjson')
+    assert result.returncode == 0, result.stderr
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert len(records) == INSTANCES * len(REGIONS)
+    assert {record['regionID'] for record in records} == set(REGIONS)
+
+
+def test_region_fanout_merged_table(cli):
+    result = cli('ecs', 'list', '--region-id', 'all')
+    assert result.returncode == 0, result.stderr
+    lines = result.stdout.splitlines()
+    assert 'instanceID' in lines[0].split() and lines[0].split()[-1] == 'regionID'
+    assert [line.split()[-1] for line in lines[2:]] == [region for region in REGIONS for _ in range(10)]
+    assert ' - INFO - ' not in result.stdout
+
+
+def test_profile_fanout_merged_json(cli):
+    cli.profiles = {'default': 'test-sk', 'prod': 'test-sk'}
+    result = cli('--all-profiles', '--output', 'json', 'ecs', 'list', '--region-id', 'r1')
+    assert result.returncode == 0, result.stderr
+    records = json.loads(result.stdout)
+    assert [record['profile'] for record in records] == ['default'] * 10 + ['prod'] * 10
+
+
+def test_profile_and_region_fanout(cli):
+    cli.profiles = {'default': 'test-sk', 'prod': 'test-sk', 'bad': 'wrong-sk'}
+    result = cli('--all-profiles', '--query', '[*].{profile: profile, region: regionID, id: instanceID}',
+                 'ecs', 'list', '--region-id', 'all', '--output', 'ndjson')
+    assert result.returncode == 1
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert len(records) == 2 * 10 * len(REGIONS)
+    assert {(record['profile'], record['region']) for record in records} == {
+        (profile, region) for profile in ('default', 'prod') for region in REGIONS}
+    assert '[bad] 错误: ' in result.stderr
+    assert '执行失败: bad' in result.stderr
+
+
+@pytest.mark.parametrize('args', [
+    ('ecs', 'statistics', '--region-id', 'all'),
+    ('ecs', 'detail', 'i-1', '--region-id=all'),
+    ('--all-profiles', 'ecs', 'statistics', '--region-id', 'r1'),
+])
+def test_fanout_rejected_for_other_commands(cli, args):
+    result = cli(*args)
+    assert result.returncode == 2
+    assert '只能用于列表查询命令' in result.stderr
+
+
+def test_all_as_other_option_value_is_not_fanout(cli):
+    result = cli('ecs', 'list', '--region-id', 'r1', '--instance-name', 'all', '--output', 'json')
+    assert result.returncode == 0, result.stderr
+    assert len(json.loads(result.stdout)) == 10
+
+
+def test_merge_records_keeps_target_order_and_labels():
+    targets = [FanoutTarget({'regionID': name}, None, {}) for name in ('a', 'b', 'c')]
+
+    def fetch(target):
+        if target.labels['regionID'] == 'b':
+            yield {'id': 'b1'}
+            raise click.ClickException('查询失败')
+        for i in range(3):
+            # 记录中的同名字段被目标标识覆盖
+            yield {'regionID': 'wrong', 'id': f"{target.labels['regionID']}{i}"}
+
+    failed = []
+    records = list(merge_records(targets, fetch, failed, workers=2))
+    assert [record['id'] for record in records] == ['a0', 'a1', 'a2', 'b1', 'c0', 'c1', 'c2']
+    assert [record['regionID'] for record in records] == ['a'] * 3 + ['b'] + ['c'] * 3
+    assert failed == ['b']
+
+
+def test_merge_records_stops_workers_when_closed(monkeypatch):
+    monkeypatch.setattr('cli.fanout.BUFFER_SIZE', 2)
+    produced = []
+
+    def fetch(target):
+        for i in range(1000):
+            produced.append(i)
+            yield {'id': i}
+
+    merged = merge_records([FanoutTarget({'regionID': 'a'}, None, {})], fetch, [], workers=1)
+    assert next(merged)['id'] == 0
+    merged.close()
+    # 工作线程在有界队列满后停止取数，关闭后退出
+    assert len(produced) < 10
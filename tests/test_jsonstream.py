@@ -0,0 +1,135 @@
+"""流式JSON解析：任意切分的响应体逐条产出结果列表元素，其余字段作为 envelope"""
+
+import json
+
+import pytest
+
+from core.jsonstream import JSONArrayStream, JSONStreamError
+
+DOCUMENTS = [
+    # returnObj 中的结果列表；列表之前、之后都有其他字段
+    {'statusCode': 800, 'returnObj': {'totalCount': 3, 'results': [
+        {'id': 'i-1', 'name': '云主机 "一"', 'tags': ['a', '[b]'], 'cpu': 2.5},
+        {'id': 'i-2', 'name': 'x\\y}', 'tags': [], 'cpu': -12},
+        {'id': 'i-3', 'name': '中文\U0001f600', 'tags': None, 'cpu': 1e3},
+    ], 'pageNo': 1}, 'message': 'success'},
+    # returnObj 本身是列表，元素为标量
+    {'statusCode': 800, 'returnObj': [1, 'two', None, True, 3.25, [4], {'five': 5}]},
+    # Kubernetes 列表
+    {'statusCode': 800, 'returnObj': {'apiVersion': 'v1', 'kind': 'PodList', 'metadata': {'resourceVersion': '1'},
+                                      'items': [{'metadata': {'name': f'pod-{i}'}} for i in range(5)]}},
+    # 路径之外的列表不是结果列表
+    {'errors': [{'code': 1}], 'data': {'list': [{'id': 1}, {'id': 2}]}},
+    # 空列表
+    {'statusCode': 800, 'returnObj': {'results': []}},
+]
+
+
+def _envelope(document):
+    """去掉结果列表元素后的响应"""
+    document = json.loads(json.dumps(document))
+    container = document.get('returnObj', document.get('data'))
+    if isinstance(container, list):
+        document['returnObj'] = []
+        return document
+    for key in ('results', 'items', 'list'):
+        if key in container:
+            container[key] = []
+    return document
+
+
+def _items(document):
+    container = document.get('returnObj', document.get('data'))
+    if isinstance(container, list):
+        return container
+    return next(container[key] for key in ('results', 'items', 'list') if key in container)
+
+
+def _chunks(text, size):
+    data = text.encode('utf-8')
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize('document', DOCUMENTS)
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 64, 1 << 20])
+@pytest.mark.parametrize('indent', [None, 2])
+def test_items_and_envelope_match_full_parse(document, size, indent):
+    stream = JSONArrayStream(_chunks(json.dumps(document, ensure_ascii=False, indent=indent), size))
+    assert list(stream) == _items(document)
+    assert stream.count == len(_items(document))
+    assert stream.envelope == _envelope(document)
+
+
+def test_string_chunks_and_custom_paths():
+    text = json.dumps({'returnObj': {'results': [1], 'billList': [{'fee': 1}, {'fee': 2}]}})
+    stream = JSONArrayStream([text[i:i + 5] for i in range(0, len(text), 5)], paths=[('returnObj', 'billList')])
+    assert list(stream) == [{'fee': 1}, {'fee': 2}]
+    assert stream.path == ('returnObj', 'billList')
+    assert stream.envelope == {'returnObj': {'results': [1], 'billList': []}}
+
+
+def test_no_result_list():
+    stream = JSONArrayStream([b'{"statusCode": 900, "message": "\xe5\x8f\x82\xe6\x95\xb0\xe9\x94\x99\xe8\xaf\xaf"}'])
+    assert list(stream) == []
+    assert stream.path is None
+    assert stream.envelope == {'statusCode': 900, 'message': '参数错误'}
+
+
+def test_envelope_before_end():
+    stream = JSONArrayStream([b'{"returnObj": [1, 2]}'])
+    with pytest.raises(RuntimeError):
+        stream.envelope
+    items = iter(stream)
+    assert next(items) == 1
+    with pytest.raises(RuntimeError):
+        stream.envelope
+
+
+def test_items_yielded_before_body_ends():
+    received = []
+
+    def chunks():
+        yield b'{"returnObj": {"results": [{"id": 1}, '
+        # 第一条记录在后续数据到达之前产出
+        received.append(list(seen))
+        yield b'{"id": 2}]}}'
+
+    seen = []
+    for item in JSONArrayStream(chunks()):
+        seen.append(item['id'])
+    assert received == [[1]]
+    assert seen == [1, 2]
+
+
+def test_memory_bounded_by_record_size():
+    record = json.dumps({'id': 'x' * 100, 'values': list(range(50))})
+    count = 5000
+
+    def chunks():
+        yield b'{"statusCode": 800, "returnObj": {"results": ['
+        for i in range(count):
+            yield (record + (',' if i < count - 1 else '')).encode()
+        yield b']}}'
+
+    stream = JSONArrayStream(chunks())
+    largest = 0
+    for _ in stream:
+        largest = max(largest, len(stream._buf) - stream._pos)
+    assert stream.count == count
+    # 缓冲区只保留未解析的部分，不随响应大小增长
+    assert largest <= 2 * len(record) + 2
+
+
+@pytest.mark.parametrize('chunks', [
+    # 结果列表未结束
+    [b'{"returnObj": {"results": [{"id": 1}, {"id"'],
+    # 元素之间缺少逗号
+    [b'{"returnObj": [1 2]}'],
+    # 元素不是合法的JSON
+    [b'{"returnObj": [{"id": nope}]}'],
+    # 列表之外的部分不是合法的JSON
+    [b'{"returnObj": [1], "message": }'],
+])
+def test_invalid_body(chunks):
+    with pytest.raises(JSONStreamError):
+        list(JSONArrayStream(chunks))
@@ -0,0 +1,193 @@
+"""通用分页器：总数已知时并发预取其余页并按页码顺序产出，以及各种结束翻页的条件"""
+
+import threading
+import time
+
+import pytest
+
+from core.paginator import PageStyle, PaginationError, Paginator
+
+NUMBERED = PageStyle('page_no', 'page_size', default_size=10)
+MARKER = PageStyle(marker_param='marker', size_param='max_keys', default_size=10)
+
+
+class FakeList:
+    """
+    按页码返回 total 条记录的列表接口
+
+    Args:
+        total: 记录总数
+        max_size: 接口允许的最大每页条数（超过时按此返回）
+        report: 第一页返回的总数字段：'totalCount'、'totalPage' 或 None（不返回总数）
+        delay: 每次调用的耗时（秒）
+    """
+
+    def __init__(self, total, max_size=100, report='totalCount', delay=0.0):
+        self.total = total
+        self.max_size = max_size
+        self.report = report
+        self.delay = delay
+        self.pages = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, page_no=1, page_size=10, **kwargs):
+        with self._lock:
+            self.pages.append(page_no)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            size = min(page_size, self.max_size)
+            start = (page_no - 1) * size
+            results = [{'id': i} for i in range(start, min(start + size, self.total))]
+            return_obj = {'results': results}
+            if self.report == 'totalCount':
+                return_obj['totalCount'] = self.total
+            elif self.report == 'totalPage':
+                return_obj['totalPage'] = -(-self.total // size)
+            return {'statusCode': 800, 'returnObj': return_obj}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _ids(paginator):
+    return [item['id'] for item in paginator]
+
+
+@pytest.mark.parametrize('report', ['totalCount', 'totalPage'])
+def test_prefetch_in_order(report):
+    method = FakeList(95, report=report, delay=0.02)
+    paginator = Paginator(method, style=NUMBERED, workers=4)
+    assert _ids(paginator) == list(range(95))
+    assert sorted(method.pages) == list(range(1, 11))
+    # 第一页之后的页并发获取，并发数不超过 workers
+    assert 1 < method.peak <= 4
+
+
+def test_prefetch_uses_returned_page_size():
+    # 接口把每页条数限制为 20：按实际返回的条数计算页数
+    method = FakeList(95, max_size=20)
+    assert _ids(Paginator(method, style=NUMBERED, page_size=50, workers=4)) == list(range(95))
+    assert sorted(method.pages) == [1, 2, 3, 4, 5]
+
+
+def test_prefetch_respects_max_items():
+    method = FakeList(1000)
+    assert _ids(Paginator(method, style=NUMBERED, max_items=25, workers=4)) == list(range(25))
+    assert sorted(method.pages) == [1, 2, 3]
+
+
+def test_prefetch_window_bounds_pages_ahead():
+    method = FakeList(1000, delay=0.01)
+    pages = Paginator(method, style=NUMBERED, workers=2).pages()
+    next(pages)
+    next(pages)
+    time.sleep(0.1)
+    # 消费者只取了两页：预取最多领先 2*workers 页
+    assert len(method.pages) <= 2 + 2 * 2
+    pages.close()
+
+
+def test_prefetch_stops_when_data_shrinks():
+    method = FakeList(95)
+    paginator = Paginator(method, style=NUMBERED, workers=4)
+    pages = paginator.pages()
+    next(pages)
+    # 翻页过程中数据减少到 30 条：遇到空页后不再产出
+    method.total = 30
+    assert [len(page['returnObj']['results']) for page in pages][:3] == [10, 10, 0]
+
+
+@pytest.mark.parametrize('report, total, pages', [
+    # 总数已知：取到总数即结束，不再请求空页
+    ('totalCount', 30, [1, 2, 3]),
+    ('totalPage', 30, [1, 2, 3]),
+    # 总数未知：取到不满的一页结束
+    (None, 25, [1, 2, 3]),
+    # 总数未知且最后一页是满的：多请求一页空页后结束
+    (None, 30, [1, 2, 3, 4]),
+])
+def test_serial_stop_conditions(report, total, pages):
+    method = FakeList(total, report=report)
+    assert _ids(Paginator(method, style=NUMBERED, workers=1)) == list(range(total))
+    assert method.pages == pages
+
+
+def test_unknown_total_is_fetched_serially():
+    method = FakeList(45, report=None, delay=0.01)
+    assert _ids(Paginator(method, style=NUMBERED, workers=4)) == list(range(45))
+    assert method.peak == 1
+
+
+def test_empty_first_page():
+    method = FakeList(0)
+    assert _ids(Paginator(method, style=NUMBERED, workers=4)) == []
+    assert method.pages == [1]
+
+
+@pytest.mark.parametrize('page, message', [
+    ({'statusCode': 900, 'errorCode': 'Ecs.Parameter', 'message': '参数错误'}, '参数错误'),
+    ({'statusCode': 800, 'returnObj': {'results': []}, '_mock': True}, '模拟数据'),
+])
+def test_error_page_raises(page, message):
+    with pytest.raises(PaginationError, match=message):
+        list(Paginator(lambda page_no, page_size: page, style=NUMBERED))
+
+
+def test_error_in_prefetched_page_raises():
+    method = FakeList(95)
+
+    def failing(page_no=1, page_size=10):
+        if page_no == 3:
+            return {'statusCode': 900, 'message': '第3页失败'}
+        return method(page_no, page_size)
+
+    paginator = Paginator(failing, style=NUMBERED, workers=4)
+    items = iter(paginator)
+    assert [next(items)['id'] for _ in range(20)] == list(range(20))
+    with pytest.raises(PaginationError, match='第3页失败'):
+        next(items)
+
+
+class FakeObjects:
+    """marker分页的对象列表接口"""
+
+    def __init__(self, keys, next_marker=True):
+        self.keys = keys
+        self.next_marker = next_marker
+        self.markers = []
+
+    def __call__(self, marker=None, max_keys=10):
+        self.markers.append(marker)
+        start = self.keys.index(marker) + 1 if marker else 0
+        contents = [{'key': key} for key in self.keys[start:start + max_keys]]
+        truncated = start + max_keys < len(self.keys)
+        return_obj = {'contents': contents, 'isTruncated': truncated}
+        if truncated and self.next_marker:
+            return_obj['nextMarker'] = contents[-1]['key']
+        return {'statusCode': 800, 'returnObj': return_obj}
+
+
+@pytest.mark.parametrize('next_marker', [True, False])
+def test_marker_pages(next_marker):
+    keys = [f"obj-{i:03d}" for i in range(25)]
+    method = FakeObjects(keys, next_marker=next_marker)
+    # 未返回 nextMarker 时以本页最后一个对象的key继续
+    assert [item['key'] for item in Paginator(method, style=MARKER)] == keys
+    assert method.markers == [None, 'obj-009', 'obj-019']
+
+
+def test_marker_repeated_stops():
+    calls = []
+
+    def stuck(marker=None, max_keys=10):
+        calls.append(marker)
+        return {'statusCode': 800, 'returnObj': {'contents': [{'key': 'a'}], 'isTruncated': True,
+                                                 'nextMarker': 'a'}}
+
+    # 接口反复返回同一个标记时不会无限翻页
+    assert len(list(Paginator(stuck, style=MARKER))) == 2
+    assert calls == [None, 'a']
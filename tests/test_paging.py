@@ -0,0 +1,201 @@
+"""自动翻页（--all）：列表命令按声明直接调用服务客户端的分页方法"""
+
+import csv
+import inspect
+import io
+import json
+
+import click
+import pytest
+
+# 模拟服务中的VPC数量（默认 50，每个VPC 4 个子网）
+VPCS = 50
+
+
+def _leaf_commands(group, ctx, path=()):
+    for name in group.list_commands(ctx):
+        command = group.get_command(ctx, name)
+        if isinstance(command, click.Group):
+            yield from _leaf_commands(command, ctx, path + (name,))
+        elif command is not None:
+            yield ' '.join(path + (name,)), command
+
+
+def test_list_operations_bind_to_client_methods():
+    """声明的参数与服务客户端方法的签名、命令的选项一致"""
+    from cli.main import cli
+
+    ctx = click.Context(cli)
+    declared = 0
+    for name, command in _leaf_commands(cli, ctx):
+        operation = getattr(command, 'list_operation', None)
+        if operation is None:
+            continue
+        declared += 1
+        assert [param.name for param in command.params].count('all_pages') == 1, name
+
+        parameters = inspect.signature(operation.function).parameters
+        style = operation.style
+        for param in (style.page_param, style.size_param, style.marker_param):
+            assert param is None or param in parameters, name
+        assert operation.page_option is not None or style.is_marker, name
+
+        options = {param.name: param.default for param in command.params}
+        for param, source in operation.arguments.items():
+            assert param in parameters, f"{name}: {param}"
+            if not callable(source):
+                assert source in options, f"{name}: {source}"
+                continue
+            try:
+                source(options)
+            except KeyError:
+                pytest.fail(f"{name}: {param} 引用了不存在的选项")
+            except (TypeError, ValueError, AttributeError):
+                # 必填选项的默认值为None
+                pass
+    assert declared > 200
+
+
+@pytest.mark.parametrize('output', ['ndjson', 'csv', 'json', 'table'])
+def test_generic_all_fetches_every_page(cli, output):
+    result = cli('vpc', 'list', '--region-id', 'r1', '--page-size', '7', '--all', '--output', output)
+    assert result.returncode == 0, result.stderr
+    if output == 'ndjson':
+        ids = [json.loads(line)['vpcID'] for line in result.stdout.splitlines()]
+    elif output == 'csv':
+        ids = [row['vpcID'] for row in csv.DictReader(io.StringIO(result.stdout))]
+    elif output == 'json':
+        ids = [record['vpcID'] for record in json.loads(result.stdout)]
+    else:
+        ids = [line.split()[0] for line in result.stdout.splitlines()[2:]]
+    assert ids == [f"vpc-{i:08x}" for i in range(VPCS)]
+
+
+def test_generic_all_uses_root_output_and_query(cli):
+    result = cli('--output', 'json', '--query', '[*].vpcID', 'vpc', 'subnet', 'list',
+                 '--region-id', 'r1', '--all')
+    assert result.returncode == 0, result.stderr
+    assert len(json.loads(result.stdout)) == VPCS * 4
+
+
+def test_generic_all_reports_api_errors(cli):
+    result = cli('cce', 'list-clusters', '--region-id', 'r1', '--all')
+    assert result.returncode == 1
+    assert 'Traceback' not in result.stderr
+    assert 'Error: 翻页查询失败' in result.stderr
+
+
+def test_iam_list_users_all_streams_table(monkeypatch):
+    """表格输出边翻页边写出：请求最后一页时，前面各页的用户已经输出"""
+    import sys
+
+    from click.testing import CliRunner
+
+    from cli.main import cli
+    from config.settings import config
+    from iam.client import IAMClient
+
+    pages, page_size = 40, 50
+    written_before = {}
+
+    def list_users(self, page_num=1, page_size=10):
+        sys.stdout.flush()
+        written_before[page_num] = sys.stdout.buffer.getvalue().count(b'\nuser-')
+        users = [{'userId': f"user-{(page_num - 1) * page_size + i:05d}", 'userName': 'u'}
+                 for i in range(page_size)] if page_num <= pages else []
+        return {'statusCode': '800',
+                'returnObj': {'result': users, 'total': pages * page_size, 'pages': pages}}
+
+    monkeypatch.setattr(IAMClient, 'list_users', list_users)
+    monkeypatch.setattr(config, 'get_max_concurrency', lambda: 2)
+    result = CliRunner().invoke(cli, ['--access-key', 'test-ak', '--secret-key', 'test-sk',
+                                      'iam', 'list-users',
+                                      '--page-size', str(page_size), '--all'])
+    assert result.exit_code == 0, result.output
+    assert result.output.count('\nuser-') == pages * page_size
+    # 最多领先输出几页（预取窗口与列宽取样），不会先收集全部结果
+    assert written_before[pages] >= (pages - 10) * page_size
+
+
+@pytest.mark.parametrize('error, output, message', [
+    ('api', 'ndjson', '翻页查询失败 [Ecs.Throttled] 请求过于频繁 (HTTP 503)'),
+    ('network', 'ndjson', '翻页查询失败（网络错误）: connection reset'),
+    ('format', 'table', '运行出错: '),
+])
+def test_ecs_list_all_reports_errors_mid_way(monkeypatch, error, output, message):
+    """翻页中途出错：输出错误信息并以非零状态退出，不输出异常堆栈"""
+    import requests
+    from click.testing import CliRunner
+
+    from cli.main import cli
+    from core import CTYUNAPIError
+    from ecs.client import ECSClient
+
+    def list_instances(self, region_id, page_no=1, page_size=10, **kwargs):
+        if page_no == 2:
+            if error == 'api':
+                raise CTYUNAPIError('请求过于频繁', code='Ecs.Throttled', status_code=503)
+            if error == 'network':
+                raise requests.ConnectionError('connection reset')
+        instances = [{'instanceID': f"ins-{page_no}-{i}", 'instanceName': 'x'} for i in range(page_size)]
+        if error == 'format' and page_no == 2:
+            instances = [None]
+        return {'statusCode': 800, 'returnObj': {'results': instances, 'totalCount': 3 * page_size}}
+
+    monkeypatch.setattr(ECSClient, 'list_instances', list_instances)
+    result = CliRunner().invoke(cli, ['--access-key', 'test-ak', '--secret-key', 'test-sk', 'ecs', 'list',
+                                      '--region-id', 'r1', '--page-size', '5', '--all', '--output', output])
+    assert result.exit_code == 1
+    assert isinstance(result.exception, SystemExit)
+    assert 'Traceback' not in result.output
+    assert message in result.output
+    if output == 'ndjson':
+        # 出错前已取得的结果照常输出
+        assert result.output.count('"instanceID"') == 5
+
+
+def test_query_applies_to_custom_table(cli):
+    """直接用 tabulate 渲染表格的命令：--query 的结果以通用表格输出"""
+    result = cli('--query', "[?instanceStatus=='running'].{id: instanceID, status: instanceStatus}",
+                 'ecs', 'list', '--region-id', 'r1', '--page-size', '6', '--output', 'table')
+    assert result.returncode == 0, result.stderr
+    lines = result.stdout.splitlines()
+    assert lines[0].split() == ['id', 'status']
+    assert lines[2:] and all(line.split()[1] == 'running' for line in lines[2:])
+    assert '云主机列表' not in result.stdout
+
+
+def test_query_table_matches_json_output(cli):
+    expression = 'returnObj.vpcs[*].{id: vpcID, cidr: CIDR}'
+    table = cli('--query', expression, 'vpc', 'list', '--region-id', 'r1', '--page-size', '3')
+    as_json = cli('--query', expression, 'vpc', 'list', '--region-id', 'r1', '--page-size', '3',
+                  '--output', 'json')
+    assert table.returncode == 0 and as_json.returncode == 0, table.stderr + as_json.stderr
+    records = json.loads(as_json.stdout)
+    assert [line.split() for line in table.stdout.splitlines()[2:]] == [
+        [record['id'], record['cidr']] for record in records]
+
+    single = cli('--query', 'returnObj.vpcs[0]', 'vpc', 'list', '--region-id', 'r1')
+    assert single.returncode == 0, single.stderr
+    assert ['vpcID', 'vpc-00000000'] in [line.split() for line in single.stdout.splitlines()]
+
+
+def test_unapplied_query_warns(cli):
+    applied = cli('--query', '[0]', 'ecs', 'list', '--region-id', 'r1', '--output', 'json')
+    assert applied.returncode == 0, applied.stderr
+    assert '--query' not in applied.stderr
+
+    ignored = cli('--query', 'statusCode', 'ecs', 'regions', '--output', 'table')
+    assert ignored.returncode == 0, ignored.stderr
+    assert '未应用 --query' in ignored.stderr
+
+
+def test_query_table_for_all_pages(cli):
+    single = cli('--query', '[0]', 'vpc', 'list', '--region-id', 'r1', '--all')
+    assert single.returncode == 0, single.stderr
+    assert ['vpcID', 'vpc-00000000'] in [line.split() for line in single.stdout.splitlines()]
+
+    rows = cli('--query', '[*].{id: vpcID}', 'vpc', 'list', '--region-id', 'r1', '--all')
+    assert rows.returncode == 0, rows.stderr
+    lines = rows.stdout.splitlines()
+    assert lines[0].split() == ['id'] and len(lines) == 2 + 50
@@ -0,0 +1,109 @@
+"""客户端查询（--query）：解析与求值"""
+
+import pytest
+
+from utils.query import Query, QueryError
+
+DATA = {
+    'returnObj': {
+        'results': [
+            {'instanceID': 'i-1', 'displayName': 'web 1', 'instanceStatus': 'running', 'cpu': 2,
+             'tags': ['a', 'b'], 'flavor': {'name': 's6.small'}},
+            {'instanceID': 'i-2', 'displayName': 'db', 'instanceStatus': 'stopped', 'cpu': 8,
+             'tags': [], 'flavor': {'name': 's6.large'}},
+            {'instanceID': 'i-3', 'displayName': 'web 2', 'instanceStatus': 'running', 'cpu': 4,
+             'tags': ['b'], 'flavor': None},
+        ],
+        'totalCount': 3,
+        'with space': 'yes',
+    },
+}
+RESULTS = DATA['returnObj']['results']
+
+
+@pytest.mark.parametrize('expression, expected', [
+    # 字段、子表达式、当前节点
+    ('returnObj.totalCount', 3),
+    ('returnObj."with space"', 'yes'),
+    ('returnObj.missing.deeper', None),
+    ('@.returnObj.totalCount', 3),
+    # 下标
+    ('returnObj.results[0].instanceID', 'i-1'),
+    ('returnObj.results[-1].instanceID', 'i-3'),
+    ('returnObj.results[5]', None),
+    # 投影：结果为 None 的元素被丢弃
+    ('returnObj.results[*].instanceID', ['i-1', 'i-2', 'i-3']),
+    ('returnObj.results[*].flavor.name', ['s6.small', 's6.large']),
+    ('returnObj.*', [RESULTS, 3, 'yes']),
+    ('returnObj.results[].tags[]', ['a', 'b', 'b']),
+    # 过滤
+    ("returnObj.results[?instanceStatus=='running'].instanceID", ['i-1', 'i-3']),
+    ('returnObj.results[?cpu > `2` && cpu <= `8`].instanceID', ['i-2', 'i-3']),
+    ("returnObj.results[?!(instanceStatus=='running')].instanceID", ['i-2']),
+    ("returnObj.results[?cpu == `2` || displayName == 'db'].instanceID", ['i-1', 'i-2']),
+    ('returnObj.results[?tags].instanceID', ['i-1', 'i-3']),
+    # 多选
+    ('returnObj.results[0].[instanceID, cpu]', ['i-1', 2]),
+    ('returnObj.results[*].{id: instanceID, name: displayName}',
+     [{'id': 'i-1', 'name': 'web 1'}, {'id': 'i-2', 'name': 'db'}, {'id': 'i-3', 'name': 'web 2'}]),
+    # 管道：结束投影
+    ('returnObj.results[*].instanceID | [0]', 'i-1'),
+    ('returnObj.results[*].tags | [1]', []),
+    # 字面量
+    ("'raw string'", 'raw string'),
+    ('`{"json": true}`', {'json': True}),
+    ('`3`', 3),
+    # 函数
+    ('length(returnObj.results)', 3),
+    ('keys(returnObj.results[0].flavor)', ['name']),
+    ('values(returnObj.results[0].flavor)', ['s6.small']),
+    ("returnObj.results[?contains(tags, 'b')].instanceID", ['i-1', 'i-3']),
+    ("returnObj.results[?starts_with(displayName, 'web')].instanceID", ['i-1', 'i-3']),
+    ("join(',', returnObj.results[*].instanceID)", 'i-1,i-2,i-3'),
+    ('to_string(returnObj.totalCount)', '3'),
+    ("to_number('12')", 12),
+    ('length(returnObj.totalCount)', None),
+])
+def test_search(expression, expected):
+    assert Query(expression).search(DATA) == expected
+
+
+@pytest.mark.parametrize('expression', [
+    'returnObj.',
+    'returnObj.results[',
+    'returnObj.results[0',
+    '[?cpu > ]',
+    '{id instanceID}',
+    'nosuchfunction(@)',
+    'length(@, @)',
+    '`{not json}`',
+    'a b',
+    'a # b',
+])
+def test_invalid_expression(expression):
+    with pytest.raises(QueryError):
+        Query(expression)
+
+
+@pytest.mark.parametrize('expression, streamable', [
+    ('[*].instanceID', True),
+    ("[?instanceStatus=='running'].{id: instanceID}", True),
+    ('[*]', True),
+    ('[0]', False),
+    ('[*].instanceID | [0]', False),
+    ('length(@)', False),
+    ('returnObj.results[*]', False),
+])
+def test_streamable(expression, streamable):
+    assert Query(expression).streamable is streamable
+
+
+@pytest.mark.parametrize('expression', [
+    '[*].instanceID',
+    "[?instanceStatus=='running'].{id: instanceID, cpu: cpu}",
+    '[?cpu > `2`]',
+    '[*].flavor.name',
+])
+def test_iter_records_matches_search(expression):
+    query = Query(expression)
+    assert list(query.iter_records(iter(RESULTS))) == query.search(RESULTS)
@@ -0,0 +1,170 @@
+"""客户端限流：令牌桶、收到 429 后的降速与恢复（AIMD）、按端点划分"""
+
+import pytest
+import requests
+
+from core import ratelimit
+from core.ratelimit import MAX_RETRY_AFTER, MIN_RATE, RELEASE_AFTER, RateLimiter, TokenBucket, retry_after_seconds
+
+URL = 'https://ctecs-global.ctapi.ctyun.cn/v4/ecs/list-instances'
+
+
+class FakeTime:
+    """可控的时钟：sleep 只推进时间"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeTime()
+    monkeypatch.setattr(ratelimit, 'time', clock)
+    return clock
+
+
+def test_fixed_rate_allows_burst_then_queues(clock):
+    bucket = TokenBucket(rate=2.0, burst=2.0)
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    # 令牌透支：并发线程按到达顺序各自等待
+    assert [bucket.reserve() for _ in range(3)] == [0.5, 1.0, 1.5]
+
+    clock.now += 10
+    # 空闲后最多积累 burst 个令牌
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+
+def test_throttled_halves_rate_once_per_interval(clock):
+    bucket = TokenBucket(rate=8.0, burst=8.0)
+    bucket.throttled()
+    # 同时被限流的并发请求只降速一次
+    bucket.throttled()
+    assert bucket.rate == 4.0
+    assert bucket.reserve() == pytest.approx(1 / 4.0)
+
+    for _ in range(10):
+        clock.now += 1.0
+        bucket.throttled()
+    assert bucket.rate == MIN_RATE
+
+
+@pytest.mark.parametrize('retry_after, pause', [
+    (5.0, 5.0),
+    (600.0, MAX_RETRY_AFTER),
+])
+def test_retry_after_pauses_endpoint(clock, retry_after, pause):
+    bucket = TokenBucket(rate=None, burst=1.0)
+    bucket.throttled(retry_after)
+    assert bucket.reserve() == pytest.approx(pause)
+
+
+def test_fixed_rate_recovers_linearly(clock):
+    bucket = TokenBucket(rate=10.0, burst=10.0)
+    bucket.throttled()
+    assert bucket.rate == 5.0
+    clock.now += 2.0
+    bucket.succeeded()
+    # 每秒恢复上限的 10%
+    assert bucket.rate == pytest.approx(7.0)
+    clock.now += 100.0
+    bucket.succeeded()
+    assert bucket.rate == 10.0
+
+
+def test_adaptive_rate_starts_from_observed_and_is_released(clock):
+    bucket = TokenBucket(rate=None, burst=1.0)
+    # 1秒内发出 16 个请求后被限流：以实际速率的一半限速
+    for _ in range(16):
+        assert bucket.reserve() == 0.0
+        clock.now += 0.0625
+    bucket.reserve()
+    bucket.throttled()
+    assert bucket.rate == 8.0
+    assert bucket._ceiling == 16.0
+
+    clock.now += 20.0
+    bucket.succeeded()
+    assert bucket.rate == 16.0
+    # 恢复到上限后持续一段时间没有 429：取消限速
+    clock.now += RELEASE_AFTER
+    bucket.succeeded()
+    assert bucket.rate is None
+    assert bucket.reserve() == 0.0
+
+
+def test_buckets_per_endpoint_and_reset_on_configure():
+    limiter = RateLimiter()
+    assert not limiter.enabled
+    limiter.configure(rate=5.0, burst=0.0, adaptive=False)
+    assert limiter.enabled
+
+    bucket = limiter.bucket(URL)
+    assert limiter.bucket(URL + '?pageNo=2') is bucket
+    assert limiter.bucket('https://ctecs-global.ctapi.ctyun.cn/v4/ecs/details') is not bucket
+    assert limiter.bucket('https://ctvpc-global.ctapi.ctyun.cn/v4/ecs/list-instances') is not bucket
+    assert (bucket.rate, bucket.burst) == (5.0, 5.0)
+
+    # 参数不变时保留已调整的速率，参数变化时重建
+    limiter.configure(rate=5.0, burst=0.0, adaptive=False)
+    assert limiter.bucket(URL) is bucket
+    limiter.configure(rate=0.0, burst=0.0, adaptive=True)
+    assert limiter.bucket(URL) is not bucket
+    assert limiter.bucket(URL).rate is None
+
+
+@pytest.mark.parametrize('value, seconds', [
+    ('3', 3.0),
+    ('0.5', 0.5),
+    ('-1', 0.0),
+    ('Wed, 21 Oct 2015 07:28:00 GMT', 0.0),
+    ('soon', None),
+    (None, None),
+])
+def test_retry_after_seconds(value, seconds):
+    assert retry_after_seconds(value) == seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code, retry_after=None):
+        self.status_code = status_code
+        self.headers = {'Retry-After': retry_after} if retry_after else {}
+
+    def close(self):
+        pass
+
+
+def test_session_retries_throttled_requests_through_bucket(clock, monkeypatch):
+    from core.transport import EOPTransport
+
+    monkeypatch.setattr(ratelimit, 'limiter', RateLimiter())
+    monkeypatch.setattr('core.transport.limiter', ratelimit.limiter)
+    ratelimit.limiter.configure(rate=0.0, burst=0.0, adaptive=True)
+    transport = EOPTransport('ak', 'sk', retries=3)
+    transport.inflight = None
+
+    responses = [FakeResponse(429, '2'), FakeResponse(429), FakeResponse(200)]
+    sent = []
+
+    def send(self, method, url, *args, **kwargs):
+        sent.append(clock.now)
+        return responses.pop(0)
+
+    monkeypatch.setattr(requests.Session, 'request', send)
+    response = transport.session.post(URL, data='{}')
+    assert response.status_code == 200
+    assert response.throttle_retries == 2
+    # 第一次重试等待 Retry-After，之后按降低后的速率发出
+    assert sent[1] - sent[0] == pytest.approx(2.0)
+    assert len(sent) == 3
+    assert ratelimit.limiter.bucket(URL).rate is not None
@@ -0,0 +1,109 @@
+"""参考数据缓存（stale-while-revalidate）：Redis可用区"""
+
+import json
+import threading
+
+import pytest
+
+from utils import cache as cache_module
+from utils.cache import REFERENCE_TTL_POLICIES, SQLiteCache, _is_valid_reference
+
+
+def zones_response(*names):
+    return {'statusCode': 800, 'message': 'success',
+            'returnObj': {'zoneList': [{'name': name, 'azDisplayName': name} for name in names]}}
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.text = str(payload)
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    """按顺序返回预设的响应，记录请求次数"""
+
+    def __init__(self, *payloads):
+        self.payloads = list(payloads)
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        return FakeResponse(self.payloads[min(self.calls, len(self.payloads)) - 1])
+
+
+class FakeClient:
+    region_id = 'r1'
+    timeout = 30
+    cache_namespace = 'test-namespace'
+
+    def __init__(self, session):
+        from auth.eop_signature import CTYUNEOPAuth
+
+        self.eop_auth = CTYUNEOPAuth('test-ak', 'test-sk')
+        self.session = session
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    instance = SQLiteCache(cache_dir=str(tmp_path / 'cache'))
+    monkeypatch.setattr(cache_module, '_global_cache', instance)
+    return instance
+
+
+def test_redis_zones_response_is_valid_reference():
+    assert _is_valid_reference(zones_response('az1'))
+    assert _is_valid_reference({'statusCode': '800', 'returnObj': {}})
+    # 整理后的可用区摘要以原始响应为准
+    assert _is_valid_reference({'success': True, 'zones': [], 'full_result': zones_response('az1')})
+    assert not _is_valid_reference({'success': False, 'zones': [], 'full_result': {'statusCode': 900}})
+    assert not _is_valid_reference({'success': True, 'full_result': {'statusCode': 900}})
+    assert not _is_valid_reference({'error': True, 'status_code': 401})
+
+
+def test_redis_zones_cached_then_served_stale(cache):
+    from rdscmd.client import RedisClient
+
+    session = FakeSession(zones_response('az1'), zones_response('az1', 'az2'))
+    redis_client = RedisClient(FakeClient(session))
+
+    first = redis_client.get_zones('r1')
+    assert redis_client.get_zones('r1') == first
+    assert session.calls == 1
+    assert redis_client.get_zones_summary('r1')['zones_count'] == 1
+    assert session.calls == 1
+
+    # 超过新鲜期：立即返回旧数据，后台刷新
+    fresh_ttl, _ = REFERENCE_TTL_POLICIES['zones']
+    key = 'ref:zones:RedisClient.get_zones:' + json.dumps({'region_id': 'r1'})
+    entry = cache.get(key, namespace='test-namespace')
+    entry['fetched_time'] -= fresh_ttl + 1
+    cache.set(key, entry, namespace='test-namespace')
+
+    assert redis_client.get_zones('r1') == first
+    for thread in threading.enumerate():
+        if thread.name == 'ctyun-refresh-zones':
+            thread.join(timeout=10)
+    assert session.calls == 2
+    assert redis_client.get_zones('r1') == zones_response('az1', 'az2')
+    assert session.calls == 2
+
+
+def test_refresh_thread_does_not_block_exit(cache, monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(cache_module, '_refresh_threads', set())
+    cache_module._start_refresh('ctyun-refresh-test', cache, 'ref:test', 'test-namespace', 60, release.wait)
+    thread = next(thread for thread in cache_module._refresh_threads)
+    assert thread.daemon
+
+    # 退出时只等待有限的时间
+    cache_module._join_refreshes(timeout=0.05)
+    assert thread.is_alive()
+    release.set()
+    thread.join(timeout=10)
+    assert not cache_module._refresh_threads
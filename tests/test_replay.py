@@ -0,0 +1,148 @@
+"""API流量录制与回放：录制的响应按请求指纹原样回放，不访问网络"""
+
+import os
+import time
+
+import pytest
+
+from conftest import ACCESS_KEY, SECRET_KEY
+from core.replay import (BODIES_FILE, INDEX_FILE, ReplayMiss, TrafficReplayer, parse_latency, record_traffic,
+                         replay_traffic)
+from core.transport import EOPTransport
+
+ECS = 'https://ctecs-global.ctapi.ctyun.cn'
+LIST = ECS + '/v4/ecs/list-instances'
+REGIONS = ECS + '/v4/region/list-regions'
+DETAILS = ECS + '/v4/ecs/instance-details'
+
+
+@pytest.fixture
+def transport(standin):
+    def make():
+        transport = EOPTransport(ACCESS_KEY, SECRET_KEY)
+        transport.endpoint_override = standin.url
+        # 请求合并会把相同的并发请求合成一次，这里逐个发出
+        transport.inflight = None
+        made.append(transport)
+        return transport
+
+    made = []
+    yield make
+    for transport in made:
+        transport.close()
+
+
+def _requests(transport):
+    return [
+        transport.request_json('POST', LIST, body={'regionID': 'r1', 'pageNo': 1, 'pageSize': 5}),
+        transport.request_json('POST', LIST, body={'regionID': 'r1', 'pageNo': 2, 'pageSize': 5}),
+        transport.request_json('GET', REGIONS),
+        # 错误响应同样录制
+        transport.request_json('GET', DETAILS, query_params={'regionID': 'r1', 'instanceID': 'missing'}),
+    ]
+
+
+def _served(standin):
+    return sum(standin.standin.stats()['requests'].values())
+
+
+def test_round_trip(standin, transport, tmp_path):
+    archive = str(tmp_path / 'archive')
+    recording = transport()
+    finish = record_traffic(recording, archive)
+    recorded = _requests(recording)
+    finish()
+    assert recording.recorder is None
+    assert recorded[0]['statusCode'] == 800 and recorded[3]['statusCode'] != 800
+
+    served = _served(standin)
+    replaying = transport()
+    # 回放不访问网络：端点指向不存在的服务也能得到响应
+    replaying.endpoint_override = 'http://127.0.0.1:9'
+    finish = replay_traffic(replaying, archive)
+    # 签名请求头（Eop-date、请求ID）每次都不同，指纹不受影响
+    time.sleep(1.1)
+    assert _requests(replaying) == recorded
+    assert replaying.replayer.hits == 4 and replaying.replayer.fallbacks == 0
+    finish()
+    assert _served(standin) == served
+
+
+def test_identical_bodies_stored_once(transport, tmp_path):
+    archive = tmp_path / 'archive'
+    recording = transport()
+    finish = record_traffic(recording, str(archive))
+    recording.request_json('GET', REGIONS)
+    size = os.path.getsize(archive / BODIES_FILE)
+    recording.request_json('GET', REGIONS)
+    finish()
+    assert os.path.getsize(archive / BODIES_FILE) == size
+    assert len((archive / INDEX_FILE).read_text().splitlines()) == 2
+
+
+def test_repeated_and_unmatched_requests(transport, tmp_path):
+    archive = str(tmp_path / 'archive')
+    recording = transport()
+    finish = record_traffic(recording, archive)
+    first = recording.request_json('POST', LIST, body={'regionID': 'r1', 'pageNo': 1, 'pageSize': 5})
+    second = recording.request_json('POST', LIST, body={'regionID': 'r1', 'pageNo': 2, 'pageSize': 5})
+    finish()
+
+    replaying = transport()
+    finish = replay_traffic(replaying, archive)
+    # 指纹不匹配（请求体不同）时按方法和URL依次返回录制的响应，用完后重复最后一个
+    body = {'regionID': 'r1', 'pageNo': 1, 'pageSize': 5, 'now': time.time()}
+    assert [replaying.request_json('POST', LIST, body=body) for _ in range(3)] == [first, second, second]
+    assert replaying.replayer.fallbacks == 3
+
+    with pytest.raises(ReplayMiss):
+        replaying.request_json('GET', REGIONS)
+    assert replaying.replayer.misses == ['GET ' + REGIONS]
+    finish()
+
+
+@pytest.mark.parametrize('latency, expected', [
+    (None, 0.0),
+    (50.0, 0.05),
+    ('recorded', 0.2),
+])
+def test_replay_latency(tmp_path, latency, expected):
+    archive = tmp_path / 'archive'
+    archive.mkdir()
+    (archive / BODIES_FILE).write_bytes(b'')
+    (archive / INDEX_FILE).write_text(
+        '{"key": "k", "method": "GET", "url": "%s", "status": 200, "headers": {}, '
+        '"offset": 0, "size": 0, "elapsed_ms": 200}\n' % REGIONS
+        # 写了一半的最后一行被忽略
+        + '{"key": "k2", "meth', encoding='utf-8')
+    replayer = TrafficReplayer(str(archive), latency)
+    assert len(replayer) == 1
+    assert replayer._delay(replayer._by_key['k'][0]) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('value, latency', [
+    (None, None),
+    ('', None),
+    ('recorded', 'recorded'),
+    ('25', 25.0),
+])
+def test_parse_latency(value, latency):
+    assert parse_latency(value) == latency
+
+
+def test_missing_archive(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        TrafficReplayer(str(tmp_path / 'missing'))
+
+
+def test_cli_round_trip(cli, standin, tmp_path):
+    archive = str(tmp_path / 'archive')
+    args = ('--output', 'json', 'ecs', 'list', '--region-id', 'r1', '--all')
+    recorded = cli('--record', archive, *args)
+    assert recorded.returncode == 0, recorded.stderr
+
+    served = _served(standin)
+    replayed = cli('--replay', archive, *args)
+    assert replayed.returncode == 0, replayed.stderr
+    assert replayed.stdout == recorded.stdout
+    assert _served(standin) == served
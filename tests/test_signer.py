@@ -0,0 +1,151 @@
+"""EOP签名：快速路径（按秒缓存的 Eop-date 与 kdate、预编码的AK/SK）与逐步计算的参考签名一致"""
+
+import base64
+import hashlib
+import hmac
+import threading
+import time
+from urllib.parse import quote
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from auth import eop_signature
+from auth.eop_signature import CTYUNEOPAuth
+from eop_server import verify_signature
+
+ACCESS_KEY = 'test-access-key-0123456789abcdef'
+SECRET_KEY = 'test-secret-key-fedcba9876543210'
+URL = 'https://ctecs-global.ctapi.ctyun.cn/v4/ecs/list-instances'
+
+
+def reference_authorization(headers, query_params, body, eop_date):
+    """按签名规范逐步计算的 Eop-Authorization（不做任何缓存）"""
+    header_list = []
+    for name in ('ctyun-eop-request-id', 'eop-date'):
+        value = next((v for k, v in headers.items() if k.lower() == name), None)
+        if value:
+            header_list.append(f"{name}:{value}\n")
+    query = '&'.join(f"{k}={quote(str(v), safe='')}" for k, v in sorted((query_params or {}).items()))
+    if isinstance(body, bytes):
+        body = body.decode('utf-8')
+    body_hash = hashlib.sha256((body or '').encode('utf-8')).hexdigest()
+    text = f"{''.join(header_list)}\n{query}\n{body_hash}"
+
+    ktime = hmac.new(SECRET_KEY.encode('utf-8'), eop_date.encode('utf-8'), hashlib.sha256).digest()
+    kak = hmac.new(ktime, ACCESS_KEY.encode('utf-8'), hashlib.sha256).digest()
+    kdate = hmac.new(kak, eop_date.split('T')[0].encode('utf-8'), hashlib.sha256).digest()
+    signature = base64.b64encode(hmac.new(kdate, text.encode('utf-8'), hashlib.sha256).digest()).decode()
+    return f"{ACCESS_KEY} Headers=ctyun-eop-request-id;eop-date Signature={signature}"
+
+
+class FakeTime:
+    """可控的 time.time()，其余函数使用真实的 time 模块"""
+
+    def __init__(self, now):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeTime(time.time())
+    monkeypatch.setattr(eop_signature, 'time', clock)
+    return clock
+
+
+REQUESTS = [
+    {},
+    {'query_params': {'regionID': '200000001852', 'pageNo': 1, 'name': '订单 服务/a&b'}},
+    {'body': '{"regionID":"200000001852","pageNo":1}'},
+    {'body': '{"instanceName":"订单服务"}'},
+    {'body': '{"instanceName":"订单服务"}'.encode('utf-8')},
+    {'body': b''},
+    {'query_params': {'b': 2, 'a': 1}, 'body': '{"x":1}'},
+]
+
+EXTRA_HEADERS = [
+    None,
+    {'regionId': '200000001852', 'X-Trace': '1'},
+    # 额外请求头覆盖签名头：签名字符串使用覆盖后的值
+    {'Eop-date': '20250801T083000Z'},
+    {'eop-date': '20250801T083000Z'},
+    {'ctyun-eop-request-id': ''},
+]
+
+
+@pytest.mark.parametrize('request_args', REQUESTS)
+@pytest.mark.parametrize('extra_headers', EXTRA_HEADERS)
+def test_matches_reference(request_args, extra_headers):
+    signer = CTYUNEOPAuth(ACCESS_KEY, SECRET_KEY)
+    headers = signer.sign_request('POST', URL, extra_headers=extra_headers, **request_args)
+    # kdate 由签名时生成的 Eop-date 派生
+    eop_date = signer._date[1]
+    assert headers['Eop-Authorization'] == reference_authorization(
+        headers, request_args.get('query_params'), request_args.get('body'), eop_date)
+
+
+@pytest.mark.parametrize('request_args', REQUESTS)
+def test_accepted_by_independent_verifier(request_args):
+    headers = CTYUNEOPAuth(ACCESS_KEY, SECRET_KEY).sign_request('GET', URL, **request_args)
+    query = [(k, str(v)) for k, v in (request_args.get('query_params') or {}).items()]
+    body = request_args.get('body') or b''
+    body = body.encode('utf-8') if isinstance(body, str) else body
+    assert verify_signature(CaseInsensitiveDict(headers), query, body, {ACCESS_KEY: SECRET_KEY}) == ACCESS_KEY
+
+
+def test_derived_key_cached_per_second(clock, monkeypatch):
+    signer = CTYUNEOPAuth(ACCESS_KEY, SECRET_KEY)
+    derivations = []
+    hmac_new = hmac.new
+
+    def counting_new(key, msg=None, digestmod=None):
+        derivations.append(msg)
+        return hmac_new(key, msg, digestmod)
+
+    monkeypatch.setattr(eop_signature.hmac, 'new', counting_new)
+
+    first = [signer.sign_request('GET', URL, query_params={'n': i}) for i in range(5)]
+    # 同一秒内的请求共用 Eop-date，kdate 只派生一次（3次HMAC）
+    assert len({headers['Eop-date'] for headers in first}) == 1
+    assert len(derivations) == 3
+    # 请求ID每次不同
+    assert len({headers['ctyun-eop-request-id'] for headers in first}) == 5
+
+    clock.now += 1
+    second = signer.sign_request('GET', URL, query_params={'n': 0})
+    assert second['Eop-date'] != first[0]['Eop-date']
+    assert len(derivations) == 6
+    assert second['Eop-Authorization'] == reference_authorization(second, {'n': 0}, None, second['Eop-date'])
+
+
+def test_concurrent_signing_across_seconds(clock):
+    signer = CTYUNEOPAuth(ACCESS_KEY, SECRET_KEY)
+    results, errors = [], []
+
+    def sign(worker):
+        try:
+            for i in range(200):
+                if worker == 0 and i % 20 == 0:
+                    # 签名过程中时间前进：其他线程可能拿到新旧两个秒数的缓存
+                    clock.now += 1
+                body = f'{{"worker":{worker},"n":{i}}}'
+                results.append((signer.sign_request('POST', URL, body=body), body))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=sign, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len({headers['Eop-date'] for headers, _ in results}) > 1
+    for headers, body in results:
+        assert headers['Eop-Authorization'] == reference_authorization(headers, None, body, headers['Eop-date'])
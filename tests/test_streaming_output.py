@@ -0,0 +1,63 @@
+"""流式输出（--output ndjson/csv）：标准输出只包含记录"""
+
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+
+from conftest import INSTANCES, ROOT, SECRET_KEY, SRC, write_config
+
+
+def test_ndjson_stdout_contains_only_records(cli):
+    result = cli('ecs', 'list', '--region-id', 'r1', '--all', '--output', 'ndjson')
+    assert result.returncode == 0, result.stderr
+    lines = result.stdout.splitlines()
+    assert len(lines) == INSTANCES
+    records = [json.loads(line) for line in lines]
+    assert all(isinstance(record, dict) and record.get('instanceID') for record in records)
+    # 日志写到标准错误
+    assert '查询云主机列表' in result.stderr
+
+
+def test_csv_stdout_contains_only_records(cli):
+    result = cli('ecs', 'list', '--region-id', 'r1', '--all', '--output', 'csv')
+    assert result.returncode == 0, result.stderr
+    rows = list(csv.DictReader(io.StringIO(result.stdout)))
+    assert len(rows) == INSTANCES
+    assert all(row['instanceID'].startswith('ins-') for row in rows)
+
+
+def test_csv_writes_raw_fields(cli):
+    """csv 与 ndjson 输出相同的原始字段，不使用表格的显示列（不截断、不含换行）"""
+    as_csv = cli('ecs', 'list', '--region-id', 'r1', '--all', '--output', 'csv')
+    as_ndjson = cli('ecs', 'list', '--region-id', 'r1', '--all', '--output', 'ndjson')
+    assert as_csv.returncode == 0 and as_ndjson.returncode == 0, as_csv.stderr + as_ndjson.stderr
+    assert len(as_csv.stdout.splitlines()) == INSTANCES + 1
+
+    records = [json.loads(line) for line in as_ndjson.stdout.splitlines()]
+    rows = list(csv.DictReader(io.StringIO(as_csv.stdout)))
+    assert list(rows[0]) == list(records[0])
+    for row, record in zip(rows, records):
+        assert row['instanceID'] == record['instanceID']
+        assert row['instanceName'] == record['instanceName']
+
+
+def test_closed_pipe_is_quiet(standin, tmp_path):
+    """下游提前关闭管道（| head）：不输出错误信息"""
+    home = tmp_path / 'home'
+    write_config(home, {'default': SECRET_KEY})
+    env = dict(os.environ, HOME=str(home), PYTHONPATH=str(SRC),
+               CTYUN_ENDPOINT_OVERRIDE=standin.url, CTYUN_NO_DAEMON='1')
+    process = subprocess.Popen(
+        [sys.executable, '-c', "from cli.main import cli; cli(prog_name='ctyun-cli')",
+         'ecs', 'list', '--region-id', 'r1', '--all', '--page-size', '10', '--output', 'csv'],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env, cwd=str(ROOT)
+    )
+    assert process.stdout.readline().startswith(b'instanceID')
+    process.stdout.close()
+    stderr = process.communicate(timeout=120)[1].decode()
+    assert 'Broken pipe' not in stderr
+    assert '运行出错' not in stderr
+    assert 'Traceback' not in stderr
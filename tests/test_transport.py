@@ -0,0 +1,185 @@
+"""传输层：签名发送与JSON解码、进行中请求的合并（SingleFlight）、相同只读请求的合并"""
+
+import threading
+import time
+
+import pytest
+
+from conftest import ACCESS_KEY, SECRET_KEY
+from core.singleflight import SingleFlight
+from core.transport import EOPTransport, request_fingerprint
+
+HOST = 'https://ecs.ctapi.ctyun.cn'
+
+
+class FakeResponse:
+    status_code = 200
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    transport = EOPTransport('ak', 'sk')
+    calls = []
+
+    def dispatch(method, url, *args, **kwargs):
+        calls.append((method, url))
+        # 让并发的相同请求在这次调用结束前发出
+        time.sleep(0.2)
+        return FakeResponse()
+
+    monkeypatch.setattr(transport.session, '_dispatch', dispatch)
+    transport.calls = calls
+    return transport
+
+
+def _concurrently(transport, method, path, count=4, **kwargs):
+    threads = [threading.Thread(target=transport.session.request, args=(method, HOST + path), kwargs=kwargs)
+               for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    return len(transport.calls)
+
+
+def test_identical_gets_are_coalesced(transport):
+    assert _concurrently(transport, 'GET', '/v4/vpc/show', params={'id': 'v1'}) == 1
+
+
+def test_posts_are_not_coalesced_by_default(transport):
+    # 路径看起来是查询接口的POST也逐个发出
+    assert _concurrently(transport, 'POST', '/v4/ecs/list-instances', data='{"pageNo": 1}') == 4
+
+
+def test_allow_listed_posts_are_coalesced(transport):
+    transport.coalesce_post_paths = frozenset({'/v4/ecs/list-instances'})
+    assert _concurrently(transport, 'POST', '/v4/ecs/list-instances', data='{"pageNo": 1}') == 1
+    assert _concurrently(transport, 'POST', '/v4/ecs/create-instance', data='{}') == 5
+
+
+def test_coalescing_disabled(transport):
+    transport.inflight = None
+    assert _concurrently(transport, 'GET', '/v4/vpc/show', params={'id': 'v1'}) == 4
+
+
+def test_singleflight_shares_result_with_waiters():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls, results = [], []
+
+    def leader_call():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 'result'
+
+    def run(func):
+        results.append(flight.do('key', func))
+
+    leader = threading.Thread(target=run, args=(leader_call,))
+    leader.start()
+    started.wait(5)
+    waiters = [threading.Thread(target=run, args=(lambda: calls.append(2),)) for _ in range(3)]
+    for thread in waiters:
+        thread.start()
+    while flight.shared < 3:
+        time.sleep(0.01)
+    release.set()
+    for thread in [leader] + waiters:
+        thread.join(5)
+
+    assert calls == [1]
+    assert sorted(results, key=lambda r: r[1]) == [('result', False)] + [('result', True)] * 3
+    # 调用结束后不再合并：下一次调用重新执行
+    assert len(flight) == 0
+    assert flight.do('key', lambda: 'again') == ('again', False)
+
+
+def test_singleflight_error_reaches_all_waiters():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    errors = []
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise ConnectionError('连接失败')
+
+    def run(func):
+        try:
+            flight.do('key', func)
+        except ConnectionError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=run, args=(failing,))
+    leader.start()
+    started.wait(5)
+    waiter = threading.Thread(target=run, args=(lambda: None,))
+    waiter.start()
+    while flight.shared < 1:
+        time.sleep(0.01)
+    release.set()
+    leader.join(5)
+    waiter.join(5)
+    assert len(errors) == 2 and errors[0] is errors[1]
+
+
+def test_fingerprint_ignores_volatile_headers():
+    first = request_fingerprint('get', HOST + '/v4/vpc/list', {'regionID': 'r1', 'pageNo': None},
+                                headers={'Eop-date': '20260101T000000Z', 'ctyun-eop-request-id': 'a',
+                                         'regionId': 'r1'})
+    second = request_fingerprint('GET', HOST + '/v4/vpc/list', {'regionID': 'r1'},
+                                 headers={'eop-date': '20260101T000001Z', 'ctyun-eop-request-id': 'b',
+                                          'regionId': 'r1'})
+    assert first == second
+    assert first != request_fingerprint('GET', HOST + '/v4/vpc/list', {'regionID': 'r2'},
+                                        headers={'regionId': 'r1'})
+
+
+@pytest.fixture
+def live_transport(standin):
+    transport = EOPTransport(ACCESS_KEY, SECRET_KEY, timeout=7)
+    transport.endpoint_override = standin.url
+    yield transport
+    transport.close()
+
+
+def test_request_json_signed_against_standin(standin, live_transport):
+    result = live_transport.request_json('POST', 'https://ctecs-global.ctapi.ctyun.cn/v4/ecs/list-instances',
+                                         body={'regionID': 'r1', 'pageNo': 2, 'pageSize': 5})
+    assert result['statusCode'] == 800
+    assert len(result['returnObj']['results']) == 5
+
+    # 查询参数与请求体一样参与签名
+    result = live_transport.request_json('GET', 'https://ctvpc-global.ctapi.ctyun.cn/v4/vpc/list',
+                                         query_params={'regionID': 'r1', 'pageNo': 1, 'pageSize': 3})
+    assert len(result['returnObj']['vpcs']) == 3
+
+
+def test_request_json_error_structure(standin):
+    transport = EOPTransport(ACCESS_KEY, 'wrong-sk')
+    transport.endpoint_override = standin.url
+    try:
+        result = transport.request_json('GET', 'https://ctecs-global.ctapi.ctyun.cn/v4/region/list-regions')
+    finally:
+        transport.close()
+    assert result['statusCode'] == 401
+    assert result['error'] == 'HTTP_401'
+    assert '签名不匹配' in result['message']
+
+
+def test_session_uses_configured_timeout(live_transport, monkeypatch):
+    seen = []
+
+    def dispatch(method, url, *args, **kwargs):
+        seen.append(kwargs.get('timeout'))
+        return FakeResponse()
+
+    monkeypatch.setattr(live_transport.session, '_dispatch', dispatch)
+    live_transport.session.post(HOST + '/v4/ecs/create-instance', data='{}')
+    live_transport.session.post(HOST + '/v4/ecs/create-instance', data='{}', timeout=3)
+    assert seen == [7, 3]
+
+
+def test_route_replaces_scheme_and_host(live_transport, standin):
+    assert live_transport.route(HOST + '/v4/vpc/list?regionID=r1') == standin.url + '/v4/vpc/list?regionID=r1'